@@ -0,0 +1,76 @@
+"""
+Benchmark que compara Board (listas de Checker) con CompactBoard (conteos con signo).
+
+Mide la memoria por posición con tracemalloc y la cantidad de movimientos
+por segundo ejecutando un ciclo fijo de movimientos reversibles.
+
+Uso:
+    python -m benchmarks.bench_board [--positions N] [--moves N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from core.board import Board
+from core.compact_board import CompactBoard
+
+# Ciclo de movimientos reversibles que deja el tablero en la posición inicial.
+_MOVE_CYCLE = (
+    ("white", 0, 1),
+    ("black", 23, 22),
+    ("white", 1, 0),
+    ("black", 22, 23),
+    ("white", 11, 13),
+    ("black", 12, 10),
+    ("white", 13, 11),
+    ("black", 10, 12),
+)
+
+
+def measure_memory(board_cls, positions):
+    """
+    Devuelve los bytes promedio que ocupa una posición del tablero dado.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    boards = [board_cls() for _ in range(positions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del boards
+    return (after - before) / positions
+
+
+def measure_moves(board_cls, moves):
+    """
+    Devuelve los movimientos por segundo del tablero dado.
+    """
+    board = board_cls()
+    cycles = max(1, moves // len(_MOVE_CYCLE))
+    move = board.move_checker
+    start = time.perf_counter()
+    for _ in range(cycles):
+        for color, from_point, to_point in _MOVE_CYCLE:
+            move(color, from_point, to_point)
+    elapsed = time.perf_counter() - start
+    return cycles * len(_MOVE_CYCLE) / elapsed
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime una tabla comparativa.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=10000)
+    parser.add_argument("--moves", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    print(f"{'Tablero':<14}{'Bytes/posición':>16}{'Movimientos/s':>16}")
+    for board_cls in (Board, CompactBoard):
+        memory = measure_memory(board_cls, args.positions)
+        speed = measure_moves(board_cls, args.moves)
+        print(f"{board_cls.__name__:<14}{memory:>16.0f}{speed:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
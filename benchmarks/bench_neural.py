@@ -0,0 +1,78 @@
+"""
+Benchmark de la evaluación con la red neuronal, una por una y por lotes.
+
+Junta posiciones de partidas al azar y mide las posiciones evaluadas por
+segundo con NeuralEvaluator.evaluate_batch para lotes de 1, 32 y 1024
+posiciones (codificación incluida), comparadas con llamar a la red una vez
+por posición.
+
+Uso:
+    python -m benchmarks.bench_neural [--positions N] [--rounds R]
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_search import new_game
+from engine.neural import NeuralEvaluator
+from engine.policies import RandomPolicy
+
+BATCH_SIZES = (1, 32, 1024)
+
+
+def sample_positions(count, seed=1):
+    """
+    Devuelve count posiciones (conteos) alcanzadas en partidas al azar.
+    """
+    positions = []
+    index = 0
+    while len(positions) < count:
+        game = new_game(seed + index)
+        policy = RandomPolicy(seed + index)
+        while not game.is_over() and len(positions) < count:
+            if not game.get_dice_values():
+                game.roll_dice()
+            candidates = game.get_legal_plays_with_positions()
+            positions.extend(after for _, after in candidates)
+            game.apply_play(policy.choose_play(game, candidates) if candidates else ())
+        index += 1
+    return positions[:count]
+
+
+def measure(evaluator, positions, batch_size, rounds):
+    """
+    Devuelve las posiciones por segundo evaluando en lotes de batch_size.
+    """
+    batches = [
+        positions[start : start + batch_size]
+        for start in range(0, len(positions) - batch_size + 1, batch_size)
+    ]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for batch in batches:
+            evaluator.evaluate_batch(batch, "white")
+    elapsed = time.perf_counter() - start
+    return rounds * len(batches) * batch_size / elapsed
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime las posiciones por segundo de cada lote.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=4096)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    evaluator = NeuralEvaluator()
+    positions = sample_positions(args.positions)
+    baseline = None
+    print(f"{'Lote':<8}{'Posiciones/s':>14}{'Aceleración':>14}")
+    for batch_size in BATCH_SIZES:
+        speed = measure(evaluator, positions, batch_size, args.rounds)
+        baseline = baseline or speed
+        print(f"{batch_size:<8}{speed:>14.0f}{speed / baseline:>13.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark de la Position ID de GNU Backgammon para exportaciones masivas.
+
+Junta las posiciones de varias partidas al azar y mide las codificaciones y
+decodificaciones por segundo de core.position_id, comparadas con una
+codificación de referencia que arma la cadena de bits ficha por ficha.
+
+Uso:
+    python -m benchmarks.bench_position_id [--games N] [--repeat R]
+"""
+
+import argparse
+import base64
+import random
+import time
+
+from core.board import OPPONENT
+from core.compact_board import CompactBoard
+from core.play_generator import enumerate_plays
+from core.position_id import decode_position_id, encode_position_id
+
+
+def string_position_id(counts, color):
+    """
+    Codificación de referencia: concatena un carácter por ficha y por
+    separador y convierte la cadena de bits al final.
+    """
+    bits = ""
+    for side in (OPPONENT[color], color):
+        if side == "white":
+            own = [max(n, 0) for n in counts[23::-1]] + [counts[24]]
+        else:
+            own = [max(-n, 0) for n in counts[:24]] + [counts[25]]
+        for n in own:
+            bits += "1" * n + "0"
+    bits = bits.ljust(80, "0")
+    data = bytes(int(bits[i : i + 8][::-1], 2) for i in range(0, 80, 8))
+    return base64.b64encode(data).decode("ascii")[:14]
+
+
+def collect_positions(games, seed=1):
+    """
+    Devuelve (conteos, color en turno) de cada turno de partidas al azar.
+    """
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(games):
+        counts = CompactBoard().get_counts()
+        color = "white"
+        while counts[26] < 15 and counts[27] < 15:
+            positions.append((counts, color))
+            dice = [rng.randint(1, 6), rng.randint(1, 6)]
+            if dice[0] == dice[1]:
+                dice *= 2
+            plays = enumerate_plays(counts, color, dice)
+            if plays:
+                counts = rng.choice(plays)[1]
+            color = OPPONENT[color]
+    return positions
+
+
+def rate(function, items, repeat):
+    """
+    Devuelve las llamadas por segundo de function sobre items.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            function(*item)
+    return repeat * len(items) / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime las operaciones por segundo.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    positions = collect_positions(args.games)
+    ids = [(encode_position_id(*position), position[1]) for position in positions]
+    assert all(
+        string_position_id(*position) == text
+        for position, (text, _) in zip(positions, ids)
+    )
+    reference = rate(string_position_id, positions, args.repeat)
+    encode = rate(encode_position_id, positions, args.repeat)
+    decode = rate(decode_position_id, ids, args.repeat)
+    print(f"Posiciones: {len(positions)}")
+    print(f"{'Operación':<28}{'Por segundo':>14}")
+    print(f"{'Codificar (cadena de bits)':<28}{reference:>14,.0f}")
+    print(f"{'Codificar (enteros)':<28}{encode:>14,.0f}   {encode / reference:.2f}x")
+    print(f"{'Decodificar':<28}{decode:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
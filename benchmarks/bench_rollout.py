@@ -0,0 +1,48 @@
+"""
+Benchmark de los rollouts de Monte Carlo.
+
+Hace un rollout de la posición inicial con y sin reducción por suerte y
+muestra la equity, el error estándar, los trials por segundo y el tiempo
+que haría falta para llegar a un error de 0,01 con cada configuración.
+
+Uso:
+    python -m benchmarks.bench_rollout [--trials N] [--workers W] [--seed S]
+"""
+
+import argparse
+
+from core.compact_board import CompactBoard
+from engine.rollout import RolloutEngine
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime una línea por configuración.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trials", type=int, default=144)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    counts = CompactBoard().get_counts()
+    print(
+        f"{'Suerte':<8}{'Equity':>9}{'Error':>9}{'Trials/s':>10}{'Seg. a 0,01':>13}"
+    )
+    for reduction in (False, True):
+        engine = RolloutEngine(
+            __variance_reduction__=reduction,
+            __workers__=args.workers,
+            __seed__=args.seed,
+        )
+        summary = engine.rollout(counts, "white", args.trials)
+        needed = summary["trials"] * (summary["std_error"] / 0.01) ** 2
+        print(
+            f"{'sí' if reduction else 'no':<8}{summary['equity']:>9.3f}"
+            f"{summary['std_error']:>9.4f}{summary['trials_per_second']:>10.1f}"
+            f"{needed / summary['trials_per_second']:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
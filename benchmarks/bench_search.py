@@ -0,0 +1,100 @@
+"""
+Benchmark del tiempo por decisión de la búsqueda expectiminimax.
+
+Arma un conjunto fijo de posiciones (la inicial y varias de medio juego
+alcanzadas con políticas al azar), tira los dados de cada una con una
+semilla y mide cuánto tarda ExpectiminimaxSearch.best_play a 0, 1 y 2
+plies, junto con los nodos de azar visitados y los cortes Star1/Star2.
+Con --table la búsqueda usa una tabla de transposición compartida entre
+las decisiones y se muestran sus aciertos.
+
+Uso:
+    python -m benchmarks.bench_search [--positions N] [--max-plies P] [--table]
+"""
+
+import argparse
+import time
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.policies import RandomPolicy
+from engine.search import ExpectiminimaxSearch
+from engine.transposition import TranspositionTable
+
+
+def new_game(seed):
+    """
+    Devuelve una partida empezada con dados reproducibles.
+    """
+    game = Game(
+        Player("Blancas", "white"),
+        Player("Negras", "black"),
+        CompactBoard(),
+        Dice.seeded(seed),
+    )
+    game.start()
+    return game
+
+
+def sample_games(positions, seed=1):
+    """
+    Devuelve partidas con los dados tirados en posiciones variadas.
+    """
+    games = []
+    for index in range(positions):
+        game = new_game(seed + index)
+        policy = RandomPolicy(seed + index)
+        for _ in range(3 * index):
+            if game.is_over():
+                break
+            if not game.get_dice_values():
+                game.roll_dice()
+            candidates = game.get_legal_plays_with_positions()
+            game.apply_play(policy.choose_play(game, candidates) if candidates else ())
+        if not game.is_over():
+            if not game.get_dice_values():
+                game.roll_dice()
+            games.append(game)
+    return games
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime el tiempo medio y máximo por decisión.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=12)
+    parser.add_argument("--max-plies", type=int, default=2)
+    parser.add_argument("--table", action="store_true")
+    args = parser.parse_args(argv)
+
+    games = sample_games(args.positions)
+    table = TranspositionTable() if args.table else None
+    search = ExpectiminimaxSearch(__table__=table)
+    print(f"{'Plies':<7}{'Medio (ms)':>12}{'Máximo (ms)':>13}{'Nodos':>9}{'Cortes':>9}")
+    for plies in range(args.max_plies + 1):
+        times, nodes, cutoffs = [], 0, 0
+        for game in games:
+            start = time.perf_counter()
+            search.best_play(game, plies)
+            times.append(time.perf_counter() - start)
+            stats = search.get_stats()
+            nodes += stats["nodes"]
+            cutoffs += stats["cutoffs"]
+        print(
+            f"{plies:<7}{1000 * sum(times) / len(times):>12.1f}"
+            f"{1000 * max(times):>13.1f}{nodes / len(games):>9.0f}"
+            f"{cutoffs / len(games):>9.0f}"
+        )
+    if table is not None:
+        stats = table.get_stats()
+        print(
+            f"Tabla: {stats['hits']} aciertos, {stats['misses']} fallos, "
+            f"{stats['collisions']} colisiones, {stats['size']} entradas"
+        )
+
+
+if __name__ == "__main__":
+    main()
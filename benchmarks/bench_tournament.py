@@ -0,0 +1,44 @@
+"""
+Benchmark de escalado del torneo multiproceso.
+
+Juega la misma cantidad de partidas con 1, 2, ... N procesos y muestra las
+partidas por segundo y la aceleración respecto de un solo proceso. Como las
+semillas se derivan por partida, todas las corridas juegan exactamente las
+mismas partidas.
+
+Uso:
+    python -m benchmarks.bench_tournament [--games N] [--max-workers W]
+"""
+
+import argparse
+import os
+
+from engine.tournament import run_tournament
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime una tabla con la aceleración.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    print(f"{'Procesos':<10}{'Partidas/s':>12}{'Aceleración':>14}")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        report = run_tournament(
+            args.games,
+            __master_seed__=1,
+            __workers__=workers,
+            __batch_size__=args.batch_size,
+        )
+        speed = report["games_per_second"]
+        baseline = baseline or speed
+        print(f"{workers:<10}{speed:>12.1f}{speed / baseline:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Generador de carga para el servidor de partidas (server.server).
+
+Levanta el servidor en un subproceso (o usa uno ya levantado con --server)
+y lanza miles de clientes asyncio, cada uno con su conexión, que juegan
+partidas completas eligiendo jugadas al azar. Mide la latencia de cada
+pedido (percentiles p50/p95/p99 e histograma, en total y por comando), el
+rendimiento, los errores y la memoria del servidor (VmRSS y VmHWM de
+/proc, en Linux), y escribe un informe JSON.
+
+Para miles de clientes puede hacer falta subir el límite de descriptores
+(ulimit -n): cada cliente usa uno de cada lado. Sin --think-ms cada
+cliente manda el pedido siguiente apenas recibe la respuesta, así que la
+latencia mide la cola del servidor saturado; con una pausa se simulan
+jugadores reales y se mide la latencia a una carga dada.
+
+Uso:
+    python -m benchmarks.load_server [--clients N] [--games G] [--think-ms MS]
+                                     [--server HOST:PORT] [--output ARCHIVO]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+
+# Límites superiores de los intervalos del histograma, en milisegundos.
+BUCKETS_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+def percentile(values, fraction):
+    """
+    Devuelve el percentil de una lista ordenada (rango más cercano).
+    """
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))]
+
+
+def summarize(latencies):
+    """
+    Resume una lista de latencias en segundos: cantidad, media, p50, p95,
+    p99, máximo e histograma, en milisegundos.
+    """
+    values = sorted(1000 * latency for latency in latencies)
+    histogram = {f"<={bound}": 0 for bound in BUCKETS_MS}
+    histogram[f">{BUCKETS_MS[-1]}"] = 0
+    for value in values:
+        for bound in BUCKETS_MS:
+            if value <= bound:
+                histogram[f"<={bound}"] += 1
+                break
+        else:
+            histogram[f">{BUCKETS_MS[-1]}"] += 1
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values) if values else None,
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": values[-1] if values else None,
+        "histogram": histogram,
+    }
+
+
+class Recorder:
+    """
+    Junta las latencias y los errores de todos los clientes.
+    """
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.games = 0
+
+    def record(self, command, latency, ok):
+        """
+        Registra un pedido respondido.
+        """
+        self.latencies.setdefault(command, []).append(latency)
+        if not ok:
+            self.add_error(command)
+
+    def add_error(self, kind):
+        """
+        Registra un error (respuesta con ok falso o falla de conexión).
+        """
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+async def request(reader, writer, message, recorder):
+    """
+    Manda un pedido, espera la respuesta y registra su latencia.
+    """
+    start = time.perf_counter()
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    recorder.record(message["cmd"], time.perf_counter() - start, response.get("ok"))
+    return response
+
+
+async def run_client(address, games, seed, recorder, think=0.0):
+    """
+    Juega partidas completas con jugadas al azar por una conexión propia,
+    esperando hasta think segundos (al azar) antes de cada jugada.
+    """
+    rng = random.Random(seed)
+    try:
+        reader, writer = await asyncio.open_connection(*address)
+    except OSError:
+        recorder.add_error("connect")
+        return
+    try:
+        for game in range(games):
+            state = await request(
+                reader, writer, {"cmd": "new", "seed": seed * 1_000 + game}, recorder
+            )
+            while state.get("ok") and state["winner"] is None:
+                if think:
+                    await asyncio.sleep(rng.uniform(0, think))
+                state = await request(
+                    reader,
+                    writer,
+                    {
+                        "cmd": "play",
+                        "game": state["game"],
+                        "play": rng.randrange(len(state["plays"])),
+                    },
+                    recorder,
+                )
+            if state.get("ok"):
+                await request(
+                    reader, writer, {"cmd": "close", "game": state["game"]}, recorder
+                )
+                recorder.games += 1
+    except (OSError, ValueError):
+        recorder.add_error("connection")
+    finally:
+        writer.close()
+
+
+def start_server():
+    """
+    Levanta el servidor en un subproceso en un puerto libre.
+
+    Returns:
+        tuple: (subproceso, (host, puerto)).
+    """
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-u", "-m", "server.server", "--port", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline().strip()
+    host, port = line.rsplit(" ", 1)[-1].rsplit(":", 1)
+    return process, (host, int(port))
+
+
+def server_memory(pid):
+    """
+    Devuelve la memoria del proceso del servidor en MB (VmRSS y VmHWM), o
+    None si no se puede leer (fuera de Linux o sin subproceso).
+    """
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            fields = dict(line.split(":", 1) for line in status if ":" in line)
+    except OSError:
+        return None
+    return {
+        "rss_mb": int(fields["VmRSS"].split()[0]) / 1024,
+        "peak_rss_mb": int(fields["VmHWM"].split()[0]) / 1024,
+    }
+
+
+async def run_load(address, clients, games, pid=None, think=0.0):
+    """
+    Lanza los clientes contra el servidor y arma el informe.
+    """
+    recorder = Recorder()
+    memory_before = server_memory(pid)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_client(address, games, seed, recorder, think) for seed in range(clients))
+    )
+    seconds = time.perf_counter() - start
+    memory_after = server_memory(pid)
+
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(b'{"cmd": "stats"}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())
+    writer.close()
+
+    everything = [value for values in recorder.latencies.values() for value in values]
+    errors = sum(recorder.errors.values())
+    return {
+        "clients": clients,
+        "think_seconds": think,
+        "games": recorder.games,
+        "requests": len(everything),
+        "errors": dict(recorder.errors),
+        "error_rate": errors / max(len(everything), 1),
+        "seconds": seconds,
+        "requests_per_second": len(everything) / seconds,
+        "moves_per_second": len(recorder.latencies.get("play", ())) / seconds,
+        "latency_ms": {
+            "all": summarize(everything),
+            **{
+                command: summarize(values)
+                for command, values in sorted(recorder.latencies.items())
+            },
+        },
+        "server": {
+            "memory_before": memory_before,
+            "memory_after": memory_after,
+            "stats": stats,
+        },
+    }
+
+
+def main(argv=None):
+    """
+    Ejecuta la carga y escribe el informe JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument(
+        "--think-ms",
+        type=float,
+        default=0.0,
+        help="Pausa máxima antes de cada jugada (por defecto ninguna)",
+    )
+    parser.add_argument("--server", help="HOST:PORT de un servidor ya levantado")
+    parser.add_argument("--output", help="Archivo del informe (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.server:
+        host, port = args.server.rsplit(":", 1)
+        address = (host, int(port))
+    else:
+        process, address = start_server()
+    try:
+        report = asyncio.run(
+            run_load(
+                address,
+                args.clients,
+                args.games,
+                process.pid if process is not None else None,
+                args.think_ms / 1000,
+            )
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,39 @@
 """
 Módulo principal para la interfaz de línea de comandos del juego Backgammon.
+
+Uso:
+    python -m cli.cli [--bot {white,black}] [--budget-ms MS] [--verbose]
+
+Con --bot la computadora juega con ese color, buscando cada jugada con
+engine.policies.AnytimePolicy en el tiempo indicado; con --verbose se
+muestra la profundidad que alcanzó en cada decisión.
 """
 
+import argparse
+import logging
 import random
+import sys
 from core.game import Game
 from core.player import Player
 from core.board import Board
 from core.dice import Dice
+from core.move import BEAR_OFF, REENTRY
+from engine.policies import AnytimePolicy
+
+# Nombre del jugador que maneja la computadora.
+BOT_NAME = "Computadora"
 
 
-def _get_player_names():
-    """Solicita y valida los nombres de los jugadores."""
-    player1_name = ""
+def _get_player_names(bot_color=None):
+    """
+    Solicita y valida los nombres de los jugadores; el del color que maneja
+    la computadora no se pregunta.
+    """
+    player1_name = BOT_NAME if bot_color == "white" else ""
     while not player1_name.strip():
         player1_name = input("Nombre del Jugador 1 (fichas blancas): ")
 
-    player2_name = ""
+    player2_name = BOT_NAME if bot_color == "black" else ""
     while not player2_name.strip():
         player2_name = input("Nombre del Jugador 2 (fichas negras): ")
 
@@ -47,46 +65,68 @@ def _decide_first_player(player1_name, player2_name):
             input("Presiona Enter para tirar de nuevo...")
 
 
+def _format_move(move):
+    """
+    Convierte un Move en el texto mostrado al usuario, ajustando la
+    numeración interna (0-23) a la mostrada al usuario (1-24).
+    """
+    if move.__kind__ == BEAR_OFF:
+        return f"Sacar {move.__from_pos__ + 1}"
+    if move.__kind__ == REENTRY:
+        return f"Barra a {move.__to_pos__ + 1}"
+    return f"{move.__from_pos__ + 1} a {move.__to_pos__ + 1}"
+
+
 def _display_possible_moves(moves):
     """
-    Muestra la lista de movimientos posibles, ajustando la numeración
-    interna (0-23) a la mostrada al usuario (1-24).
+    Muestra la lista de movimientos posibles (objetos Move) con la
+    numeración del usuario.
     """
     if not moves:
         return
 
     print("Movimientos posibles:")
     for i, move in enumerate(moves, 1):
-        if move.startswith("sacar"):
-            # El formato "sacar [número]" ya es amigable para el usuario
-            print(f"{i}) {move.capitalize()}")
-        elif " a " in move:
-            parts = move.split(" a ")
-            from_str = parts[0]
-            to_str = parts[1]
-
-            display_move = ""
-            if from_str == "Barra":
-                # Reingreso desde la barra
-                to_pos = int(to_str) + 1
-                display_move = f"Barra a {to_pos}"
-            else:
-                # Movimiento normal
-                from_pos = int(from_str) + 1
-                display_to = str(int(to_str) + 1)
-                display_move = f"{from_pos} a {display_to}"
-
-            print(f"{i}) {display_move}")
-
-
-def main():
+        print(f"{i}) {_format_move(move)}")
+
+
+def _play_bot_turn(game, bot):
+    """
+    Juega el turno completo de la computadora y tira los dados del rival.
+    """
+    candidates = game.get_legal_plays_with_positions()
+    name = game.get_current_player().get_player_name()
+    if not candidates:
+        print(f"{name} no tiene movimientos posibles.")
+        game.switch_turn()
+        return
+    play = bot.choose_play(game, candidates)
+    print(f"{name} juega: {', '.join(_format_move(move) for move in play)}")
+    game.apply_play(play)
+    if not game.is_over():
+        game.roll_dice()
+
+
+def main(argv=()):
     """
     La función principal para el juego de Backgammon en CLI.
+
+    Args:
+        argv (list, opcional): Los argumentos de la línea de comandos.
     """
+    parser = argparse.ArgumentParser(description="Backgammon en la terminal.")
+    parser.add_argument("--bot", choices=("white", "black"))
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(list(argv))
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+    bot = AnytimePolicy(args.budget_ms / 1000) if args.bot else None
+
     print("¡Bienvenido a Backgammon CLI!")
 
     # 1. Obtener nombres de los jugadores
-    player1_name, player2_name = _get_player_names()
+    player1_name, player2_name = _get_player_names(args.bot)
 
     # 2. Decidir quién empieza
     first_player_idx = _decide_first_player(player1_name, player2_name)
@@ -123,7 +163,11 @@ def main():
 
         __game__.display_board()
 
-        __possible_moves__ = __game__.get_possible_moves()
+        if bot is not None and __current_player__.__color__ == args.bot:
+            _play_bot_turn(__game__, bot)
+            continue
+
+        __possible_moves__ = __game__.generate_moves()
         if not __possible_moves__:
             print("No tienes movimientos posibles. El turno pasa al siguiente jugador.")
             __game__.switch_turn()
@@ -191,4 +235,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
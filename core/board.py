@@ -12,9 +12,175 @@ Board
 """
 
 from core.checker import Checker
+from core.position_id import encode_position_id
+from core.zobrist import STEP_KEYS, fold_bar_and_off, hash_counts
+
+# Distancia a la salida (pips) de una ficha de cada color en cada punto.
+PIP_DISTANCE = {
+    "white": tuple(24 - __index__ for __index__ in range(24)),
+    "black": tuple(__index__ + 1 for __index__ in range(24)),
+}
+# Máscaras de 24 bits del cuadrante de casa de cada color.
+HOME_MASK = {"white": 0x3F << 18, "black": 0x3F}
+# Pips de una ficha en la barra.
+BAR_PIPS = 25
+# Máscara con los 24 puntos del tablero.
+ALL_POINTS = (1 << 24) - 1
+OPPONENT = {"white": "black", "black": "white"}
+
+# Operaciones de lista sin aviso, para los cambios que hace el propio tablero.
+_pop = list.pop
+_append = list.append
+
+
+def tally_counts(__counts__, __color__):
+    """
+    Calcula desde cero los contadores de un color a partir de los conteos.
+
+    Args:
+        __counts__ (list): Los conteos con signo en el formato de get_counts().
+        __color__ (str): El color de las fichas.
+
+    Returns:
+        tuple: (pips en los puntos, fichas fuera de casa, máscara de puntos
+               ocupados, máscara de puntos hechos con 2 fichas o más).
+    """
+    __sign__ = 1 if __color__ == "white" else -1
+    __distance__ = PIP_DISTANCE[__color__]
+    __home__ = HOME_MASK[__color__]
+    __pips__ = __outside__ = __occupied__ = __made__ = 0
+    for __index__ in range(24):
+        __value__ = __counts__[__index__] * __sign__
+        if __value__ > 0:
+            __pips__ += __value__ * __distance__[__index__]
+            __occupied__ |= 1 << __index__
+            if __value__ > 1:
+                __made__ |= 1 << __index__
+            if not __home__ >> __index__ & 1:
+                __outside__ += __value__
+    return __pips__, __outside__, __occupied__, __made__
+
+
+def masks_in_contact(__white_mask__, __black_mask__):
+    """
+    Indica si hay contacto según las máscaras de puntos ocupados.
+
+    Hay contacto mientras alguna ficha blanca (que avanza hacia el punto 23)
+    esté detrás de alguna negra (que avanza hacia el punto 0), es decir, si
+    la ficha blanca más atrasada está en un punto menor que la negra más
+    atrasada. Sin contacto la partida es una carrera pura.
+
+    Args:
+        __white_mask__ (int): La máscara de puntos ocupados por las blancas.
+        __black_mask__ (int): La máscara de puntos ocupados por las negras.
+
+    Returns:
+        bool: True si las fichas todavía pueden golpearse o bloquearse.
+    """
+    if not __black_mask__:
+        return False
+    return bool(__white_mask__ & ((1 << (__black_mask__.bit_length() - 1)) - 1))
+
+
+def counts_in_contact(__counts__):
+    """
+    Indica si hay contacto en una posición dada como conteos con signo.
+
+    Args:
+        __counts__ (list): Los conteos en el formato de get_counts().
+
+    Returns:
+        bool: True si hay fichas en la barra o alguna blanca está detrás de
+              alguna negra.
+    """
+    if __counts__[24] or __counts__[25]:
+        return True
+    for __index__ in range(24):
+        if __counts__[__index__] > 0:
+            return any(__value__ < 0 for __value__ in __counts__[__index__ + 1 : 24])
+    return False
+
+
+class _TrackedPoint(list):
+    """
+    Fichas de un punto que avisan al tablero cuando se modifican desde
+    afuera, para que el estado incremental se recalcule.
+    """
+
+    __slots__ = ("__board__",)
+
+    def __init__(self, __board__, __checkers__=()):
+        super().__init__(__checkers__)
+        self.__board__ = __board__
+
+    def _touch(self):
+        """Marca el tablero para recalcular su estado incremental."""
+        self.__board__.__dirty__ = True
+
+    def append(self, __checker__):
+        """Agrega una ficha al punto."""
+        super().append(__checker__)
+        self._touch()
+
+    def extend(self, __checkers__):
+        """Agrega varias fichas al punto."""
+        super().extend(__checkers__)
+        self._touch()
+
+    def insert(self, __index__, __checker__):
+        """Inserta una ficha en el punto."""
+        super().insert(__index__, __checker__)
+        self._touch()
+
+    def pop(self, __index__=-1):
+        """Quita y devuelve una ficha del punto."""
+        __checker__ = super().pop(__index__)
+        self._touch()
+        return __checker__
+
+    def remove(self, __checker__):
+        """Quita una ficha del punto."""
+        super().remove(__checker__)
+        self._touch()
+
+    def clear(self):
+        """Vacía el punto."""
+        super().clear()
+        self._touch()
+
+    def __setitem__(self, __index__, __value__):
+        super().__setitem__(__index__, __value__)
+        self._touch()
+
+    def __delitem__(self, __index__):
+        super().__delitem__(__index__)
+        self._touch()
+
+    def __iadd__(self, __checkers__):
+        self.extend(__checkers__)
+        return self
+
+
+class _TrackedPoints(list):
+    """
+    Lista de los 24 puntos que avisa al tablero cuando un punto se reasigna
+    directamente, para que el estado incremental se recalcule.
+    """
+
+    __slots__ = ("__board__",)
+
+    def __init__(self, __board__, __points__):
+        super().__init__(
+            _TrackedPoint(__board__, __point__) for __point__ in __points__
+        )
+        self.__board__ = __board__
+
+    def __setitem__(self, __index__, __value__):
+        super().__setitem__(__index__, _TrackedPoint(self.__board__, __value__))
+        self.__board__.__dirty__ = True
 
 
-class Board:
+class Board:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     Representa el tablero de Backgammon.
 
@@ -25,15 +191,33 @@ class Board:
                              de cada color.
         __home__ (dict): Un diccionario que almacena las fichas que han salido
                          del tablero para cada color.
+        __zobrist__ (int): El hash Zobrist de los puntos, mantenido en cada
+                           movimiento.
+        __pips__ (dict): La cuenta de pips de las fichas en los puntos de
+                         cada color.
+        __outside__ (dict): La cantidad de fichas de cada color en los puntos
+                            fuera de su cuadrante de casa.
+        __occupied__ (dict): Máscara de 24 bits con los puntos ocupados por
+                             cada color.
+        __made__ (dict): Máscara de 24 bits con los puntos de cada color que
+                         tienen 2 fichas o más.
+        __dirty__ (bool): Indica que un punto fue modificado desde afuera y
+                          el estado incremental debe recalcularse.
     """
 
     def __init__(self):
         """
         Inicializa el tablero con la posición de inicio estándar.
         """
-        self.__points__ = [[] for _ in range(24)]
+        self.__points__ = _TrackedPoints(self, [[] for _ in range(24)])
         self.__captured__ = {"white": [], "black": []}
         self.__home__ = {"white": [], "black": []}
+        self.__zobrist__ = 0
+        self.__pips__ = {"white": 0, "black": 0}
+        self.__outside__ = {"white": 0, "black": 0}
+        self.__occupied__ = {"white": 0, "black": 0}
+        self.__made__ = {"white": 0, "black": 0}
+        self.__dirty__ = True
         self.__setup_initial_position__()
 
     def __setup_initial_position__(self):
@@ -60,26 +244,19 @@ class Board:
         """
         if not (0 <= __from_point__ < 24 and 0 <= __to_point__ < 24):
             raise IndexError("El punto está fuera de los límites del tablero")
-        if not self.__points__[__from_point__]:
+        self._refresh()
+        __opponent__ = OPPONENT[__color__]
+        if not self.__occupied__[__color__] >> __from_point__ & 1:
+            if self.__occupied__[__opponent__] >> __from_point__ & 1:
+                raise ValueError("No hay ficha de este color en el punto de origen")
             raise ValueError("No hay ficha en el punto de origen")
-        if self.__points__[__from_point__][-1].__color__ != __color__:
-            raise ValueError("No hay ficha de este color en el punto de origen")
-        if (
-            len(self.__points__[__to_point__]) > 1
-            and self.__points__[__to_point__][-1].__color__ != __color__
-        ):
+        if self.__made__[__opponent__] >> __to_point__ & 1:
             raise ValueError("No se puede mover a un punto bloqueado")
 
-        checker = self.__points__[__from_point__].pop()
+        checker = _pop(self.__points__[__from_point__])
+        self._update_point(__color__, __from_point__, -1)
 
-        if (
-            len(self.__points__[__to_point__]) == 1
-            and self.__points__[__to_point__][-1].__color__ != __color__
-        ):
-            captured = self.__points__[__to_point__].pop()
-            self.__captured__[captured.__color__].append(captured)
-
-        self.__points__[__to_point__].append(checker)
+        self._land(checker, __to_point__)
 
     def bear_off(self, __color__, __from_point__):
         """
@@ -89,12 +266,11 @@ class Board:
             __color__ (str): El color de la ficha a sacar.
             __from_point__ (int): El punto desde el cual se saca la ficha.
         """
-        if (
-            not self.__points__[__from_point__]
-            or self.__points__[__from_point__][-1].__color__ != __color__
-        ):
+        self._refresh()
+        if not self.__occupied__[__color__] >> __from_point__ & 1:
             raise ValueError("No hay una ficha de este color en el punto de origen")
-        checker = self.__points__[__from_point__].pop()
+        checker = _pop(self.__points__[__from_point__])
+        self._update_point(__color__, __from_point__, -1)
         self.__home__[__color__].append(checker)
 
     def enter_from_captured(self, __color__, __to_point__):
@@ -107,22 +283,105 @@ class Board:
         """
         if not self.__captured__[__color__]:
             raise ValueError("No hay fichas en la barra")
-        if (
-            len(self.__points__[__to_point__]) > 1
-            and self.__points__[__to_point__][-1].__color__ != __color__
-        ):
+        self._refresh()
+        if self.__made__[OPPONENT[__color__]] >> __to_point__ & 1:
             raise ValueError("No se puede ingresar a un punto bloqueado")
 
         checker = self.__captured__[__color__].pop()
 
-        if (
-            len(self.__points__[__to_point__]) == 1
-            and self.__points__[__to_point__][-1].__color__ != __color__
-        ):
-            captured = self.__points__[__to_point__].pop()
-            self.__captured__[captured.__color__].append(captured)
+        self._land(checker, __to_point__)
+
+    def return_to_bar(self, __color__, __from_point__):
+        """
+        Devuelve a la barra una ficha del tablero, sin capturas.
+
+        Se usa para deshacer un reingreso.
+
+        Args:
+            __color__ (str): El color de la ficha.
+            __from_point__ (int): El punto donde está la ficha.
+        """
+        self._refresh()
+        if not self.__occupied__[__color__] >> __from_point__ & 1:
+            raise ValueError("No hay una ficha de este color en el punto de origen")
+        checker = _pop(self.__points__[__from_point__])
+        self._update_point(__color__, __from_point__, -1)
+        self.__captured__[__color__].append(checker)
+
+    def return_from_home(self, __color__, __to_point__):
+        """
+        Devuelve al tablero una ficha retirada, sin capturas.
+
+        Se usa para deshacer un bear-off.
+
+        Args:
+            __color__ (str): El color de la ficha.
+            __to_point__ (int): El punto al que vuelve la ficha.
+        """
+        if not self.__home__[__color__]:
+            raise ValueError("No hay fichas retiradas de este color")
+        self._refresh()
+        if self.__occupied__[OPPONENT[__color__]] >> __to_point__ & 1:
+            raise ValueError("El punto de destino está ocupado por el rival")
+        checker = self.__home__[__color__].pop()
+        _append(self.__points__[__to_point__], checker)
+        self._update_point(__color__, __to_point__, 1)
+
+    def _land(self, __checker__, __to_point__):
+        """
+        Coloca una ficha en un punto, enviando a la barra un blot rival si lo hay.
+
+        Args:
+            __checker__ (Checker): La ficha que llega al punto.
+            __to_point__ (int): El punto de destino.
+        """
+        __point__ = self.__points__[__to_point__]
+        __opponent__ = OPPONENT[__checker__.__color__]
+        if self.__occupied__[__opponent__] >> __to_point__ & 1:
+            captured = _pop(__point__)
+            self._update_point(__opponent__, __to_point__, -1)
+            self.__captured__[__opponent__].append(captured)
 
-        self.__points__[__to_point__].append(checker)
+        _append(__point__, __checker__)
+        self._update_point(__checker__.__color__, __to_point__, 1)
+
+    def _update_point(self, __color__, __index__, __delta__):
+        """
+        Actualiza el hash Zobrist, los contadores y las máscaras tras cambiar
+        la cantidad de fichas de un punto.
+
+        Args:
+            __color__ (str): El color de las fichas del punto.
+            __index__ (int): El índice del punto.
+            __delta__ (int): La variación de fichas (+1 o -1) ya aplicada.
+        """
+        __after__ = len(self.__points__[__index__])
+        __low__ = __after__ - 1 if __delta__ > 0 else __after__
+        self.__zobrist__ ^= STEP_KEYS[__color__][__index__][__low__]
+        self.__pips__[__color__] += __delta__ * PIP_DISTANCE[__color__][__index__]
+        if not HOME_MASK[__color__] >> __index__ & 1:
+            self.__outside__[__color__] += __delta__
+        # El punto pasa entre 0 y 1 fichas (ocupado) o entre 1 y 2 (hecho).
+        if __low__ == 0:
+            self.__occupied__[__color__] ^= 1 << __index__
+        elif __low__ == 1:
+            self.__made__[__color__] ^= 1 << __index__
+
+    def _refresh(self):
+        """
+        Recalcula el estado incremental si algún punto se modificó desde afuera.
+        """
+        if self.__dirty__:
+            __counts__ = self.get_counts()
+            self.__zobrist__ = hash_counts(__counts__)
+            for __color__ in ("white", "black"):
+                (
+                    self.__pips__[__color__],
+                    self.__outside__[__color__],
+                    self.__occupied__[__color__],
+                    self.__made__[__color__],
+                ) = tally_counts(__counts__, __color__)
+            self.__dirty__ = False
 
     def get_point(self, __index__):
         """
@@ -160,6 +419,19 @@ class Board:
         """
         return self.__home__[__color__]
 
+    def get_point_owner(self, __index__):
+        """
+        Devuelve el color de las fichas de un punto, o None si está vacío.
+
+        Args:
+            __index__ (int): El índice del punto.
+
+        Returns:
+            str: El color dueño del punto o None.
+        """
+        __point__ = self.__points__[__index__]
+        return __point__[-1].__color__ if __point__ else None
+
     def get_point_count(self, __index__):
         """
         Devuelve el número de fichas en un punto dado.
@@ -172,6 +444,166 @@ class Board:
         """
         return len(self.__points__[__index__])
 
+    def get_bar_count(self, __color__):
+        """
+        Devuelve la cantidad de fichas de un color en la barra.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: Las fichas capturadas.
+        """
+        return len(self.__captured__[__color__])
+
+    def get_off_count(self, __color__):
+        """
+        Devuelve la cantidad de fichas de un color retiradas del tablero.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: Las fichas retiradas.
+        """
+        return len(self.__home__[__color__])
+
+    def get_outside_count(self, __color__):
+        """
+        Devuelve la cantidad de fichas de un color en los puntos fuera de su
+        cuadrante de casa, sin contar la barra.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: Las fichas fuera de casa.
+        """
+        self._refresh()
+        return self.__outside__[__color__]
+
+    def get_pip_count(self, __color__):
+        """
+        Devuelve la cuenta de pips de un color, incluidas las fichas en la barra.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La suma de las distancias a la salida de sus fichas.
+        """
+        self._refresh()
+        return self.__pips__[__color__] + BAR_PIPS * len(self.__captured__[__color__])
+
+    def get_occupied_mask(self, __color__):
+        """
+        Devuelve la máscara de 24 bits de los puntos ocupados por un color.
+
+        El bit i está activo si el punto i tiene fichas de ese color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La máscara de puntos ocupados.
+        """
+        self._refresh()
+        return self.__occupied__[__color__]
+
+    def get_made_mask(self, __color__):
+        """
+        Devuelve la máscara de 24 bits de los puntos hechos (2 fichas o más)
+        de un color, es decir, los puntos bloqueados para el rival.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La máscara de puntos hechos.
+        """
+        self._refresh()
+        return self.__made__[__color__]
+
+    def get_blot_mask(self, __color__):
+        """
+        Devuelve la máscara de 24 bits de los puntos con una sola ficha de un color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La máscara de blots.
+        """
+        self._refresh()
+        return self.__occupied__[__color__] & ~self.__made__[__color__]
+
+    def has_contact(self):
+        """
+        Indica si las fichas de ambos colores todavía pueden encontrarse.
+
+        Se calcula a partir de las máscaras de puntos ocupados, que se
+        mantienen en cada movimiento, sin recorrer el tablero.
+
+        Returns:
+            bool: False si la partida es una carrera pura.
+        """
+        self._refresh()
+        return bool(
+            self.__captured__["white"] or self.__captured__["black"]
+        ) or masks_in_contact(self.__occupied__["white"], self.__occupied__["black"])
+
+    def get_counts(self):
+        """
+        Devuelve la posición como una lista de 28 conteos con signo.
+
+        Los índices 0-23 son los puntos (positivo = blancas, negativo = negras),
+        24/25 la barra de blancas/negras y 26/27 las fichas retiradas de
+        blancas/negras, igual que en CompactBoard.
+
+        Returns:
+            list: Los conteos de la posición.
+        """
+        __counts__ = []
+        for __point__ in self.__points__:
+            if not __point__:
+                __counts__.append(0)
+            elif __point__[-1].__color__ == "white":
+                __counts__.append(len(__point__))
+            else:
+                __counts__.append(-len(__point__))
+        __counts__.append(len(self.__captured__["white"]))
+        __counts__.append(len(self.__captured__["black"]))
+        __counts__.append(len(self.__home__["white"]))
+        __counts__.append(len(self.__home__["black"]))
+        return __counts__
+
+    def get_position_id(self, __color__):
+        """
+        Devuelve la Position ID de GNU Backgammon de la posición.
+
+        Args:
+            __color__ (str): El color que tiene el turno.
+
+        Returns:
+            str: Los 14 caracteres de la Position ID.
+        """
+        return encode_position_id(self.get_counts(), __color__)
+
+    @property
+    def zobrist_hash(self):
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición en O(1).
+
+        La parte de los puntos se mantiene en cada movimiento; la barra y las
+        fichas retiradas se combinan a partir de sus conteos al leerlo.
+        """
+        self._refresh()
+        return fold_bar_and_off(
+            self.__zobrist__,
+            (len(self.__captured__["white"]), len(self.__captured__["black"])),
+            (len(self.__home__["white"]), len(self.__home__["black"])),
+        )
+
     def get_2d_representation(self):
         """
         Genera una representación en cadena de texto en 2D del tablero de Backgammon.
@@ -205,15 +637,15 @@ class Board:
         for i in range(6):  # 0-4 para fichas, 5 para contadores
             line = ""
             for p in range(11, 5, -1):
-                line += _get_point_string(self.__points__[p], i)
+                line += _get_point_string(self.get_point(p), i)
             line += "|     |"
             for p in range(5, -1, -1):
-                line += _get_point_string(self.__points__[p], i)
+                line += _get_point_string(self.get_point(p), i)
             board_str += line + "\n"
 
         # Barra central con conteo de fichas capturadas
-        white_captured = len(self.__captured__["white"])
-        black_captured = len(self.__captured__["black"])
+        white_captured = len(self.get_captured("white"))
+        black_captured = len(self.get_captured("black"))
         bar_display = f"B:{white_captured} N:{black_captured}"
         board_str += (
             f"                     |{bar_display.center(5)}|                     \n"
@@ -223,10 +655,10 @@ class Board:
         for i in range(5, -1, -1):  # 5 para contadores, 4-0 para fichas
             line = ""
             for p in range(12, 18):
-                line += _get_point_string(self.__points__[p], i)
+                line += _get_point_string(self.get_point(p), i)
             line += "|     |"
             for p in range(18, 24):
-                line += _get_point_string(self.__points__[p], i)
+                line += _get_point_string(self.get_point(p), i)
             board_str += line + "\n"
 
         # Pie de página
@@ -234,8 +666,8 @@ class Board:
         board_str += f"{bottom_header} |     | {bottom_footer}\n"
 
         # Conteo de fichas en casa
-        white_home = len(self.__home__["white"])
-        black_home = len(self.__home__["black"])
+        white_home = len(self.get_home("white"))
+        black_home = len(self.get_home("black"))
         board_str += f"\nFichas en casa - Blancas: {white_home}, Negras: {black_home}\n"
 
         return board_str
@@ -0,0 +1,513 @@
+"""
+Módulo que define un tablero compacto de Backgammon basado en conteos con signo.
+
+Este módulo contiene la clase CompactBoard, una alternativa a Board que
+representa la posición completa como una lista fija de enteros con signo
+en lugar de listas de objetos Checker. Expone la misma interfaz pública que
+Board, por lo que Game puede utilizarla sin cambios.
+
+Disposición de la lista (28 casillas):
+
+- 0..23: puntos del tablero. Valor positivo = fichas blancas,
+  valor negativo = fichas negras.
+- 24 / 25: fichas en la barra de blancas / negras.
+- 26 / 27: fichas retiradas (fuera del tablero) de blancas / negras.
+
+Classes
+-------
+CompactBoard
+    Representa el tablero de juego como una lista de conteos con signo
+"""
+
+from core.board import (
+    BAR_PIPS,
+    HOME_MASK,
+    OPPONENT,
+    PIP_DISTANCE,
+    Board,
+    masks_in_contact,
+    tally_counts,
+)
+from core.checker import Checker
+from core.position_id import decode_position_id, encode_position_id
+from core.zobrist import STEP_KEYS, fold_bar_and_off, hash_counts
+
+POINTS = 24
+SLOTS = 28
+BAR = {"white": 24, "black": 25}
+OFF = {"white": 26, "black": 27}
+SIGN = {"white": 1, "black": -1}
+SIDE = {"white": 0, "black": 1}
+
+# Contadores guardados tras las 28 casillas: pips en los puntos, fichas fuera
+# de casa, máscara de ocupados y máscara de puntos hechos, cada uno con el
+# valor de blancas seguido por el de negras. move_checker usa los índices
+# literales por velocidad.
+_PIPS = 28
+_OUTSIDE = 30
+_OCCUPIED = 32
+_MADE = 34
+
+# Fichas compartidas que se usan sólo para construir las vistas de lectura.
+_VIEW_CHECKERS = {"white": Checker("white"), "black": Checker("black")}
+
+_INITIAL_COUNTS = (
+    (2, 0, 0, 0, 0, -5, 0, -3, 0, 0, 0, 5)
+    + (-5, 0, 0, 0, 3, 0, 5, 0, 0, 0, 0, -2)
+    + (0, 0, 0, 0)
+)
+
+
+def _with_tallies(__counts__):
+    """Devuelve los 28 conteos seguidos de los contadores de ambos colores."""
+    __white__ = tally_counts(__counts__, "white")
+    __black__ = tally_counts(__counts__, "black")
+    return list(__counts__[:SLOTS]) + [
+        __value__ for __pair__ in zip(__white__, __black__) for __value__ in __pair__
+    ]
+
+
+class CompactBoard:  # pylint: disable=too-many-public-methods
+    """
+    Representa el tablero de Backgammon como una lista de conteos con signo.
+
+    Atributos:
+        __counts__ (list): Lista de 28 enteros con signo con los conteos
+                           de los puntos, la barra y las fichas retiradas,
+                           seguidos por los contadores de pips, fichas fuera
+                           de casa y puntos ocupados de cada color.
+        __zobrist__ (int): El hash Zobrist de los puntos, mantenido en cada
+                           movimiento.
+    """
+
+    __slots__ = ("__counts__", "__zobrist__")
+
+    def __init__(self):
+        """
+        Inicializa el tablero con la posición de inicio estándar.
+        """
+        self.__counts__ = _with_tallies(_INITIAL_COUNTS)
+        self.__zobrist__ = hash_counts(self.__counts__)
+
+    @classmethod
+    def from_counts(cls, __counts__):
+        """
+        Crea un tablero compacto a partir de una lista de 28 conteos con signo.
+
+        Args:
+            __counts__ (list): Los conteos en el formato de get_counts().
+
+        Returns:
+            CompactBoard: Un tablero compacto con esa posición.
+        """
+        __compact__ = cls.__new__(cls)
+        __compact__.__counts__ = _with_tallies(__counts__)
+        __compact__.__zobrist__ = hash_counts(__compact__.__counts__)
+        return __compact__
+
+    @classmethod
+    def from_position_id(cls, __position_id__, __color__):
+        """
+        Crea un tablero compacto a partir de una Position ID de GNU Backgammon.
+
+        Args:
+            __position_id__ (str): Los 14 caracteres de la Position ID.
+            __color__ (str): El color que tiene el turno.
+
+        Returns:
+            CompactBoard: Un tablero compacto con esa posición.
+
+        Raises:
+            ValueError: Si la Position ID no es válida.
+        """
+        return cls.from_counts(decode_position_id(__position_id__, __color__))
+
+    @classmethod
+    def from_board(cls, __board__):
+        """
+        Crea un tablero compacto a partir de cualquier tablero compatible.
+
+        Args:
+            __board__ (Board): El tablero de origen.
+
+        Returns:
+            CompactBoard: Un tablero compacto con la misma posición.
+        """
+        return cls.from_counts(__board__.get_counts())
+
+    def copy(self):
+        """
+        Devuelve una copia independiente del tablero.
+
+        Returns:
+            CompactBoard: La copia del tablero.
+        """
+        __clone__ = CompactBoard.__new__(CompactBoard)
+        __clone__.__counts__ = self.__counts__[:]
+        __clone__.__zobrist__ = self.__zobrist__
+        return __clone__
+
+    def move_checker(self, __color__, __from_point__, __to_point__):
+        """
+        Mueve una ficha de un punto a otro.
+
+        Args:
+            __color__ (str): El color de la ficha a mover.
+            __from_point__ (int): El punto de partida.
+            __to_point__ (int): El punto de destino.
+        """
+        if not (0 <= __from_point__ < 24 and 0 <= __to_point__ < 24):
+            raise IndexError("El punto está fuera de los límites del tablero")
+        __counts__ = self.__counts__
+        __sign__ = 1 if __color__ == "white" else -1
+        __value__ = __counts__[__from_point__] * __sign__
+        if not __value__:
+            raise ValueError("No hay ficha en el punto de origen")
+        if __value__ < 0:
+            raise ValueError("No hay ficha de este color en el punto de origen")
+        __target__ = __counts__[__to_point__] * __sign__
+        if __target__ < -1:
+            raise ValueError("No se puede mover a un punto bloqueado")
+        if __from_point__ == __to_point__:
+            return
+
+        __side__ = 0 if __sign__ > 0 else 1
+        __counts__[28 + __side__] += (__from_point__ - __to_point__) * __sign__
+        __home__ = HOME_MASK[__color__]
+        if (__home__ >> __from_point__ ^ __home__ >> __to_point__) & 1:
+            __counts__[30 + __side__] += 1 if __home__ >> __from_point__ & 1 else -1
+        if __value__ <= 2:
+            __counts__[(32 if __value__ == 1 else 34) + __side__] ^= 1 << __from_point__
+        if __target__ == -1:
+            self._capture(OPPONENT[__color__], __to_point__)
+            __target__ = 0
+        if __target__ <= 1:
+            __counts__[(32 if __target__ == 0 else 34) + __side__] ^= 1 << __to_point__
+
+        __keys__ = STEP_KEYS[__color__]
+        __counts__[__from_point__] -= __sign__
+        __counts__[__to_point__] += __sign__
+        self.__zobrist__ ^= (
+            __keys__[__from_point__][__value__ - 1] ^ __keys__[__to_point__][__target__]
+        )
+
+    def bear_off(self, __color__, __from_point__):
+        """
+        Saca una ficha del tablero.
+
+        Args:
+            __color__ (str): El color de la ficha a sacar.
+            __from_point__ (int): El punto desde el cual se saca la ficha.
+        """
+        if self.__counts__[__from_point__] * SIGN[__color__] <= 0:
+            raise ValueError("No hay una ficha de este color en el punto de origen")
+        self._step(__color__, __from_point__, -1)
+        self.__counts__[OFF[__color__]] += 1
+
+    def enter_from_captured(self, __color__, __to_point__):
+        """
+        Reingresa una ficha capturada al tablero.
+
+        Args:
+            __color__ (str): El color de la ficha a reingresar.
+            __to_point__ (int): El punto al que se reingresa la ficha.
+        """
+        __counts__ = self.__counts__
+        __sign__ = SIGN[__color__]
+        if not __counts__[BAR[__color__]]:
+            raise ValueError("No hay fichas en la barra")
+        __target__ = __counts__[__to_point__] * __sign__
+        if __target__ < -1:
+            raise ValueError("No se puede ingresar a un punto bloqueado")
+
+        __counts__[BAR[__color__]] -= 1
+        if __target__ == -1:
+            self._capture(OPPONENT[__color__], __to_point__)
+        self._step(__color__, __to_point__, 1)
+
+    def return_to_bar(self, __color__, __from_point__):
+        """
+        Devuelve a la barra una ficha del tablero, sin capturas.
+
+        Se usa para deshacer un reingreso.
+
+        Args:
+            __color__ (str): El color de la ficha.
+            __from_point__ (int): El punto donde está la ficha.
+        """
+        if self.__counts__[__from_point__] * SIGN[__color__] <= 0:
+            raise ValueError("No hay una ficha de este color en el punto de origen")
+        self._step(__color__, __from_point__, -1)
+        self.__counts__[BAR[__color__]] += 1
+
+    def return_from_home(self, __color__, __to_point__):
+        """
+        Devuelve al tablero una ficha retirada, sin capturas.
+
+        Se usa para deshacer un bear-off.
+
+        Args:
+            __color__ (str): El color de la ficha.
+            __to_point__ (int): El punto al que vuelve la ficha.
+        """
+        if not self.__counts__[OFF[__color__]]:
+            raise ValueError("No hay fichas retiradas de este color")
+        if self.__counts__[__to_point__] * SIGN[__color__] < 0:
+            raise ValueError("El punto de destino está ocupado por el rival")
+        self.__counts__[OFF[__color__]] -= 1
+        self._step(__color__, __to_point__, 1)
+
+    def _step(self, __color__, __index__, __delta__):
+        """
+        Suma o resta una ficha de un punto y actualiza el hash y los contadores.
+
+        Args:
+            __color__ (str): El color de la ficha.
+            __index__ (int): El índice del punto.
+            __delta__ (int): +1 para agregar la ficha, -1 para quitarla.
+        """
+        __counts__ = self.__counts__
+        __sign__ = SIGN[__color__]
+        __before__ = __counts__[__index__] * __sign__
+        __after__ = __before__ + __delta__
+        __counts__[__index__] += __delta__ * __sign__
+        self.__zobrist__ ^= STEP_KEYS[__color__][__index__][min(__before__, __after__)]
+        __side__ = SIDE[__color__]
+        __counts__[_PIPS + __side__] += __delta__ * PIP_DISTANCE[__color__][__index__]
+        if not HOME_MASK[__color__] >> __index__ & 1:
+            __counts__[_OUTSIDE + __side__] += __delta__
+        __low__ = min(__before__, __after__)
+        if __low__ <= 1:
+            __counts__[(_OCCUPIED if __low__ == 0 else _MADE) + __side__] ^= (
+                1 << __index__
+            )
+
+    def _capture(self, __color__, __index__):
+        """
+        Envía a la barra el blot de un color que está en un punto.
+
+        Args:
+            __color__ (str): El color del blot capturado.
+            __index__ (int): El índice del punto.
+        """
+        self._step(__color__, __index__, -1)
+        self.__counts__[BAR[__color__]] += 1
+
+    def get_point(self, __index__):
+        """
+        Devuelve una vista de sólo lectura de las fichas en un punto dado.
+
+        Las fichas de la vista son compartidas; modificar la lista devuelta
+        no altera el tablero.
+
+        Args:
+            __index__ (int): El índice del punto.
+
+        Returns:
+            list: La lista de fichas en el punto.
+        """
+        __color__ = self.get_point_owner(__index__)
+        if __color__ is None:
+            return []
+        return [_VIEW_CHECKERS[__color__]] * abs(self.__counts__[__index__])
+
+    def get_captured(self, __color__):
+        """
+        Devuelve una vista de sólo lectura de las fichas capturadas de un color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            list: La lista de fichas capturadas.
+        """
+        return [_VIEW_CHECKERS[__color__]] * self.__counts__[BAR[__color__]]
+
+    def get_home(self, __color__):
+        """
+        Devuelve una vista de sólo lectura de las fichas retiradas de un color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            list: La lista de fichas que han salido.
+        """
+        return [_VIEW_CHECKERS[__color__]] * self.__counts__[OFF[__color__]]
+
+    def get_point_owner(self, __index__):
+        """
+        Devuelve el color de las fichas de un punto, o None si está vacío.
+
+        Args:
+            __index__ (int): El índice del punto.
+
+        Returns:
+            str: El color dueño del punto o None.
+        """
+        __value__ = self.__counts__[__index__]
+        if __value__ > 0:
+            return "white"
+        if __value__ < 0:
+            return "black"
+        return None
+
+    def get_point_count(self, __index__):
+        """
+        Devuelve el número de fichas en un punto dado.
+
+        Args:
+            __index__ (int): El índice del punto.
+
+        Returns:
+            int: El número de fichas en el punto.
+        """
+        return abs(self.__counts__[__index__])
+
+    def get_bar_count(self, __color__):
+        """
+        Devuelve la cantidad de fichas de un color en la barra.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: Las fichas capturadas.
+        """
+        return self.__counts__[BAR[__color__]]
+
+    def get_off_count(self, __color__):
+        """
+        Devuelve la cantidad de fichas de un color retiradas del tablero.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: Las fichas retiradas.
+        """
+        return self.__counts__[OFF[__color__]]
+
+    def get_outside_count(self, __color__):
+        """
+        Devuelve la cantidad de fichas de un color fuera de su cuadrante de casa,
+        sin contar la barra.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: Las fichas fuera de casa.
+        """
+        return self.__counts__[_OUTSIDE + SIDE[__color__]]
+
+    def get_pip_count(self, __color__):
+        """
+        Devuelve la cuenta de pips de un color, incluidas las fichas en la barra.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La suma de las distancias a la salida de sus fichas.
+        """
+        return (
+            self.__counts__[_PIPS + SIDE[__color__]]
+            + BAR_PIPS * self.__counts__[BAR[__color__]]
+        )
+
+    def get_occupied_mask(self, __color__):
+        """
+        Devuelve la máscara de 24 bits de los puntos ocupados por un color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La máscara de puntos ocupados.
+        """
+        return self.__counts__[_OCCUPIED + SIDE[__color__]]
+
+    def get_made_mask(self, __color__):
+        """
+        Devuelve la máscara de 24 bits de los puntos hechos (2 fichas o más)
+        de un color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La máscara de puntos hechos.
+        """
+        return self.__counts__[_MADE + SIDE[__color__]]
+
+    def get_blot_mask(self, __color__):
+        """
+        Devuelve la máscara de 24 bits de los puntos con una sola ficha de un color.
+
+        Args:
+            __color__ (str): El color de las fichas.
+
+        Returns:
+            int: La máscara de blots.
+        """
+        __side__ = SIDE[__color__]
+        return (
+            self.__counts__[_OCCUPIED + __side__] & ~self.__counts__[_MADE + __side__]
+        )
+
+    def has_contact(self):
+        """
+        Indica si las fichas de ambos colores todavía pueden encontrarse.
+
+        Returns:
+            bool: False si la partida es una carrera pura.
+        """
+        __counts__ = self.__counts__
+        return bool(__counts__[24] or __counts__[25]) or masks_in_contact(
+            __counts__[_OCCUPIED], __counts__[_OCCUPIED + 1]
+        )
+
+    def get_counts(self):
+        """
+        Devuelve una copia de los 28 conteos con signo de la posición.
+
+        Returns:
+            list: Los conteos de la posición.
+        """
+        return self.__counts__[:SLOTS]
+
+    def get_position_id(self, __color__):
+        """
+        Devuelve la Position ID de GNU Backgammon de la posición.
+
+        Args:
+            __color__ (str): El color que tiene el turno.
+
+        Returns:
+            str: Los 14 caracteres de la Position ID.
+        """
+        return encode_position_id(self.__counts__, __color__)
+
+    @property
+    def zobrist_hash(self):
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición en O(1).
+        """
+        __counts__ = self.__counts__
+        return fold_bar_and_off(
+            self.__zobrist__, (__counts__[24], __counts__[25]), __counts__[26:28]
+        )
+
+    def get_2d_representation(self):
+        """
+        Genera la misma representación 2D que Board a partir de las vistas.
+        """
+        return Board.get_2d_representation(self)
+
+    @property
+    def __points_status__(self):
+        """
+        Devuelve una lista de diccionarios con el conteo de fichas en cada punto.
+        """
+        return [{"count": abs(__value__)} for __value__ in self.__counts__[:POINTS]]
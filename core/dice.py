@@ -4,6 +4,12 @@ Módulo que define la clase Dice para los dados del juego.
 Este módulo contiene la implementación de los dados utilizados en Backgammon,
 gestionando las tiradas y la detección de dobles.
 
+Por defecto los dados usan el módulo global random, como siempre. También
+pueden recibir un generador propio (o una semilla, con Dice.seeded) para
+que las simulaciones sean reproducibles, generar las tiradas por bloques
+para no pagar dos llamadas a random.randint por turno, y grabar o
+reproducir una "cinta" con las tiradas para pruebas y depuración.
+
 Classes
 -------
 Dice
@@ -12,22 +18,114 @@ Dice
 
 import random
 
+from core.exceptions import DiceTapeExhaustedException
+
+# Las 36 tiradas posibles; las tiradas por bloques se eligen de esta tabla.
+_ROLLS = tuple(
+    (__first__, __second__) for __first__ in range(1, 7) for __second__ in range(1, 7)
+)
+
 
 class Dice:
     """
     Representa un par de dados para el juego de Backgammon.
+
+    Atributos:
+        __value1__ (int): El valor del primer dado.
+        __value2__ (int): El valor del segundo dado.
+        __rng__ (random.Random): El generador propio, o None para usar el
+                                 módulo global random.
+        __batch_size__ (int): Las tiradas que se generan por bloque; 0 para
+                              tirar de a una.
+        __buffer__ (list): Las tiradas pendientes, en orden inverso.
+        __replay__ (bool): Indica que las tiradas salen de una cinta fija.
+        __tape__ (list): Las tiradas grabadas, o None si no se graba.
     """
 
-    def __init__(self):
+    def __init__(self, __rng__=None, __batch_size__=0):
+        """
+        Inicializa los dados.
+
+        Args:
+            __rng__ (random.Random, opcional): El generador a usar. Por
+                                               defecto el módulo random.
+            __batch_size__ (int, opcional): Si es mayor que 0, las tiradas se
+                                            generan en bloques de ese tamaño.
+        """
         self.__value1__ = None
         self.__value2__ = None
+        self.__rng__ = __rng__
+        self.__batch_size__ = __batch_size__
+        self.__buffer__ = []
+        self.__replay__ = False
+        self.__tape__ = None
+
+    @classmethod
+    def seeded(cls, __seed__, __batch_size__=0):
+        """
+        Crea dados reproducibles a partir de una semilla.
+
+        Args:
+            __seed__ (int): La semilla del generador.
+            __batch_size__ (int, opcional): Las tiradas por bloque.
+
+        Returns:
+            Dice: Los dados.
+        """
+        return cls(random.Random(__seed__), __batch_size__)
+
+    @classmethod
+    def from_tape(cls, __rolls__):
+        """
+        Crea dados que repiten una secuencia fija de tiradas.
+
+        Args:
+            __rolls__ (list): Las tiradas como pares (dado1, dado2), por
+                              ejemplo las devueltas por get_tape().
+
+        Returns:
+            Dice: Los dados.
+        """
+        __dice__ = cls()
+        __dice__.__buffer__ = [tuple(__roll__) for __roll__ in reversed(__rolls__)]
+        __dice__.__replay__ = True
+        return __dice__
 
     def roll(self):
         """
         Lanza los dos dados y guarda sus valores.
         """
-        self.__value1__ = random.randint(1, 6)
-        self.__value2__ = random.randint(1, 6)
+        if self.__buffer__:
+            self.__value1__, self.__value2__ = self.__buffer__.pop()
+        elif self.__replay__:
+            raise DiceTapeExhaustedException("La cinta de dados no tiene más tiradas")
+        elif self.__batch_size__ > 0:
+            __rng__ = self.__rng__ or random
+            self.__buffer__ = __rng__.choices(_ROLLS, k=self.__batch_size__)
+            self.__value1__, self.__value2__ = self.__buffer__.pop()
+        elif self.__rng__ is not None:
+            self.__value1__ = self.__rng__.randint(1, 6)
+            self.__value2__ = self.__rng__.randint(1, 6)
+        else:
+            self.__value1__ = random.randint(1, 6)
+            self.__value2__ = random.randint(1, 6)
+        if self.__tape__ is not None:
+            self.__tape__.append((self.__value1__, self.__value2__))
+
+    def start_recording(self):
+        """
+        Empieza a grabar las tiradas siguientes en una cinta nueva.
+        """
+        self.__tape__ = []
+
+    def get_tape(self):
+        """
+        Devuelve las tiradas grabadas desde start_recording().
+
+        Returns:
+            list: Los pares (dado1, dado2), o una lista vacía si no se graba.
+        """
+        return list(self.__tape__ or [])
 
     def get_values(self):
         """
@@ -21,3 +21,11 @@ class InsufficientDiceException(BackgammonException):
 
 class NoPiecesException(BackgammonException):
     """Excepción para cuando no hay fichas para mover."""
+
+
+class DiceTapeExhaustedException(BackgammonException):
+    """Excepción para cuando una cinta de dados no tiene más tiradas."""
+
+
+class SearchTimeoutException(BackgammonException):
+    """Excepción para cuando una búsqueda supera su tiempo límite."""
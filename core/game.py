@@ -11,19 +11,55 @@ Game
     Clase principal que controla el flujo del juego Backgammon
 """
 
-
-class Game:
+import struct
+
+from core.board import ALL_POINTS, HOME_MASK, OPPONENT
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.journal import GameJournal
+from core.move import BEAR_OFF, NORMAL, REENTRY, Move
+from core.play_generator import enumerate_plays, generate_plays, legal_first_steps
+from core.player import Player
+from core.position_id import (
+    GAME_OVER,
+    GAME_PLAYING,
+    decode_match_id,
+    encode_match_id,
+    encode_position_id,
+)
+from core.zobrist import fold_turn_and_dice
+
+# Registro de deshacer: bits 0-15 el Move codificado (con la captura real),
+# bits 16-18 la posición del dado en __dice_values__ y dos banderas.
+_UNDO_MOVE_MASK = 0xFFFF
+_UNDO_DIE_SHIFT = 16
+_UNDO_SWITCHED = 1 << 19
+_UNDO_WINNER = 1 << 20
+
+# Instantánea de to_bytes(): versión, los 24 puntos con signo, barra y fichas
+# retiradas de cada color, banderas y hasta 4 dados restantes (0 = ninguno).
+# Banderas: bit 0 el turno, bit 1 si el primer jugador es el de negras y
+# bits 2-3 el ganador (0 ninguno, 1 el primer jugador, 2 el segundo).
+SNAPSHOT_VERSION = 1
+_SNAPSHOT = struct.Struct("<B24b4BB4B")
+SNAPSHOT_SIZE = _SNAPSHOT.size
+
+
+class Game:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     Gestiona el flujo de un juego de Backgammon, conectando el tablero, los jugadores y las reglas.
 
     Atributos:
         __players__ (list): Una lista de los dos jugadores en el juego.
         __current_turn__ (int): El índice del jugador actual en la lista __players__.
-        __history__ (list): Un historial de los movimientos realizados en el juego.
+        __history__ (GameJournal): El diario de las tiradas, movimientos y pases
+                                   de turno de la partida.
         __winner__ (Player): El ganador del juego.
         __board__ (Board): El tablero del juego.
         __dice__ (Dice): Los dados utilizados en el juego.
         __dice_values__ (list): Los valores actuales de los dados.
+        __undo_stack__ (list): Registros compactos de los movimientos aplicados
+                               con push_move(), para deshacerlos con pop_move().
     """
 
     def __init__(self, player1, player2, board, dice):
@@ -38,11 +74,12 @@ class Game:
         """
         self.__players__ = [player1, player2]
         self.__current_turn__ = 0
-        self.__history__ = []
         self.__winner__ = None
         self.__board__ = board
         self.__dice__ = dice
         self.__dice_values__ = []
+        self.__undo_stack__ = []
+        self.__history__ = GameJournal(self.to_bytes())
 
     def start(self):
         """
@@ -67,13 +104,14 @@ class Game:
             self.__dice_values__ = [__values__[0]] * 4
         else:
             self.__dice_values__ = list(__values__)
+        self.__history__.record_roll(self)
 
     def check_winner(self):
         """
         Verifica si algún jugador ha ganado la partida.
         """
         for __player__ in self.__players__:
-            if len(self.__board__.get_home(__player__.__color__)) == 15:
+            if self.__board__.get_off_count(__player__.__color__) == 15:
                 self.__winner__ = __player__
                 break
 
@@ -83,11 +121,183 @@ class Game:
         """
         self.__board__.__init__()  # Reinicia el tablero a su estado inicial
         self.__current_turn__ = 0
-        self.__history__ = []
         self.__winner__ = None
         self.__dice_values__ = []
+        self.__undo_stack__ = []
+        self.__history__ = GameJournal(self.to_bytes())
         self.start()  # Realiza la primera tirada de dados
 
+    @property
+    def zobrist_hash(self):
+        """
+        Devuelve el hash de 64 bits de la posición de juego en O(1).
+
+        Combina el hash Zobrist del tablero con el jugador en turno y los
+        dados que quedan por usar, de modo que sirve como clave para tablas
+        de transposición y cachés de resultados.
+        """
+        return fold_turn_and_dice(
+            self.__board__.zobrist_hash, self.__current_turn__, self.__dice_values__
+        )
+
+    def to_bytes(self):
+        """
+        Codifica el estado de la partida en una instantánea de tamaño fijo.
+
+        Guarda los conteos del tablero, el turno, el orden de los colores,
+        los dados que quedan y el ganador. No guarda los nombres de los
+        jugadores, el historial ni el estado del generador de los dados.
+
+        Returns:
+            bytes: SNAPSHOT_SIZE bytes; ver from_bytes.
+        """
+        __counts__ = self.__board__.get_counts()
+        __flags__ = self.__current_turn__
+        if self.__players__[0].__color__ == "black":
+            __flags__ |= 2
+        if self.__winner__ is not None:
+            __flags__ |= (self.__players__.index(self.__winner__) + 1) << 2
+        __dice__ = list(self.__dice_values__) + [0] * (4 - len(self.__dice_values__))
+        return _SNAPSHOT.pack(SNAPSHOT_VERSION, *__counts__, __flags__, *__dice__)
+
+    @classmethod
+    def from_bytes(cls, __data__, __player1__=None, __player2__=None, __dice__=None):
+        """
+        Reconstruye una partida a partir de una instantánea de to_bytes().
+
+        La partida queda sobre un CompactBoard y con el historial vacío.
+
+        Args:
+            __data__ (bytes): La instantánea.
+            __player1__ (Player, opcional): El primer jugador; por defecto uno
+                                            nuevo del color guardado.
+            __player2__ (Player, opcional): El segundo jugador.
+            __dice__ (Dice, opcional): Los dados para los turnos siguientes;
+                                       por defecto unos nuevos.
+
+        Returns:
+            Game: La partida restaurada.
+
+        Raises:
+            ValueError: Si la instantánea no es válida o los colores de los
+                        jugadores no coinciden con los guardados.
+        """
+        if len(__data__) != SNAPSHOT_SIZE or __data__[0] != SNAPSHOT_VERSION:
+            raise ValueError("Instantánea de partida inválida")
+        __fields__ = _SNAPSHOT.unpack(__data__)
+        __flags__ = __fields__[29]
+        __colors__ = ("black", "white") if __flags__ & 2 else ("white", "black")
+        __players__ = [
+            __player__
+            or Player("Blancas" if __color__ == "white" else "Negras", __color__)
+            for __player__, __color__ in zip((__player1__, __player2__), __colors__)
+        ]
+        if tuple(__player__.__color__ for __player__ in __players__) != __colors__:
+            raise ValueError("Los colores de los jugadores no coinciden")
+        __game__ = cls(
+            __players__[0],
+            __players__[1],
+            CompactBoard.from_counts(__fields__[1:29]),
+            __dice__ if __dice__ is not None else Dice(),
+        )
+        __game__.__current_turn__ = __flags__ & 1
+        if __flags__ >> 2:
+            __game__.__winner__ = __players__[(__flags__ >> 2) - 1]
+        __game__.__dice_values__ = [
+            __value__ for __value__ in __fields__[30:] if __value__
+        ]
+        # El diario de __init__ partió del estado anterior a restaurarla.
+        __game__.__history__ = GameJournal(__game__.to_bytes())
+        return __game__
+
+    def get_position_id(self):
+        """
+        Devuelve la Position ID de GNU Backgammon de la posición, desde el
+        punto de vista del jugador en turno.
+
+        Returns:
+            str: Los 14 caracteres de la Position ID.
+        """
+        return encode_position_id(
+            self.__board__.get_counts(), self.get_current_player().__color__
+        )
+
+    def get_match_id(self, __match_length__=0, __scores__=(0, 0)):
+        """
+        Devuelve la Match ID de GNU Backgammon de la partida.
+
+        El jugador 0 de GNU es el primero de __players__. Como no hay cubo,
+        va en 1 en el centro. Los dados son los dos primeros que quedan por
+        jugar (0 si no hay).
+
+        Args:
+            __match_length__ (int, opcional): El largo del partido; 0 si no
+                                              es un partido.
+            __scores__ (tuple, opcional): Los puntajes de los jugadores 0 y 1.
+
+        Returns:
+            str: Los 12 caracteres de la Match ID.
+        """
+        __dice__ = (list(self.__dice_values__[:2]) + [0, 0])[:2]
+        return encode_match_id(
+            {
+                "on_roll": self.__current_turn__,
+                "turn": self.__current_turn__,
+                "state": GAME_OVER if self.__winner__ is not None else GAME_PLAYING,
+                "dice": tuple(__dice__),
+                "match_length": __match_length__,
+                "scores": __scores__,
+            }
+        )
+
+    @classmethod
+    def from_ids(
+        cls, __position_id__, __match_id__, __player1__=None, __player2__=None
+    ):
+        """
+        Crea una partida a partir de una Position ID y una Match ID de GNU
+        Backgammon.
+
+        El jugador 0 de GNU es el primero; por defecto, blancas. La partida
+        queda sobre un CompactBoard, con dados nuevos, y con los dados de la
+        Match ID (dobles cuatro veces) si los tiene.
+
+        Args:
+            __position_id__ (str): Los 14 caracteres de la Position ID.
+            __match_id__ (str): Los 12 caracteres de la Match ID.
+            __player1__ (Player, opcional): El jugador 0.
+            __player2__ (Player, opcional): El jugador 1.
+
+        Returns:
+            Game: La partida.
+
+        Raises:
+            ValueError: Si algún identificador no es válido.
+        """
+        __match__ = decode_match_id(__match_id__)
+        __players__ = [
+            __player1__ or Player("Blancas", "white"),
+            __player2__ or Player("Negras", "black"),
+        ]
+        __on_roll__ = __match__["on_roll"]
+        __game__ = cls(
+            __players__[0],
+            __players__[1],
+            CompactBoard.from_position_id(
+                __position_id__, __players__[__on_roll__].__color__
+            ),
+            Dice(),
+        )
+        __game__.__current_turn__ = __on_roll__
+        __die1__, __die2__ = __match__["dice"]
+        if __die1__ and __die2__:
+            __game__.__dice_values__ = (
+                [__die1__] * 4 if __die1__ == __die2__ else [__die1__, __die2__]
+            )
+        __game__.check_winner()
+        __game__.__history__ = GameJournal(__game__.to_bytes())
+        return __game__
+
     def get_current_player(self):
         """
         Devuelve el jugador actual.
@@ -99,7 +309,7 @@ class Game:
         Verifica si el jugador actual tiene fichas capturadas.
         """
         __player__ = self.get_current_player()
-        return len(self.__board__.get_captured(__player__.__color__)) > 0
+        return self.__board__.get_bar_count(__player__.__color__) > 0
 
     def can_current_player_bear_off(self):
         """
@@ -120,25 +330,77 @@ class Game:
         """
         return self.__winner__
 
+    def get_win_points(self):
+        """
+        Devuelve los puntos que vale la partida terminada.
+
+        Returns:
+            int: 1 por una victoria simple, 2 por un gammon (el rival no sacó
+                 ninguna ficha), 3 por un backgammon (además tiene fichas en
+                 la barra o en el cuadrante de casa del ganador) y 0 si la
+                 partida no terminó.
+        """
+        if self.__winner__ is None:
+            return 0
+        __color__ = self.__winner__.__color__
+        __loser__ = OPPONENT[__color__]
+        if self.__board__.get_off_count(__loser__):
+            return 1
+        if self.__board__.get_bar_count(__loser__) or (
+            self.__board__.get_occupied_mask(__loser__) & HOME_MASK[__color__]
+        ):
+            return 3
+        return 2
+
     def get_possible_moves(self):
         """
         Calcula y devuelve una lista de todos los movimientos posibles para el jugador actual.
+
+        Mantiene el formato de texto histórico ("12 a 15", "sacar 19",
+        "Barra a 3"). El código nuevo debe usar generate_moves(), que devuelve
+        objetos Move sin construir cadenas.
+        """
+        return _unique_texts(self.generate_moves())
+
+    def generate_moves(self):
+        """
+        Calcula los movimientos simples posibles para el jugador actual.
         Delega la lógica a métodos helper según el estado del juego.
+
+        Returns:
+            list: Los movimientos posibles como objetos Move.
         """
         __player__ = self.get_current_player()
 
         if self.__board__.get_captured(__player__.__color__):
-            return self._get_reentry_moves()
+            return self._generate_reentry_moves()
         if self.can_current_player_bear_off():
             # Cuando se puede hacer bear off, se deben considerar tanto
             # los movimientos normales como los de sacar fichas.
-            normal_moves = self._get_normal_moves()
-            bear_off_moves = self._get_bear_off_moves()
+            normal_moves = self._generate_normal_moves()
+            bear_off_moves = self._generate_bear_off_moves()
             return normal_moves + bear_off_moves
 
-        return self._get_normal_moves()
+        return self._generate_normal_moves()
 
     def _get_reentry_moves(self):
+        """Devuelve en formato de texto los movimientos de reingreso posibles."""
+        return _unique_texts(self._generate_reentry_moves())
+
+    def _get_bear_off_moves(self):
+        """Devuelve en formato de texto los movimientos de bear-off válidos."""
+        return _unique_texts(self._generate_bear_off_moves())
+
+    def _get_normal_moves(self):
+        """Devuelve en formato de texto los movimientos normales posibles."""
+        return _unique_texts(self._generate_normal_moves())
+
+    def _is_hit(self, __player__, __to_pos__):
+        """Verifica si llegar a un punto captura un blot rival."""
+        __opponent__ = OPPONENT[__player__.__color__]
+        return bool(self.__board__.get_blot_mask(__opponent__) >> __to_pos__ & 1)
+
+    def _generate_reentry_moves(self):
         """Calcula los movimientos de reingreso posibles desde la barra."""
         __possible_moves__ = []
         __player__ = self.get_current_player()
@@ -149,12 +411,20 @@ class Game:
                     __die__ - 1 if __player__.__color__ == "white" else 24 - __die__
                 )
                 if self._validate_reentry(__player__, __to_pos__):
-                    __possible_moves__.append(f"Barra a {__to_pos__}")
+                    __possible_moves__.append(
+                        Move(
+                            -1,
+                            __to_pos__,
+                            __die__,
+                            REENTRY,
+                            self._is_hit(__player__, __to_pos__),
+                        )
+                    )
             except (ValueError, TypeError):  # Añadido TypeError
                 continue
         return __possible_moves__
 
-    def _get_bear_off_moves(self):
+    def _generate_bear_off_moves(self):
         """
         Calcula y devuelve todos los movimientos de bear-off válidos.
 
@@ -164,34 +434,19 @@ class Game:
            permitir sacar la ficha más lejana disponible
         """
         possible_moves = []
+        seen_points = set()
         player = self.get_current_player()
         dice_values = list(self.get_dice_values())
+        off_pos = 24 if player.__color__ == "white" else -1
 
         if player.__color__ == "white":
             home_range = range(18, 24)  # 18-23
         else:
             home_range = range(0, 6)  # 0-5
 
-        # Encontrar la ficha más lejana (furthest from exit)
-        furthest_checker_pos = None
-        if player.__color__ == "white":
-            # Para blancas: más lejano = número menor (18 es más lejos que 23)
-            for pos in range(18, 24):
-                if (
-                    self.__board__.get_point_count(pos) > 0
-                    and self.__board__.get_point(pos)[-1].__color__ == player.__color__
-                ):
-                    furthest_checker_pos = pos
-                    break
-        else:
-            # Para negras: más lejano = número menor (0 es más lejos que 5)
-            for pos in range(0, 6):
-                if (
-                    self.__board__.get_point_count(pos) > 0
-                    and self.__board__.get_point(pos)[-1].__color__ == player.__color__
-                ):
-                    furthest_checker_pos = pos
-                    break
+        # Encontrar la ficha más lejana (furthest from exit): el punto ocupado
+        # del cuadrante de casa más cercano a 18 para blancas y a 5 para negras.
+        furthest_checker_pos = self._furthest_home_point(player)
 
         # Procesar cada dado
         for die in set(dice_values):
@@ -215,9 +470,9 @@ class Game:
                 # Si coincide exactamente
                 if distance == die:
                     exact_match_found = True
-                    move_str = f"sacar {from_pos + 1}"
-                    if move_str not in possible_moves:
-                        possible_moves.append(move_str)
+                    if from_pos not in seen_points:
+                        seen_points.add(from_pos)
+                        possible_moves.append(Move(from_pos, off_pos, die, BEAR_OFF))
 
             # Si NO hay coincidencia exacta para este dado → usar ficha más lejana
             if not exact_match_found and furthest_checker_pos is not None:
@@ -227,39 +482,128 @@ class Game:
                 else:
                     furthest_distance = furthest_checker_pos + 1
 
-                if die >= furthest_distance:
-                    move_str = f"sacar {furthest_checker_pos + 1}"
-                    if move_str not in possible_moves:
-                        possible_moves.append(move_str)
+                if die >= furthest_distance and furthest_checker_pos not in seen_points:
+                    seen_points.add(furthest_checker_pos)
+                    possible_moves.append(
+                        Move(furthest_checker_pos, off_pos, die, BEAR_OFF)
+                    )
 
         return possible_moves
 
-    def _get_normal_moves(self):
-        """Calcula los movimientos normales posibles en el tablero."""
+    def _generate_normal_moves(self):
+        """
+        Calcula los movimientos normales posibles en el tablero.
+
+        Para cada dado, los orígenes legales salen de desplazar la máscara de
+        puntos libres (no hechos por el rival) y cruzarla con la de puntos
+        propios, sin revisar punto por punto.
+        """
         __possible_moves__ = []
         __player__ = self.get_current_player()
-        __dice__ = self.get_dice_values()
+        __color__ = __player__.__color__
+        __opponent__ = OPPONENT[__color__]
+        __board__ = self.__board__
+        __own__ = __board__.get_occupied_mask(__color__)
+        __open__ = ALL_POINTS & ~__board__.get_made_mask(__opponent__)
+        __blots__ = __board__.get_blot_mask(__opponent__)
+        __direction__ = 1 if __color__ == "white" else -1
+
+        __sources__ = {}
+        for __die__ in sorted(set(self.get_dice_values())):
+            if not isinstance(__die__, int) or not 1 <= __die__ <= 23:
+                continue
+            if __direction__ > 0:
+                __sources__[__die__] = __own__ & (__open__ >> __die__)
+            else:
+                __sources__[__die__] = __own__ & (__open__ << __die__)
+
         for __from_pos__ in range(24):
-            if (
-                self.__board__.get_point_count(__from_pos__) > 0
-                and self.__board__.get_point(__from_pos__)[-1].__color__
-                == __player__.__color__
-            ):
-                for __die__ in set(__dice__):
-                    try:
-                        __direction__ = 1 if __player__.__color__ == "white" else -1
-                        __to_pos__ = __from_pos__ + __die__ * __direction__
-                        if 0 <= __to_pos__ < 24:
-                            if self._validate_move(
-                                __player__, __from_pos__, __to_pos__
-                            ):
-                                __possible_moves__.append(
-                                    f"{__from_pos__} a {__to_pos__}"
-                                )
-                    except (ValueError, IndexError):
-                        continue
+            if not __own__ >> __from_pos__ & 1:
+                continue
+            for __die__, __mask__ in __sources__.items():
+                if __mask__ >> __from_pos__ & 1:
+                    __to_pos__ = __from_pos__ + __die__ * __direction__
+                    __possible_moves__.append(
+                        Move(
+                            __from_pos__,
+                            __to_pos__,
+                            __die__,
+                            NORMAL,
+                            bool(__blots__ >> __to_pos__ & 1),
+                        )
+                    )
         return __possible_moves__
 
+    def get_legal_plays(self):
+        """
+        Devuelve todas las jugadas completas y distintas del turno actual.
+
+        Cada jugada es una tupla de objetos Move que usa el máximo de dados
+        posible; las jugadas que llevan a la misma posición se devuelven una
+        sola vez.
+        """
+        __player__ = self.get_current_player()
+        return generate_plays(
+            self.__board__.get_counts(), __player__.__color__, self.__dice_values__
+        )
+
+    def get_legal_plays_with_positions(self):
+        """
+        Devuelve las jugadas completas del turno actual junto con los conteos
+        de la posición a la que llevan (ver Board.get_counts).
+
+        Returns:
+            list: Tuplas (jugada, conteos_resultantes).
+        """
+        __player__ = self.get_current_player()
+        return enumerate_plays(
+            self.__board__.get_counts(), __player__.__color__, self.__dice_values__
+        )
+
+    def get_hints(self, __count__=3, __budget__=None):
+        """
+        Devuelve las mejores jugadas del turno actual según el asesor
+        compartido de engine.hint, que guarda el análisis de cada turno.
+
+        Args:
+            __count__ (int, opcional): Las jugadas a devolver.
+            __budget__ (float, opcional): Los segundos para la búsqueda si el
+                                          turno no se analizó antes o se
+                                          analizó con menos tiempo sin
+                                          llegar a todas las jugadas.
+
+        Returns:
+            list: Tuplas (jugada, equity, pérdida, plies) de mejor a peor
+                  (ver HintAdvisor.hints).
+        """
+        # El motor se importa recién acá: core no depende de engine.
+        from engine.hint import (  # pylint: disable=import-outside-toplevel
+            default_advisor,
+        )
+
+        return default_advisor().hints(self, __count__, __budget__)
+
+    def apply_play(self, __play__):
+        """
+        Aplica una jugada completa del jugador actual y pasa el turno al rival
+        sin tirar los dados.
+
+        Si la jugada no usa todos los dados (porque no se puede), los dados
+        restantes se descartan. La jugada no se puede deshacer: el registro de
+        pop_move() se vacía.
+
+        Args:
+            __play__ (tuple): Los objetos Move de la jugada, posiblemente vacía.
+        """
+        for __move__ in __play__:
+            self.push_move(__move__)
+            self.__history__.record_move(self.__undo_stack__[-1] & _UNDO_MOVE_MASK)
+        self.__undo_stack__.clear()
+        if self.__dice_values__ and self.__winner__ is None:
+            self.__dice_values__ = []
+            self.__current_turn__ = 1 - self.__current_turn__
+            self.__history__.record_pass(self.__current_turn__)
+
     def get_dice_values(self):
         """
         Devuelve los valores actuales de los dados.
@@ -283,11 +627,8 @@ class Game:
             if 24 - __to_pos__ not in self.__dice_values__:
                 raise ValueError("La distancia del movimiento no coincide con el dado")
 
-        if (
-            self.__board__.get_point_count(__to_pos__) > 1
-            and self.__board__.get_point(__to_pos__)[-1].__color__
-            != __player__.__color__
-        ):
+        __opponent__ = OPPONENT[__player__.__color__]
+        if self.__board__.get_made_mask(__opponent__) >> __to_pos__ & 1:
             raise ValueError("El punto de destino está bloqueado")
 
         return True
@@ -300,25 +641,29 @@ class Game:
         - El jugador NO debe tener fichas capturadas en la barra.
         - Todas las 15 fichas deben estar en su cuadrante de casa.
         """
-        # Verificar que no hay fichas en la barra (regla oficial)
-        if self.__board__.get_captured(__player__.__color__):
-            return False
+        # Sin fichas en la barra (regla oficial) ni fuera del cuadrante de casa,
+        # según los contadores que el tablero mantiene en cada movimiento.
+        __color__ = __player__.__color__
+        return not (
+            self.__board__.get_bar_count(__color__)
+            or self.__board__.get_outside_count(__color__)
+        )
 
-        # El home board de las blancas son los puntos 18-23 (visual 19-24).
-        # El de las negras son los puntos 0-5 (visual 1-6).
-        __home_points__ = range(18, 24) if __player__.__color__ == "white" else range(6)
+    def _furthest_home_point(self, __player__):
+        """
+        Devuelve el punto del cuadrante de casa con fichas del jugador más
+        lejano a la salida: el más bajo para blancas y el más alto para negras.
 
-        # Todas las fichas deben estar en el cuadrante de casa
-        for i in range(24):
-            if i not in __home_points__:
-                if (
-                    self.__board__.get_point_count(i) > 0
-                    and len(self.__board__.get_point(i)) > 0
-                    and self.__board__.get_point(i)[-1].__color__
-                    == __player__.__color__
-                ):
-                    return False
-        return True
+        Returns:
+            int: El índice del punto, o None si el cuadrante está vacío.
+        """
+        __color__ = __player__.__color__
+        __mask__ = self.__board__.get_occupied_mask(__color__) & HOME_MASK[__color__]
+        if not __mask__:
+            return None
+        if __color__ == "white":
+            return (__mask__ & -__mask__).bit_length() - 1
+        return __mask__.bit_length() - 1
 
     def _validate_bear_off(self, player, from_pos, die):
         """
@@ -354,27 +699,7 @@ class Game:
 
         # 4. Regla de "ficha más lejana"
         # Encontrar si esta es la ficha más lejana
-        is_furthest = False
-        if player.__color__ == "white":
-            # Para blancas: más lejano = número menor
-            is_furthest = True
-            for pos in range(18, from_pos):
-                if (
-                    self.__board__.get_point_count(pos) > 0
-                    and self.__board__.get_point(pos)[-1].__color__ == player.__color__
-                ):
-                    is_furthest = False
-                    break
-        else:
-            # Para negras: más lejano = número menor
-            is_furthest = True
-            for pos in range(0, from_pos):
-                if (
-                    self.__board__.get_point_count(pos) > 0
-                    and self.__board__.get_point(pos)[-1].__color__ == player.__color__
-                ):
-                    is_furthest = False
-                    break
+        is_furthest = self._furthest_home_point(player) == from_pos
 
         # Si es la ficha más lejana y el dado es mayor o igual a la distancia → válido
         if is_furthest and die >= distance:
@@ -395,17 +720,14 @@ class Game:
         if __move_distance__ not in self.__dice_values__:
             raise ValueError("La distancia del movimiento no coincide con el dado")
 
-        if self.__board__.get_point_count(__from_pos__) == 0:
+        __color__ = __player__.__color__
+        __opponent__ = OPPONENT[__color__]
+        if not self.__board__.get_occupied_mask(__color__) >> __from_pos__ & 1:
+            if self.__board__.get_occupied_mask(__opponent__) >> __from_pos__ & 1:
+                raise ValueError("El jugador no es dueño de la ficha")
             raise ValueError("No hay fichas en el punto de origen")
 
-        if self.__board__.get_point(__from_pos__)[-1].__color__ != __player__.__color__:
-            raise ValueError("El jugador no es dueño de la ficha")
-
-        if (
-            self.__board__.get_point_count(__to_pos__) > 1
-            and self.__board__.get_point(__to_pos__)[-1].__color__
-            != __player__.__color__
-        ):
+        if self.__board__.get_made_mask(__opponent__) >> __to_pos__ & 1:
             raise ValueError("El punto de destino está bloqueado")
 
         return True
@@ -418,6 +740,9 @@ class Game:
         - Si es posible usar ambos dados, el jugador DEBE hacerlo.
         - Si solo uno es jugable, debe usar el más alto posible.
 
+        Un movimiento es válido si es el primer paso de alguna jugada completa
+        legal; el generador de jugadas ya aplica estas reglas en una pasada.
+
         Returns:
             bool: True si el movimiento desperdiciaría dados, False si es válido.
         """
@@ -426,101 +751,108 @@ class Game:
             return False
 
         __player__ = self.get_current_player()
-        is_bear_off = __to_pos__ in (24, -1)
-        is_reentry = self.current_player_has_captured()
-
-        # Calcular qué dado se usaría con este movimiento
-        die_to_use = None
-
-        if is_reentry:
-            if __player__.__color__ == "white":
-                die_to_use = __to_pos__ + 1
-            else:  # black
-                die_to_use = 24 - __to_pos__
-        elif is_bear_off:
-            if __player__.__color__ == "white":
-                distance = 24 - __from_pos__
-            else:  # black
-                distance = __from_pos__ + 1
-
-            # Para bear-off, puede usar dado exacto o mayor
-            if distance in self.__dice_values__:
-                die_to_use = distance
-            else:
-                # Buscar el dado mayor que se usaría
-                available = [d for d in self.__dice_values__ if d >= distance]
-                if available:
-                    die_to_use = max(available)
-        else:
-            # Movimiento normal
-            __direction__ = 1 if __player__.__color__ == "white" else -1
-            die_to_use = (__to_pos__ - __from_pos__) * __direction__
-
-        # Si no podemos determinar el dado, permitir el movimiento
-        if die_to_use is None or die_to_use not in self.__dice_values__:
-            return False
-
-        # Simular el estado después del movimiento
-        remaining_dice = self.__dice_values__.copy()
-        remaining_dice.remove(die_to_use)
-
-        # Si no quedan dados después, no hay desperdicio
-        if not remaining_dice:
-            return False
-
-        # Guardar dados actuales y simular dados restantes
-        original_dice = self.__dice_values__
-        self.__dice_values__ = remaining_dice
-
-        # Verificar si hay movimientos posibles con los dados restantes
         try:
-            possible_moves_after = self.get_possible_moves()
-        except Exception:  # pylint: disable=broad-except
-            # Si hay error al calcular, permitir el movimiento
-            self.__dice_values__ = original_dice
+            __steps__ = legal_first_steps(
+                self.__board__.get_counts(), __player__.__color__, self.__dice_values__
+            )
+        except (TypeError, IndexError):
+            # Dados o tablero fuera de rango: la validación normal decide
             return False
-
-        # Restaurar dados originales
-        self.__dice_values__ = original_dice
-
-        # Si SÍ hay movimientos después, el movimiento es válido
-        if possible_moves_after:
+        if not __steps__:
             return False
 
-        # Si NO hay movimientos después, verificar si había alternativa mejor
-        # Solo verificar si tenemos exactamente 2 dados (caso más común)
-        if len(self.__dice_values__) == 2:
-            # Para cada dado alternativo disponible
-            for die in set(self.__dice_values__):
-                if die == die_to_use:
-                    continue
+        is_bear_off = __to_pos__ in (24, -1)
+        is_reentry = self.current_player_has_captured()
+        for __step__ in __steps__:
+            __step_from__, __step_to__ = __step__.__from_pos__, __step__.__to_pos__
+            if is_reentry:
+                __matches__ = __step_to__ == __to_pos__
+            elif is_bear_off:
+                __matches__ = __step_from__ == __from_pos__ and __step_to__ in (24, -1)
+            else:
+                __matches__ = (__step_from__, __step_to__) == (__from_pos__, __to_pos__)
+            if __matches__:
+                return False
+        return True
 
-                # Primero verificar si ese dado alternativo ES JUGABLE
-                self.__dice_values__ = [die]
-                alternative_first_moves = self.get_possible_moves()
+    def push_move(self, __move__):
+        """
+        Aplica un movimiento en el lugar, sin validarlo, y guarda cómo deshacerlo.
 
-                if not alternative_first_moves:
-                    # Este dado alternativo no es jugable, continuar
-                    self.__dice_values__ = original_dice
-                    continue
+        Pensado para búsquedas y verificaciones de reglas: no copia el tablero
+        ni tira los dados. Consume el dado del movimiento y, si no quedan
+        dados y la partida sigue, pasa el turno (con la lista de dados vacía).
 
-                # El dado alternativo SÍ es jugable. Ahora simular usarlo
-                test_remaining = original_dice.copy()
-                test_remaining.remove(die)
+        Args:
+            __move__ (Move): Un movimiento legal del jugador actual.
+        """
+        __player__ = self.get_current_player()
+        __color__ = __player__.__color__
+        __board__ = self.__board__
+        __from_pos__, __to_pos__ = __move__.__from_pos__, __move__.__to_pos__
+        __die_index__ = self.__dice_values__.index(__move__.__die__)
+        __hit__ = False
+
+        if __move__.__kind__ == BEAR_OFF:
+            __board__.bear_off(__color__, __from_pos__)
+        else:
+            __hit__ = __board__.get_point_count(
+                __to_pos__
+            ) == 1 and __board__.get_point_owner(__to_pos__) not in (None, __color__)
+            if __move__.__kind__ == REENTRY:
+                __board__.enter_from_captured(__color__, __to_pos__)
+            else:
+                __board__.move_checker(__color__, __from_pos__, __to_pos__)
 
-                self.__dice_values__ = test_remaining
-                try:
-                    alternative_moves_after = self.get_possible_moves()
-                except Exception:  # pylint: disable=broad-except
-                    alternative_moves_after = []
+        del self.__dice_values__[__die_index__]
+        __record__ = (
+            (__move__.encode() & 0x7FFF)
+            | int(__hit__) << 15
+            | __die_index__ << _UNDO_DIE_SHIFT
+        )
+        if (
+            __move__.__kind__ == BEAR_OFF
+            and self.__winner__ is None
+            and __board__.get_off_count(__color__) == 15
+        ):
+            self.__winner__ = __player__
+            __record__ |= _UNDO_WINNER
+        if not self.__dice_values__ and self.__winner__ is None:
+            self.__current_turn__ = 1 - self.__current_turn__
+            __record__ |= _UNDO_SWITCHED
+        self.__undo_stack__.append(__record__)
 
-                self.__dice_values__ = original_dice
+    def pop_move(self):
+        """
+        Deshace el último movimiento aplicado con push_move().
 
-                # Si con el dado alternativo SÍ hay movimientos después
-                if alternative_moves_after:
-                    return True  # El movimiento actual desperdiciaría dados
+        Returns:
+            Move: El movimiento deshecho, con la captura real marcada.
+        """
+        __record__ = self.__undo_stack__.pop()
+        __move__ = Move.decode(__record__ & _UNDO_MOVE_MASK)
+        if __record__ & _UNDO_SWITCHED:
+            self.__current_turn__ = 1 - self.__current_turn__
+        if __record__ & _UNDO_WINNER:
+            self.__winner__ = None
+        self.__dice_values__.insert(
+            __record__ >> _UNDO_DIE_SHIFT & 0x7, __move__.__die__
+        )
 
-        return False  # El movimiento es válido (no hay mejor alternativa)
+        __color__ = self.get_current_player().__color__
+        __opponent__ = self.__players__[1 - self.__current_turn__].__color__
+        __board__ = self.__board__
+        __from_pos__, __to_pos__ = __move__.__from_pos__, __move__.__to_pos__
+        if __move__.__kind__ == BEAR_OFF:
+            __board__.return_from_home(__color__, __from_pos__)
+            return __move__
+        if __move__.__kind__ == REENTRY:
+            __board__.return_to_bar(__color__, __to_pos__)
+        else:
+            __board__.move_checker(__color__, __to_pos__, __from_pos__)
+        if __move__.__hit__:
+            __board__.enter_from_captured(__opponent__, __to_pos__)
+        return __move__
 
     def make_move(self, __from_pos__, __to_pos__):
         """
@@ -550,11 +882,16 @@ class Game:
         """Ejecuta un movimiento de reingreso desde la barra."""
         try:
             if self._validate_reentry(__player__, __to_pos__):
+                __hit__ = self._is_hit(__player__, __to_pos__)
                 self.__board__.enter_from_captured(__player__.__color__, __to_pos__)
                 if __player__.__color__ == "white":
-                    self.__dice_values__.remove(__to_pos__ + 1)
+                    __die__ = __to_pos__ + 1
                 else:  # black
-                    self.__dice_values__.remove(24 - __to_pos__)
+                    __die__ = 24 - __to_pos__
+                self.__dice_values__.remove(__die__)
+                self.__history__.record_move(
+                    Move(-1, __to_pos__, __die__, REENTRY, __hit__).encode()
+                )
 
                 if not self.__dice_values__:
                     self.switch_turn()
@@ -582,6 +919,7 @@ class Game:
                 if self._validate_bear_off(__player__, __from_pos__, distance):
                     self.__board__.bear_off(__player__.__color__, __from_pos__)
                     self.__dice_values__.remove(distance)
+                    self._record_bear_off(__player__, __from_pos__, distance)
                     self.check_winner()
                     if not self.__dice_values__ and not self.is_over():
                         self.switch_turn()
@@ -599,6 +937,7 @@ class Game:
                 if self._validate_bear_off(__player__, __from_pos__, die):
                     self.__board__.bear_off(__player__.__color__, __from_pos__)
                     self.__dice_values__.remove(die)
+                    self._record_bear_off(__player__, __from_pos__, die)
                     self.check_winner()
                     if not self.__dice_values__ and not self.is_over():
                         self.switch_turn()
@@ -608,16 +947,29 @@ class Game:
 
         return False  # No se pudo ejecutar el bear-off
 
+    def _record_bear_off(self, __player__, __from_pos__, __die__):
+        """Registra en el diario una ficha sacada con make_move()."""
+        __to_pos__ = 24 if __player__.__color__ == "white" else -1
+        self.__history__.record_move(
+            Move(__from_pos__, __to_pos__, __die__, BEAR_OFF).encode()
+        )
+
     def _execute_board_move(self, __player__, __from_pos__, __to_pos__):
         """Ejecuta un movimiento normal en el tablero."""
         try:
             if self._validate_move(__player__, __from_pos__, __to_pos__):
+                __hit__ = self._is_hit(__player__, __to_pos__)
                 self.__board__.move_checker(
                     __player__.__color__, __from_pos__, __to_pos__
                 )
                 __direction__ = 1 if __player__.__color__ == "white" else -1
                 __move_distance__ = (__to_pos__ - __from_pos__) * __direction__
                 self.__dice_values__.remove(__move_distance__)
+                self.__history__.record_move(
+                    Move(
+                        __from_pos__, __to_pos__, __move_distance__, NORMAL, __hit__
+                    ).encode()
+                )
 
                 self.check_winner()
                 if not self.__dice_values__ and not self.is_over():
@@ -626,3 +978,22 @@ class Game:
         except (ValueError, IndexError):
             return False
         return False
+
+
+def _unique_texts(__moves__):
+    """
+    Convierte movimientos al formato de texto histórico de Game, sin repetir.
+
+    Sólo lo usan los métodos que conservan la interfaz basada en cadenas.
+    """
+    __texts__ = []
+    for __move__ in __moves__:
+        if __move__.__kind__ == BEAR_OFF:
+            __text__ = f"sacar {__move__.__from_pos__ + 1}"
+        elif __move__.__kind__ == REENTRY:
+            __text__ = f"Barra a {__move__.__to_pos__}"
+        else:
+            __text__ = f"{__move__.__from_pos__} a {__move__.__to_pos__}"
+        if __text__ not in __texts__:
+            __texts__.append(__text__)
+    return __texts__
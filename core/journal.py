@@ -0,0 +1,238 @@
+"""
+Módulo que define el diario de una partida: el registro de solo agregado
+de las tiradas, los movimientos y los pases de turno, con instantáneas
+periódicas para reconstruir cualquier turno sin repetir toda la partida.
+
+Cada evento es un entero de 32 bits guardado en un array: bits 16-17 el
+tipo y bits 0-15 los datos.
+
+- EVENT_MOVE: el código de Move.encode() con la captura real.
+- EVENT_ROLL: dado 1 (bits 0-2), dado 2 (bits 3-5) y el jugador que tira
+  (bit 6). Cada tirada empieza un turno ("ply").
+- EVENT_PASS: el jugador que recibe el turno (bit 0), cuando se pasa sin
+  tirar y descartando los dados que quedan.
+
+El diario guarda la instantánea (Game.to_bytes) de la posición inicial y
+otra después de la tirada de cada turno múltiplo del intervalo. Para llegar
+a un turno se parte de la instantánea más cercana anterior y se aplican
+sólo los eventos que faltan (ver core.replay).
+
+Classes
+-------
+GameJournal
+    Registra los eventos de una partida y sus instantáneas
+"""
+
+import bisect
+import struct
+import sys
+from array import array
+
+EVENT_MOVE = 0
+EVENT_ROLL = 1
+EVENT_PASS = 2
+
+# Turnos entre instantáneas por defecto.
+CHECKPOINT_INTERVAL = 16
+
+_MAGIC = b"BGJ1"
+# Encabezado del flujo: marca, intervalo, eventos, instantáneas y el tamaño
+# de cada instantánea.
+_HEADER = struct.Struct("<4sHIIH")
+_CHECKPOINT_INDEX = struct.Struct("<I")
+
+
+def _little_endian(__events__):
+    """Devuelve una copia de los eventos con los bytes en orden little-endian."""
+    __copy__ = array("I", __events__)
+    if sys.byteorder == "big":
+        __copy__.byteswap()
+    return __copy__
+
+
+class GameJournal:
+    """
+    Registra los eventos de una partida y sus instantáneas.
+
+    Atributos:
+        __events__ (array): Los eventos codificados, en orden.
+        __plies__ (array): La posición en __events__ de la tirada de cada turno.
+        __checkpoints__ (list): Las instantáneas de Game.to_bytes().
+        __checkpoint_events__ (list): La cantidad de eventos ya aplicados en
+                                      cada instantánea, en orden creciente.
+        __interval__ (int): Los turnos entre instantáneas.
+    """
+
+    def __init__(self, __snapshot__, __interval__=CHECKPOINT_INTERVAL):
+        """
+        Inicializa el diario vacío.
+
+        Args:
+            __snapshot__ (bytes): La instantánea de la posición inicial.
+            __interval__ (int, opcional): Los turnos entre instantáneas.
+        """
+        self.__events__ = array("I")
+        self.__plies__ = array("I")
+        self.__checkpoints__ = [__snapshot__]
+        self.__checkpoint_events__ = [0]
+        self.__interval__ = __interval__
+
+    def __len__(self):
+        """
+        Devuelve la cantidad de eventos registrados.
+        """
+        return len(self.__events__)
+
+    def get_ply_count(self):
+        """
+        Devuelve la cantidad de turnos (tiradas) registrados.
+        """
+        return len(self.__plies__)
+
+    def get_events(self):
+        """
+        Devuelve los eventos decodificados.
+
+        Returns:
+            list: Tuplas (tipo, datos) en orden.
+        """
+        return [(__event__ >> 16, __event__ & 0xFFFF) for __event__ in self.__events__]
+
+    def record_move(self, __code__):
+        """
+        Registra un movimiento.
+
+        Args:
+            __code__ (int): El código de Move.encode(), con la captura real.
+        """
+        self.__events__.append(__code__)
+
+    def record_pass(self, __turn__):
+        """
+        Registra un pase de turno sin tirada.
+
+        Args:
+            __turn__ (int): El índice del jugador que recibe el turno.
+        """
+        self.__events__.append(EVENT_PASS << 16 | __turn__)
+
+    def record_roll(self, __game__):
+        """
+        Registra la tirada que acaba de hacer el jugador en turno y, si el
+        turno es múltiplo del intervalo, guarda una instantánea.
+
+        Args:
+            __game__ (Game): La partida, con los dados ya tirados.
+        """
+        __first__, __second__ = __game__.__dice__.get_values()
+        self.__plies__.append(len(self.__events__))
+        self.__events__.append(
+            EVENT_ROLL << 16
+            | __first__
+            | __second__ << 3
+            | __game__.__current_turn__ << 6
+        )
+        if (len(self.__plies__) - 1) % self.__interval__ == 0:
+            self.__checkpoints__.append(__game__.to_bytes())
+            self.__checkpoint_events__.append(len(self.__events__))
+
+    def locate(self, __ply__=None):
+        """
+        Devuelve desde dónde reconstruir un turno: la instantánea más cercana
+        anterior y los eventos que faltan aplicarle.
+
+        Args:
+            __ply__ (int, opcional): El turno, contado desde 0; la posición
+                                     es la de después de su tirada. Por
+                                     defecto, la posición final.
+
+        Returns:
+            tuple: (instantánea, lista de eventos codificados).
+
+        Raises:
+            IndexError: Si el turno no está en el diario.
+        """
+        if __ply__ is None:
+            __target__ = len(self.__events__)
+        else:
+            if not 0 <= __ply__ < len(self.__plies__):
+                raise IndexError(f"El diario no tiene el turno {__ply__}")
+            __target__ = self.__plies__[__ply__] + 1
+        __index__ = bisect.bisect_right(self.__checkpoint_events__, __target__) - 1
+        __start__ = self.__checkpoint_events__[__index__]
+        return (
+            self.__checkpoints__[__index__],
+            self.__events__[__start__:__target__].tolist(),
+        )
+
+    def write(self, __stream__):
+        """
+        Escribe el diario en un flujo binario.
+
+        Args:
+            __stream__ (file): El flujo, abierto para escribir bytes.
+        """
+        __stream__.write(
+            _HEADER.pack(
+                _MAGIC,
+                self.__interval__,
+                len(self.__events__),
+                len(self.__checkpoints__),
+                len(self.__checkpoints__[0]),
+            )
+        )
+        __stream__.write(_little_endian(self.__events__).tobytes())
+        for __events__, __snapshot__ in zip(
+            self.__checkpoint_events__, self.__checkpoints__
+        ):
+            __stream__.write(_CHECKPOINT_INDEX.pack(__events__) + __snapshot__)
+
+    @classmethod
+    def read(cls, __stream__):
+        """
+        Lee un diario escrito con write().
+
+        Args:
+            __stream__ (file): El flujo, abierto para leer bytes.
+
+        Returns:
+            GameJournal: El diario.
+
+        Raises:
+            ValueError: Si el flujo no tiene un diario válido.
+        """
+        __header__ = __stream__.read(_HEADER.size)
+        if len(__header__) != _HEADER.size:
+            raise ValueError("Diario de partida inválido")
+        __magic__, __interval__, __count__, __checkpoints__, __size__ = _HEADER.unpack(
+            __header__
+        )
+        if __magic__ != _MAGIC or not __checkpoints__:
+            raise ValueError("Diario de partida inválido")
+        __raw__ = __stream__.read(4 * __count__)
+        __records__ = [
+            __stream__.read(_CHECKPOINT_INDEX.size + __size__)
+            for _ in range(__checkpoints__)
+        ]
+        if len(__raw__) != 4 * __count__ or any(
+            len(__record__) != _CHECKPOINT_INDEX.size + __size__
+            for __record__ in __records__
+        ):
+            raise ValueError("Diario de partida truncado")
+        __journal__ = cls(None, __interval__)
+        __journal__.__events__ = _little_endian(array("I", __raw__))
+        __journal__.__plies__ = array(
+            "I",
+            (
+                __index__
+                for __index__, __event__ in enumerate(__journal__.__events__)
+                if __event__ >> 16 == EVENT_ROLL
+            ),
+        )
+        __journal__.__checkpoints__ = [
+            __record__[_CHECKPOINT_INDEX.size :] for __record__ in __records__
+        ]
+        __journal__.__checkpoint_events__ = [
+            _CHECKPOINT_INDEX.unpack_from(__record__)[0] for __record__ in __records__
+        ]
+        return __journal__
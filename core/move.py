@@ -0,0 +1,114 @@
+"""
+Módulo que define la clase Move para representar movimientos simples.
+
+Un Move guarda el origen, el destino, el dado usado, el tipo de movimiento y
+si captura un blot rival. Se puede codificar en un único entero de 16 bits,
+lo que permite generar, comparar y almacenar millones de movimientos sin
+construir ni interpretar cadenas de texto.
+
+Las coordenadas son las de Game: origen -1 para reingresar desde la barra y
+destino 24 (blancas) o -1 (negras) para sacar una ficha.
+
+Classes
+-------
+Move
+    Representa un movimiento simple de una ficha
+"""
+
+NORMAL = 0
+REENTRY = 1
+BEAR_OFF = 2
+
+
+class Move:
+    """
+    Representa un movimiento simple de Backgammon.
+
+    Atributos:
+        __from_pos__ (int): El punto de origen (-1 desde la barra).
+        __to_pos__ (int): El punto de destino (24 o -1 al sacar una ficha).
+        __die__ (int): El valor del dado que consume el movimiento.
+        __kind__ (int): El tipo de movimiento (NORMAL, REENTRY o BEAR_OFF).
+        __hit__ (bool): Indica si el movimiento captura un blot rival.
+    """
+
+    __slots__ = ("__from_pos__", "__to_pos__", "__die__", "__kind__", "__hit__")
+
+    def __init__(
+        self, __from_pos__, __to_pos__, __die__, __kind__=NORMAL, __hit__=False
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Inicializa un movimiento.
+
+        Args:
+            __from_pos__ (int): El punto de origen.
+            __to_pos__ (int): El punto de destino.
+            __die__ (int): El valor del dado usado.
+            __kind__ (int, opcional): El tipo de movimiento. Por defecto NORMAL.
+            __hit__ (bool, opcional): Si captura un blot. Por defecto False.
+        """
+        self.__from_pos__ = __from_pos__
+        self.__to_pos__ = __to_pos__
+        self.__die__ = __die__
+        self.__kind__ = __kind__
+        self.__hit__ = __hit__
+
+    def encode(self):
+        """
+        Codifica el movimiento en un entero de 16 bits.
+
+        Bits 0-4: origen + 1, bits 5-9: destino + 1, bits 10-12: dado,
+        bits 13-14: tipo, bit 15: captura.
+
+        Returns:
+            int: El código del movimiento.
+        """
+        return (
+            (self.__from_pos__ + 1)
+            | (self.__to_pos__ + 1) << 5
+            | self.__die__ << 10
+            | self.__kind__ << 13
+            | int(self.__hit__) << 15
+        )
+
+    @classmethod
+    def decode(cls, __code__):
+        """
+        Reconstruye un movimiento a partir de su código entero.
+
+        Args:
+            __code__ (int): El código devuelto por encode().
+
+        Returns:
+            Move: El movimiento codificado.
+        """
+        return cls(
+            (__code__ & 0x1F) - 1,
+            (__code__ >> 5 & 0x1F) - 1,
+            __code__ >> 10 & 0x7,
+            __code__ >> 13 & 0x3,
+            bool(__code__ >> 15 & 0x1),
+        )
+
+    def __eq__(self, __other__):
+        """
+        Compara dos movimientos por su codificación.
+        """
+        if not isinstance(__other__, Move):
+            return NotImplemented
+        return self.encode() == __other__.encode()
+
+    def __hash__(self):
+        """
+        Devuelve el hash del movimiento, igual a su codificación.
+        """
+        return self.encode()
+
+    def __repr__(self):
+        """
+        Devuelve una representación del movimiento en formato de texto.
+        """
+        return (
+            f"Move({self.__from_pos__}, {self.__to_pos__}, die={self.__die__}, "
+            f"kind={self.__kind__}, hit={self.__hit__})"
+        )
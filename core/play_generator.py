@@ -0,0 +1,365 @@
+"""
+Módulo que genera las jugadas completas y legales de un turno de Backgammon.
+
+Una jugada es la secuencia de 1 a 4 movimientos simples que un jugador
+realiza con su tirada. El generador recorre todas las secuencias posibles
+(reingreso desde la barra, movimientos normales y bear-off incluidos),
+aplica en la misma pasada las reglas de uso máximo de dados (usar ambos
+dados si es posible; si sólo se puede usar uno, el mayor) y descarta las
+jugadas que llevan a una posición ya generada.
+
+La búsqueda trabaja sobre los conteos con signo del tablero (ver
+Board.get_counts) vistos desde el jugador que mueve: la distancia 1-24 a la
+salida, 25 para la barra y 0 para las fichas retiradas.
+
+Cada movimiento simple se devuelve como un objeto Move en las coordenadas
+de Game: origen -1 para reingresar desde la barra y destino 24 (blancas) o
+-1 (negras) para sacar una ficha.
+
+Functions
+---------
+enumerate_plays
+    Devuelve cada jugada distinta junto con la posición resultante
+enumerate_positions
+    Devuelve sólo las posiciones distintas a las que lleva una tirada
+generate_plays
+    Devuelve sólo las jugadas distintas
+legal_first_steps
+    Devuelve los movimientos simples con los que puede empezar una jugada legal
+"""
+
+from core.move import BEAR_OFF, NORMAL, REENTRY, Move
+
+_BAR = 25
+
+
+def _to_board(__color__, __distance__):
+    """
+    Convierte una distancia a la salida en el índice de punto del tablero.
+    """
+    return 24 - __distance__ if __color__ == "white" else __distance__ - 1
+
+
+def _split(__counts__, __color__):
+    """
+    Separa los conteos del tablero en fichas propias y rivales indexadas por
+    la distancia a la salida del jugador que mueve.
+    """
+    __sign__ = 1 if __color__ == "white" else -1
+    __own__ = [0] * 26
+    __opp__ = [0] * 26
+    for __distance__ in range(1, 25):
+        __value__ = __counts__[_to_board(__color__, __distance__)] * __sign__
+        if __value__ > 0:
+            __own__[__distance__] = __value__
+        elif __value__ < 0:
+            __opp__[__distance__] = -__value__
+    __own__[_BAR] = __counts__[24 if __color__ == "white" else 25]
+    __own__[0] = __counts__[26 if __color__ == "white" else 27]
+    return __own__, __opp__
+
+
+def _join(__counts__, __color__, __own__, __opp__, __hits__):
+    """
+    Reconstruye los conteos del tablero a partir de las listas propias y rivales.
+    """
+    if __color__ == "white":
+        __result__ = [
+            __mine__ - __theirs__
+            for __mine__, __theirs__ in zip(__own__[24:0:-1], __opp__[24:0:-1])
+        ]
+        __result__ += (
+            __own__[_BAR],
+            __counts__[25] + __hits__,
+            __own__[0],
+            __counts__[27],
+        )
+    else:
+        __result__ = [
+            __theirs__ - __mine__
+            for __mine__, __theirs__ in zip(__own__[1:25], __opp__[1:25])
+        ]
+        __result__ += (
+            __counts__[24] + __hits__,
+            __own__[_BAR],
+            __counts__[26],
+            __own__[0],
+        )
+    return __result__
+
+
+class _PlaySearch:  # pylint: disable=too-many-instance-attributes
+    """
+    Búsqueda en profundidad de las jugadas de un turno sobre listas mutables.
+
+    Con __all_orders__ no poda las permutaciones de los dobles, para que
+    first_steps vea todos los órdenes en que se puede jugar cada jugada.
+    """
+
+    def __init__(self, __counts__, __color__, __dice__, __all_orders__=False):
+        self.__color__ = __color__
+        self.__all_orders__ = __all_orders__
+        self.__own__, self.__opp__ = _split(__counts__, __color__)
+        self.__outside__ = sum(self.__own__[7:])
+        self.__is_double__ = len(__dice__) > 1 and len(set(__dice__)) == 1
+        self.__best__ = {}
+        self.__starts__ = set()
+        self.__max_used__ = 0
+        self.__path__ = []
+        self.__hits__ = 0
+
+    def _highest(self):
+        """Devuelve la distancia de la ficha propia más alejada de la salida."""
+        for __distance__ in range(_BAR, 0, -1):
+            if self.__own__[__distance__]:
+                return __distance__
+        return 0
+
+    def _targets(self, __die__, __floor__):
+        """
+        Devuelve los pares (desde, hasta) legales en distancias para un dado.
+        """
+        __own__, __opp__ = self.__own__, self.__opp__
+        if __own__[_BAR]:
+            __to__ = _BAR - __die__
+            return [(_BAR, __to__)] if __opp__[__to__] <= 1 else []
+        __moves__ = []
+        __can_bear_off__ = self.__outside__ == 0
+        __highest__ = self._highest() if __can_bear_off__ else 0
+        for __from__ in range(min(__floor__, 24), 0, -1):
+            if not __own__[__from__]:
+                continue
+            __to__ = __from__ - __die__
+            if __to__ > 0:
+                if __opp__[__to__] <= 1:
+                    __moves__.append((__from__, __to__))
+            elif __can_bear_off__ and (__to__ == 0 or __from__ == __highest__):
+                __moves__.append((__from__, 0))
+        return __moves__
+
+    def _apply(self, __from__, __to__):
+        """Aplica un movimiento simple y devuelve si capturó un blot."""
+        __own__, __opp__ = self.__own__, self.__opp__
+        __own__[__from__] -= 1
+        __own__[__to__] += 1
+        if __from__ > 6 >= __to__:
+            self.__outside__ -= 1
+        __hit__ = __to__ > 0 and __opp__[__to__] == 1
+        if __hit__:
+            __opp__[__to__] = 0
+            self.__hits__ += 1
+        return __hit__
+
+    def _undo(self, __from__, __to__, __hit__):
+        """Revierte un movimiento simple aplicado con _apply."""
+        __own__ = self.__own__
+        __own__[__to__] -= 1
+        __own__[__from__] += 1
+        if __from__ > 6 >= __to__:
+            self.__outside__ += 1
+        if __hit__:
+            self.__opp__[__to__] = 1
+            self.__hits__ -= 1
+
+    def _record(self):
+        """Registra la jugada actual si usa al menos tantos dados como la mejor."""
+        __used__ = len(self.__path__)
+        if __used__ < self.__max_used__:
+            return
+        if __used__ > self.__max_used__:
+            self.__max_used__ = __used__
+            self.__best__ = {}
+            self.__starts__ = set()
+        if __used__:
+            self.__starts__.add(self.__path__[0])
+        __key__ = (tuple(self.__own__), tuple(self.__opp__))
+        __known__ = self.__best__.get(__key__)
+        # Ante posiciones repetidas se conserva la variante que empieza con
+        # el dado mayor, para que la regla del dado mayor no la descarte.
+        if __known__ is None or __known__[0][0][2] < self.__path__[0][2]:
+            self.__best__[__key__] = (tuple(self.__path__), self.__hits__)
+
+    def search(self, __dice__, __floor__=_BAR):
+        """
+        Recorre recursivamente todas las secuencias con los dados restantes.
+
+        Args:
+            __dice__ (tuple): Los dados que quedan por usar.
+            __floor__ (int): En dobles, la distancia máxima desde la que se
+                             puede mover, para no generar permutaciones
+                             (salvo con __all_orders__).
+        """
+        __moved__ = False
+        for __index__, __die__ in enumerate(__dice__):
+            if __die__ in __dice__[:__index__]:
+                continue
+            __rest__ = __dice__[:__index__] + __dice__[__index__ + 1 :]
+            for __from__, __to__ in self._targets(__die__, __floor__):
+                __moved__ = True
+                __hit__ = self._apply(__from__, __to__)
+                self.__path__.append((__from__, __to__, __die__, __hit__))
+                self.search(
+                    __rest__,
+                    (
+                        __from__
+                        if self.__is_double__ and not self.__all_orders__
+                        else _BAR
+                    ),
+                )
+                self.__path__.pop()
+                self._undo(__from__, __to__, __hit__)
+        if not __moved__:
+            self._record()
+
+    def results(self, __counts__, __dice__, __with_moves__=True):
+        """
+        Devuelve las jugadas distintas con su posición resultante, aplicando
+        la regla del dado mayor cuando sólo se puede usar uno. Sin
+        __with_moves__ la jugada se devuelve como None, lo que ahorra crear
+        los objetos Move cuando sólo interesan las posiciones.
+        """
+        __entries__ = [
+            (__key__, __path__, __hits__)
+            for __key__, (__path__, __hits__) in self.__best__.items()
+        ]
+        if self.__max_used__ == 1 and not self.__is_double__ and len(__dice__) > 1:
+            __larger__ = max(__dice__)
+            __with_larger__ = [
+                __entry__
+                for __entry__ in __entries__
+                if __entry__[1][0][2] == __larger__
+            ]
+            if __with_larger__:
+                __entries__ = __with_larger__
+        __plays__ = []
+        for (__own__, __opp__), __path__, __hits__ in __entries__:
+            __play__ = (
+                tuple(self._to_game_step(__step__) for __step__ in __path__)
+                if __with_moves__
+                else None
+            )
+            __position__ = _join(__counts__, self.__color__, __own__, __opp__, __hits__)
+            __plays__.append((__play__, __position__))
+        return __plays__
+
+    def first_steps(self, __dice__):
+        """
+        Devuelve los movimientos con los que puede empezar alguna jugada legal,
+        sin deduplicar por posición y aplicando la regla del dado mayor.
+        """
+        __starts__ = self.__starts__
+        if self.__max_used__ == 1 and not self.__is_double__ and len(__dice__) > 1:
+            __larger__ = max(__dice__)
+            __with_larger__ = {
+                __step__ for __step__ in __starts__ if __step__[2] == __larger__
+            }
+            if __with_larger__:
+                __starts__ = __with_larger__
+        return {self._to_game_step(__step__) for __step__ in __starts__}
+
+    def _to_game_step(self, __step__):
+        """Convierte un movimiento en distancias a las coordenadas de Game."""
+        __from__, __to__, __die__, __hit__ = __step__
+        __color__ = self.__color__
+        __kind__ = NORMAL
+        if __from__ == _BAR:
+            __game_from__ = -1
+            __kind__ = REENTRY
+        else:
+            __game_from__ = _to_board(__color__, __from__)
+        if __to__ == 0:
+            __game_to__ = 24 if __color__ == "white" else -1
+            __kind__ = BEAR_OFF
+        else:
+            __game_to__ = _to_board(__color__, __to__)
+        return Move(__game_from__, __game_to__, __die__, __kind__, __hit__)
+
+
+def enumerate_plays(__counts__, __color__, __dice__):
+    """
+    Enumera las jugadas legales y distintas de una tirada.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo del tablero.
+        __color__ (str): El color del jugador que mueve.
+        __dice__ (list): Los dados disponibles (4 valores iguales en dobles).
+
+    Returns:
+        list: Tuplas (jugada, conteos_resultantes). Cada jugada es una tupla
+              de objetos Move. Si no hay movimientos
+              legales la lista está vacía.
+    """
+    if not __dice__:
+        return []
+    __search__ = _PlaySearch(__counts__, __color__, __dice__)
+    __search__.search(tuple(__dice__))
+    if __search__.__max_used__ == 0:
+        return []
+    return __search__.results(__counts__, __dice__)
+
+
+def enumerate_positions(__counts__, __color__, __dice__):
+    """
+    Enumera las posiciones distintas a las que lleva una tirada, sin armar
+    los movimientos: es la variante barata de enumerate_plays para las
+    búsquedas, que sólo evalúan posiciones.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo del tablero.
+        __color__ (str): El color del jugador que mueve.
+        __dice__ (list): Los dados disponibles.
+
+    Returns:
+        list: Los conteos resultantes de cada jugada legal y distinta. Si no
+              hay movimientos legales la lista está vacía.
+    """
+    if not __dice__:
+        return []
+    __search__ = _PlaySearch(__counts__, __color__, __dice__)
+    __search__.search(tuple(__dice__))
+    if __search__.__max_used__ == 0:
+        return []
+    return [
+        __position__
+        for _, __position__ in __search__.results(__counts__, __dice__, False)
+    ]
+
+
+def generate_plays(__counts__, __color__, __dice__):
+    """
+    Devuelve las jugadas legales y distintas de una tirada.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo del tablero.
+        __color__ (str): El color del jugador que mueve.
+        __dice__ (list): Los dados disponibles.
+
+    Returns:
+        list: Las jugadas, cada una una tupla de objetos Move.
+    """
+    return [
+        __play__ for __play__, _ in enumerate_plays(__counts__, __color__, __dice__)
+    ]
+
+
+def legal_first_steps(__counts__, __color__, __dice__):
+    """
+    Devuelve los movimientos simples con los que puede empezar una jugada legal.
+
+    A diferencia de generate_plays, no descarta órdenes distintos que llevan a
+    la misma posición (tampoco en dobles, donde la búsqueda normal poda las
+    permutaciones): sirve para validar el movimiento que elige un jugador.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo del tablero.
+        __color__ (str): El color del jugador que mueve.
+        __dice__ (list): Los dados disponibles.
+
+    Returns:
+        set: Los objetos Move permitidos como primer paso.
+    """
+    if not __dice__:
+        return set()
+    __search__ = _PlaySearch(__counts__, __color__, __dice__, True)
+    __search__.search(tuple(__dice__))
+    return __search__.first_steps(__dice__)
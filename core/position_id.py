@@ -0,0 +1,239 @@
+"""
+Módulo que codifica posiciones y partidas con los identificadores de GNU
+Backgammon (Position ID y Match ID), para intercambiarlas con otras
+herramientas de análisis.
+
+Position ID: para cada jugador, primero el que no tiene el turno, se
+recorren sus 24 puntos desde su propio punto 1 y después su barra; cada
+ficha es un bit 1 y cada punto termina con un bit 0. Los 80 bits se
+guardan del menos significativo en adelante en 10 bytes, que en base64
+sin relleno son 14 caracteres. La clave se arma como un entero de Python
+(un bloque de unos por punto) en lugar de concatenar un carácter por ficha.
+
+Match ID: 66 bits con el cubo, el turno, el estado del juego, los dados,
+el largo del partido y los puntajes, en 9 bytes y 12 caracteres. Los
+campos se pasan y se devuelven como diccionario (ver MATCH_DEFAULTS).
+
+Las funciones trabajan sobre los 28 conteos con signo de get_counts();
+el punto 1 de blancas es el índice 23 y el de negras el 0.
+
+Functions
+---------
+encode_position_id
+    Codifica una posición desde el punto de vista del color en turno
+decode_position_id
+    Devuelve los conteos de una Position ID
+encode_match_id
+    Codifica el estado de un partido
+decode_match_id
+    Devuelve los campos de una Match ID
+"""
+
+import base64
+import binascii
+
+CHECKERS = 15
+
+# Estados del juego en la Match ID.
+GAME_NONE = 0
+GAME_PLAYING = 1
+GAME_OVER = 2
+GAME_RESIGNED = 3
+GAME_DROPPED = 4
+
+# Dueño del cubo cuando está en el centro.
+CENTERED = None
+
+# Campos de la Match ID y sus valores por defecto: una partida en juego,
+# sin partido (largo 0) y con el cubo en 1 en el centro. Los jugadores son
+# 0 y 1.
+MATCH_DEFAULTS = {
+    "cube": 1,
+    "cube_owner": CENTERED,
+    "on_roll": 0,
+    "crawford": False,
+    "state": GAME_PLAYING,
+    "turn": 0,
+    "double_offered": False,
+    "resigned": 0,
+    "dice": (0, 0),
+    "match_length": 0,
+    "scores": (0, 0),
+}
+
+# (desplazamiento, ancho) de cada campo de la Match ID.
+_MATCH_FIELDS = (
+    ("cube", 0, 4),
+    ("cube_owner", 4, 2),
+    ("on_roll", 6, 1),
+    ("crawford", 7, 1),
+    ("state", 8, 3),
+    ("turn", 11, 1),
+    ("double_offered", 12, 1),
+    ("resigned", 13, 2),
+    ("die1", 15, 3),
+    ("die2", 18, 3),
+    ("match_length", 21, 15),
+    ("score0", 36, 15),
+    ("score1", 51, 15),
+)
+
+
+def _own_counts(__counts__, __color__):
+    """
+    Devuelve las 25 cantidades de un color desde su punto de vista: sus
+    puntos 1 a 24 y la barra.
+    """
+    if __color__ == "white":
+        return [__n__ if __n__ > 0 else 0 for __n__ in __counts__[23::-1]] + [
+            __counts__[24]
+        ]
+    return [-__n__ if __n__ < 0 else 0 for __n__ in __counts__[:24]] + [__counts__[25]]
+
+
+def encode_position_id(__counts__, __color__):
+    """
+    Codifica una posición como Position ID.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __color__ (str): El color que tiene el turno.
+
+    Returns:
+        str: Los 14 caracteres de la Position ID.
+    """
+    __opponent__ = "black" if __color__ == "white" else "white"
+    __key__ = 0
+    __bit__ = 0
+    for __side__ in (__opponent__, __color__):
+        for __n__ in _own_counts(__counts__, __side__):
+            if __n__:
+                __key__ |= ((1 << __n__) - 1) << __bit__
+                __bit__ += __n__
+            __bit__ += 1
+    return base64.b64encode(__key__.to_bytes(10, "little")).decode("ascii")[:14]
+
+
+def _decode_key(__text__, __size__):
+    """
+    Devuelve el entero de __size__ bytes codificado en base64 sin relleno.
+    """
+    try:
+        __raw__ = base64.b64decode(__text__ + "=" * (-len(__text__) % 4), validate=True)
+    except (binascii.Error, ValueError) as __error__:
+        raise ValueError(f"Identificador inválido: {__text__!r}") from __error__
+    if len(__raw__) != __size__:
+        raise ValueError(f"Identificador inválido: {__text__!r}")
+    return int.from_bytes(__raw__, "little")
+
+
+def decode_position_id(__text__, __color__):
+    """
+    Devuelve la posición de una Position ID.
+
+    Args:
+        __text__ (str): Los 14 caracteres de la Position ID.
+        __color__ (str): El color que tiene el turno.
+
+    Returns:
+        list: Los 28 conteos con signo; las fichas que faltan en el tablero
+              y la barra se cuentan como retiradas.
+
+    Raises:
+        ValueError: Si el texto no es una Position ID válida.
+    """
+    if not isinstance(__text__, str) or len(__text__) != 14:
+        raise ValueError(f"Position ID inválida: {__text__!r}")
+    __key__ = _decode_key(__text__, 10)
+    __opponent__ = "black" if __color__ == "white" else "white"
+    __counts__ = [0] * 28
+    for __side__ in (__opponent__, __color__):
+        __own__ = []
+        while len(__own__) < 25:
+            __n__ = 0
+            while __key__ & 1:
+                __n__ += 1
+                __key__ >>= 1
+            __key__ >>= 1
+            __own__.append(__n__)
+        if sum(__own__) > CHECKERS:
+            raise ValueError(f"Position ID inválida: {__text__!r}")
+        for __index__, __n__ in enumerate(__own__[:24]):
+            if not __n__:
+                continue
+            __point__ = 23 - __index__ if __side__ == "white" else __index__
+            if __counts__[__point__]:
+                raise ValueError(f"Position ID inválida: {__text__!r}")
+            __counts__[__point__] = __n__ if __side__ == "white" else -__n__
+        __slot__ = 0 if __side__ == "white" else 1
+        __counts__[24 + __slot__] = __own__[24]
+        __counts__[26 + __slot__] = CHECKERS - sum(__own__)
+    if __key__:
+        raise ValueError(f"Position ID inválida: {__text__!r}")
+    return __counts__
+
+
+def encode_match_id(__fields__=None):
+    """
+    Codifica el estado de un partido como Match ID.
+
+    Args:
+        __fields__ (dict, opcional): Los campos que difieren de
+                                     MATCH_DEFAULTS.
+
+    Returns:
+        str: Los 12 caracteres de la Match ID.
+    """
+    __fields__ = {**MATCH_DEFAULTS, **(__fields__ or {})}
+    __values__ = {
+        **__fields__,
+        "cube": __fields__["cube"].bit_length() - 1,
+        "cube_owner": (
+            3 if __fields__["cube_owner"] is None else __fields__["cube_owner"]
+        ),
+        "die1": __fields__["dice"][0],
+        "die2": __fields__["dice"][1],
+        "score0": __fields__["scores"][0],
+        "score1": __fields__["scores"][1],
+    }
+    __key__ = 0
+    for __field__, __shift__, __width__ in _MATCH_FIELDS:
+        __key__ |= (int(__values__[__field__]) & ((1 << __width__) - 1)) << __shift__
+    return base64.b64encode(__key__.to_bytes(9, "little")).decode("ascii")
+
+
+def decode_match_id(__text__):
+    """
+    Devuelve los campos de una Match ID.
+
+    Args:
+        __text__ (str): Los 12 caracteres de la Match ID.
+
+    Returns:
+        dict: Los campos, con las claves de MATCH_DEFAULTS.
+
+    Raises:
+        ValueError: Si el texto no es una Match ID válida.
+    """
+    if not isinstance(__text__, str) or len(__text__) != 12:
+        raise ValueError(f"Match ID inválida: {__text__!r}")
+    __key__ = _decode_key(__text__, 9)
+    __values__ = {
+        __field__: (__key__ >> __shift__) & ((1 << __width__) - 1)
+        for __field__, __shift__, __width__ in _MATCH_FIELDS
+    }
+    return {
+        "cube": 1 << __values__["cube"],
+        "cube_owner": (
+            None if __values__["cube_owner"] == 3 else __values__["cube_owner"]
+        ),
+        "on_roll": __values__["on_roll"],
+        "crawford": bool(__values__["crawford"]),
+        "state": __values__["state"],
+        "turn": __values__["turn"],
+        "double_offered": bool(__values__["double_offered"]),
+        "resigned": __values__["resigned"],
+        "dice": (__values__["die1"], __values__["die2"]),
+        "match_length": __values__["match_length"],
+        "scores": (__values__["score0"], __values__["score1"]),
+    }
@@ -0,0 +1,59 @@
+"""
+Módulo que reconstruye partidas a partir de su diario (core.journal).
+
+Para llegar a un turno se parte de la instantánea más cercana anterior que
+guardó el diario y se aplican sólo los eventos que faltan, así que revisar
+el turno 180 de una partida larga aplica a lo sumo los eventos de un
+intervalo entre instantáneas en lugar de repetir la partida desde el
+principio.
+
+Functions
+---------
+replay
+    Devuelve la partida en un turno de su diario
+"""
+
+from core.game import Game
+from core.journal import EVENT_MOVE, EVENT_ROLL, GameJournal
+from core.move import Move
+
+
+def replay(__journal__, __ply__=None):
+    """
+    Reconstruye la partida en un turno de su diario.
+
+    La partida queda sobre un CompactBoard, con dados nuevos y con un
+    diario propio que empieza en esa posición.
+
+    Args:
+        __journal__ (GameJournal): El diario, por ejemplo el __history__ de
+                                   una partida o uno leído con
+                                   GameJournal.read.
+        __ply__ (int, opcional): El turno, contado desde 0; la posición es
+                                 la de después de su tirada. Por defecto, la
+                                 posición final.
+
+    Returns:
+        Game: La partida en ese turno.
+
+    Raises:
+        IndexError: Si el turno no está en el diario.
+    """
+    __snapshot__, __events__ = __journal__.locate(__ply__)
+    __game__ = Game.from_bytes(__snapshot__)
+    for __event__ in __events__:
+        __kind__ = __event__ >> 16
+        if __kind__ == EVENT_MOVE:
+            __game__.push_move(Move.decode(__event__ & 0xFFFF))
+        elif __kind__ == EVENT_ROLL:
+            __first__, __second__ = __event__ & 0x7, __event__ >> 3 & 0x7
+            __game__.__current_turn__ = __event__ >> 6 & 1
+            __game__.__dice_values__ = (
+                [__first__] * 4 if __first__ == __second__ else [__first__, __second__]
+            )
+        else:
+            __game__.__current_turn__ = __event__ & 1
+            __game__.__dice_values__ = []
+    __game__.__undo_stack__.clear()
+    __game__.__history__ = GameJournal(__game__.to_bytes(), __journal__.__interval__)
+    return __game__
@@ -0,0 +1,115 @@
+"""
+Módulo que define las claves de hashing Zobrist para posiciones de Backgammon.
+
+Cada combinación (color, punto, cantidad de fichas) tiene asociada una clave
+aleatoria de 64 bits. El hash de una posición es el XOR de las claves de todos
+sus puntos, por lo que al mover una ficha basta con quitar la clave de la
+cantidad anterior y agregar la de la nueva cantidad, en O(1).
+
+Las claves se generan con una semilla fija, de modo que el mismo tablero
+produce el mismo hash en todos los procesos y ejecuciones.
+
+Functions
+---------
+hash_counts
+    Calcula desde cero el hash de una posición en formato de conteos con signo
+fold_turn_and_dice
+    Combina el hash del tablero con el turno y los dados restantes
+"""
+
+import random
+
+MAX_COUNT = 31
+_SEED = 0x5EED_BAC6
+
+_rng = random.Random(_SEED)
+
+
+def _new_keys(size):
+    """
+    Genera una lista de claves de 64 bits donde la cantidad 0 vale 0,
+    para que un punto vacío no aporte nada al hash.
+    """
+    return [0] + [_rng.getrandbits(64) for _ in range(size - 1)]
+
+
+POINT_KEYS = {
+    __color__: [_new_keys(MAX_COUNT + 1) for _ in range(24)]
+    for __color__ in ("white", "black")
+}
+# STEP_KEYS[color][punto][n] es el cambio del hash cuando un punto pasa de n
+# a n + 1 fichas (o de n + 1 a n): una sola operación XOR por punto.
+STEP_KEYS = {
+    __color__: [
+        [__keys__[__n__] ^ __keys__[__n__ + 1] for __n__ in range(MAX_COUNT)]
+        for __keys__ in POINT_KEYS[__color__]
+    ]
+    for __color__ in ("white", "black")
+}
+BAR_KEYS = {__color__: _new_keys(MAX_COUNT + 1) for __color__ in ("white", "black")}
+OFF_KEYS = {__color__: _new_keys(MAX_COUNT + 1) for __color__ in ("white", "black")}
+SIDE_KEY = _rng.getrandbits(64)
+DICE_KEYS = [_new_keys(5) for _ in range(7)]
+
+
+def hash_counts(__counts__):
+    """
+    Calcula el hash Zobrist de los puntos de una posición.
+
+    Args:
+        __counts__ (list): Conteos con signo de los 24 puntos
+                           (positivo = blancas, negativo = negras).
+
+    Returns:
+        int: El hash de los puntos (sin barra ni fichas retiradas).
+    """
+    __key__ = 0
+    for __point__ in range(24):
+        __value__ = __counts__[__point__]
+        if __value__ > 0:
+            __key__ ^= POINT_KEYS["white"][__point__][__value__]
+        elif __value__ < 0:
+            __key__ ^= POINT_KEYS["black"][__point__][-__value__]
+    return __key__
+
+
+def fold_bar_and_off(__points_hash__, __bar__, __off__):
+    """
+    Agrega al hash de los puntos las claves de la barra y de las fichas retiradas.
+
+    Args:
+        __points_hash__ (int): El hash de los puntos.
+        __bar__ (tuple): Fichas en la barra (blancas, negras).
+        __off__ (tuple): Fichas retiradas (blancas, negras).
+
+    Returns:
+        int: El hash completo del tablero.
+    """
+    return (
+        __points_hash__
+        ^ BAR_KEYS["white"][__bar__[0]]
+        ^ BAR_KEYS["black"][__bar__[1]]
+        ^ OFF_KEYS["white"][__off__[0]]
+        ^ OFF_KEYS["black"][__off__[1]]
+    )
+
+
+def fold_turn_and_dice(__board_hash__, __turn__, __dice_values__):
+    """
+    Combina el hash del tablero con el jugador en turno y los dados restantes.
+
+    Args:
+        __board_hash__ (int): El hash del tablero.
+        __turn__ (int): Índice del jugador en turno (0 o 1).
+        __dice_values__ (list): Los valores de dados que quedan por usar.
+
+    Returns:
+        int: El hash de la posición de juego.
+    """
+    __key__ = __board_hash__ ^ (SIDE_KEY if __turn__ else 0)
+    __seen__ = {}
+    for __die__ in __dice_values__:
+        __seen__[__die__] = __seen__.get(__die__, 0) + 1
+    for __die__, __count__ in __seen__.items():
+        __key__ ^= DICE_KEYS[__die__][__count__]
+    return __key__
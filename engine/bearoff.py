@@ -0,0 +1,700 @@
+"""
+Bases de datos de bear-off precalculadas y mapeadas en memoria.
+
+Cuando todas las fichas de un jugador están en su casa, lo único que
+importa de su posición es cuántas hay en cada uno de los 6 puntos, y el
+número de tiradas que le faltan para retirarlas no depende del rival. La
+base de un lado guarda, para cada distribución de hasta MAX_CHECKERS fichas
+en los 6 puntos (54264 con 15 fichas), la cantidad esperada de tiradas para
+sacarlas todas jugando para minimizarla, y la distribución completa de esa
+cantidad (probabilidad de terminar en exactamente 0, 1, ..., MAX_TURNS - 1
+tiradas; la última casilla acumula el resto). Se calcula con programación
+dinámica en orden creciente de pips: el valor de una posición sale del
+mejor resultado de cada una de las 21 tiradas, que siempre tiene menos pips
+y ya está calculado.
+
+La base de dos lados guarda la probabilidad exacta de ganar (sin cubo) del
+jugador en turno para cada par de distribuciones de hasta
+TWO_SIDED_CHECKERS fichas por lado (853776 pares con 6), calculada hacia
+atrás por niveles de pips totales (ver build_two_sided).
+
+Los archivos tienen una cabecera y los valores en el orden del índice de
+cada posición (ver one_sided_index): la de un lado, las esperanzas como
+float32 y las distribuciones como uint16 (probabilidad * 65535); la de dos
+lados, las probabilidades como uint16 con el par (a, b) en a * N + b. Los
+lectores los abren con mmap, así que varios procesos que los usan comparten
+una sola copia en memoria y cada consulta cuesta calcular un índice.
+
+Uso:
+    python -m engine.bearoff [--two-sided] [--checkers N] [--output RUTA]
+
+Classes
+-------
+OneSidedBearoff
+    El lector de la base de un lado
+TwoSidedBearoff
+    El lector de la base de dos lados
+
+Functions
+---------
+home_points
+    Devuelve las fichas de un color en cada punto de su casa
+one_sided_index
+    Calcula el índice de una distribución en las bases
+build_one_sided
+    Calcula la base de un lado
+write_one_sided
+    Calcula la base de un lado y la escribe en un archivo
+build_two_sided
+    Calcula la base de dos lados
+write_two_sided
+    Calcula la base de dos lados y la escribe en un archivo
+load_one_sided
+    Abre la base de un lado la primera vez que se pide
+load_two_sided
+    Abre la base de dos lados la primera vez que se pide
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+from core.board import OPPONENT
+
+# Puntos de la casa y máximo de fichas de cada jugador.
+HOME_POINTS = 6
+MAX_CHECKERS = 15
+# Casillas de la distribución de tiradas.
+MAX_TURNS = 32
+# Ruta por defecto del archivo.
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "data", "bearoff1.bin")
+# Máximo de fichas por lado y ruta por defecto de la base de dos lados.
+TWO_SIDED_CHECKERS = 6
+DEFAULT_TWO_SIDED_PATH = os.path.join(os.path.dirname(__file__), "data", "bearoff2.bin")
+
+# Cabecera: firma, puntos, fichas, casillas y cantidad de posiciones.
+_HEADER = struct.Struct("<8sIIII")
+_MAGIC = b"BGBEAR1\0"
+_SCALE = 65535
+_TWO_SIDED_MAGIC = b"BGBEAR2\0"
+# Pares de posiciones que se calculan por lote en la base de dos lados.
+_TWO_SIDED_CHUNK = 4096
+# Las 21 tiradas como dados a jugar (4 en los dobles), con su probabilidad.
+_ROLLS = [
+    ((__d1__,) * 4, 1 / 36) if __d1__ == __d2__ else ((__d1__, __d2__), 2 / 36)
+    for __d1__ in range(1, 7)
+    for __d2__ in range(__d1__, 7)
+]
+
+
+def home_points(__counts__, __color__):
+    """
+    Devuelve las fichas de un color en cada punto de su casa.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __color__ (str): El color.
+
+    Returns:
+        tuple: Las fichas a 1, 2, ..., 6 puntos de la salida, o None si
+               alguna está en la barra o fuera de la casa.
+    """
+    if __color__ == "white":
+        if __counts__[24] or any(__count__ > 0 for __count__ in __counts__[:18]):
+            return None
+        return tuple(max(__counts__[23 - __index__], 0) for __index__ in range(6))
+    if __counts__[25] or any(__count__ < 0 for __count__ in __counts__[6:24]):
+        return None
+    return tuple(max(-__counts__[__index__], 0) for __index__ in range(6))
+
+
+def one_sided_index(__points__):
+    """
+    Calcula el índice de una distribución en la base.
+
+    Las fichas en los 6 puntos más las que faltan para MAX_CHECKERS forman
+    una secuencia de MAX_CHECKERS fichas y 6 separadores; el índice es el
+    rango de las posiciones de los separadores en el sistema combinatorio.
+    No depende del máximo de fichas de la base, así que una base más chica
+    usa los primeros índices de una más grande.
+
+    Args:
+        __points__ (tuple): Las fichas a 1, 2, ..., 6 puntos de la salida.
+
+    Returns:
+        int: El índice, entre 0 y la cantidad de posiciones menos uno.
+    """
+    __index__ = 0
+    __position__ = -1
+    for __rank__, __checkers__ in enumerate(__points__, 1):
+        __position__ += __checkers__ + 1
+        __index__ += comb(__position__, __rank__)
+    return __index__
+
+
+def _positions(__max_checkers__):
+    """
+    Devuelve todas las distribuciones de hasta esa cantidad de fichas.
+    """
+    __result__ = [()]
+    for _ in range(HOME_POINTS):
+        __result__ = [
+            __partial__ + (__checkers__,)
+            for __partial__ in __result__
+            for __checkers__ in range(__max_checkers__ - sum(__partial__) + 1)
+        ]
+    return __result__
+
+
+def _pips(__points__):
+    """Cuenta de pips de una distribución."""
+    return sum(
+        __distance__ * __checkers__
+        for __distance__, __checkers__ in enumerate(__points__, 1)
+    )
+
+
+@lru_cache(maxsize=None)
+def _step(__points__, __die__):
+    """
+    Devuelve las distribuciones a las que se llega jugando un dado.
+
+    En el bear-off siempre se puede jugar un dado: se retira una ficha de
+    ese punto, se mueve una de un punto más alto o, si no hay ninguna más
+    alta, se retira la del punto más alto.
+    """
+    if not any(__points__):
+        return (__points__,)
+    __results__ = set()
+    __mutable__ = list(__points__)
+    if __points__[__die__ - 1]:
+        __mutable__[__die__ - 1] -= 1
+        __results__.add(tuple(__mutable__))
+        __mutable__[__die__ - 1] += 1
+    __higher__ = False
+    for __point__ in range(__die__ + 1, HOME_POINTS + 1):
+        if __points__[__point__ - 1]:
+            __higher__ = True
+            __mutable__[__point__ - 1] -= 1
+            __mutable__[__point__ - __die__ - 1] += 1
+            __results__.add(tuple(__mutable__))
+            __mutable__[__point__ - 1] += 1
+            __mutable__[__point__ - __die__ - 1] -= 1
+    if not __higher__ and not __points__[__die__ - 1]:
+        __highest__ = max(
+            __point__ for __point__ in range(__die__) if __points__[__point__]
+        )
+        __mutable__[__highest__] -= 1
+        __results__.add(tuple(__mutable__))
+    return tuple(__results__)
+
+
+def _roll_results(__points__, __dice__):
+    """
+    Devuelve las distribuciones a las que se llega jugando una tirada entera.
+    """
+    __states__ = {__points__}
+    for __die__ in __dice__:
+        __states__ = {
+            __after__
+            for __state__ in __states__
+            for __after__ in _step(__state__, __die__)
+        }
+    if len(__dice__) == 2:
+        __reversed__ = {__points__}
+        for __die__ in reversed(__dice__):
+            __reversed__ = {
+                __after__
+                for __state__ in __reversed__
+                for __after__ in _step(__state__, __die__)
+            }
+        __states__ |= __reversed__
+    return __states__
+
+
+def build_one_sided(__max_checkers__=MAX_CHECKERS):
+    """
+    Calcula la base de bear-off de un lado.
+
+    Args:
+        __max_checkers__ (int, opcional): El máximo de fichas por posición.
+
+    Returns:
+        tuple: (esperanzas, distribuciones): dos listas en el orden del
+               índice, con la cantidad esperada de tiradas y la lista de
+               MAX_TURNS probabilidades de cada posición.
+    """
+    __positions__ = sorted(_positions(__max_checkers__), key=_pips)
+    __count__ = comb(__max_checkers__ + HOME_POINTS, HOME_POINTS)
+    __means__ = [0.0] * __count__
+    __distributions__ = [None] * __count__
+    __distributions__[0] = [1.0] + [0.0] * (MAX_TURNS - 1)
+    for __points__ in __positions__[1:]:
+        __mean__ = 1.0
+        __distribution__ = [0.0] * MAX_TURNS
+        for __dice__, __probability__ in _ROLLS:
+            __best__ = min(
+                (
+                    one_sided_index(__after__)
+                    for __after__ in _roll_results(__points__, __dice__)
+                ),
+                key=__means__.__getitem__,
+            )
+            __mean__ += __probability__ * __means__[__best__]
+            __following__ = __distributions__[__best__]
+            for __turns__ in range(MAX_TURNS - 1):
+                __distribution__[__turns__ + 1] += (
+                    __probability__ * __following__[__turns__]
+                )
+            __distribution__[-1] += __probability__ * __following__[-1]
+        __index__ = one_sided_index(__points__)
+        __means__[__index__] = __mean__
+        __distributions__[__index__] = __distribution__
+    _step.cache_clear()
+    return __means__, __distributions__
+
+
+def write_one_sided(__path__=DEFAULT_PATH, __max_checkers__=MAX_CHECKERS):
+    """
+    Calcula la base de bear-off de un lado y la escribe en un archivo.
+
+    Args:
+        __path__ (str, opcional): La ruta del archivo.
+        __max_checkers__ (int, opcional): El máximo de fichas por posición.
+
+    Returns:
+        int: La cantidad de posiciones escritas.
+    """
+    __means__, __distributions__ = build_one_sided(__max_checkers__)
+    __count__ = len(__means__)
+    os.makedirs(os.path.dirname(os.path.abspath(__path__)), exist_ok=True)
+    with open(__path__, "wb") as __file__:
+        __file__.write(
+            _HEADER.pack(_MAGIC, HOME_POINTS, __max_checkers__, MAX_TURNS, __count__)
+        )
+        __file__.write(struct.pack(f"<{__count__}f", *__means__))
+        for __distribution__ in __distributions__:
+            __file__.write(
+                struct.pack(
+                    f"<{MAX_TURNS}H",
+                    *(round(__value__ * _SCALE) for __value__ in __distribution__),
+                )
+            )
+    return __count__
+
+
+def _successor_table(__points__):
+    """
+    Devuelve una matriz (N, 21, M) con los índices de las distribuciones a
+    las que se llega desde cada una con cada tirada.
+
+    Las listas se rellenan repitiendo el primer sucesor; repetir no cambia
+    el mejor.
+    """
+    __successors__ = [
+        [
+            [
+                one_sided_index(__after__)
+                for __after__ in _roll_results(__position__, __dice__)
+            ]
+            for __dice__, _ in _ROLLS
+        ]
+        for __position__ in __points__
+    ]
+    _step.cache_clear()
+    __width__ = max(
+        len(__after__) for __rolls__ in __successors__ for __after__ in __rolls__
+    )
+    return np.array(
+        [
+            [
+                __after__ + __after__[:1] * (__width__ - len(__after__))
+                for __after__ in __rolls__
+            ]
+            for __rolls__ in __successors__
+        ],
+        dtype=np.int32,
+    )
+
+
+def build_two_sided(__max_checkers__=TWO_SIDED_CHECKERS):
+    """
+    Calcula la base de bear-off de dos lados por programación dinámica
+    retrógrada.
+
+    La probabilidad de ganar del jugador en turno con la distribución a
+    contra la b es el promedio, sobre las 21 tiradas, de la mejor jugada:
+    1 si retira todas, y si no 1 menos la del rival en turno contra lo que
+    quedó. Esa posición tiene menos pips en total, así que las posiciones
+    se calculan por niveles de pips totales, cada nivel en lote con NumPy.
+
+    Args:
+        __max_checkers__ (int, opcional): El máximo de fichas por lado;
+                                          menos de MAX_CHECKERS, para que
+                                          no haya gammons.
+
+    Returns:
+        numpy.ndarray: Una matriz (N, N) con la probabilidad de ganar del
+                       jugador en turno, indexada por one_sided_index de
+                       su distribución y la del rival.
+
+    Raises:
+        ValueError: Si la cantidad de fichas permite gammons.
+    """
+    if not 0 < __max_checkers__ < MAX_CHECKERS:
+        raise ValueError(f"El máximo de fichas debe estar entre 1 y {MAX_CHECKERS - 1}")
+    __points__ = sorted(_positions(__max_checkers__), key=one_sided_index)
+    __count__ = len(__points__)
+    __table__ = _successor_table(__points__)
+    __probabilities__ = np.array([__probability__ for _, __probability__ in _ROLLS])
+    __pips__ = np.array([_pips(__position__) for __position__ in __points__])
+
+    # wins[a, 0] = 0: el rival ya retiró todas. wins[0, b] no se usa.
+    __wins__ = np.zeros((__count__, __count__))
+    __wins__[0, 1:] = 1.0
+    __totals__ = __pips__[:, None] + __pips__[None, :]
+    for __total__ in range(2, 2 * int(__pips__.max()) + 1):
+        __mine__, __theirs__ = np.nonzero(__totals__ == __total__)
+        __playing__ = (__mine__ > 0) & (__theirs__ > 0)
+        __mine__, __theirs__ = __mine__[__playing__], __theirs__[__playing__]
+        for __start__ in range(0, len(__mine__), _TWO_SIDED_CHUNK):
+            __rows__ = __mine__[__start__ : __start__ + _TWO_SIDED_CHUNK]
+            __columns__ = __theirs__[__start__ : __start__ + _TWO_SIDED_CHUNK]
+            __replies__ = (
+                1.0 - __wins__[__columns__[:, None, None], __table__[__rows__]]
+            )
+            __wins__[__rows__, __columns__] = (
+                __replies__.max(axis=2) @ __probabilities__
+            )
+    # Las 21 probabilidades suman 1 salvo por el redondeo.
+    return np.clip(__wins__, 0.0, 1.0)
+
+
+def write_two_sided(
+    __path__=DEFAULT_TWO_SIDED_PATH, __max_checkers__=TWO_SIDED_CHECKERS
+):
+    """
+    Calcula la base de bear-off de dos lados y la escribe en un archivo.
+
+    Args:
+        __path__ (str, opcional): La ruta del archivo.
+        __max_checkers__ (int, opcional): El máximo de fichas por lado.
+
+    Returns:
+        int: La cantidad de pares de posiciones escritos.
+    """
+    __wins__ = build_two_sided(__max_checkers__)
+    os.makedirs(os.path.dirname(os.path.abspath(__path__)), exist_ok=True)
+    with open(__path__, "wb") as __file__:
+        __file__.write(
+            _HEADER.pack(
+                _TWO_SIDED_MAGIC, HOME_POINTS, __max_checkers__, 0, len(__wins__)
+            )
+        )
+        __file__.write(np.rint(__wins__ * _SCALE).astype("<u2").tobytes())
+    return __wins__.size
+
+
+class OneSidedBearoff:
+    """
+    Lector de la base de bear-off de un lado, mapeada en memoria.
+
+    Atributos:
+        __file__ (file): El archivo abierto.
+        __map__ (mmap.mmap): El mapeo de sólo lectura del archivo.
+        __max_checkers__ (int): El máximo de fichas de la base.
+        __means__ (memoryview): Las esperanzas, como float32.
+        __distributions__ (memoryview): Las distribuciones, como uint16.
+    """
+
+    def __init__(self, __path__=DEFAULT_PATH):
+        """
+        Abre la base.
+
+        Args:
+            __path__ (str, opcional): La ruta del archivo.
+
+        Raises:
+            ValueError: Si el archivo no es una base de bear-off de un lado.
+        """
+        self.__file__ = open(__path__, "rb")  # pylint: disable=consider-using-with
+        self.__map__ = mmap.mmap(self.__file__.fileno(), 0, access=mmap.ACCESS_READ)
+        __magic__, __points__, __checkers__, __turns__, __count__ = _HEADER.unpack_from(
+            self.__map__
+        )
+        if (__magic__, __points__, __turns__) != (_MAGIC, HOME_POINTS, MAX_TURNS):
+            self.close()
+            raise ValueError(f"{__path__} no es una base de bear-off de un lado")
+        self.__max_checkers__ = __checkers__
+        __start__ = _HEADER.size
+        __view__ = memoryview(self.__map__)
+        self.__means__ = __view__[__start__ : __start__ + 4 * __count__].cast("f")
+        __start__ += 4 * __count__
+        self.__distributions__ = __view__[
+            __start__ : __start__ + 2 * MAX_TURNS * __count__
+        ].cast("H")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *__exc_info__):
+        self.close()
+
+    def __len__(self):
+        """
+        Devuelve la cantidad de posiciones de la base.
+        """
+        return len(self.__means__)
+
+    def close(self):
+        """
+        Libera el mapeo y cierra el archivo.
+        """
+        for __view__ in ("__means__", "__distributions__"):
+            if hasattr(self, __view__):
+                getattr(self, __view__).release()
+        self.__map__.close()
+        self.__file__.close()
+
+    def get_max_checkers(self):
+        """
+        Devuelve el máximo de fichas por posición de la base.
+        """
+        return self.__max_checkers__
+
+    def expected_rolls(self, __points__):
+        """
+        Devuelve la cantidad esperada de tiradas para retirar las fichas.
+
+        Args:
+            __points__ (tuple): Las fichas a 1, 2, ..., 6 puntos de la salida.
+
+        Returns:
+            float: La cantidad esperada de tiradas.
+        """
+        return self.__means__[one_sided_index(__points__)]
+
+    def distribution(self, __points__):
+        """
+        Devuelve la distribución de la cantidad de tiradas para retirarlas.
+
+        Args:
+            __points__ (tuple): Las fichas a 1, 2, ..., 6 puntos de la salida.
+
+        Returns:
+            list: MAX_TURNS probabilidades de terminar en exactamente 0, 1,
+                  ... tiradas.
+        """
+        __start__ = MAX_TURNS * one_sided_index(__points__)
+        return [
+            __value__ / _SCALE
+            for __value__ in self.__distributions__[__start__ : __start__ + MAX_TURNS]
+        ]
+
+    def lookup(self, __counts__, __color__):
+        """
+        Devuelve las tiradas esperadas de un color en una posición.
+
+        Args:
+            __counts__ (list): Los 28 conteos con signo de la posición.
+            __color__ (str): El color.
+
+        Returns:
+            float: La cantidad esperada de tiradas, o None si el color no
+                   tiene todas las fichas en casa o tiene más de las que
+                   cubre la base.
+        """
+        __points__ = home_points(__counts__, __color__)
+        if __points__ is None or sum(__points__) > self.__max_checkers__:
+            return None
+        return self.expected_rolls(__points__)
+
+    def best_play(self, __candidates__, __color__):
+        """
+        Elige la jugada de bear-off que minimiza las tiradas esperadas.
+
+        Args:
+            __candidates__ (list): Tuplas (jugada, conteos_resultantes), como
+                                   las de Game.get_legal_plays_with_positions().
+            __color__ (str): El color que mueve.
+
+        Returns:
+            tuple: La mejor jugada, o None si alguna posición resultante no
+                   está en la base.
+        """
+        __best__, __best_rolls__ = None, None
+        for __play__, __after__ in __candidates__:
+            __rolls__ = self.lookup(__after__, __color__)
+            if __rolls__ is None:
+                return None
+            if __best_rolls__ is None or __rolls__ < __best_rolls__:
+                __best__, __best_rolls__ = __play__, __rolls__
+        return __best__
+
+
+class TwoSidedBearoff:
+    """
+    Lector de la base de bear-off de dos lados, mapeada en memoria.
+
+    Atributos:
+        __file__ (file): El archivo abierto.
+        __map__ (mmap.mmap): El mapeo de sólo lectura del archivo.
+        __max_checkers__ (int): El máximo de fichas por lado.
+        __count__ (int): Las distribuciones posibles de cada lado.
+        __wins__ (memoryview): Las probabilidades de ganar, como uint16.
+    """
+
+    def __init__(self, __path__=DEFAULT_TWO_SIDED_PATH):
+        """
+        Abre la base.
+
+        Args:
+            __path__ (str, opcional): La ruta del archivo.
+
+        Raises:
+            ValueError: Si el archivo no es una base de bear-off de dos lados.
+        """
+        self.__file__ = open(__path__, "rb")  # pylint: disable=consider-using-with
+        self.__map__ = mmap.mmap(self.__file__.fileno(), 0, access=mmap.ACCESS_READ)
+        __magic__, __points__, __checkers__, _, __count__ = _HEADER.unpack_from(
+            self.__map__
+        )
+        if (__magic__, __points__) != (_TWO_SIDED_MAGIC, HOME_POINTS):
+            self.close()
+            raise ValueError(f"{__path__} no es una base de bear-off de dos lados")
+        self.__max_checkers__ = __checkers__
+        self.__count__ = __count__
+        self.__wins__ = memoryview(self.__map__)[
+            _HEADER.size : _HEADER.size + 2 * __count__ * __count__
+        ].cast("H")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *__exc_info__):
+        self.close()
+
+    def __len__(self):
+        """
+        Devuelve la cantidad de pares de posiciones de la base.
+        """
+        return len(self.__wins__)
+
+    def close(self):
+        """
+        Libera el mapeo y cierra el archivo.
+        """
+        if isinstance(getattr(self, "__wins__", None), memoryview):
+            getattr(self, "__wins__").release()
+        self.__map__.close()
+        self.__file__.close()
+
+    def get_max_checkers(self):
+        """
+        Devuelve el máximo de fichas por lado de la base.
+        """
+        return self.__max_checkers__
+
+    def win_probability(self, __mine__, __theirs__):
+        """
+        Devuelve la probabilidad de ganar del jugador en turno.
+
+        Args:
+            __mine__ (tuple): Sus fichas a 1, 2, ..., 6 puntos de la salida.
+            __theirs__ (tuple): Las del rival.
+
+        Returns:
+            float: La probabilidad de ganar, sin cubo.
+        """
+        return (
+            self.__wins__[
+                one_sided_index(__mine__) * self.__count__ + one_sided_index(__theirs__)
+            ]
+            / _SCALE
+        )
+
+    def lookup(self, __board__, __color__):
+        """
+        Devuelve la equity exacta sin cubo del color en turno.
+
+        Args:
+            __board__ (Board): El tablero, o sus 28 conteos.
+            __color__ (str): El color que tiene el turno.
+
+        Returns:
+            float: La equity, entre -1 y 1 (no hay gammons), o None si
+                   algún lado tiene fichas fuera de la casa o más de las
+                   que cubre la base.
+        """
+        __counts__ = (
+            __board__.get_counts() if hasattr(__board__, "get_counts") else __board__
+        )
+        __mine__ = home_points(__counts__, __color__)
+        __theirs__ = home_points(__counts__, OPPONENT[__color__])
+        if (
+            __mine__ is None
+            or __theirs__ is None
+            or sum(__mine__) > self.__max_checkers__
+            or sum(__theirs__) > self.__max_checkers__
+        ):
+            return None
+        return 2.0 * self.win_probability(__mine__, __theirs__) - 1.0
+
+
+@lru_cache(maxsize=None)
+def load_one_sided(__path__=DEFAULT_PATH):
+    """
+    Abre la base de un lado la primera vez que se pide y la comparte.
+
+    Args:
+        __path__ (str, opcional): La ruta del archivo.
+
+    Returns:
+        OneSidedBearoff: La base, o None si el archivo no existe.
+    """
+    if not os.path.exists(__path__):
+        return None
+    return OneSidedBearoff(__path__)
+
+
+@lru_cache(maxsize=None)
+def load_two_sided(__path__=DEFAULT_TWO_SIDED_PATH):
+    """
+    Abre la base de dos lados la primera vez que se pide y la comparte.
+
+    Args:
+        __path__ (str, opcional): La ruta del archivo.
+
+    Returns:
+        TwoSidedBearoff: La base, o None si el archivo no existe.
+    """
+    if not os.path.exists(__path__):
+        return None
+    return TwoSidedBearoff(__path__)
+
+
+def main(argv=None):
+    """
+    Genera la base desde la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--checkers", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--two-sided", action="store_true")
+    args = parser.parse_args(argv)
+    if args.two_sided:
+        output = args.output or DEFAULT_TWO_SIDED_PATH
+        count = write_two_sided(output, args.checkers or TWO_SIDED_CHECKERS)
+    else:
+        output = args.output or DEFAULT_PATH
+        count = write_one_sided(output, args.checkers or MAX_CHECKERS)
+    print(f"{count} posiciones escritas en {output}")
+
+
+if __name__ == "__main__":
+    main()
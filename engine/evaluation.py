@@ -0,0 +1,146 @@
+"""
+Módulo con la evaluación estática de posiciones para los motores de búsqueda.
+
+Las posiciones se reciben como los 28 conteos con signo de
+Board.get_counts(). La evaluación devuelve la equity (puntos esperados, sin
+cubo) del color indicado suponiendo que le toca tirar: +1 es una victoria
+segura, -1 una derrota segura, y en las posiciones terminadas vale ±1, ±2 o
+±3 según sea una victoria simple, un gammon o un backgammon.
+
+La evaluación heurística combina la carrera de pips (con la ventaja de tener
+el turno), los puntos hechos en el cuadrante de casa, las fichas en la barra
+y los blots expuestos, y pasa el resultado por una logística. Es barata, que
+es lo que importa en las hojas de la búsqueda.
+
+Las posiciones sin contacto son carreras puras y se valúan con la
+probabilidad de ganar de engine.race (con las bases de bear-off de
+engine/data si se generaron), sin gammons como el resto de la heurística.
+
+Functions
+---------
+win_points
+    Devuelve los puntos de una partida ya ganada por un color
+evaluate
+    Evalúa estáticamente una posición para el color que tiene el turno
+"""
+
+import math
+
+from core.board import OPPONENT
+from engine.bearoff import load_one_sided, load_two_sided
+from engine.race import race_probabilities
+
+# Fichas de cada jugador.
+CHECKERS = 15
+
+# Equity mínima y máxima de cualquier posición (un backgammon).
+MIN_EQUITY = -3.0
+MAX_EQUITY = 3.0
+
+# Cotas de evaluate() en las posiciones que no terminaron.
+NON_TERMINAL_BOUNDS = (-1.0, 1.0)
+
+# Índices de la barra y de las fichas retiradas en los conteos.
+_BAR = {"white": 24, "black": 25}
+_OFF = {"white": 26, "black": 27}
+
+# Pips que vale tener el turno en la carrera.
+_ROLL_BONUS = 4
+# Pesos de la heurística, en unidades de la logística.
+_RACE_WEIGHT = 12.0
+_HOME_POINT_WEIGHT = 0.08
+_BAR_WEIGHT = 0.2
+_BLOT_WEIGHT = 0.12
+
+
+def win_points(__counts__, __winner__):
+    """
+    Devuelve los puntos de una partida en la que el ganador sacó sus fichas.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __winner__ (str): El color que sacó sus 15 fichas.
+
+    Returns:
+        int: 1 por una victoria simple, 2 por un gammon y 3 por un backgammon.
+    """
+    __loser__ = OPPONENT[__winner__]
+    if __counts__[_OFF[__loser__]]:
+        return 1
+    if __counts__[_BAR[__loser__]]:
+        return 3
+    if __winner__ == "white":
+        __trapped__ = any(__value__ < 0 for __value__ in __counts__[18:24])
+    else:
+        __trapped__ = any(__value__ > 0 for __value__ in __counts__[0:6])
+    return 3 if __trapped__ else 2
+
+
+def evaluate(__counts__, __color__):  # pylint: disable=too-many-locals
+    """
+    Evalúa una posición para el color que tiene el turno.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __color__ (str): El color que está por tirar.
+
+    Returns:
+        float: La equity del color, entre MIN_EQUITY y MAX_EQUITY.
+    """
+    if CHECKERS in (__counts__[26], __counts__[27]):
+        __winner__ = "white" if __counts__[26] == CHECKERS else "black"
+        __points__ = float(win_points(__counts__, __winner__))
+        return __points__ if __winner__ == __color__ else -__points__
+
+    __white_bar__, __black_bar__ = __counts__[24], __counts__[25]
+    __white_pips__ = 25 * __white_bar__
+    __black_pips__ = 25 * __black_bar__
+    __white_back__, __black_back__ = 24, -1
+    __white_blots__, __black_blots__ = [], []
+    __white_home__ = __black_home__ = 0
+    for __index__, __value__ in enumerate(__counts__[:24]):
+        if __value__ > 0:
+            __white_pips__ += __value__ * (24 - __index__)
+            if __white_back__ == 24:
+                __white_back__ = __index__
+            if __value__ == 1:
+                __white_blots__.append(__index__)
+            elif __index__ >= 18:
+                __white_home__ += 1
+        elif __value__ < 0:
+            __black_pips__ -= __value__ * (__index__ + 1)
+            __black_back__ = __index__
+            if __value__ == -1:
+                __black_blots__.append(__index__)
+            elif __index__ < 6:
+                __black_home__ += 1
+
+    if not (__white_bar__ or __black_bar__ or __white_back__ < __black_back__):
+        __win__ = race_probabilities(
+            __counts__, __color__, load_one_sided(), load_two_sided()
+        )[0]
+        return 2.0 * __win__ - 1.0
+
+    # Hay contacto: un blot está expuesto si alguna ficha rival puede
+    # alcanzarlo (todas pueden si el rival tiene fichas en la barra).
+    __white_exposed__ = (
+        len(__white_blots__)
+        if __black_bar__
+        else len([__i__ for __i__ in __white_blots__ if __i__ < __black_back__])
+    )
+    __black_exposed__ = (
+        len(__black_blots__)
+        if __white_bar__
+        else len([__i__ for __i__ in __black_blots__ if __i__ > __white_back__])
+    )
+    # Puntaje desde el punto de vista de las blancas, sin el turno.
+    __score__ = _HOME_POINT_WEIGHT * (__white_home__ - __black_home__)
+    __score__ += _BAR_WEIGHT * (__black_bar__ - __white_bar__)
+    __score__ += _BLOT_WEIGHT * (__black_exposed__ - __white_exposed__)
+
+    __sign__ = 1 if __color__ == "white" else -1
+    __lead__ = (__black_pips__ - __white_pips__) * __sign__ + _ROLL_BONUS
+    __score__ = __score__ * __sign__ + _RACE_WEIGHT * __lead__ / (
+        __white_pips__ + __black_pips__ + 20
+    )
+    return 2.0 / (1.0 + math.exp(-__score__)) - 1.0
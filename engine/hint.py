@@ -0,0 +1,215 @@
+"""
+Sugerencias de jugada ("hint") para el turno actual de una partida.
+
+HintAdvisor ordena las jugadas completas de los dados del turno con una
+búsqueda de 1 ply sobre la evaluación heurística: cada jugada vale el
+promedio, sobre las 21 tiradas del rival, de la posición que deja su mejor
+respuesta. Primero puntúa todas a 0 plies y después las reevalúa a 1 ply
+de mejor a peor mientras quede tiempo; las que no llegan conservan la
+valuación a 0 plies y quedan detrás, como en ExpectiminimaxSearch.analyze.
+
+Los resultados se guardan en una caché LRU indexada por el hash Zobrist del
+tablero, el color en turno y los dados, así que pedir otra vez la
+sugerencia del mismo turno no vuelve a buscar; sólo se repite la búsqueda
+si el análisis guardado quedó incompleto y ahora se da más tiempo.
+Game.get_hints usa el asesor compartido de default_advisor.
+
+Classes
+-------
+HintAdvisor
+    Ordena las jugadas de un turno y guarda los resultados
+
+Functions
+---------
+default_advisor
+    Devuelve el asesor compartido por todas las partidas
+"""
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from core.board import OPPONENT
+from core.play_generator import enumerate_plays, enumerate_positions
+from engine.evaluation import CHECKERS, evaluate
+from engine.search import ROLLS, dice_for_roll
+
+# Jugadas que devuelve una sugerencia por defecto.
+DEFAULT_HINTS = 3
+# Segundos por defecto para la búsqueda a 1 ply.
+DEFAULT_BUDGET = 0.5
+# Turnos que guarda la caché.
+DEFAULT_CACHE_SIZE = 1024
+
+
+class HintAdvisor:
+    """
+    Ordena las jugadas del turno actual con una búsqueda de 1 ply.
+
+    Atributos:
+        __evaluator__ (callable): La evaluación estática (conteos, color) ->
+                                  equity del color que tiene el turno.
+        __budget__ (float): Los segundos por defecto para la búsqueda.
+        __cache__ (OrderedDict): Por (hash del tablero, color, dados), el
+                                 análisis y los segundos con que se hizo,
+                                 del menos al más recientemente usado.
+        __capacity__ (int): Los turnos que guarda la caché.
+        __stats__ (dict): Los aciertos (hits) y fallos (misses) de la caché.
+    """
+
+    def __init__(
+        self,
+        __evaluator__=evaluate,
+        __budget__=DEFAULT_BUDGET,
+        __capacity__=DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Inicializa el asesor.
+
+        Args:
+            __evaluator__ (callable, opcional): La evaluación estática.
+            __budget__ (float, opcional): Los segundos por defecto.
+            __capacity__ (int, opcional): Los turnos que guarda la caché.
+        """
+        self.__evaluator__ = __evaluator__
+        self.__budget__ = __budget__
+        self.__cache__ = OrderedDict()
+        self.__capacity__ = __capacity__
+        self.__stats__ = {"hits": 0, "misses": 0}
+
+    def get_stats(self):
+        """
+        Devuelve los contadores de la caché.
+
+        Returns:
+            dict: hits, misses y size.
+        """
+        return {**self.__stats__, "size": len(self.__cache__)}
+
+    def clear(self):
+        """
+        Vacía la caché.
+        """
+        self.__cache__.clear()
+
+    def hints(self, __game__, __count__=DEFAULT_HINTS, __budget__=None):
+        """
+        Devuelve las mejores jugadas del turno actual de una partida.
+
+        Args:
+            __game__ (Game): La partida, con los dados ya tirados.
+            __count__ (int, opcional): Las jugadas a devolver.
+            __budget__ (float, opcional): Los segundos para la búsqueda; por
+                                          defecto los del asesor. Sólo se usa
+                                          si el turno no está en la caché o
+                                          si su análisis quedó incompleto
+                                          con menos tiempo.
+
+        Returns:
+            list: Tuplas (jugada, equity, pérdida, plies) de mejor a peor;
+                  pérdida es la diferencia con la equity de la mejor jugada
+                  y plies la profundidad a la que se evaluó (0 o 1). Vacía
+                  si no hay jugadas legales.
+        """
+        __budget__ = self.__budget__ if __budget__ is None else __budget__
+        __color__ = __game__.get_current_player().__color__
+        __dice__ = __game__.get_dice_values()
+        # El hash de la partida mezcla el índice del turno, no el color: una
+        # partida que empieza con negras daría la misma clave que una con
+        # blancas.
+        __key__ = (__game__.__board__.zobrist_hash, __color__, tuple(sorted(__dice__)))
+        __entry__ = self.__cache__.get(__key__)
+        if __entry__ is None or (
+            __budget__ > __entry__[1]
+            and len(__entry__[0]) > 1
+            and any(__plies__ == 0 for _, _, _, __plies__ in __entry__[0])
+        ):
+            self.__stats__["misses"] += 1
+            __entry__ = (
+                self.analyze_counts(
+                    __game__.__board__.get_counts(), __color__, __dice__, __budget__
+                ),
+                __budget__,
+            )
+            self.__cache__[__key__] = __entry__
+            self.__cache__.move_to_end(__key__)
+            if len(self.__cache__) > self.__capacity__:
+                self.__cache__.popitem(last=False)
+        else:
+            self.__stats__["hits"] += 1
+            self.__cache__.move_to_end(__key__)
+        return __entry__[0][:__count__]
+
+    def analyze_counts(self, __counts__, __color__, __dice__, __budget__=None):
+        """
+        Ordena las jugadas de una tirada sobre los conteos de una posición,
+        sin usar la caché.
+
+        Args:
+            __counts__ (list): Los 28 conteos con signo de la posición.
+            __color__ (str): El color que mueve.
+            __dice__ (list): Los dados a jugar.
+            __budget__ (float, opcional): Los segundos para la búsqueda.
+
+        Returns:
+            list: Ver hints, con todas las jugadas.
+        """
+        __deadline__ = time.perf_counter() + (
+            self.__budget__ if __budget__ is None else __budget__
+        )
+        __opponent__ = OPPONENT[__color__]
+        __scored__ = [
+            (__play__, __after__, -self.__evaluator__(__after__, __opponent__), 0)
+            for __play__, __after__ in enumerate_plays(__counts__, __color__, __dice__)
+        ]
+        __scored__.sort(key=lambda __entry__: -__entry__[2])
+        __deeper__ = []
+        if len(__scored__) > 1:
+            while __scored__ and time.perf_counter() < __deadline__:
+                __play__, __after__, _, _ = __scored__.pop(0)
+                __equity__ = self._lookahead(__after__, __color__)
+                __deeper__.append((__play__, __after__, __equity__, 1))
+            __deeper__.sort(key=lambda __entry__: -__entry__[2])
+        __ranked__ = __deeper__ + __scored__
+        if not __ranked__:
+            return []
+        __best__ = __ranked__[0][2]
+        return [
+            (__play__, __equity__, __best__ - __equity__, __plies__)
+            for __play__, _, __equity__, __plies__ in __ranked__
+        ]
+
+    def _lookahead(self, __after__, __color__):
+        """
+        Equity a 1 ply, para el color que movió, de la posición que dejó su
+        jugada: el promedio sobre las tiradas del rival de su mejor respuesta.
+        """
+        __opponent__ = OPPONENT[__color__]
+        if CHECKERS in (__after__[26], __after__[27]):
+            return -self.__evaluator__(__after__, __opponent__)
+        __total__ = 0.0
+        for __roll__, __probability__ in ROLLS:
+            __replies__ = enumerate_positions(
+                __after__, __opponent__, dice_for_roll(__roll__)
+            )
+            if __replies__:
+                __value__ = min(
+                    self.__evaluator__(__reply__, __color__)
+                    for __reply__ in __replies__
+                )
+            else:
+                __value__ = self.__evaluator__(__after__, __color__)
+            __total__ += __probability__ * __value__
+        return __total__
+
+
+@lru_cache(maxsize=None)
+def default_advisor():
+    """
+    Devuelve el asesor compartido por todas las partidas, con la
+    evaluación heurística y el tiempo por defecto.
+
+    Returns:
+        HintAdvisor: El asesor.
+    """
+    return HintAdvisor()
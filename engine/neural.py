@@ -0,0 +1,273 @@
+"""
+Evaluador de posiciones con una red neuronal al estilo de TD-Gammon, en NumPy.
+
+Cada posición se codifica desde el punto de vista del jugador que tiene el
+turno en un vector de INPUTS (198) valores:
+
+- 96 por jugador (primero el que tiene el turno): para cada uno de sus 24
+  puntos, ordenados por distancia a la salida, las 4 unidades de TD-Gammon
+  (al menos 1, 2 y 3 fichas, y (n - 3) / 2 si hay más de 3).
+- Las fichas en la barra de cada jugador / 2 y las retiradas / 15.
+- Las cuentas de pips de cada jugador / 100, en lugar de las dos unidades
+  de turno del original, que con la codificación relativa serían constantes.
+
+La red es un perceptrón de una capa oculta con salidas sigmoides que estima
+las probabilidades de ganar, ganar un gammon, ganar un backgammon, perder un
+gammon y perder un backgammon; de ellas sale la equity.
+
+Lo importante para el rendimiento es evaluate_batch: codifica todas las
+posiciones a la vez y las pasa por la red con una sola multiplicación de
+matrices por capa, así que puntuar todas las jugadas de un turno cuesta
+casi lo mismo que puntuar una sola. ExpectiminimaxSearch lo usa
+automáticamente para las respuestas de cada tirada.
+
+Classes
+-------
+NeuralEvaluator
+    La red con su codificación, evaluación por lotes y pesos guardables
+
+Functions
+---------
+encode_batch
+    Codifica varias posiciones en una matriz de entradas
+"""
+
+import numpy as np
+
+from core.board import OPPONENT
+from engine.evaluation import CHECKERS, MAX_EQUITY, MIN_EQUITY, evaluate
+
+# Tamaño de la entrada de la red.
+INPUTS = 198
+# Salidas: ganar, gammon, backgammon, perder gammon, perder backgammon.
+OUTPUTS = 5
+# Neuronas de la capa oculta por defecto.
+DEFAULT_HIDDEN = 80
+
+# Distancia a la salida de cada punto (en orden de distancia 1 a 24).
+_DISTANCES = np.arange(1, 25, dtype=np.float32)
+# Peso de cada salida en la equity.
+_EQUITY_WEIGHTS = np.array([2.0, 1.0, 1.0, -1.0, -1.0], dtype=np.float32)
+
+
+def _units(__checkers__):
+    """
+    Convierte una matriz (N, 24) de fichas por punto en las (N, 96) unidades
+    de TD-Gammon.
+    """
+    __units__ = np.empty(__checkers__.shape + (4,), dtype=np.float32)
+    __units__[..., 0] = __checkers__ >= 1
+    __units__[..., 1] = __checkers__ >= 2
+    __units__[..., 2] = __checkers__ >= 3
+    __units__[..., 3] = np.maximum(__checkers__ - 3, 0) / 2
+    return __units__.reshape(len(__checkers__), 96)
+
+
+def encode_batch(__positions__, __color__):
+    """
+    Codifica varias posiciones desde el punto de vista de un color.
+
+    Args:
+        __positions__ (list): Los conteos de 28 valores de cada posición, o
+                              una matriz (N, 28) con ellos.
+        __color__ (str): El color que tiene el turno en todas ellas.
+
+    Returns:
+        numpy.ndarray: Una matriz (N, INPUTS) de float32.
+    """
+    __counts__ = np.asarray(__positions__, dtype=np.float32).reshape(-1, 28)
+    __white__ = np.maximum(__counts__[:, 23::-1], 0)
+    __black__ = np.maximum(-__counts__[:, :24], 0)
+    if __color__ == "white":
+        __mine__, __theirs__ = __white__, __black__
+        __bar__, __off__ = __counts__[:, [24, 25]], __counts__[:, [26, 27]]
+    else:
+        __mine__, __theirs__ = __black__, __white__
+        __bar__, __off__ = __counts__[:, [25, 24]], __counts__[:, [27, 26]]
+    __pips__ = np.stack(
+        [
+            __mine__ @ _DISTANCES + 25 * __bar__[:, 0],
+            __theirs__ @ _DISTANCES + 25 * __bar__[:, 1],
+        ],
+        axis=1,
+    )
+    return np.concatenate(
+        [
+            _units(__mine__),
+            _units(__theirs__),
+            __bar__ / 2,
+            __off__ / CHECKERS,
+            __pips__ / 100,
+        ],
+        axis=1,
+    )
+
+
+def _sigmoid(__values__):
+    """Función logística elemento a elemento."""
+    return 1.0 / (1.0 + np.exp(-__values__))
+
+
+class NeuralEvaluator:
+    """
+    Red neuronal que evalúa posiciones para el jugador que tiene el turno.
+
+    Sirve como evaluador de ExpectiminimaxSearch: se puede llamar como
+    evaluate(conteos, color) y además ofrece evaluate_batch.
+
+    Atributos:
+        __hidden_weights__ (numpy.ndarray): Pesos (INPUTS, oculta).
+        __hidden_bias__ (numpy.ndarray): Sesgos de la capa oculta.
+        __output_weights__ (numpy.ndarray): Pesos (oculta, OUTPUTS).
+        __output_bias__ (numpy.ndarray): Sesgos de la salida.
+    """
+
+    # Cotas de la equity en posiciones no terminadas (incluye gammons).
+    __bounds__ = (MIN_EQUITY, MAX_EQUITY)
+
+    def __init__(self, __hidden__=DEFAULT_HIDDEN, __seed__=0):
+        """
+        Inicializa la red con pesos pequeños al azar.
+
+        Args:
+            __hidden__ (int, opcional): Las neuronas de la capa oculta.
+            __seed__ (int, opcional): La semilla de los pesos iniciales.
+        """
+        __rng__ = np.random.default_rng(__seed__)
+        __scale__ = 1.0 / np.sqrt(INPUTS)
+        self.__hidden_weights__ = __rng__.normal(
+            0.0, __scale__, (INPUTS, __hidden__)
+        ).astype(np.float32)
+        self.__hidden_bias__ = np.zeros(__hidden__, dtype=np.float32)
+        self.__output_weights__ = __rng__.normal(
+            0.0, 1.0 / np.sqrt(__hidden__), (__hidden__, OUTPUTS)
+        ).astype(np.float32)
+        self.__output_bias__ = np.zeros(OUTPUTS, dtype=np.float32)
+
+    def get_weights(self):
+        """
+        Devuelve los pesos de la red.
+
+        Returns:
+            dict: hidden_weights, hidden_bias, output_weights y output_bias.
+        """
+        return {
+            "hidden_weights": self.__hidden_weights__,
+            "hidden_bias": self.__hidden_bias__,
+            "output_weights": self.__output_weights__,
+            "output_bias": self.__output_bias__,
+        }
+
+    def set_weights(self, __weights__):
+        """
+        Reemplaza los pesos de la red.
+
+        Args:
+            __weights__ (dict): Las matrices, con las claves de get_weights().
+        """
+        self.__hidden_weights__ = np.asarray(
+            __weights__["hidden_weights"], dtype=np.float32
+        )
+        self.__hidden_bias__ = np.asarray(__weights__["hidden_bias"], dtype=np.float32)
+        self.__output_weights__ = np.asarray(
+            __weights__["output_weights"], dtype=np.float32
+        )
+        self.__output_bias__ = np.asarray(__weights__["output_bias"], dtype=np.float32)
+
+    def save(self, __path__):
+        """
+        Guarda los pesos en un archivo .npz.
+        """
+        np.savez(__path__, **self.get_weights())
+
+    @classmethod
+    def load(cls, __path__):
+        """
+        Crea un evaluador con los pesos guardados con save().
+        """
+        with np.load(__path__) as __data__:
+            __weights__ = {__name__: __data__[__name__] for __name__ in __data__.files}
+        __evaluator__ = cls(len(__weights__["hidden_bias"]))
+        __evaluator__.set_weights(__weights__)
+        return __evaluator__
+
+    def forward(self, __inputs__):
+        """
+        Pasa un lote de entradas por la red.
+
+        Args:
+            __inputs__ (numpy.ndarray): Una matriz (N, INPUTS).
+
+        Returns:
+            numpy.ndarray: Las activaciones ocultas (N, oculta) y las
+                           probabilidades de salida (N, OUTPUTS).
+        """
+        __hidden__ = _sigmoid(
+            __inputs__ @ self.__hidden_weights__ + self.__hidden_bias__
+        )
+        return __hidden__, _sigmoid(
+            __hidden__ @ self.__output_weights__ + self.__output_bias__
+        )
+
+    def probabilities(self, __positions__, __color__):
+        """
+        Estima las probabilidades de varias posiciones para el color en turno.
+
+        Args:
+            __positions__ (list): Los conteos de cada posición.
+            __color__ (str): El color que tiene el turno.
+
+        Returns:
+            numpy.ndarray: Una matriz (N, OUTPUTS): ganar, gammon, backgammon,
+                           perder gammon y perder backgammon.
+        """
+        return self.forward(encode_batch(__positions__, __color__))[1]
+
+    def evaluate_batch(self, __positions__, __color__):
+        """
+        Evalúa varias posiciones con una sola pasada de la red.
+
+        Las posiciones terminadas valen sus puntos exactos (ver
+        engine.evaluation.evaluate).
+
+        Args:
+            __positions__ (list): Los conteos de cada posición.
+            __color__ (str): El color que tiene el turno en todas ellas.
+
+        Returns:
+            numpy.ndarray: La equity de cada posición para ese color.
+        """
+        __counts__ = np.asarray(__positions__, dtype=np.float32).reshape(-1, 28)
+        __equities__ = (
+            self.forward(encode_batch(__counts__, __color__))[1] @ _EQUITY_WEIGHTS
+        ) - 1.0
+        for __index__ in np.flatnonzero(
+            (__counts__[:, 26] == CHECKERS) | (__counts__[:, 27] == CHECKERS)
+        ):
+            __equities__[__index__] = evaluate(__positions__[__index__], __color__)
+        return __equities__
+
+    def __call__(self, __counts__, __color__):
+        """
+        Evalúa una sola posición para el color que tiene el turno.
+
+        Returns:
+            float: La equity.
+        """
+        return float(self.evaluate_batch([__counts__], __color__)[0])
+
+    def score_plays(self, __candidates__, __color__):
+        """
+        Puntúa todas las jugadas de un turno en un solo lote.
+
+        Args:
+            __candidates__ (list): Tuplas (jugada, conteos_resultantes).
+            __color__ (str): El color que mueve.
+
+        Returns:
+            numpy.ndarray: La equity de cada jugada para el color que mueve
+                           (el negado de la del rival, que queda en turno).
+        """
+        return -self.evaluate_batch(
+            [__after__ for _, __after__ in __candidates__], OPPONENT[__color__]
+        )
@@ -0,0 +1,341 @@
+"""
+Módulo que define las políticas que eligen la jugada de un turno.
+
+Una política recibe la partida y las jugadas legales del turno, cada una
+junto con los conteos de la posición a la que lleva (ver
+Game.get_legal_plays_with_positions), y devuelve la jugada elegida. Así los
+simuladores y torneos pueden enfrentar distintas estrategias sin depender
+de la interfaz de usuario.
+
+Classes
+-------
+Policy
+    Clase base de las políticas
+RandomPolicy
+    Elige una jugada al azar
+FirstLegalPolicy
+    Elige la primera jugada generada
+GreedyPipPolicy
+    Elige la jugada que más fichas saca y deja la mejor posición medida en
+    pips
+SearchPolicy
+    Elige la jugada con la búsqueda expectiminimax
+AnytimePolicy
+    Elige la jugada con la búsqueda expectiminimax en un tiempo límite
+NeuralPolicy
+    Elige la jugada mejor puntuada por la red neuronal, en un solo lote
+
+Functions
+---------
+pip_count
+    Calcula la cuenta de pips de un color a partir de los conteos
+make_policy
+    Crea una política a partir de su nombre
+"""
+
+import logging
+import random
+import time
+
+from core.board import BAR_PIPS, HOME_MASK, OPPONENT, tally_counts
+from engine.neural import NeuralEvaluator
+from engine.search import ExpectiminimaxSearch
+from engine.transposition import TranspositionTable
+
+# Segundos por decisión por defecto de AnytimePolicy.
+DEFAULT_BUDGET = 0.05
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pesos de GreedyPipPolicy, en pips: cada punto hecho, cada punto hecho de
+# la casa (además del anterior) y cada blot que el rival puede alcanzar.
+_POINT_PIPS = 2
+_HOME_POINT_PIPS = 1
+_BLOT_PIPS = 4
+
+
+def pip_count(__counts__, __color__):
+    """
+    Calcula la cuenta de pips de un color, incluidas las fichas en la barra.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __color__ (str): El color de las fichas.
+
+    Returns:
+        int: La suma de las distancias a la salida de sus fichas.
+    """
+    __bar__ = __counts__[24 if __color__ == "white" else 25]
+    return tally_counts(__counts__, __color__)[0] + BAR_PIPS * __bar__
+
+
+def _exposed_blots(__blots__, __color__, __opponent_mask__, __opponent_bar__):
+    """
+    Cuenta los blots de un color que alguna ficha rival tiene por delante:
+    todos si el rival tiene fichas en la barra.
+    """
+    if not __opponent_bar__:
+        if not __opponent_mask__:
+            return 0
+        if __color__ == "white":
+            __blots__ &= (1 << (__opponent_mask__.bit_length() - 1)) - 1
+        else:
+            __blots__ &= -((__opponent_mask__ & -__opponent_mask__) << 1)
+    return bin(__blots__).count("1")
+
+
+class Policy:  # pylint: disable=too-few-public-methods
+    """
+    Clase base de las políticas de juego.
+    """
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Elige una jugada entre las legales.
+
+        Args:
+            __game__ (Game): La partida, con el jugador en turno y sus dados.
+            __candidates__ (list): Tuplas (jugada, conteos_resultantes); nunca
+                                   está vacía.
+
+        Returns:
+            tuple: La jugada elegida, una tupla de objetos Move.
+        """
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política que elige una jugada legal al azar.
+
+    Atributos:
+        __rng__ (random.Random): El generador de números aleatorios propio.
+    """
+
+    def __init__(self, __seed__=None):
+        """
+        Inicializa la política con una semilla opcional.
+
+        Args:
+            __seed__ (int, opcional): La semilla del generador.
+        """
+        self.__rng__ = random.Random(__seed__)
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Devuelve una de las jugadas legales al azar.
+        """
+        return self.__rng__.choice(__candidates__)[0]
+
+
+class FirstLegalPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política que elige siempre la primera jugada generada.
+    """
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Devuelve la primera jugada legal.
+        """
+        return __candidates__[0][0]
+
+
+class GreedyPipPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política que elige la jugada que saca más fichas y, entre ellas, la que
+    deja la mejor posición: la diferencia de pips (la cuenta del rival menos
+    la propia, que sólo cambia con las capturas porque todas las jugadas
+    avanzan lo mismo) más los puntos hechos, sobre todo en la casa, menos
+    los blots expuestos.
+    """
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Devuelve la jugada con más fichas retiradas y mejor posición.
+        """
+        __color__ = __game__.get_current_player().__color__
+        __opponent__ = OPPONENT[__color__]
+        __off__ = 26 if __color__ == "white" else 27
+        __opponent_bar__ = 25 if __color__ == "white" else 24
+        __best__, __best_score__ = None, None
+        for __play__, __counts__ in __candidates__:
+            _, _, __occupied__, __made__ = tally_counts(__counts__, __color__)
+            __opponent_mask__ = tally_counts(__counts__, __opponent__)[2]
+            __exposed__ = _exposed_blots(
+                __occupied__ & ~__made__,
+                __color__,
+                __opponent_mask__,
+                __counts__[__opponent_bar__],
+            )
+            __score__ = (
+                __counts__[__off__],
+                pip_count(__counts__, __opponent__)
+                - pip_count(__counts__, __color__)
+                + _POINT_PIPS * bin(__made__).count("1")
+                + _HOME_POINT_PIPS * bin(__made__ & HOME_MASK[__color__]).count("1")
+                - _BLOT_PIPS * __exposed__,
+            )
+            if __best_score__ is None or __score__ > __best_score__:
+                __best__, __best_score__ = __play__, __score__
+        return __best__
+
+
+class SearchPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política que elige la jugada con ExpectiminimaxSearch.
+
+    Atributos:
+        __plies__ (int): La profundidad de cada decisión.
+        __search__ (ExpectiminimaxSearch): La búsqueda.
+    """
+
+    def __init__(self, __plies__=1, __search__=None):
+        """
+        Inicializa la política.
+
+        Args:
+            __plies__ (int, opcional): La profundidad de cada decisión.
+            __search__ (ExpectiminimaxSearch, opcional): La búsqueda a usar.
+                                                         Por defecto una con
+                                                         su propia tabla de
+                                                         transposición.
+        """
+        self.__plies__ = __plies__
+        self.__search__ = __search__ or ExpectiminimaxSearch(
+            __table__=TranspositionTable()
+        )
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Devuelve la jugada mejor evaluada por la búsqueda.
+        """
+        if len(__candidates__) == 1:
+            return __candidates__[0][0]
+        return self.__search__.best_play(__game__, self.__plies__)
+
+
+class AnytimePolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política que busca cada decisión con un tiempo límite, profundizando de
+    0 a 1 y 2 plies (ver ExpectiminimaxSearch.best_play_within).
+
+    Registra en el logger del módulo, con nivel INFO, la profundidad
+    alcanzada y el tiempo de cada decisión, y cuenta las decisiones por
+    profundidad para dimensionar el hardware.
+
+    Atributos:
+        __budget__ (float): Los segundos por decisión.
+        __max_plies__ (int): La profundidad máxima.
+        __search__ (ExpectiminimaxSearch): La búsqueda.
+        __depths__ (dict): Las decisiones buscadas por profundidad alcanzada.
+    """
+
+    def __init__(self, __budget__=DEFAULT_BUDGET, __max_plies__=2, __search__=None):
+        """
+        Inicializa la política.
+
+        Args:
+            __budget__ (float, opcional): Los segundos por decisión.
+            __max_plies__ (int, opcional): La profundidad máxima.
+            __search__ (ExpectiminimaxSearch, opcional): La búsqueda a usar.
+                                                         Por defecto una con
+                                                         su propia tabla de
+                                                         transposición.
+        """
+        self.__budget__ = __budget__
+        self.__max_plies__ = __max_plies__
+        self.__search__ = __search__ or ExpectiminimaxSearch(
+            __table__=TranspositionTable()
+        )
+        self.__depths__ = {}
+
+    def get_depth_counts(self):
+        """
+        Devuelve cuántas decisiones llegaron a cada profundidad; las jugadas
+        forzadas no se buscan y no se cuentan.
+
+        Returns:
+            dict: Profundidad -> decisiones.
+        """
+        return dict(self.__depths__)
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Devuelve la mejor jugada del ply más profundo que entró en el tiempo.
+        """
+        if len(__candidates__) == 1:
+            return __candidates__[0][0]
+        __start__ = time.perf_counter()
+        __play__, __plies__ = self.__search__.best_play_within(
+            __game__, self.__budget__, self.__max_plies__
+        )
+        self.__depths__[__plies__] = self.__depths__.get(__plies__, 0) + 1
+        _LOGGER.info(
+            "Jugada a %d plies en %.1f ms (límite %.1f ms, %d jugadas)",
+            __plies__,
+            1000 * (time.perf_counter() - __start__),
+            1000 * self.__budget__,
+            len(__candidates__),
+        )
+        return __play__
+
+
+class NeuralPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política que puntúa todas las jugadas del turno con una sola pasada de
+    la red neuronal y elige la mejor.
+
+    Atributos:
+        __evaluator__ (NeuralEvaluator): La red.
+    """
+
+    def __init__(self, __evaluator__=None):
+        """
+        Inicializa la política.
+
+        Args:
+            __evaluator__ (NeuralEvaluator, opcional): La red. Por defecto
+                                                       una sin entrenar.
+        """
+        self.__evaluator__ = __evaluator__ or NeuralEvaluator()
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Devuelve la jugada con mayor equity según la red.
+        """
+        __scores__ = self.__evaluator__.score_plays(
+            __candidates__, __game__.get_current_player().__color__
+        )
+        return __candidates__[int(__scores__.argmax())][0]
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "first": FirstLegalPolicy,
+    "greedy": GreedyPipPolicy,
+    "expectiminimax": SearchPolicy,
+    "anytime": AnytimePolicy,
+    "neural": NeuralPolicy,
+}
+
+
+def make_policy(__policy_name__, __seed__=None):
+    """
+    Crea una política a partir de su nombre.
+
+    Args:
+        __policy_name__ (str): "random", "first", "greedy",
+                               "expectiminimax" (a 1 ply), "anytime" (con
+                               DEFAULT_BUDGET por jugada) o "neural".
+        __seed__ (int, opcional): La semilla, usada por las políticas al azar.
+
+    Returns:
+        Policy: La política creada.
+    """
+    if __policy_name__ not in POLICIES:
+        raise ValueError(f"Política desconocida: {__policy_name__}")
+    if __policy_name__ == "random":
+        return RandomPolicy(__seed__)
+    if __policy_name__ == "neural":
+        return NeuralPolicy(NeuralEvaluator(__seed__=__seed__ or 0))
+    return POLICIES[__policy_name__]()
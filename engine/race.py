@@ -0,0 +1,205 @@
+"""
+Evaluación de carreras: posiciones en las que ya no hay contacto.
+
+Cuando todas las fichas de cada jugador pasaron a las del rival (ver
+core.board.counts_in_contact o Board.has_contact), la partida es una
+carrera pura y no hace falta buscar: alcanza una estimación cerrada a
+partir de las cuentas de pips.
+
+La cuenta de pips se corrige por el desperdicio típico del bear-off (fichas
+apiladas en los puntos bajos y huecos en los altos, como en la cuenta de
+Keith) y la diferencia de tiradas que necesita cada jugador se aproxima con
+una normal: una tirada avanza en promedio 8,17 pips, la varianza crece con
+los pips en juego como en la fórmula de Kleinman y tener el turno vale
+media tirada. Los gammons se estiman igual, contra los pips que le faltan
+al perdedor para meter todas sus fichas en casa y sacar una.
+
+Si se le pasan las bases de bear-off (ver engine.bearoff), las posiciones
+que cubren se resuelven con ellas: la de dos lados da el valor exacto y la
+de un lado, con ambos jugadores en casa, combina sus distribuciones de
+tiradas.
+
+Functions
+---------
+effective_pips
+    Devuelve la cuenta de pips de un color corregida por el desperdicio
+race_probabilities
+    Estima las probabilidades de ganar y de gammon en una carrera
+race_equity
+    Estima la equity sin cubo del color en turno en una carrera
+"""
+
+import math
+
+from core.board import BAR_PIPS, OPPONENT, PIP_DISTANCE
+from engine.bearoff import home_points
+
+# Índices de la barra y de las fichas retiradas en los conteos.
+_BAR = {"white": 24, "black": 25}
+_OFF = {"white": 26, "black": 27}
+
+# Pips que avanza en promedio una tirada (los dobles valen 4).
+_PIPS_PER_ROLL = (
+    sum(
+        4 * __first__ if __first__ == __second__ else __first__ + __second__
+        for __first__ in range(1, 7)
+        for __second__ in range(1, 7)
+    )
+    / 36
+)
+# Varianza de la diferencia de tiradas, en pips² por pip total en juego: la
+# de Kleinman para carreras largas y una menor, ajustada contra la base de
+# un lado, cuando ambos jugadores ya están en casa.
+_RACE_SPREAD = 2.0
+_BEAR_OFF_SPREAD = 1.1
+
+
+def effective_pips(__counts__, __color__):
+    """
+    Devuelve la cuenta de pips de un color corregida por el desperdicio.
+
+    Suma 2 pips por cada ficha después de la primera en el punto 1, 1 por
+    cada una después de la primera en el punto 2 y después de la tercera en
+    el punto 3, y 1 por cada punto vacío entre el 4 y el 6.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __color__ (str): El color.
+
+    Returns:
+        int: Los pips efectivos.
+    """
+    __sign__ = 1 if __color__ == "white" else -1
+    __distance__ = PIP_DISTANCE[__color__]
+    __pips__ = BAR_PIPS * __counts__[_BAR[__color__]]
+    __by_distance__ = [0] * 7
+    for __index__ in range(24):
+        __checkers__ = __counts__[__index__] * __sign__
+        if __checkers__ > 0:
+            __pips__ += __checkers__ * __distance__[__index__]
+            if __distance__[__index__] <= 6:
+                __by_distance__[__distance__[__index__]] = __checkers__
+    return (
+        __pips__
+        + 2 * max(__by_distance__[1] - 1, 0)
+        + max(__by_distance__[2] - 1, 0)
+        + max(__by_distance__[3] - 3, 0)
+        + sum(1 for __point__ in (4, 5, 6) if not __by_distance__[__point__])
+    )
+
+
+def _gammon_save_pips(__counts__, __color__):
+    """
+    Pips que le faltan a un color para meter sus fichas en casa y sacar
+    una, o None si ya sacó alguna.
+    """
+    if __counts__[_OFF[__color__]]:
+        return None
+    __sign__ = 1 if __color__ == "white" else -1
+    __distance__ = PIP_DISTANCE[__color__]
+    __travel__ = (BAR_PIPS - 6) * __counts__[_BAR[__color__]]
+    __nearest__ = 6
+    for __index__ in range(24):
+        __checkers__ = __counts__[__index__] * __sign__
+        if __checkers__ > 0:
+            __travel__ += __checkers__ * max(__distance__[__index__] - 6, 0)
+            __nearest__ = min(__nearest__, __distance__[__index__])
+    return __travel__ + __nearest__
+
+
+def _finishes_first(__pips__, __other_pips__, __spread__=_RACE_SPREAD):
+    """
+    Probabilidad de que el jugador en turno con __pips__ por recorrer llegue
+    en no más tiradas que el rival con __other_pips__: la diferencia se
+    aproxima con una normal y tener el turno vale media tirada.
+    """
+    __lead__ = __other_pips__ - __pips__ + _PIPS_PER_ROLL / 2
+    __deviation__ = math.sqrt(__spread__ * max(__pips__ + __other_pips__, 1))
+    return 0.5 * (1.0 + math.erf(__lead__ / (__deviation__ * math.sqrt(2.0))))
+
+
+def _one_sided_win(__database__, __mine__, __theirs__):
+    """
+    Probabilidad de ganar del jugador en turno con ambos lados en casa,
+    combinando las distribuciones de tiradas de la base de un lado.
+    """
+    __my_turns__ = __database__.distribution(__mine__)
+    __their_turns__ = __database__.distribution(__theirs__)
+    __win__ = 0.0
+    __their_remaining__ = 1.0
+    for __mine_now__, __theirs_now__ in zip(__my_turns__, __their_turns__):
+        __win__ += __mine_now__ * __their_remaining__
+        __their_remaining__ -= __theirs_now__
+    return min(max(__win__, 0.0), 1.0)
+
+
+def race_probabilities(
+    __counts__, __color__, __one_sided__=None, __two_sided__=None
+):  # pylint: disable=too-many-locals
+    """
+    Estima las probabilidades de una carrera para el color en turno.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de una posición sin
+                           contacto y no terminada.
+        __color__ (str): El color que tiene el turno.
+        __one_sided__ (OneSidedBearoff, opcional): La base de un lado.
+        __two_sided__ (TwoSidedBearoff, opcional): La base de dos lados.
+
+    Returns:
+        tuple: (ganar, ganar un gammon, perder un gammon).
+    """
+    __opponent__ = OPPONENT[__color__]
+    if __two_sided__ is not None:
+        __equity__ = __two_sided__.lookup(__counts__, __color__)
+        if __equity__ is not None:
+            return (__equity__ + 1.0) / 2.0, 0.0, 0.0
+
+    __my_pips__ = effective_pips(__counts__, __color__)
+    __their_pips__ = effective_pips(__counts__, __opponent__)
+    __mine__ = home_points(__counts__, __color__)
+    __theirs__ = home_points(__counts__, __opponent__)
+    __home__ = __mine__ is not None and __theirs__ is not None
+    if (
+        __home__
+        and __one_sided__ is not None
+        and max(sum(__mine__), sum(__theirs__)) <= __one_sided__.get_max_checkers()
+    ):
+        __win__ = _one_sided_win(__one_sided__, __mine__, __theirs__)
+    else:
+        __win__ = _finishes_first(
+            __my_pips__,
+            __their_pips__,
+            _BEAR_OFF_SPREAD if __home__ else _RACE_SPREAD,
+        )
+
+    __win_gammon__ = __lose_gammon__ = 0.0
+    __their_save__ = _gammon_save_pips(__counts__, __opponent__)
+    if __their_save__ is not None:
+        __win_gammon__ = min(_finishes_first(__my_pips__, __their_save__), __win__)
+    __my_save__ = _gammon_save_pips(__counts__, __color__)
+    if __my_save__ is not None:
+        __lose_gammon__ = min(
+            1.0 - _finishes_first(__my_save__, __their_pips__), 1.0 - __win__
+        )
+    return __win__, __win_gammon__, __lose_gammon__
+
+
+def race_equity(__counts__, __color__, __one_sided__=None, __two_sided__=None):
+    """
+    Estima la equity sin cubo del color en turno en una carrera.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de una posición sin
+                           contacto y no terminada.
+        __color__ (str): El color que tiene el turno.
+        __one_sided__ (OneSidedBearoff, opcional): La base de un lado.
+        __two_sided__ (TwoSidedBearoff, opcional): La base de dos lados.
+
+    Returns:
+        float: La equity, entre -2 y 2 (los backgammons se desprecian).
+    """
+    __win__, __win_gammon__, __lose_gammon__ = race_probabilities(
+        __counts__, __color__, __one_sided__, __two_sided__
+    )
+    return 2.0 * __win__ - 1.0 + __win_gammon__ - __lose_gammon__
@@ -0,0 +1,306 @@
+"""
+Rollouts de Monte Carlo: estima la equity de una posición, o de cada jugada
+de un turno, jugando muchas partidas hasta el final con una política rápida.
+
+Cada partida de prueba (trial) juega con la política de 0 plies del
+evaluador (la misma evaluación estática de la búsqueda) y termina cuando
+alguien saca todas sus fichas, o antes, cuando se rompe el contacto: las
+carreras se valúan con engine.race.race_equity, mucho más barato que
+jugarlas y casi sin ruido.
+
+Para bajar la varianza:
+
+- Dados cuasi aleatorios: las dos primeras tiradas de cada trial no son al
+  azar sino que recorren las 36 x 36 combinaciones en orden (estratificadas),
+  así que con un múltiplo de 36 trials cada primera tirada aparece la misma
+  cantidad de veces.
+- Reducción por suerte: en cada turno se calcula cuánto mejor o peor que
+  el promedio de las 21 tiradas fue la tirada que salió, según el
+  evaluador, y se descuenta del resultado. La suerte tiene esperanza cero,
+  así que el estimador sigue sin sesgo, y absorbe buena parte del ruido de
+  los dados. Cuesta evaluar las 21 tiradas en cada turno (unas 20 veces
+  más lento) y con la evaluación heurística sólo reduce la varianza a la
+  mitad, así que viene desactivada; conviene con un evaluador que mida
+  bien la suerte, como la red de engine.neural.
+- Números aleatorios comunes: todas las jugadas de un turno se prueban con
+  las mismas semillas, así que sus diferencias tienen mucho menos ruido que
+  sus valores.
+
+Cada trial tiene su propio generador, derivado de la semilla y de su
+número, así que el resultado no depende de cuántos procesos se usen. Con
+varios procesos los trials se reparten en lotes en un ProcessPoolExecutor.
+
+Classes
+-------
+RolloutEngine
+    Hace rollouts de posiciones y de las jugadas de un turno
+"""
+
+import math
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.board import OPPONENT, counts_in_contact
+from core.play_generator import enumerate_plays, enumerate_positions
+from engine.bearoff import load_one_sided, load_two_sided
+from engine.evaluation import CHECKERS, evaluate
+from engine.race import race_equity
+from engine.search import ROLLS, dice_for_roll
+
+# Trials por defecto (todas las combinaciones de las dos primeras tiradas).
+DEFAULT_TRIALS = 1296
+# Trials que resuelve cada tarea del pool.
+TRIAL_CHUNK = 36
+# Turnos máximos de un trial antes de cortarlo con el evaluador.
+MAX_PLIES = 400
+
+# Las 36 tiradas ordenadas, para estratificar las primeras.
+_OUTCOMES = tuple(
+    (__first__, __second__) for __first__ in range(1, 7) for __second__ in range(1, 7)
+)
+# Índice de cada tirada (menor, mayor) en ROLLS.
+_ROLL_INDEX = {__roll__: __index__ for __index__, (__roll__, _) in enumerate(ROLLS)}
+
+
+def _trial_roll(__rng__, __trial__, __ply__):
+    """
+    Devuelve la tirada de un turno de un trial, como (menor, mayor): las
+    dos primeras estratificadas según el número de trial y el resto al azar.
+    """
+    if __ply__ == 0:
+        __roll__ = _OUTCOMES[__trial__ % 36]
+    elif __ply__ == 1:
+        __roll__ = _OUTCOMES[__trial__ // 36 % 36]
+    else:
+        __roll__ = (__rng__.randint(1, 6), __rng__.randint(1, 6))
+    return min(__roll__), max(__roll__)
+
+
+def _summary(__values__, __seconds__):
+    """
+    Resume los resultados de los trials.
+    """
+    __count__ = len(__values__)
+    __deviation__ = statistics.stdev(__values__) if __count__ > 1 else 0.0
+    return {
+        "equity": statistics.fmean(__values__),
+        "std_error": __deviation__ / math.sqrt(__count__),
+        "trials": __count__,
+        "seconds": __seconds__,
+        "trials_per_second": __count__ / __seconds__ if __seconds__ else 0.0,
+    }
+
+
+class RolloutEngine:
+    """
+    Motor de rollouts de Monte Carlo.
+
+    Atributos:
+        __evaluator__ (callable): La evaluación estática (conteos, color) ->
+                                  equity que define la política de los
+                                  trials y la suerte de cada tirada.
+        __variance_reduction__ (bool): Si se descuenta la suerte.
+        __truncate__ (bool): Si los trials se cortan al empezar la carrera.
+        __workers__ (int): Los procesos que juegan los trials.
+        __seed__ (int): La semilla de la que sale la de cada trial.
+        __max_plies__ (int): Los turnos máximos de un trial.
+    """
+
+    def __init__(
+        self,
+        __evaluator__=evaluate,
+        __variance_reduction__=False,
+        __truncate__=True,
+        __workers__=1,
+        __seed__=0,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Inicializa el motor.
+
+        Args:
+            __evaluator__ (callable, opcional): La evaluación estática; si
+                                                tiene evaluate_batch (ver
+                                                engine.neural) se usa.
+            __variance_reduction__ (bool, opcional): Si se descuenta la
+                                                     suerte.
+            __truncate__ (bool, opcional): Si las carreras se valúan en lugar
+                                           de jugarlas.
+            __workers__ (int, opcional): Los procesos; con 1 se juega en el
+                                         proceso actual.
+            __seed__ (int, opcional): La semilla de los trials.
+        """
+        self.__evaluator__ = __evaluator__
+        self.__variance_reduction__ = __variance_reduction__
+        self.__truncate__ = __truncate__
+        self.__workers__ = __workers__
+        self.__seed__ = __seed__
+        self.__max_plies__ = MAX_PLIES
+
+    def rollout(self, __counts__, __color__, __trials__=DEFAULT_TRIALS):
+        """
+        Estima la equity de una posición antes de que el color tire.
+
+        Args:
+            __counts__ (list): Los 28 conteos con signo de la posición.
+            __color__ (str): El color que tiene el turno.
+            __trials__ (int, opcional): La cantidad de partidas.
+
+        Returns:
+            dict: equity, std_error, trials, seconds y trials_per_second.
+        """
+        __start__ = time.perf_counter()
+        __values__ = self._run([(__counts__, __color__)], __trials__)[0]
+        return _summary(__values__, time.perf_counter() - __start__)
+
+    def rollout_plays(self, __counts__, __color__, __dice__, __trials__=DEFAULT_TRIALS):
+        """
+        Estima la equity de cada jugada de una tirada.
+
+        Todas las jugadas se prueban con los mismos trials. seconds y
+        trials_per_second de cada una se refieren al rollout completo.
+
+        Args:
+            __counts__ (list): Los 28 conteos con signo de la posición.
+            __color__ (str): El color que mueve.
+            __dice__ (list): Los dados a jugar.
+            __trials__ (int, opcional): La cantidad de partidas por jugada.
+
+        Returns:
+            list: Pares (jugada, resumen) ordenados de mejor a peor; la
+                  equity es la del color que mueve.
+        """
+        __start__ = time.perf_counter()
+        __candidates__ = enumerate_plays(__counts__, __color__, __dice__)
+        __opponent__ = OPPONENT[__color__]
+        __results__ = self._run(
+            [(__after__, __opponent__) for _, __after__ in __candidates__], __trials__
+        )
+        __seconds__ = time.perf_counter() - __start__
+        __analysis__ = []
+        for (__play__, _), __values__ in zip(__candidates__, __results__):
+            __summary__ = _summary(
+                [-__value__ for __value__ in __values__], __seconds__
+            )
+            __summary__["trials_per_second"] *= len(__candidates__)
+            __analysis__.append((__play__, __summary__))
+        __analysis__.sort(key=lambda __entry__: -__entry__[1]["equity"])
+        return __analysis__
+
+    def analyze(self, __game__, __trials__=DEFAULT_TRIALS):
+        """
+        Estima la equity de cada jugada legal del turno actual de una partida.
+
+        Returns:
+            list: Ver rollout_plays.
+        """
+        return self.rollout_plays(
+            __game__.__board__.get_counts(),
+            __game__.get_current_player().__color__,
+            __game__.get_dice_values(),
+            __trials__,
+        )
+
+    def _run(self, __positions__, __trials__):
+        """
+        Juega los trials de varias posiciones, en el proceso actual o en el
+        pool, y devuelve la lista de resultados de cada una.
+        """
+        __chunks__ = [
+            range(__first__, min(__first__ + TRIAL_CHUNK, __trials__))
+            for __first__ in range(0, __trials__, TRIAL_CHUNK)
+        ]
+        __tasks__ = [
+            (__counts__, __color__, __chunk__)
+            for __counts__, __color__ in __positions__
+            for __chunk__ in __chunks__
+        ]
+        if self.__workers__ > 1:
+            with ProcessPoolExecutor(max_workers=self.__workers__) as __pool__:
+                __done__ = list(__pool__.map(self._run_chunk, __tasks__))
+        else:
+            __done__ = [self._run_chunk(__task__) for __task__ in __tasks__]
+        return [
+            [
+                __value__
+                for __chunk__ in __done__[
+                    __index__ * len(__chunks__) : (__index__ + 1) * len(__chunks__)
+                ]
+                for __value__ in __chunk__
+            ]
+            for __index__ in range(len(__positions__))
+        ]
+
+    def _run_chunk(self, __task__):
+        """
+        Juega un lote de trials de una posición; se ejecuta en el pool.
+        """
+        __counts__, __color__, __chunk__ = __task__
+        return [
+            self._trial(__counts__, __color__, __trial__) for __trial__ in __chunk__
+        ]
+
+    def _best(self, __counts__, __color__, __dice__):
+        """
+        Elige la jugada de 0 plies de una tirada.
+
+        Returns:
+            tuple: (equity para el color que mueve, conteos resultantes).
+        """
+        __opponent__ = OPPONENT[__color__]
+        __positions__ = enumerate_positions(__counts__, __color__, __dice__)
+        if not __positions__:
+            return -self.__evaluator__(__counts__, __opponent__), __counts__
+        if hasattr(self.__evaluator__, "evaluate_batch"):
+            __values__ = self.__evaluator__.evaluate_batch(__positions__, __opponent__)
+            __index__ = int(__values__.argmin())
+            return -float(__values__[__index__]), __positions__[__index__]
+        __values__ = [
+            self.__evaluator__(__after__, __opponent__) for __after__ in __positions__
+        ]
+        __index__ = __values__.index(min(__values__))
+        return -__values__[__index__], __positions__[__index__]
+
+    def _trial(self, __counts__, __color__, __trial__):
+        """
+        Juega un trial desde una posición y devuelve su resultado para el
+        color que tiene el turno, menos la suerte acumulada si corresponde.
+        """
+        __rng__ = random.Random(self.__seed__ * 1_000_003 + __trial__)
+        __player__ = __color__
+        __luck__ = 0.0
+        for __ply__ in range(self.__max_plies__):
+            if CHECKERS in (__counts__[26], __counts__[27]):
+                __value__ = evaluate(__counts__, __player__)
+                break
+            if self.__truncate__ and not counts_in_contact(__counts__):
+                __value__ = race_equity(
+                    __counts__, __player__, load_one_sided(), load_two_sided()
+                )
+                break
+            __roll__ = _trial_roll(__rng__, __trial__, __ply__)
+            if self.__variance_reduction__:
+                __outcomes__ = [
+                    self._best(__counts__, __player__, dice_for_roll(__other__))
+                    for __other__, _ in ROLLS
+                ]
+                __mean__ = sum(
+                    __probability__ * __equity__
+                    for (_, __probability__), (__equity__, _) in zip(
+                        ROLLS, __outcomes__
+                    )
+                )
+                __equity__, __counts__ = __outcomes__[_ROLL_INDEX[__roll__]]
+                __sign__ = 1.0 if __player__ == __color__ else -1.0
+                __luck__ += __sign__ * (__equity__ - __mean__)
+            else:
+                _, __counts__ = self._best(
+                    __counts__, __player__, dice_for_roll(__roll__)
+                )
+            __player__ = OPPONENT[__player__]
+        else:
+            __value__ = self.__evaluator__(__counts__, __player__)
+        if __player__ != __color__:
+            __value__ = -__value__
+        return __value__ - __luck__
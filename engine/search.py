@@ -0,0 +1,514 @@
+"""
+Búsqueda expectiminimax sobre los nodos de azar de los dados.
+
+Evalúa las jugadas de un turno a 0, 1 o 2 plies. A 0 plies cada jugada vale
+la evaluación estática de la posición a la que lleva. Cada ply agrega un
+nodo de azar: se promedian las 21 tiradas distintas (los dobles pesan 1/36
+y el resto 2/36) y, para cada tirada, el jugador que mueve elige la mejor
+respuesta.
+
+Si el evaluador ofrece evaluate_batch (como engine.neural.NeuralEvaluator),
+todas las respuestas de una tirada se evalúan en un solo lote.
+
+Para que 2 plies entren en bastante menos de un segundo por decisión:
+
+- Ordenamiento: las respuestas de cada tirada se ordenan por su evaluación
+  estática y sólo se expanden las mejores (filtro de jugadas). En la raíz,
+  cada ply vuelve a evaluar sólo las mejores jugadas del ply anterior.
+- Star1: cada nodo de azar acota su valor con los límites de la equity y
+  corta en cuanto el promedio ya no puede entrar
+  en la ventana (alfa, beta) que le pasa su padre.
+- Star2: antes de expandir, el nodo de azar sondea la primera respuesta de
+  cada tirada; su valor es una cota inferior del nodo de esa tirada y
+  permite cortar sin mirar el resto de las respuestas.
+
+Los límites de la equity son (MIN_EQUITY, MAX_EQUITY) salvo que ningún
+jugador pueda terminar la partida dentro del horizonte de la búsqueda: en
+ese caso alcanzan las cotas de la evaluación estática en posiciones no
+terminadas, mucho más estrechas, y Star1/Star2 cortan bastante más.
+
+Con __race_cutoff__ las posiciones sin contacto no se expanden: son
+carreras puras y valen directamente la evaluación estática, que para ellas
+es la estimación cerrada de engine.race.
+
+Con una TranspositionTable (ver engine.transposition) los nodos de azar ya
+calculados, exactos o como cotas de una ventana, no se vuelven a buscar;
+SearchPolicy conserva la tabla entre decisiones.
+
+Las equities se expresan siempre desde el punto de vista del jugador que
+mueve en cada nodo, así que el valor de un hijo es el negado del valor del
+nodo de azar del rival (negamax).
+
+best_play_within es la versión con tiempo límite (anytime): profundiza de
+0 a 1 y 2 plies mientras quede tiempo y, si el reloj vence en medio de un
+ply, la búsqueda se cancela (SearchTimeoutException, que se revisa antes de
+cada nodo de azar y de cada tirada) y vale la mejor jugada del último ply
+completo. El 0 ply siempre se completa, así que siempre hay una jugada.
+
+Classes
+-------
+ExpectiminimaxSearch
+    Evalúa las jugadas de una posición a la profundidad pedida
+
+Functions
+---------
+dice_for_roll
+    Convierte una tirada en la lista de dados que se juegan
+"""
+
+import time
+
+from core.board import OPPONENT, counts_in_contact
+from core.exceptions import SearchTimeoutException
+from core.play_generator import enumerate_plays, enumerate_positions
+from engine.evaluation import (
+    CHECKERS,
+    MAX_EQUITY,
+    MIN_EQUITY,
+    NON_TERMINAL_BOUNDS,
+    evaluate,
+)
+from engine.transposition import EXACT, LOWER, UPPER, position_key
+
+# Las 21 tiradas distintas con su probabilidad.
+ROLLS = tuple(
+    ((__first__, __second__), (1 if __first__ == __second__ else 2) / 36)
+    for __first__ in range(1, 7)
+    for __second__ in range(__first__, 7)
+)
+
+# Jugadas que se vuelven a evaluar en la raíz a cada profundidad.
+ROOT_WIDTHS = {1: 8, 2: 2}
+
+# Respuestas que se expanden por tirada en los nodos de azar interiores.
+REPLY_WIDTH = 2
+
+
+def dice_for_roll(__roll__):
+    """
+    Convierte una tirada en la lista de dados que se juegan.
+
+    Args:
+        __roll__ (tuple): Los valores de los dos dados.
+
+    Returns:
+        list: Los dos dados, o cuatro veces el valor en un doble.
+    """
+    __first__, __second__ = __roll__
+    if __first__ == __second__:
+        return [__first__] * 4
+    return [__first__, __second__]
+
+
+# Fichas que un jugador puede sacar como máximo en un turno.
+_MAX_OFF_PER_TURN = 4
+
+
+def _is_terminal(__counts__):
+    """Indica si algún jugador ya sacó todas sus fichas."""
+    return CHECKERS in (__counts__[26], __counts__[27])
+
+
+def _can_end_within(__counts__, __turns__):
+    """
+    Indica si algún jugador podría sacar todas sus fichas en esos turnos.
+    """
+    __reach__ = CHECKERS - _MAX_OFF_PER_TURN * __turns__
+    return __counts__[26] >= __reach__ or __counts__[27] >= __reach__
+
+
+class ExpectiminimaxSearch:  # pylint: disable=too-many-instance-attributes
+    """
+    Búsqueda expectiminimax con filtro de jugadas y poda Star1/Star2.
+
+    Atributos:
+        __evaluator__ (callable): La evaluación estática (conteos, color) ->
+                                  equity del color que tiene el turno.
+        __root_widths__ (dict): Las jugadas reevaluadas en la raíz por ply.
+        __reply_width__ (int): Las respuestas expandidas por tirada.
+        __static_bounds__ (tuple): Las cotas del evaluador en posiciones no
+                                   terminadas.
+        __bounds__ (tuple): Las cotas de la equity en la búsqueda actual.
+        __table__ (TranspositionTable): La tabla de transposición, o None.
+        __race_cutoff__ (bool): Si las carreras se evalúan sin expandirlas.
+        __deadline__ (float): El instante (time.perf_counter) en que se
+                              cancela la búsqueda actual, o None.
+        __stats__ (dict): Los contadores de la última búsqueda: nodes
+                          (nodos de azar), evaluations y cutoffs.
+    """
+
+    def __init__(
+        self,
+        __evaluator__=evaluate,
+        __root_widths__=None,
+        __reply_width__=REPLY_WIDTH,
+        __static_bounds__=None,
+        __table__=None,
+        __race_cutoff__=False,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Inicializa la búsqueda.
+
+        Args:
+            __evaluator__ (callable, opcional): La evaluación estática.
+            __root_widths__ (dict, opcional): Jugadas reevaluadas en la raíz
+                                              por ply. Por defecto ROOT_WIDTHS.
+            __reply_width__ (int, opcional): Respuestas por tirada en los
+                                             nodos interiores.
+            __static_bounds__ (tuple, opcional): Las cotas (mínima, máxima)
+                                                 del evaluador en posiciones
+                                                 no terminadas. Por defecto
+                                                 su atributo __bounds__, o
+                                                 NON_TERMINAL_BOUNDS.
+            __table__ (TranspositionTable, opcional): La tabla donde guardar
+                                                      y buscar los nodos de
+                                                      azar.
+            __race_cutoff__ (bool, opcional): Si las posiciones sin contacto
+                                              se evalúan estáticamente en
+                                              lugar de expandirlas.
+        """
+        self.__evaluator__ = __evaluator__
+        self.__root_widths__ = __root_widths__ or ROOT_WIDTHS
+        self.__reply_width__ = __reply_width__
+        self.__static_bounds__ = __static_bounds__ or getattr(
+            __evaluator__, "__bounds__", NON_TERMINAL_BOUNDS
+        )
+        self.__bounds__ = (MIN_EQUITY, MAX_EQUITY)
+        self.__table__ = __table__
+        self.__race_cutoff__ = __race_cutoff__
+        self.__deadline__ = None
+        self.__stats__ = {"nodes": 0, "evaluations": 0, "cutoffs": 0}
+
+    def get_stats(self):
+        """
+        Devuelve los contadores de la última búsqueda.
+
+        Returns:
+            dict: nodes, evaluations y cutoffs.
+        """
+        return dict(self.__stats__)
+
+    def analyze(self, __game__, __plies__=2):
+        """
+        Evalúa las jugadas legales del turno actual de una partida.
+
+        Args:
+            __game__ (Game): La partida, con los dados ya tirados.
+            __plies__ (int, opcional): La profundidad (0, 1 o 2).
+
+        Returns:
+            list: Ver analyze_counts.
+        """
+        return self.analyze_counts(
+            __game__.__board__.get_counts(),
+            __game__.get_current_player().__color__,
+            __game__.get_dice_values(),
+            __plies__,
+        )
+
+    def analyze_counts(self, __counts__, __color__, __dice__, __plies__=2):
+        """
+        Evalúa las jugadas de una tirada sobre los conteos de una posición.
+
+        Args:
+            __counts__ (list): Los 28 conteos con signo de la posición.
+            __color__ (str): El color que mueve.
+            __dice__ (list): Los dados a jugar.
+            __plies__ (int, opcional): La profundidad.
+
+        Returns:
+            list: Tuplas (jugada, equity, plies) ordenadas de mejor a peor.
+                  plies es la profundidad a la que se evaluó la jugada: las
+                  que el filtro de la raíz descartó conservan la valuación
+                  del ply anterior y quedan detrás de las más profundas.
+        """
+        return self._root(__counts__, __color__, __dice__, __plies__, True)
+
+    def best_play(self, __game__, __plies__=2):
+        """
+        Devuelve la mejor jugada del turno actual, o () si no hay ninguna.
+
+        A diferencia de analyze, sólo la equity de la mejor jugada tiene que
+        ser exacta: el resto se busca con la ventana (mejor hasta ahora,
+        máximo), lo que permite a Star1 descartarlas antes.
+        """
+        __analysis__ = self._root(
+            __game__.__board__.get_counts(),
+            __game__.get_current_player().__color__,
+            __game__.get_dice_values(),
+            __plies__,
+            False,
+        )
+        return __analysis__[0][0] if __analysis__ else ()
+
+    def best_play_within(self, __game__, __budget__, __max_plies__=2):
+        """
+        Devuelve la mejor jugada del turno actual que se pueda buscar en un
+        tiempo límite, profundizando de a un ply.
+
+        Args:
+            __game__ (Game): La partida, con los dados ya tirados.
+            __budget__ (float): Los segundos disponibles.
+            __max_plies__ (int, opcional): La profundidad máxima.
+
+        Returns:
+            tuple: (jugada, plies), con la jugada del ply más profundo que se
+                   completó, o () si no hay ninguna, y ese ply.
+        """
+        __deadline__ = time.perf_counter() + __budget__
+        __counts__ = __game__.__board__.get_counts()
+        __color__ = __game__.get_current_player().__color__
+        __dice__ = __game__.get_dice_values()
+        __best__, __reached__ = (), 0
+        for __plies__ in range(__max_plies__ + 1):
+            # El 0 ply no se cancela: es la jugada de reserva.
+            self.__deadline__ = __deadline__ if __plies__ else None
+            try:
+                __analysis__ = self._root(
+                    __counts__, __color__, __dice__, __plies__, False
+                )
+            except SearchTimeoutException:
+                break
+            finally:
+                self.__deadline__ = None
+            if not __analysis__:
+                break
+            __best__, __reached__ = __analysis__[0][0], __plies__
+            if len(__analysis__) == 1:
+                break
+        return __best__, __reached__
+
+    def _check_deadline(self):
+        """Cancela la búsqueda si se venció su tiempo límite."""
+        if self.__deadline__ is not None and time.perf_counter() >= self.__deadline__:
+            raise SearchTimeoutException("Se agotó el tiempo de la búsqueda")
+
+    def _root(
+        self, __counts__, __color__, __dice__, __plies__, __exact__
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Evalúa las jugadas de la raíz ply por ply, reevaluando a cada
+        profundidad sólo las mejores del ply anterior. Con __exact__ en falso
+        cada jugada se busca con la ventana (mejor equity del ply, máximo),
+        así que las que no la superan devuelven sólo una cota superior.
+        """
+        self.__stats__ = {"nodes": 0, "evaluations": 0, "cutoffs": 0}
+        if self.__table__ is not None:
+            self.__table__.new_search()
+        self.__bounds__ = (
+            (MIN_EQUITY, MAX_EQUITY)
+            if _can_end_within(__counts__, __plies__ + 1)
+            else self.__static_bounds__
+        )
+        __low__, __high__ = self.__bounds__
+        __opponent__ = OPPONENT[__color__]
+        __candidates__ = enumerate_plays(__counts__, __color__, __dice__)
+        __scored__ = [
+            (__play__, __after__, -__equity__, 0)
+            for (__play__, __after__), __equity__ in zip(
+                __candidates__,
+                self._evaluate_all(
+                    [__after__ for _, __after__ in __candidates__], __opponent__
+                ),
+            )
+        ]
+        __scored__.sort(key=lambda __entry__: -__entry__[2])
+        for __ply__ in range(1, __plies__ + 1):
+            if len(__scored__) <= 1:
+                break
+            __width__ = self.__root_widths__.get(__ply__, len(__scored__))
+            __deeper__ = []
+            __alpha__ = __low__
+            for __play__, __after__, _, _ in __scored__[:__width__]:
+                __equity__ = -self._chance(
+                    __after__, __opponent__, __ply__, -__high__, -__alpha__
+                )
+                if not __exact__:
+                    __alpha__ = max(__alpha__, __equity__)
+                __deeper__.append((__play__, __after__, __equity__, __ply__))
+            __deeper__.sort(key=lambda __entry__: -__entry__[2])
+            __scored__ = __deeper__ + __scored__[__width__:]
+        return [
+            (__play__, __equity__, __ply__)
+            for __play__, _, __equity__, __ply__ in __scored__
+        ]
+
+    def _evaluate(self, __counts__, __color__):
+        """Llama a la evaluación estática y la cuenta."""
+        self.__stats__["evaluations"] += 1
+        return self.__evaluator__(__counts__, __color__)
+
+    def _evaluate_all(self, __positions__, __color__):
+        """
+        Evalúa varias posiciones para el mismo color; si el evaluador tiene
+        evaluate_batch (ver engine.neural) las evalúa en un solo lote.
+        """
+        self.__stats__["evaluations"] += len(__positions__)
+        if __positions__ and hasattr(self.__evaluator__, "evaluate_batch"):
+            return self.__evaluator__.evaluate_batch(__positions__, __color__).tolist()
+        return [self.__evaluator__(__after__, __color__) for __after__ in __positions__]
+
+    def _replies(self, __counts__, __color__, __roll__):
+        """
+        Devuelve las respuestas a una tirada ordenadas por evaluación estática.
+
+        Returns:
+            list: Pares (equity a 0 plies, conteos resultantes) de mejor a peor.
+        """
+        self._check_deadline()
+        __positions__ = enumerate_positions(
+            __counts__, __color__, dice_for_roll(__roll__)
+        )
+        __replies__ = [
+            (-__equity__, __after__)
+            for __after__, __equity__ in zip(
+                __positions__, self._evaluate_all(__positions__, OPPONENT[__color__])
+            )
+        ]
+        __replies__.sort(key=lambda __entry__: -__entry__[0])
+        return __replies__
+
+    def _roll_value(self, __counts__, __color__, __roll__):
+        """Valor a 0 plies de la mejor respuesta a una tirada."""
+        __replies__ = self._replies(__counts__, __color__, __roll__)
+        if __replies__:
+            return __replies__[0][0]
+        return -self._evaluate(__counts__, OPPONENT[__color__])
+
+    def _chance(self, __counts__, __color__, __depth__, __alpha__, __beta__):
+        """
+        Valor de una posición para el color que está por tirar, promediando
+        las 21 tiradas, con poda Star1 sobre la ventana (alfa, beta).
+
+        El resultado es exacto si queda dentro de la ventana; si no, es una
+        cota del lado de la ventana que cortó.
+        """
+        self._check_deadline()
+        self.__stats__["nodes"] += 1
+        if (
+            __depth__ == 0
+            or _is_terminal(__counts__)
+            or (self.__race_cutoff__ and not counts_in_contact(__counts__))
+        ):
+            return self._evaluate(__counts__, __color__)
+        if self.__table__ is None:
+            return self._expand(__counts__, __color__, __depth__, __alpha__, __beta__)
+        __key__ = position_key(__counts__, __color__)
+        __value__ = self.__table__.probe(__key__, __depth__, __alpha__, __beta__)
+        if __value__ is None:
+            __value__ = self._expand(
+                __counts__, __color__, __depth__, __alpha__, __beta__
+            )
+            __bound__ = EXACT
+            if __value__ <= __alpha__:
+                __bound__ = UPPER
+            elif __value__ >= __beta__:
+                __bound__ = LOWER
+            self.__table__.store(__key__, __depth__, __value__, __bound__)
+        return __value__
+
+    def _expand(
+        self, __counts__, __color__, __depth__, __alpha__, __beta__
+    ):  # pylint: disable=too-many-locals
+        """
+        Expande un nodo de azar no terminal de profundidad 1 o más.
+        """
+        if __depth__ == 1:
+            return self._leaf_chance(__counts__, __color__, __alpha__, __beta__)
+
+        # Star2: la primera respuesta (la mejor a 0 plies) de cada tirada se
+        # busca completa; su valor es una cota inferior del nodo de la tirada.
+        __low__, __high__ = self.__bounds__
+        __opponent__ = OPPONENT[__color__]
+        __nodes__ = []
+        __lower_total__ = 0.0
+        __remaining__ = 1.0
+        for __roll__, __probability__ in ROLLS:
+            __replies__ = self._replies(__counts__, __color__, __roll__)
+            __after__ = __replies__[0][1] if __replies__ else __counts__
+            __lower__ = -self._chance(
+                __after__, __opponent__, __depth__ - 1, __low__, __high__
+            )
+            __rest__ = __replies__[1 : self.__reply_width__]
+            __nodes__.append((__probability__, __lower__, __rest__))
+            __lower_total__ += __probability__ * __lower__
+            __remaining__ -= __probability__
+            if __lower_total__ + __remaining__ * __low__ >= __beta__:
+                self.__stats__["cutoffs"] += 1
+                return __lower_total__ + __remaining__ * __low__
+
+        # Star1: se completa cada tirada con una ventana que garantiza que el
+        # promedio final sigue pudiendo caer dentro de (alfa, beta).
+        __total__ = 0.0
+        __upper_rest__ = sum(
+            __probability__ * (__high__ if __rest__ else __lower__)
+            for __probability__, __lower__, __rest__ in __nodes__
+        )
+        __lower_rest__ = __lower_total__
+        for __probability__, __lower__, __rest__ in __nodes__:
+            __upper_rest__ -= __probability__ * (__high__ if __rest__ else __lower__)
+            __lower_rest__ -= __probability__ * __lower__
+            __value__ = __lower__
+            if __rest__:
+                __value__ = self._max_node(
+                    __rest__,
+                    __opponent__,
+                    __depth__,
+                    __lower__,
+                    (__alpha__ - __total__ - __upper_rest__) / __probability__,
+                    (__beta__ - __total__ - __lower_rest__) / __probability__,
+                )
+            __total__ += __probability__ * __value__
+            if __total__ + __upper_rest__ <= __alpha__:
+                self.__stats__["cutoffs"] += 1
+                return __total__ + __upper_rest__
+            if __total__ + __lower_rest__ >= __beta__:
+                self.__stats__["cutoffs"] += 1
+                return __total__ + __lower_rest__
+        return __total__
+
+    def _max_node(
+        self, __replies__, __opponent__, __depth__, __best__, __alpha__, __beta__
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Completa el nodo de una tirada: el mejor valor entre la respuesta ya
+        sondeada (__best__) y las demás, con poda alfa-beta.
+        """
+        if __best__ >= __beta__:
+            return __best__
+        __alpha__ = max(__alpha__, __best__)
+        for _, __after__ in __replies__:
+            __value__ = -self._chance(
+                __after__, __opponent__, __depth__ - 1, -__beta__, -__alpha__
+            )
+            if __value__ > __best__:
+                __best__ = __value__
+                if __best__ >= __beta__:
+                    self.__stats__["cutoffs"] += 1
+                    return __best__
+                __alpha__ = max(__alpha__, __best__)
+        return __best__
+
+    def _leaf_chance(self, __counts__, __color__, __alpha__, __beta__):
+        """
+        Nodo de azar cuyas respuestas se evalúan estáticamente: el valor de
+        cada tirada es exacto, así que sólo se aplica Star1 para no generar
+        las jugadas de las tiradas restantes cuando ya no hacen falta.
+        """
+        __low__, __high__ = self.__bounds__
+        __total__ = 0.0
+        __remaining__ = 1.0
+        for __roll__, __probability__ in ROLLS[:-1]:
+            __total__ += __probability__ * self._roll_value(
+                __counts__, __color__, __roll__
+            )
+            __remaining__ -= __probability__
+            if __total__ + __remaining__ * __high__ <= __alpha__:
+                self.__stats__["cutoffs"] += 1
+                return __total__ + __remaining__ * __high__
+            if __total__ + __remaining__ * __low__ >= __beta__:
+                self.__stats__["cutoffs"] += 1
+                return __total__ + __remaining__ * __low__
+        return __total__ + __remaining__ * self._roll_value(
+            __counts__, __color__, ROLLS[-1][0]
+        )
@@ -0,0 +1,149 @@
+"""
+Simulador de partidas completas sin interfaz, para medir el rendimiento.
+
+Juega N partidas entre dos políticas (ver engine.policies) usando
+core.game.Game, sin imprimir nada durante el juego, y devuelve un resumen
+con las partidas por segundo, la cantidad media de turnos y las tasas de
+victoria, gammon y backgammon. Es la medida de referencia para cualquier
+optimización del motor.
+
+Uso:
+    python -m engine.simulator [--games N] [--white P] [--black P] [--seed S]
+
+Functions
+---------
+play_game
+    Juega una partida completa entre dos políticas
+simulate
+    Juega N partidas y devuelve el resumen
+"""
+
+import argparse
+import random
+import time
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.policies import POLICIES, make_policy
+
+# Límite de turnos por partida, para cortar políticas que no avanzan.
+MAX_PLIES = 10000
+
+# Tiradas que los dados de la simulación generan por bloque.
+DICE_BATCH_SIZE = 4096
+
+
+def play_game(
+    __white__, __black__, __board__=None, __dice__=None, __max_plies__=MAX_PLIES
+):
+    """
+    Juega una partida completa entre dos políticas.
+
+    Args:
+        __white__ (Policy): La política de las blancas, que empiezan.
+        __black__ (Policy): La política de las negras.
+        __board__ (Board, opcional): El tablero inicial. Por defecto un
+                                     CompactBoard nuevo.
+        __dice__ (Dice, opcional): Los dados. Por defecto unos Dice() que
+                                   usan el módulo random.
+        __max_plies__ (int, opcional): El máximo de turnos a jugar.
+
+    Returns:
+        Game: La partida al terminar, de donde se leen el ganador y
+              get_win_points().
+        int: La cantidad de turnos jugados.
+    """
+    __game__ = Game(
+        Player("Blancas", "white"),
+        Player("Negras", "black"),
+        __board__ if __board__ is not None else CompactBoard(),
+        __dice__ if __dice__ is not None else Dice(),
+    )
+    __game__.start()
+    __policies__ = {"white": __white__, "black": __black__}
+    __plies__ = 0
+    while not __game__.is_over() and __plies__ < __max_plies__:
+        if not __game__.get_dice_values():
+            __game__.roll_dice()
+        __candidates__ = __game__.get_legal_plays_with_positions()
+        __play__ = ()
+        if __candidates__:
+            __color__ = __game__.get_current_player().__color__
+            __play__ = __policies__[__color__].choose_play(__game__, __candidates__)
+        __game__.apply_play(__play__)
+        __plies__ += 1
+    return __game__, __plies__
+
+
+def simulate(__games__, __white__="random", __black__="random", __seed__=None):
+    """
+    Juega varias partidas entre dos políticas y resume los resultados.
+
+    Args:
+        __games__ (int): La cantidad de partidas.
+        __white__ (str): El nombre de la política de las blancas.
+        __black__ (str): El nombre de la política de las negras.
+        __seed__ (int, opcional): La semilla de los dados y de las
+                                  políticas al azar.
+
+    Returns:
+        dict: games, seconds, games_per_second, mean_plies, white_wins,
+              black_wins, unfinished, gammon_rate y backgammon_rate.
+    """
+    __dice__ = Dice(random.Random(__seed__), DICE_BATCH_SIZE)
+    __white_policy__ = make_policy(__white__, __seed__)
+    __black_policy__ = make_policy(
+        __black__, None if __seed__ is None else __seed__ + 1
+    )
+    __wins__ = {"white": 0, "black": 0}
+    __points__ = {1: 0, 2: 0, 3: 0}
+    __total_plies__ = 0
+    __start__ = time.perf_counter()
+    for _ in range(__games__):
+        __game__, __plies__ = play_game(
+            __white_policy__, __black_policy__, __dice__=__dice__
+        )
+        __total_plies__ += __plies__
+        if __game__.is_over():
+            __wins__[__game__.get_winner().__color__] += 1
+            __points__[__game__.get_win_points()] += 1
+    __seconds__ = time.perf_counter() - __start__
+    __finished__ = __wins__["white"] + __wins__["black"]
+    return {
+        "games": __games__,
+        "seconds": __seconds__,
+        "games_per_second": __games__ / __seconds__ if __seconds__ else 0.0,
+        "mean_plies": __total_plies__ / __games__ if __games__ else 0.0,
+        "white_wins": __wins__["white"],
+        "black_wins": __wins__["black"],
+        "unfinished": __games__ - __finished__,
+        "gammon_rate": __points__[2] / __finished__ if __finished__ else 0.0,
+        "backgammon_rate": __points__[3] / __finished__ if __finished__ else 0.0,
+    }
+
+
+def main(argv=None):
+    """
+    Ejecuta la simulación desde la línea de comandos e imprime el resumen.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--white", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--black", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    report = simulate(args.games, args.white, args.black, args.seed)
+    print(f"Partidas:          {report['games']}")
+    print(f"Partidas/s:        {report['games_per_second']:.1f}")
+    print(f"Turnos promedio:   {report['mean_plies']:.1f}")
+    print(f"Victorias blancas: {report['white_wins']}")
+    print(f"Victorias negras:  {report['black_wins']}")
+    print(f"Tasa de gammon:    {report['gammon_rate']:.3f}")
+    print(f"Tasa de backgammon:{report['backgammon_rate']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
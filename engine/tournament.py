@@ -0,0 +1,223 @@
+"""
+Torneo de partidas sin interfaz repartido entre varios procesos.
+
+Las partidas se dividen en lotes que se juegan en un ProcessPoolExecutor.
+Cada partida recibe una semilla propia derivada de la semilla maestra y de
+su número de partida, de modo que el resultado de cualquier partida (dados
+incluidos) se puede reproducir con play_seeded_game() sin importar cuántos
+procesos se usaron ni en qué orden terminaron los lotes. Los resultados de
+cada lote vuelven al proceso principal apenas el lote termina y se suman
+al resumen.
+
+Uso:
+    python -m engine.tournament [--games N] [--workers W] [--seed S]
+                                [--white P] [--black P] [--batch-size B]
+
+Functions
+---------
+derive_seed
+    Calcula la semilla de una partida a partir de la semilla maestra
+play_seeded_game
+    Juega (o reproduce) una partida con su semilla
+run_tournament
+    Juega N partidas en paralelo y devuelve el resumen
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from core.dice import Dice
+from engine.policies import POLICIES, make_policy
+from engine.simulator import play_game
+
+# Cantidad de partidas por lote enviado a cada proceso.
+DEFAULT_BATCH_SIZE = 250
+
+# Tiradas que los dados de cada partida generan por bloque; alcanza para la
+# mayoría de las partidas entre políticas simples.
+GAME_DICE_BATCH_SIZE = 128
+
+
+def derive_seed(__master_seed__, __index__):
+    """
+    Calcula una semilla de 64 bits independiente para una partida.
+
+    Args:
+        __master_seed__ (int): La semilla maestra del torneo.
+        __index__ (int): El número de partida.
+
+    Returns:
+        int: La semilla de la partida.
+    """
+    __digest__ = hashlib.blake2b(
+        f"{__master_seed__}:{__index__}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(__digest__, "big")
+
+
+def play_seeded_game(__white__, __black__, __seed__):
+    """
+    Juega una partida cuyos dados y políticas al azar dependen sólo de la semilla.
+
+    Args:
+        __white__ (str): El nombre de la política de las blancas.
+        __black__ (str): El nombre de la política de las negras.
+        __seed__ (int): La semilla de la partida (ver derive_seed).
+
+    Returns:
+        Game: La partida terminada.
+        int: La cantidad de turnos jugados.
+    """
+    return play_game(
+        make_policy(__white__, __seed__ + 1),
+        make_policy(__black__, __seed__ + 2),
+        __dice__=Dice.seeded(__seed__, GAME_DICE_BATCH_SIZE),
+    )
+
+
+def _play_batch(__white__, __black__, __master_seed__, __start__, __stop__):
+    """
+    Juega un lote de partidas consecutivas; se ejecuta en un proceso del pool.
+
+    Returns:
+        list: Una tupla (número, color ganador o None, puntos, turnos) por partida.
+    """
+    __results__ = []
+    for __index__ in range(__start__, __stop__):
+        __game__, __plies__ = play_seeded_game(
+            __white__, __black__, derive_seed(__master_seed__, __index__)
+        )
+        __winner__ = __game__.get_winner()
+        __results__.append(
+            (
+                __index__,
+                __winner__.__color__ if __winner__ else None,
+                __game__.get_win_points(),
+                __plies__,
+            )
+        )
+    return __results__
+
+
+def _batches(__games__, __batch_size__):
+    """Divide las partidas en rangos [inicio, fin) de a lo sumo batch_size."""
+    return [
+        (__start__, min(__start__ + __batch_size__, __games__))
+        for __start__ in range(0, __games__, __batch_size__)
+    ]
+
+
+def run_tournament(
+    __games__,
+    __white__="random",
+    __black__="random",
+    __master_seed__=0,
+    __workers__=None,
+    __batch_size__=DEFAULT_BATCH_SIZE,
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    """
+    Juega varias partidas repartidas entre procesos y resume los resultados.
+
+    Args:
+        __games__ (int): La cantidad de partidas.
+        __white__ (str): El nombre de la política de las blancas.
+        __black__ (str): El nombre de la política de las negras.
+        __master_seed__ (int): La semilla de la que se derivan las de cada partida.
+        __workers__ (int, opcional): La cantidad de procesos. Por defecto
+                                     todos los núcleos; con 1 se juega en el
+                                     proceso actual.
+        __batch_size__ (int): Las partidas por lote.
+
+    Returns:
+        dict: games, workers, seconds, games_per_second, mean_plies,
+              white_wins, black_wins, unfinished, white_points,
+              black_points, gammons y backgammons.
+    """
+    __workers__ = __workers__ or os.cpu_count() or 1
+    __report__ = {
+        "games": __games__,
+        "workers": __workers__,
+        "white_wins": 0,
+        "black_wins": 0,
+        "unfinished": 0,
+        "white_points": 0,
+        "black_points": 0,
+        "gammons": 0,
+        "backgammons": 0,
+    }
+    __total_plies__ = 0
+    __start__ = time.perf_counter()
+
+    def _collect(__results__):
+        nonlocal __total_plies__
+        for _, __color__, __points__, __plies__ in __results__:
+            __total_plies__ += __plies__
+            if __color__ is None:
+                __report__["unfinished"] += 1
+                continue
+            __report__[f"{__color__}_wins"] += 1
+            __report__[f"{__color__}_points"] += __points__
+            if __points__ == 2:
+                __report__["gammons"] += 1
+            elif __points__ == 3:
+                __report__["backgammons"] += 1
+
+    __ranges__ = _batches(__games__, __batch_size__)
+    if __workers__ == 1:
+        for __first__, __last__ in __ranges__:
+            _collect(
+                _play_batch(__white__, __black__, __master_seed__, __first__, __last__)
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=__workers__) as __pool__:
+            __futures__ = [
+                __pool__.submit(
+                    _play_batch,
+                    __white__,
+                    __black__,
+                    __master_seed__,
+                    __first__,
+                    __last__,
+                )
+                for __first__, __last__ in __ranges__
+            ]
+            for __future__ in as_completed(__futures__):
+                _collect(__future__.result())
+
+    __seconds__ = time.perf_counter() - __start__
+    __report__["seconds"] = __seconds__
+    __report__["games_per_second"] = __games__ / __seconds__ if __seconds__ else 0.0
+    __report__["mean_plies"] = __total_plies__ / __games__ if __games__ else 0.0
+    return __report__
+
+
+def main(argv=None):
+    """
+    Ejecuta el torneo desde la línea de comandos e imprime el resumen.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--white", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--black", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    report = run_tournament(
+        args.games, args.white, args.black, args.seed, args.workers, args.batch_size
+    )
+    print(f"Partidas:          {report['games']} en {report['workers']} procesos")
+    print(f"Partidas/s:        {report['games_per_second']:.1f}")
+    print(f"Turnos promedio:   {report['mean_plies']:.1f}")
+    print(f"Victorias blancas: {report['white_wins']} ({report['white_points']} pts)")
+    print(f"Victorias negras:  {report['black_wins']} ({report['black_points']} pts)")
+    print(f"Gammons:           {report['gammons']}")
+    print(f"Backgammons:       {report['backgammons']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Entrenamiento por TD(λ) de la red neuronal (ver engine.neural) jugando
+partidas contra sí misma.
+
+Los actores juegan partidas con una copia de los pesos: en cada turno
+puntúan todas las jugadas en un lote y eligen la mejor (o una al azar con
+probabilidad epsilon, para explorar), y devuelven la trayectoria de
+posiciones con el color en turno y el resultado final. El aprendiz recibe
+las trayectorias y aplica la actualización TD(λ) a sus pesos.
+
+La actualización de una partida es la de TD(λ) con trazas de elegibilidad
+acumuladas y pesos fijos durante la partida (actualización offline):
+
+    Δθ = α Σ_t δ_t e_t,   e_t = Σ_{j<=t} λ^(t-j) ∇Y_j
+
+que, reordenando la suma, es Δθ = α Σ_j ∇Y_j D_j con D_j = δ_j + λ D_(j+1).
+Así la traza se calcula hacia atrás sobre toda la trayectoria y el
+gradiente de todas las posiciones sale de una sola pasada por lotes.
+δ_t es la diferencia entre la predicción de la posición siguiente (vista
+desde el jugador en turno en t) y la de t; en la última posición, entre el
+resultado real y la predicción.
+
+Con varios actores, cada uno corre en un proceso de un ProcessPoolExecutor
+y el aprendiz, en el proceso principal, le manda los pesos actuales con
+cada lote nuevo. Los pesos se guardan cada cierto número de partidas y el
+resumen informa las partidas entrenadas por hora.
+
+Uso:
+    python -m engine.training [--games N] [--actors A] [--hidden H]
+                              [--checkpoint-dir D] [--checkpoint-every C]
+
+Classes
+-------
+TDTrainer
+    El aprendiz: la red, los parámetros de TD(λ) y los puntos de control
+
+Functions
+---------
+self_play_game
+    Juega una partida de la red contra sí misma y devuelve su trayectoria
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from core.dice import Dice
+from engine.neural import INPUTS, NeuralEvaluator, encode_batch
+from engine.policies import Policy
+from engine.simulator import play_game
+
+# Tasa de aprendizaje, λ y exploración por defecto.
+DEFAULT_ALPHA = 0.1
+DEFAULT_LAMBDA = 0.7
+DEFAULT_EPSILON = 0.05
+# Neuronas ocultas de la red que se entrena.
+DEFAULT_HIDDEN = 40
+# Partidas que juega un actor con cada copia de los pesos.
+GAMES_PER_TASK = 10
+
+# Orden de las salidas visto desde el rival: ganar pasa a ser perder, etc.
+_FLIP = [0, 3, 4, 1, 2]
+
+
+class _SelfPlayPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """
+    Política de entrenamiento que registra cada posición en la que decide.
+
+    Atributos:
+        __evaluator__ (NeuralEvaluator): La red.
+        __rng__ (random.Random): El generador para explorar.
+        __epsilon__ (float): La probabilidad de jugar al azar.
+        __states__ (list): Pares (conteos, color en turno) registrados.
+    """
+
+    def __init__(self, __evaluator__, __rng__, __epsilon__, __states__):
+        self.__evaluator__ = __evaluator__
+        self.__rng__ = __rng__
+        self.__epsilon__ = __epsilon__
+        self.__states__ = __states__
+
+    def choose_play(self, __game__, __candidates__):
+        """
+        Registra la posición y elige la mejor jugada según la red.
+        """
+        __color__ = __game__.get_current_player().__color__
+        self.__states__.append((__game__.__board__.get_counts(), __color__))
+        if self.__rng__.random() < self.__epsilon__:
+            return self.__rng__.choice(__candidates__)[0]
+        __scores__ = self.__evaluator__.score_plays(__candidates__, __color__)
+        return __candidates__[int(__scores__.argmax())][0]
+
+
+def self_play_game(__evaluator__, __seed__, __epsilon__=DEFAULT_EPSILON):
+    """
+    Juega una partida de la red contra sí misma.
+
+    Args:
+        __evaluator__ (NeuralEvaluator): La red que elige las jugadas.
+        __seed__ (int): La semilla de los dados y de la exploración.
+        __epsilon__ (float, opcional): La probabilidad de jugar al azar.
+
+    Returns:
+        tuple: (conteos, colores, ganador, puntos): una matriz (T, 28) con
+               las posiciones en las que se decidió, el color en turno en
+               cada una, el color ganador y los puntos ganados; o None si
+               la partida no terminó.
+    """
+    __states__ = []
+    __policy__ = _SelfPlayPolicy(
+        __evaluator__, random.Random(__seed__), __epsilon__, __states__
+    )
+    __game__, _ = play_game(__policy__, __policy__, __dice__=Dice.seeded(__seed__))
+    if not __game__.is_over() or not __states__:
+        return None
+    return (
+        np.array([__counts__ for __counts__, _ in __states__], dtype=np.int8),
+        [__color__ for _, __color__ in __states__],
+        __game__.get_winner().__color__,
+        __game__.get_win_points(),
+    )
+
+
+def _actor_games(__weights__, __seeds__, __epsilon__):
+    """
+    Juega un lote de partidas con una copia de los pesos; se ejecuta en un
+    proceso del pool.
+    """
+    __evaluator__ = NeuralEvaluator(len(__weights__["hidden_bias"]))
+    __evaluator__.set_weights(__weights__)
+    return [
+        __trajectory__
+        for __trajectory__ in (
+            self_play_game(__evaluator__, __seed__, __epsilon__)
+            for __seed__ in __seeds__
+        )
+        if __trajectory__ is not None
+    ]
+
+
+def _encode_trajectory(__counts__, __colors__):
+    """
+    Codifica cada posición de una trayectoria desde el color en turno.
+    """
+    __inputs__ = np.empty((len(__colors__), INPUTS), dtype=np.float32)
+    for __color__ in ("white", "black"):
+        __rows__ = [
+            __index__
+            for __index__, __turn__ in enumerate(__colors__)
+            if __turn__ == __color__
+        ]
+        if __rows__:
+            __inputs__[__rows__] = encode_batch(__counts__[__rows__], __color__)
+    return __inputs__
+
+
+def _td_errors(__outputs__, __trajectory__):
+    """
+    Calcula los errores TD de cada posición: la predicción siguiente vista
+    desde el jugador en turno (o, al final, el resultado real) menos la
+    predicción actual.
+    """
+    _, __colors__, __winner__, __points__ = __trajectory__
+    __targets__ = np.empty_like(__outputs__)
+    for __index__ in range(len(__colors__) - 1):
+        __following__ = __outputs__[__index__ + 1]
+        if __colors__[__index__ + 1] != __colors__[__index__]:
+            __following__ = __following__[_FLIP]
+        __targets__[__index__] = __following__
+    __result__ = np.array(
+        [1.0, __points__ >= 2, __points__ == 3, 0.0, 0.0], dtype=np.float32
+    )
+    __targets__[-1] = __result__ if __colors__[-1] == __winner__ else __result__[_FLIP]
+    return __targets__ - __outputs__
+
+
+class TDTrainer:
+    """
+    Aprendiz de TD(λ) dueño de la red neuronal.
+
+    Atributos:
+        __evaluator__ (NeuralEvaluator): La red que se entrena.
+        __alpha__ (float): La tasa de aprendizaje.
+        __lambda__ (float): El factor de decaimiento de las trazas.
+        __games__ (int): Las partidas aprendidas hasta ahora.
+        __positions__ (int): Las posiciones aprendidas hasta ahora.
+    """
+
+    def __init__(
+        self, __evaluator__=None, __alpha__=DEFAULT_ALPHA, __lambda__=DEFAULT_LAMBDA
+    ):
+        """
+        Inicializa el aprendiz.
+
+        Args:
+            __evaluator__ (NeuralEvaluator, opcional): La red. Por defecto
+                                                       una nueva de
+                                                       DEFAULT_HIDDEN neuronas.
+            __alpha__ (float, opcional): La tasa de aprendizaje.
+            __lambda__ (float, opcional): El λ de TD(λ).
+        """
+        self.__evaluator__ = __evaluator__ or NeuralEvaluator(DEFAULT_HIDDEN)
+        self.__alpha__ = __alpha__
+        self.__lambda__ = __lambda__
+        self.__games__ = 0
+        self.__positions__ = 0
+
+    def get_evaluator(self):
+        """
+        Devuelve la red que se entrena.
+        """
+        return self.__evaluator__
+
+    def learn(self, __trajectory__):
+        """
+        Aplica la actualización TD(λ) de una partida.
+
+        Args:
+            __trajectory__ (tuple): La trayectoria de self_play_game().
+
+        Returns:
+            float: El error TD medio en valor absoluto de la partida.
+        """
+        __counts__, __colors__, _, _ = __trajectory__
+        __inputs__ = _encode_trajectory(__counts__, __colors__)
+        __hidden__, __outputs__ = self.__evaluator__.forward(__inputs__)
+        __deltas__ = _td_errors(__outputs__, __trajectory__)
+
+        # D_j = δ_j + λ D_(j+1): la suma de las trazas de elegibilidad.
+        __errors__ = np.empty_like(__deltas__)
+        __running__ = np.zeros(__deltas__.shape[1], dtype=np.float32)
+        for __index__ in range(len(__deltas__) - 1, -1, -1):
+            __running__ = __deltas__[__index__] + self.__lambda__ * __running__
+            __errors__[__index__] = __running__
+
+        __weights__ = self.__evaluator__.get_weights()
+        __output_grad__ = __errors__ * __outputs__ * (1.0 - __outputs__)
+        __hidden_grad__ = (__output_grad__ @ __weights__["output_weights"].T) * (
+            __hidden__ * (1.0 - __hidden__)
+        )
+        __weights__["output_weights"] += self.__alpha__ * (
+            __hidden__.T @ __output_grad__
+        )
+        __weights__["output_bias"] += self.__alpha__ * __output_grad__.sum(axis=0)
+        __weights__["hidden_weights"] += self.__alpha__ * (
+            __inputs__.T @ __hidden_grad__
+        )
+        __weights__["hidden_bias"] += self.__alpha__ * __hidden_grad__.sum(axis=0)
+
+        self.__games__ += 1
+        self.__positions__ += len(__colors__)
+        return float(np.abs(__deltas__).mean())
+
+    def checkpoint(self, __directory__):
+        """
+        Guarda los pesos actuales en el directorio, con el número de partidas
+        en el nombre y también como td_latest.npz.
+
+        Returns:
+            str: La ruta del punto de control numerado.
+        """
+        os.makedirs(__directory__, exist_ok=True)
+        __path__ = os.path.join(__directory__, f"td_{self.__games__:08d}.npz")
+        self.__evaluator__.save(__path__)
+        self.__evaluator__.save(os.path.join(__directory__, "td_latest.npz"))
+        return __path__
+
+    def train(
+        self,
+        __games__,
+        __actors__=1,
+        __seed__=0,
+        __checkpoint_dir__=None,
+        __checkpoint_every__=0,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        """
+        Juega y aprende una cantidad de partidas.
+
+        Args:
+            __games__ (int): Las partidas a jugar.
+            __actors__ (int, opcional): Los procesos actores; con 1 se juega
+                                        en el proceso actual, aprendiendo
+                                        después de cada partida.
+            __seed__ (int, opcional): La semilla de la que salen las de cada
+                                      partida.
+            __checkpoint_dir__ (str, opcional): Dónde guardar los pesos.
+            __checkpoint_every__ (int, opcional): Cada cuántas partidas
+                                                  guardarlos; 0 sólo al final.
+
+        Returns:
+            dict: games, positions, seconds, games_per_hour,
+                  positions_per_second, mean_td_error y checkpoints.
+        """
+        __start__ = time.perf_counter()
+        __first_game__, __first_positions__ = self.__games__, self.__positions__
+        __errors__, __checkpoints__ = [], []
+
+        def _absorb(__trajectories__):
+            for __trajectory__ in __trajectories__:
+                __errors__.append(self.learn(__trajectory__))
+                if (
+                    __checkpoint_dir__
+                    and __checkpoint_every__
+                    and (self.__games__ - __first_game__) % __checkpoint_every__ == 0
+                ):
+                    __checkpoints__.append(self.checkpoint(__checkpoint_dir__))
+
+        __seeds__ = [__seed__ * 1_000_003 + __index__ for __index__ in range(__games__)]
+        if __actors__ == 1:
+            for __game_seed__ in __seeds__:
+                __trajectory__ = self_play_game(self.__evaluator__, __game_seed__)
+                _absorb([] if __trajectory__ is None else [__trajectory__])
+        else:
+            __chunks__ = [
+                __seeds__[__first__ : __first__ + GAMES_PER_TASK]
+                for __first__ in range(0, __games__, GAMES_PER_TASK)
+            ]
+            with ProcessPoolExecutor(max_workers=__actors__) as __pool__:
+                __pending__ = set()
+                while __chunks__ or __pending__:
+                    while __chunks__ and len(__pending__) < __actors__:
+                        __pending__.add(
+                            __pool__.submit(
+                                _actor_games,
+                                self.__evaluator__.get_weights(),
+                                __chunks__.pop(0),
+                                DEFAULT_EPSILON,
+                            )
+                        )
+                    __done__, __pending__ = wait(
+                        __pending__, return_when=FIRST_COMPLETED
+                    )
+                    for __future__ in __done__:
+                        _absorb(__future__.result())
+
+        if __checkpoint_dir__ and not (
+            __checkpoints__
+            and __checkpoints__[-1].endswith(f"{self.__games__:08d}.npz")
+        ):
+            __checkpoints__.append(self.checkpoint(__checkpoint_dir__))
+        __seconds__ = time.perf_counter() - __start__
+        __played__ = self.__games__ - __first_game__
+        __positions__ = self.__positions__ - __first_positions__
+        return {
+            "games": __played__,
+            "positions": __positions__,
+            "seconds": __seconds__,
+            "games_per_hour": 3600 * __played__ / __seconds__ if __seconds__ else 0.0,
+            "positions_per_second": __positions__ / __seconds__ if __seconds__ else 0.0,
+            "mean_td_error": float(np.mean(__errors__)) if __errors__ else 0.0,
+            "checkpoints": __checkpoints__,
+        }
+
+
+def main(argv=None):
+    """
+    Entrena desde la línea de comandos e imprime el resumen.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--actors", type=int, default=1)
+    parser.add_argument("--hidden", type=int, default=DEFAULT_HIDDEN)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint-dir", default=None)
+    parser.add_argument("--checkpoint-every", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    trainer = TDTrainer(NeuralEvaluator(args.hidden, args.seed))
+    report = trainer.train(
+        args.games,
+        args.actors,
+        args.seed,
+        args.checkpoint_dir,
+        args.checkpoint_every,
+    )
+    print(f"Partidas:          {report['games']} con {args.actors} actores")
+    print(f"Partidas/hora:     {report['games_per_hour']:.0f}")
+    print(f"Posiciones/s:      {report['positions_per_second']:.1f}")
+    print(f"Error TD medio:    {report['mean_td_error']:.4f}")
+    for path in report["checkpoints"]:
+        print(f"Guardado:          {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Tabla de transposición de tamaño fijo para las evaluaciones de posiciones.
+
+Las búsquedas llegan a la misma posición por distintos órdenes de
+movimientos (sobre todo con dobles). La tabla guarda, para cada clave de 64
+bits (el hash Zobrist de la posición y el jugador en turno, ver
+position_key o Game.zobrist_hash), la equity calculada, la profundidad a la
+que se calculó y si es exacta o sólo una cota de una búsqueda con ventana.
+
+La capacidad es fija (una potencia de dos) y cada clave tiene un único
+lugar, elegido por sus bits bajos. Los datos se guardan en arreglos del
+módulo array, unos 20 bytes por entrada, así que la memoria no crece con
+el uso. Cuando dos posiciones compiten por el mismo lugar se conserva la de
+mayor profundidad, salvo que la guardada sea de una búsqueda anterior (ver
+new_search), que siempre se reemplaza.
+
+Classes
+-------
+TranspositionTable
+    La tabla con sus contadores de aciertos, fallos y colisiones
+
+Functions
+---------
+position_key
+    Calcula la clave de una posición en formato de conteos
+"""
+
+from array import array
+
+from core.zobrist import fold_bar_and_off, fold_turn_and_dice, hash_counts
+
+# Tipos de valor guardado: exacto, cota inferior o cota superior.
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Capacidad por defecto, en entradas.
+DEFAULT_CAPACITY = 1 << 16
+
+_EMPTY = -1
+_AGE_MASK = 0xFFFF
+
+
+def position_key(__counts__, __color__):
+    """
+    Calcula la clave de una posición con el jugador en turno.
+
+    Coincide con Game.zobrist_hash cuando el jugador 2 de la partida es el
+    de las negras y no quedan dados por usar.
+
+    Args:
+        __counts__ (list): Los 28 conteos con signo de la posición.
+        __color__ (str): El color que tiene el turno.
+
+    Returns:
+        int: La clave de 64 bits.
+    """
+    __board_hash__ = fold_bar_and_off(
+        hash_counts(__counts__),
+        (__counts__[24], __counts__[25]),
+        (__counts__[26], __counts__[27]),
+    )
+    return fold_turn_and_dice(__board_hash__, 1 if __color__ == "black" else 0, ())
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición con reemplazo por profundidad y antigüedad.
+
+    Atributos:
+        __mask__ (int): La capacidad menos uno, para indexar por los bits bajos.
+        __keys__ (array): La clave completa guardada en cada lugar.
+        __equities__ (array): Las equities guardadas.
+        __depths__ (array): La profundidad de cada entrada, o -1 si está vacía.
+        __bounds__ (array): EXACT, LOWER o UPPER.
+        __ages__ (array): La búsqueda en la que se guardó cada entrada.
+        __counters__ (dict): hits, misses, collisions, stores, replacements,
+                             rejected y la búsqueda actual (age).
+    """
+
+    def __init__(self, __capacity__=DEFAULT_CAPACITY):
+        """
+        Inicializa una tabla vacía.
+
+        Args:
+            __capacity__ (int, opcional): La cantidad de entradas; se redondea
+                                          a la potencia de dos siguiente.
+        """
+        __size__ = 1
+        while __size__ < __capacity__:
+            __size__ <<= 1
+        self.__mask__ = __size__ - 1
+        self.__keys__ = array("Q", bytes(8 * __size__))
+        self.__equities__ = array("d", bytes(8 * __size__))
+        self.__depths__ = array("b", bytes(__size__))
+        self.__bounds__ = array("B", bytes(__size__))
+        self.__ages__ = array("H", bytes(2 * __size__))
+        self.__counters__ = {}
+        self.clear()
+
+    def __len__(self):
+        """
+        Devuelve la cantidad de entradas ocupadas.
+        """
+        return len(self.__depths__) - self.__depths__.count(_EMPTY)
+
+    def get_capacity(self):
+        """
+        Devuelve la cantidad máxima de entradas.
+        """
+        return self.__mask__ + 1
+
+    def clear(self):
+        """
+        Vacía la tabla y pone los contadores en cero.
+        """
+        self.__depths__[:] = array("b", [_EMPTY]) * (self.__mask__ + 1)
+        self.__counters__ = {
+            "hits": 0,
+            "misses": 0,
+            "collisions": 0,
+            "stores": 0,
+            "replacements": 0,
+            "rejected": 0,
+            "age": 0,
+        }
+
+    def new_search(self):
+        """
+        Empieza una búsqueda nueva: las entradas de las anteriores pasan a
+        poder reemplazarse aunque sean más profundas.
+        """
+        self.__counters__["age"] = (self.__counters__["age"] + 1) & _AGE_MASK
+
+    def probe(
+        self, __key__, __depth__, __alpha__=float("-inf"), __beta__=float("inf")
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Busca la equity de una posición calculada al menos a esa profundidad.
+
+        Una cota sólo sirve si resuelve la ventana: una cota inferior que ya
+        alcanza beta o una superior que no supera alfa.
+
+        Args:
+            __key__ (int): La clave de la posición.
+            __depth__ (int): La profundidad mínima aceptada.
+            __alpha__ (float, opcional): El extremo inferior de la ventana.
+            __beta__ (float, opcional): El extremo superior de la ventana.
+
+        Returns:
+            float: La equity guardada, o None si no hay una utilizable.
+        """
+        __index__ = __key__ & self.__mask__
+        __stored_depth__ = self.__depths__[__index__]
+        if __stored_depth__ == _EMPTY:
+            self.__counters__["misses"] += 1
+            return None
+        if self.__keys__[__index__] != __key__:
+            self.__counters__["collisions"] += 1
+            self.__counters__["misses"] += 1
+            return None
+        __equity__ = self.__equities__[__index__]
+        __bound__ = self.__bounds__[__index__]
+        __usable__ = __stored_depth__ >= __depth__
+        if __bound__ == LOWER:
+            __usable__ = __usable__ and __equity__ >= __beta__
+        elif __bound__ == UPPER:
+            __usable__ = __usable__ and __equity__ <= __alpha__
+        if __usable__:
+            self.__counters__["hits"] += 1
+            return __equity__
+        self.__counters__["misses"] += 1
+        return None
+
+    def store(self, __key__, __depth__, __equity__, __bound__=EXACT):
+        """
+        Guarda la equity de una posición si la política de reemplazo lo permite.
+
+        Args:
+            __key__ (int): La clave de la posición.
+            __depth__ (int): La profundidad a la que se calculó.
+            __equity__ (float): La equity.
+            __bound__ (int, opcional): EXACT, LOWER o UPPER.
+
+        Returns:
+            bool: True si la entrada se guardó.
+        """
+        __index__ = __key__ & self.__mask__
+        __stored_depth__ = self.__depths__[__index__]
+        __age__ = self.__counters__["age"]
+        if __stored_depth__ != _EMPTY and self.__keys__[__index__] != __key__:
+            if self.__ages__[__index__] == __age__ and __stored_depth__ > __depth__:
+                self.__counters__["rejected"] += 1
+                return False
+            self.__counters__["replacements"] += 1
+        elif (
+            __stored_depth__ > __depth__
+            and self.__ages__[__index__] == __age__
+            and self.__bounds__[__index__] == EXACT
+        ):
+            # Misma posición: no se pisa un valor exacto más profundo.
+            self.__counters__["rejected"] += 1
+            return False
+        self.__keys__[__index__] = __key__
+        self.__equities__[__index__] = __equity__
+        self.__depths__[__index__] = __depth__
+        self.__bounds__[__index__] = __bound__
+        self.__ages__[__index__] = __age__
+        self.__counters__["stores"] += 1
+        return True
+
+    def get_stats(self):
+        """
+        Devuelve los contadores de la tabla.
+
+        Returns:
+            dict: hits, misses, collisions (búsquedas que encontraron otra
+                  posición en el lugar), stores, replacements (entradas de
+                  otra posición pisadas), rejected, age, size y capacity.
+        """
+        __stats__ = dict(self.__counters__)
+        __stats__["size"] = len(self)
+        __stats__["capacity"] = self.get_capacity()
+        return __stats__
@@ -45,6 +45,13 @@ Estructura del Archivo:
 import pygame
 import random
 
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.move import BEAR_OFF, REENTRY
+from core.player import Player
+from engine.policies import AnytimePolicy
+
 # --- 1. Imports y Constantes -----------------------------------------------
 
 # Inicialización de Pygame
@@ -129,6 +136,12 @@ for i in range(12):
 PLAYER_WHITE = "W"
 PLAYER_BLACK = "B"
 
+# Partidas contra la computadora: juega con negras y busca cada jugada con
+# un tiempo límite (ver engine.policies.AnytimePolicy).
+BOT_NAME = "CPU"
+BOT_BUDGET = 0.05
+bot_policy = AnytimePolicy(BOT_BUDGET)
+
 
 def setup_initial_state():
     """
@@ -174,6 +187,7 @@ def setup_initial_state():
         "input_boxes": {},
         "buttons": {},
         "first_roll_data": {PLAYER_WHITE: 0, PLAYER_BLACK: 0, "rolled": False},
+        "bot": None,  # Color que maneja la computadora, si hay
     }
     return game_state
 
@@ -355,6 +369,75 @@ def apply_move(start_point, end_point, player, game_state):
     return game_state
 
 
+def to_counts(game_state):
+    """
+    Convierte el estado del juego a los 28 conteos con signo del motor (ver
+    Board.get_counts). El motor numera los puntos al revés: el punto p de
+    la interfaz es el índice 24 - p.
+    """
+    counts = [0] * 28
+    for point_idx, checkers in enumerate(game_state["board"]):
+        if checkers:
+            sign = 1 if checkers[0] == PLAYER_WHITE else -1
+            counts[23 - point_idx] = sign * len(checkers)
+    counts[24] = game_state["bar"][PLAYER_WHITE]
+    counts[25] = game_state["bar"][PLAYER_BLACK]
+    counts[26] = game_state["off"][PLAYER_WHITE]
+    counts[27] = game_state["off"][PLAYER_BLACK]
+    return counts
+
+
+def to_ui_move(move):
+    """
+    Convierte un Move del motor en el par (origen, destino) de apply_move.
+    """
+    if move.__kind__ == REENTRY:
+        return "BAR", 24 - move.__to_pos__
+    if move.__kind__ == BEAR_OFF:
+        return 24 - move.__from_pos__, "OFF"
+    return 24 - move.__from_pos__, 24 - move.__to_pos__
+
+
+def play_bot_turn(game_data, legal_moves, policy=None):
+    """
+    Juega el turno completo de la computadora: tira los dados si hace
+    falta, elige la jugada con el motor y pasa el turno.
+    """
+    player = game_data["current_player"]
+    if not game_data["dice"]:
+        d1, d2 = roll_dice()
+        game_data["dice"] = [d1, d2]
+        game_data["moves_remaining"] = [d1] * 4 if d1 == d2 else [d1, d2]
+
+    color = "white" if player == PLAYER_WHITE else "black"
+    game = Game(
+        Player(game_data["player_names"][PLAYER_WHITE], "white"),
+        Player(game_data["player_names"][PLAYER_BLACK], "black"),
+        CompactBoard.from_counts(to_counts(game_data)),
+        Dice(),
+    )
+    game.__current_turn__ = 0 if color == "white" else 1
+    game.__dice_values__ = list(game_data["moves_remaining"])
+    candidates = game.get_legal_plays_with_positions()
+    if candidates:
+        play = (policy or bot_policy).choose_play(game, candidates)
+        for move in play:
+            start, end = to_ui_move(move)
+            game_data = apply_move(start, end, player, game_data)
+        game_data["message"] = f"{game_data['player_names'][player]} jugó " + ", ".join(
+            f"{start}-{end}" for start, end in map(to_ui_move, play)
+        )
+    else:
+        game_data["message"] = f"{game_data['player_names'][player]} no puede mover."
+
+    game_data["current_player"] = get_opponent(player)
+    game_data["dice"] = []
+    game_data["moves_remaining"] = []
+    game_data["selected_point"] = None
+    legal_moves.clear()
+    return game_data, legal_moves
+
+
 # --- 4. Funciones de Dibujo (Renderizado) ----------------------------------
 
 
@@ -622,6 +705,10 @@ def draw_menu(surface, game_state):
     """
     button_rect = pygame.Rect(SCREEN_WIDTH / 2 - 150, SCREEN_HEIGHT / 2 + 50, 300, 60)
     game_state["buttons"]["vs_player"] = button_rect
+    bot_button_rect = pygame.Rect(
+        SCREEN_WIDTH / 2 - 150, SCREEN_HEIGHT / 2 + 130, 300, 60
+    )
+    game_state["buttons"]["vs_computer"] = bot_button_rect
 
     if surface is None:
         return  # Modo de prueba: solo registrar componentes, no dibujar.
@@ -635,18 +722,22 @@ def draw_menu(surface, game_state):
         title_text, (SCREEN_WIDTH / 2 - title_text.get_width() / 2, SCREEN_HEIGHT / 3)
     )
 
-    # Botón con fondo blanco y borde negro para mejor contraste
-    pygame.draw.rect(surface, COLOR_WHITE, button_rect, border_radius=15)
-    pygame.draw.rect(surface, COLOR_TEXT_DARK, button_rect, 2, border_radius=15)
+    # Botones con fondo blanco y borde negro para mejor contraste
+    for rect, label in (
+        (button_rect, "Jugador vs Jugador"),
+        (bot_button_rect, "Jugador vs Computadora"),
+    ):
+        pygame.draw.rect(surface, COLOR_WHITE, rect, border_radius=15)
+        pygame.draw.rect(surface, COLOR_TEXT_DARK, rect, 2, border_radius=15)
 
-    button_text = font_hud_bold.render("Jugador vs Jugador", True, COLOR_TEXT_DARK)
-    surface.blit(
-        button_text,
-        (
-            button_rect.centerx - button_text.get_width() / 2,
-            button_rect.centery - button_text.get_height() / 2,
-        ),
-    )
+        button_text = font_hud_bold.render(label, True, COLOR_TEXT_DARK)
+        surface.blit(
+            button_text,
+            (
+                rect.centerx - button_text.get_width() / 2,
+                rect.centery - button_text.get_height() / 2,
+            ),
+        )
 
 
 def draw_name_input(surface, game_state):
@@ -1006,6 +1097,12 @@ def handle_menu_events(event, game_data):
             "vs_player"
         ].collidepoint(event.pos):
             game_data["game_phase"] = "NAME_INPUT"
+        elif "vs_computer" in game_data.get("buttons", {}) and game_data["buttons"][
+            "vs_computer"
+        ].collidepoint(event.pos):
+            game_data["bot"] = PLAYER_BLACK
+            game_data["player_names"][PLAYER_BLACK] = BOT_NAME
+            game_data["game_phase"] = "NAME_INPUT"
     return game_data
 
 
@@ -1141,6 +1238,15 @@ def main_loop():
                     event, game_data, legal_moves
                 )
 
+        # --- Turno de la computadora (si la partida no terminó) ---
+        if (
+            game_data["game_phase"] == "PLAY"
+            and game_data["current_player"] == game_data["bot"]
+        ):
+            game_data = check_for_win(game_data)
+            if game_data["game_phase"] == "PLAY":
+                game_data, legal_moves = play_bot_turn(game_data, legal_moves)
+
         # --- Dibujado según la Fase ---
         if game_data["game_phase"] == "MENU":
             draw_menu(screen, game_data)
@@ -0,0 +1,147 @@
+"""
+Hibernación en disco de las partidas inactivas del servidor.
+
+Una partida alojada ocupa varios KB (Game, el tablero, los jugadores y los
+dados con su generador); su instantánea de Game.to_bytes ocupa 34 bytes.
+HibernationManager anota cuándo se usó cada partida por última vez, guarda
+en un archivo dbm local las que llevan más de cierto tiempo sin pedidos
+(sacándolas de memoria) y las reconstruye cuando llega el pedido siguiente.
+
+Las partidas restauradas tienen dados nuevos: si la partida se creó con
+semilla, las tiradas posteriores a la hibernación ya no son reproducibles.
+El archivo sobrevive al servidor, así que al levantarlo otra vez con el
+mismo archivo las partidas guardadas siguen disponibles.
+
+Classes
+-------
+HibernationManager
+    Guarda en disco las partidas inactivas y las restaura a pedido
+"""
+
+import dbm
+import time
+
+from core.game import Game
+
+# Segundos sin pedidos tras los cuales una partida se guarda en disco.
+DEFAULT_IDLE_SECONDS = 300
+
+
+class HibernationManager:
+    """
+    Guarda en disco las partidas inactivas y las restaura a pedido.
+
+    Atributos:
+        __store__ (dbm): El archivo con las instantáneas, por número de partida.
+        __idle_seconds__ (float): Los segundos de inactividad para hibernar.
+        __last_used__ (dict): El último uso (time.monotonic) de cada partida
+                              en memoria, por número.
+        __stats__ (dict): Las partidas hibernadas (hibernated) y restauradas
+                          (restored) desde que se abrió el archivo.
+    """
+
+    def __init__(self, __path__, __idle_seconds__=DEFAULT_IDLE_SECONDS):
+        """
+        Abre (o crea) el archivo de instantáneas.
+
+        Args:
+            __path__ (str): La ruta del archivo dbm.
+            __idle_seconds__ (float, opcional): Los segundos de inactividad
+                                                para hibernar una partida.
+        """
+        self.__store__ = dbm.open(__path__, "c")
+        self.__idle_seconds__ = __idle_seconds__
+        self.__last_used__ = {}
+        self.__stats__ = {"hibernated": 0, "restored": 0}
+
+    def get_stats(self):
+        """
+        Devuelve los contadores de la hibernación.
+
+        Returns:
+            dict: hibernated, restored y stored (partidas en el archivo).
+        """
+        return {**self.__stats__, "stored": len(self.__store__)}
+
+    def get_max_id(self):
+        """
+        Devuelve el número más alto de las partidas guardadas, o 0.
+        """
+        return max((int(__key__) for __key__ in self.__store__.keys()), default=0)
+
+    def touch(self, __id__, __now__=None):
+        """
+        Anota que la partida se acaba de usar.
+        """
+        self.__last_used__[__id__] = time.monotonic() if __now__ is None else __now__
+
+    def forget(self, __id__):
+        """
+        Olvida una partida descartada, esté en memoria o en el archivo.
+        """
+        self.__last_used__.pop(__id__, None)
+        __key__ = str(__id__)
+        if __key__ in self.__store__:
+            del self.__store__[__key__]
+
+    def evict(self, __sessions__, __now__=None):
+        """
+        Guarda en el archivo y saca de __sessions__ las partidas inactivas.
+
+        Las partidas con un pedido en curso (su lock tomado) no se tocan.
+
+        Args:
+            __sessions__ (dict): Las partidas en memoria por número; se
+                                 modifica.
+            __now__ (float, opcional): El instante actual (time.monotonic).
+
+        Returns:
+            int: Las partidas hibernadas.
+        """
+        __limit__ = (
+            time.monotonic() if __now__ is None else __now__
+        ) - self.__idle_seconds__
+        __idle__ = [
+            __id__
+            for __id__, __used__ in self.__last_used__.items()
+            if __used__ <= __limit__
+        ]
+        __evicted__ = 0
+        for __id__ in __idle__:
+            __session__ = __sessions__.get(__id__)
+            if __session__ is None:
+                del self.__last_used__[__id__]
+                continue
+            if __session__.__lock__.locked():
+                continue
+            self.__store__[str(__id__)] = __session__.__game__.to_bytes()
+            del __sessions__[__id__]
+            del self.__last_used__[__id__]
+            __evicted__ += 1
+        self.__stats__["hibernated"] += __evicted__
+        return __evicted__
+
+    def restore(self, __id__):
+        """
+        Saca una partida del archivo y la reconstruye.
+
+        Args:
+            __id__ (int): El número de la partida.
+
+        Returns:
+            Game: La partida, o None si no está hibernada.
+        """
+        __key__ = str(__id__)
+        if __key__ not in self.__store__:
+            return None
+        __game__ = Game.from_bytes(self.__store__[__key__])
+        del self.__store__[__key__]
+        self.__stats__["restored"] += 1
+        self.touch(__id__)
+        return __game__
+
+    def close(self):
+        """
+        Cierra el archivo.
+        """
+        self.__store__.close()
@@ -0,0 +1,491 @@
+"""
+Servidor asyncio de partidas de Backgammon.
+
+Cada conexión TCP habla un protocolo de líneas: el cliente manda un objeto
+JSON por línea y recibe otro por línea con la respuesta, en el mismo orden.
+Las partidas (core.game.Game) viven en el servidor y se identifican con un
+número, así que una conexión puede llevar varias y varias conexiones la
+misma (por ejemplo, un jugador en cada una). Cada partida tiene su propio
+asyncio.Lock: los pedidos sobre una misma partida se atienden de a uno y
+los de partidas distintas no se esperan entre sí.
+
+Pedidos (campo "cmd"):
+
+- new: crea una partida. Opcionales: "white", "black" (nombres) y "seed"
+  (dados reproducibles).
+- state: devuelve el estado de la partida "game".
+- play: aplica una jugada completa del jugador en turno, dada por su
+  posición "play" en la lista "plays" del estado o por sus movimientos
+  "moves" ([[origen, destino], ...], en cualquier orden legal). Con
+  "color" se rechaza si no es su turno. Después tira los dados del rival
+  y pasa los turnos sin jugadas.
+- hint: las mejores "count" jugadas del turno (ver Game.get_hints),
+  calculadas en un hilo aparte (uno solo, porque el asesor y su caché son
+  compartidos) para no frenar al resto de las conexiones.
+- close: descarta la partida.
+- stats: contadores del servidor.
+
+Las respuestas llevan "ok": true y los datos, u "ok": false y "error". El
+estado de una partida tiene "game", "turn", "dice", "counts" (ver
+Board.get_counts), "plays", "winner" y "points".
+
+Con --store, las partidas que pasan --idle-seconds sin pedidos se guardan
+en ese archivo y salen de memoria (ver server.hibernation); el pedido
+siguiente sobre una de ellas la restaura sin que el cliente lo note.
+
+Uso:
+    python -m server.server [--host HOST] [--port PORT] [--store ARCHIVO]
+                            [--idle-seconds SEGUNDOS]
+
+Classes
+-------
+GameSession
+    Una partida alojada en el servidor con su lock
+GameServer
+    Atiende las conexiones y los pedidos sobre las partidas
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.play_generator import legal_first_steps
+from core.player import Player
+from server.hibernation import DEFAULT_IDLE_SECONDS, HibernationManager
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+# Largo máximo de una línea de pedido, en bytes.
+MAX_LINE = 1 << 16
+# Partidas simultáneas máximas por defecto.
+MAX_GAMES = 100_000
+# Segundos para calcular una sugerencia.
+HINT_BUDGET = 0.05
+
+
+class ProtocolError(Exception):
+    """Excepción para pedidos inválidos; su mensaje vuelve al cliente."""
+
+
+def _move_pairs(__play__):
+    """
+    Devuelve los movimientos de una jugada como pares [origen, destino].
+    """
+    return [[__move__.__from_pos__, __move__.__to_pos__] for __move__ in __play__]
+
+
+class GameSession:  # pylint: disable=too-few-public-methods
+    """
+    Una partida alojada en el servidor.
+
+    Atributos:
+        __id__ (int): El número de la partida.
+        __game__ (Game): La partida.
+        __lock__ (asyncio.Lock): Serializa los pedidos sobre la partida.
+        __plays__ (list): Las jugadas legales del turno actual con la
+                          posición a la que lleva cada una, o None si
+                          todavía no se calcularon.
+    """
+
+    def __init__(self, __id__, __game__):
+        """
+        Inicializa la sesión.
+
+        Args:
+            __id__ (int): El número de la partida.
+            __game__ (Game): La partida, con los dados ya tirados.
+        """
+        self.__id__ = __id__
+        self.__game__ = __game__
+        self.__lock__ = asyncio.Lock()
+        self.__plays__ = None
+
+    def get_plays(self):
+        """
+        Devuelve las jugadas legales del turno actual, calculadas una sola
+        vez por turno.
+        """
+        if self.__plays__ is None:
+            self.__plays__ = (
+                []
+                if self.__game__.is_over()
+                else self.__game__.get_legal_plays_with_positions()
+            )
+        return [__play__ for __play__, _ in self.__plays__]
+
+    def _match_moves(self, __pairs__):
+        """
+        Devuelve la jugada legal a la que lleva una secuencia de pares
+        [origen, destino] jugada en cualquier orden válido.
+
+        Aplica cada paso, si es legal, sobre una copia de la partida y busca
+        la jugada cuya posición final coincide.
+        """
+        __color__ = self.__game__.get_current_player().__color__
+        __scratch__ = Game.from_bytes(self.__game__.to_bytes())
+        for __from_pos__, __to_pos__ in __pairs__:
+            __steps__ = legal_first_steps(
+                __scratch__.__board__.get_counts(),
+                __color__,
+                __scratch__.__dice_values__,
+            )
+            __step__ = next(
+                (
+                    __s__
+                    for __s__ in __steps__
+                    if (__s__.__from_pos__, __s__.__to_pos__)
+                    == (__from_pos__, __to_pos__)
+                ),
+                None,
+            )
+            if __step__ is None:
+                raise ProtocolError("Jugada ilegal")
+            __scratch__.push_move(__step__)
+        __counts__ = __scratch__.__board__.get_counts()
+        for __play__, __position__ in self.__plays__:
+            if __position__ == __counts__:
+                return __play__
+        raise ProtocolError("Jugada ilegal")
+
+    def to_dict(self):
+        """
+        Devuelve el estado de la partida para enviarlo al cliente.
+        """
+        __game__ = self.__game__
+        __winner__ = __game__.get_winner()
+        return {
+            "game": self.__id__,
+            "turn": None if __winner__ else __game__.get_current_player().__color__,
+            "dice": list(__game__.get_dice_values()),
+            "counts": __game__.__board__.get_counts(),
+            "plays": [_move_pairs(__play__) for __play__ in self.get_plays()],
+            "winner": __winner__.__color__ if __winner__ else None,
+            "points": __game__.get_win_points(),
+        }
+
+    def play(self, __request__):
+        """
+        Aplica la jugada pedida, tira los dados del rival y pasa los turnos
+        en los que no hay jugadas.
+        """
+        __game__ = self.__game__
+        if __game__.is_over():
+            raise ProtocolError("La partida terminó")
+        __color__ = __request__.get("color")
+        if (
+            __color__ is not None
+            and __color__ != __game__.get_current_player().__color__
+        ):
+            raise ProtocolError("No es el turno de ese color")
+        __plays__ = self.get_plays()
+        if "play" in __request__:
+            __index__ = __request__["play"]
+            if not isinstance(__index__, int) or not 0 <= __index__ < len(__plays__):
+                raise ProtocolError("Jugada inexistente")
+            __play__ = __plays__[__index__]
+        else:
+            __play__ = self._match_moves(__request__.get("moves", []))
+        __game__.apply_play(__play__)
+        # Turnos sin jugadas legales: se pasan solos.
+        while not __game__.is_over():
+            __game__.roll_dice()
+            self.__plays__ = __game__.get_legal_plays_with_positions()
+            if self.__plays__:
+                break
+            __game__.apply_play(())
+        else:
+            self.__plays__ = []
+
+
+class GameServer:
+    """
+    Servidor de partidas sobre asyncio.
+
+    Atributos:
+        __sessions__ (dict): Las partidas por número.
+        __ids__ (itertools.count): Los números de las partidas nuevas.
+        __max_games__ (int): Las partidas simultáneas máximas.
+        __hint_executor__ (ThreadPoolExecutor): El hilo de las sugerencias.
+        __hibernation__ (HibernationManager): Guarda las partidas inactivas
+                                              en disco, o None.
+        __evictor__ (asyncio.Task): La tarea que hiberna periódicamente, o
+                                    None.
+        __stats__ (dict): Contadores: connections (abiertas), requests,
+                          moves, errors y games_created.
+    """
+
+    def __init__(self, __max_games__=MAX_GAMES, __hibernation__=None):
+        """
+        Inicializa el servidor sin partidas en memoria.
+
+        Args:
+            __max_games__ (int, opcional): Las partidas simultáneas máximas
+                                           en memoria.
+            __hibernation__ (HibernationManager, opcional): Dónde hibernar
+                                                            las inactivas.
+        """
+        self.__sessions__ = {}
+        __first__ = __hibernation__.get_max_id() + 1 if __hibernation__ else 1
+        self.__ids__ = itertools.count(__first__)
+        self.__max_games__ = __max_games__
+        self.__hint_executor__ = ThreadPoolExecutor(max_workers=1)
+        self.__hibernation__ = __hibernation__
+        self.__evictor__ = None
+        self.__stats__ = {
+            "connections": 0,
+            "requests": 0,
+            "moves": 0,
+            "errors": 0,
+            "games_created": 0,
+        }
+
+    def get_stats(self):
+        """
+        Devuelve los contadores del servidor y las partidas abiertas.
+
+        Returns:
+            dict: connections, requests, moves, errors, games_created y games
+                  (en memoria), más los de HibernationManager.get_stats si
+                  hay hibernación.
+        """
+        __stats__ = {**self.__stats__, "games": len(self.__sessions__)}
+        if self.__hibernation__ is not None:
+            __stats__.update(self.__hibernation__.get_stats())
+        return __stats__
+
+    async def start(self, __host__=DEFAULT_HOST, __port__=DEFAULT_PORT):
+        """
+        Empieza a aceptar conexiones y, si hay hibernación, a hibernar
+        periódicamente las partidas inactivas.
+
+        Args:
+            __host__ (str, opcional): La dirección donde escuchar.
+            __port__ (int, opcional): El puerto; 0 elige uno libre.
+
+        Returns:
+            asyncio.Server: El servidor, para cerrarlo o saber su puerto.
+        """
+        if self.__hibernation__ is not None and self.__evictor__ is None:
+            self.__evictor__ = asyncio.create_task(self._evict_periodically())
+        return await asyncio.start_server(
+            self.handle_connection, __host__, __port__, limit=MAX_LINE, backlog=4096
+        )
+
+    def evict_idle(self, __now__=None):
+        """
+        Hiberna las partidas inactivas.
+
+        Returns:
+            int: Las partidas hibernadas (0 si no hay hibernación).
+        """
+        if self.__hibernation__ is None:
+            return 0
+        return self.__hibernation__.evict(self.__sessions__, __now__)
+
+    async def _evict_periodically(self):
+        """
+        Hiberna las partidas inactivas cada medio período de inactividad.
+        """
+        while True:
+            await asyncio.sleep(self.__hibernation__.__idle_seconds__ / 2)
+            self.evict_idle()
+
+    def close(self):
+        """
+        Deja de hibernar y cierra el archivo de la hibernación.
+        """
+        if self.__evictor__ is not None:
+            self.__evictor__.cancel()
+            self.__evictor__ = None
+        if self.__hibernation__ is not None:
+            self.__hibernation__.close()
+
+    async def handle_connection(self, __reader__, __writer__):
+        """
+        Atiende los pedidos de una conexión hasta que el cliente la cierra.
+        """
+        self.__stats__["connections"] += 1
+        try:
+            while True:
+                try:
+                    __line__ = await __reader__.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not __line__:
+                    break
+                __response__ = await self.handle_line(__line__)
+                __writer__.write(json.dumps(__response__).encode() + b"\n")
+                await __writer__.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__stats__["connections"] -= 1
+            __writer__.close()
+
+    async def handle_line(self, __line__):
+        """
+        Decodifica y atiende una línea de pedido.
+
+        Returns:
+            dict: La respuesta.
+        """
+        try:
+            __request__ = json.loads(__line__)
+        except ValueError:
+            self.__stats__["errors"] += 1
+            return {"ok": False, "error": "JSON inválido"}
+        return await self.dispatch(__request__)
+
+    async def dispatch(self, __request__):
+        """
+        Atiende un pedido ya decodificado.
+
+        Args:
+            __request__ (dict): El pedido, con su campo "cmd".
+
+        Returns:
+            dict: La respuesta, con "ok" y los datos o el error.
+        """
+        self.__stats__["requests"] += 1
+        try:
+            if not isinstance(__request__, dict):
+                raise ProtocolError("El pedido debe ser un objeto")
+            __command__ = __request__.get("cmd")
+            if __command__ == "new":
+                __data__ = self._new(__request__)
+            elif __command__ == "stats":
+                __data__ = self.get_stats()
+            elif __command__ in ("state", "play", "hint", "close"):
+                __session__ = self._session(__request__)
+                async with __session__.__lock__:
+                    # Otro pedido en espera del mismo lock pudo cerrarla.
+                    if self.__sessions__.get(__session__.__id__) is not __session__:
+                        raise ProtocolError("Partida inexistente")
+                    __data__ = await self._session_command(
+                        __command__, __session__, __request__
+                    )
+            else:
+                raise ProtocolError(f"Pedido desconocido: {__command__}")
+        except ProtocolError as __error__:
+            self.__stats__["errors"] += 1
+            return {"ok": False, "error": str(__error__)}
+        except (TypeError, ValueError):
+            self.__stats__["errors"] += 1
+            return {"ok": False, "error": "Pedido mal formado"}
+        return {"ok": True, **__data__}
+
+    async def _session_command(self, __command__, __session__, __request__):
+        """
+        Atiende un pedido sobre una partida, con su lock ya tomado.
+        """
+        if __command__ == "play":
+            __session__.play(__request__)
+            self.__stats__["moves"] += 1
+        elif __command__ == "hint":
+            return {"hints": await self._hint(__session__, __request__)}
+        elif __command__ == "close":
+            self.__sessions__.pop(__session__.__id__, None)
+            if self.__hibernation__ is not None:
+                self.__hibernation__.forget(__session__.__id__)
+            return {"game": __session__.__id__}
+        return __session__.to_dict()
+
+    def _new(self, __request__):
+        """
+        Crea una partida y tira los dados del primer turno.
+        """
+        if len(self.__sessions__) >= self.__max_games__:
+            raise ProtocolError("Demasiadas partidas abiertas")
+        __seed__ = __request__.get("seed")
+        __game__ = Game(
+            Player(str(__request__.get("white", "Blancas")), "white"),
+            Player(str(__request__.get("black", "Negras")), "black"),
+            CompactBoard(),
+            Dice() if __seed__ is None else Dice.seeded(__seed__),
+        )
+        __game__.start()
+        __session__ = GameSession(next(self.__ids__), __game__)
+        self.__sessions__[__session__.__id__] = __session__
+        if self.__hibernation__ is not None:
+            self.__hibernation__.touch(__session__.__id__)
+        self.__stats__["games_created"] += 1
+        return __session__.to_dict()
+
+    def _session(self, __request__):
+        """
+        Devuelve la partida del pedido, restaurándola si estaba hibernada.
+        """
+        __id__ = __request__.get("game")
+        if not isinstance(__id__, int):
+            raise ProtocolError("Partida inexistente")
+        __session__ = self.__sessions__.get(__id__)
+        if self.__hibernation__ is not None:
+            if __session__ is None:
+                __game__ = self.__hibernation__.restore(__id__)
+                if __game__ is not None:
+                    __session__ = GameSession(__id__, __game__)
+                    self.__sessions__[__id__] = __session__
+            self.__hibernation__.touch(__id__)
+        if __session__ is None:
+            raise ProtocolError("Partida inexistente")
+        return __session__
+
+    async def _hint(self, __session__, __request__):
+        """
+        Calcula las sugerencias del turno en el hilo de las sugerencias,
+        con el lock de la partida tomado.
+        """
+        __game__ = __session__.__game__
+        __count__ = __request__.get("count", 3)
+        if __game__.is_over() or not isinstance(__count__, int):
+            return []
+        __hints__ = await asyncio.get_running_loop().run_in_executor(
+            self.__hint_executor__, __game__.get_hints, __count__, HINT_BUDGET
+        )
+        return [
+            {"moves": _move_pairs(__play__), "equity": __equity__, "loss": __loss__}
+            for __play__, __equity__, __loss__, _ in __hints__
+        ]
+
+
+async def serve(__host__=DEFAULT_HOST, __port__=DEFAULT_PORT, __hibernation__=None):
+    """
+    Levanta el servidor y atiende conexiones hasta que se lo interrumpe.
+    """
+    __game_server__ = GameServer(__hibernation__=__hibernation__)
+    __server__ = await __game_server__.start(__host__, __port__)
+    __address__ = __server__.sockets[0].getsockname()
+    print(f"Servidor de Backgammon escuchando en {__address__[0]}:{__address__[1]}")
+    try:
+        async with __server__:
+            await __server__.serve_forever()
+    finally:
+        __game_server__.close()
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Servidor de partidas de Backgammon.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--store", help="Archivo donde hibernar las partidas inactivas")
+    parser.add_argument("--idle-seconds", type=float, default=DEFAULT_IDLE_SECONDS)
+    args = parser.parse_args(argv)
+    hibernation = (
+        HibernationManager(args.store, args.idle_seconds) if args.store else None
+    )
+    try:
+        asyncio.run(serve(args.host, args.port, hibernation))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Este módulo contiene las pruebas unitarias para la base de bear-off de un lado.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from math import comb
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.bearoff import (
+    MAX_TURNS,
+    OneSidedBearoff,
+    TwoSidedBearoff,
+    build_one_sided,
+    build_two_sided,
+    home_points,
+    load_two_sided,
+    one_sided_index,
+    write_one_sided,
+    write_two_sided,
+)
+
+
+def all_positions(max_checkers):
+    """
+    Devuelve todas las distribuciones de hasta max_checkers fichas.
+    """
+    positions = [()]
+    for _ in range(6):
+        positions = [
+            partial + (checkers,)
+            for partial in positions
+            for checkers in range(max_checkers - sum(partial) + 1)
+        ]
+    return positions
+
+
+class TestOneSidedBearoff(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para la generación y lectura de la base.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "bearoff1.bin")
+        write_one_sided(cls.path, 5)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.database = OneSidedBearoff(self.path)
+
+    def tearDown(self):
+        self.database.close()
+
+    def test_index(self):
+        """
+        Verifica que el índice numere las posiciones sin huecos ni repetidos.
+        """
+        indices = {one_sided_index(points) for points in all_positions(4)}
+        self.assertEqual(indices, set(range(comb(10, 6))))
+        self.assertEqual(one_sided_index((0,) * 6), 0)
+
+    def test_known_values(self):
+        """
+        Verifica las tiradas esperadas de posiciones fáciles de calcular.
+        """
+        self.assertEqual(len(self.database), comb(11, 6))
+        self.assertEqual(self.database.get_max_checkers(), 5)
+        self.assertEqual(self.database.expected_rolls((0,) * 6), 0.0)
+        self.assertEqual(self.database.expected_rolls((1, 0, 0, 0, 0, 0)), 1.0)
+        # Con una ficha en el punto 4 sólo el 2-1 no la retira.
+        self.assertAlmostEqual(
+            self.database.expected_rolls((0, 0, 0, 1, 0, 0)), 1 + 2 / 36, places=6
+        )
+        distribution = self.database.distribution((0, 0, 0, 1, 0, 0))
+        self.assertEqual(len(distribution), MAX_TURNS)
+        self.assertAlmostEqual(distribution[1], 34 / 36, places=4)
+        self.assertAlmostEqual(distribution[2], 2 / 36, places=4)
+
+    def test_file_matches_build(self):
+        """
+        Verifica que el archivo tenga lo calculado y que una base más chica
+        coincida con el comienzo de una más grande.
+        """
+        means, distributions = build_one_sided(4)
+        for points in all_positions(4):
+            index = one_sided_index(points)
+            self.assertAlmostEqual(
+                self.database.expected_rolls(points), means[index], places=5
+            )
+            self.assertAlmostEqual(sum(distributions[index]), 1.0)
+
+    def test_lookup(self):
+        """
+        Verifica la consulta con los conteos de un tablero.
+        """
+        counts = [0] * 28
+        counts[23], counts[20], counts[26] = 2, 1, 12
+        counts[0], counts[12] = -14, -1
+        board = CompactBoard.from_counts(counts)
+        self.assertEqual(home_points(counts, "white"), (2, 0, 0, 1, 0, 0))
+        self.assertIsNone(home_points(counts, "black"))
+        self.assertEqual(
+            self.database.lookup(board.get_counts(), "white"),
+            self.database.expected_rolls((2, 0, 0, 1, 0, 0)),
+        )
+        counts[0], counts[5], counts[12], counts[27] = -3, -1, 0, 11
+        self.assertEqual(home_points(counts, "black"), (3, 0, 0, 0, 0, 1))
+        counts[0], counts[27] = -5, 9
+        self.assertIsNone(self.database.lookup(counts, "black"))
+
+    def test_best_play(self):
+        """
+        Verifica que la mejor jugada minimice las tiradas esperadas.
+        """
+        counts = [0] * 28
+        counts[18], counts[19], counts[22], counts[26] = 2, 1, 2, 10
+        counts[0], counts[27] = -2, 13
+        game = Game(
+            Player("Alice", "white"),
+            Player("Bob", "black"),
+            CompactBoard.from_counts(counts),
+            Dice(),
+        )
+        game.__dice_values__ = [4, 1]
+        candidates = game.get_legal_plays_with_positions()
+        best = self.database.best_play(candidates, "white")
+        rolls = [self.database.lookup(after, "white") for _, after in candidates]
+        plays = [play for play, _ in candidates]
+        self.assertEqual(rolls[plays.index(best)], min(rolls))
+
+    def test_invalid_file(self):
+        """
+        Verifica que se rechace un archivo que no es una base.
+        """
+        path = os.path.join(self.directory, "otro.bin")
+        with open(path, "wb") as file:
+            file.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            OneSidedBearoff(path)
+
+
+class TestTwoSidedBearoff(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para la base de bear-off de dos lados.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "bearoff2.bin")
+        write_two_sided(cls.path, 3)
+        cls.one_sided_path = os.path.join(cls.directory, "bearoff1.bin")
+        write_one_sided(cls.one_sided_path, 3)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.database = TwoSidedBearoff(self.path)
+
+    def tearDown(self):
+        self.database.close()
+
+    def test_against_sure_bear_off(self):
+        """
+        Verifica que contra un rival que retira todo en la próxima tirada se
+        gane sólo retirando todo en esta, como dice la base de un lado.
+        """
+        self.assertEqual(len(self.database), comb(9, 6) ** 2)
+        with OneSidedBearoff(self.one_sided_path) as one_sided:
+            for points in all_positions(3)[1:]:
+                for theirs in ((1, 0, 0, 0, 0, 0), (2, 0, 0, 0, 0, 0)):
+                    self.assertAlmostEqual(
+                        self.database.win_probability(points, theirs),
+                        one_sided.distribution(points)[1],
+                        places=4,
+                    )
+        self.assertAlmostEqual(
+            self.database.win_probability((0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)),
+            0.75,
+            places=4,
+        )
+
+    def test_recurrence(self):
+        """
+        Verifica que la probabilidad en turno mejore la del rival: tener el
+        turno nunca perjudica en una carrera simétrica.
+        """
+        wins = build_two_sided(2)
+        self.assertTrue(((wins >= 0) & (wins <= 1)).all())
+        for index in range(1, len(wins)):
+            self.assertGreaterEqual(wins[index, index], 0.5)
+        with self.assertRaises(ValueError):
+            build_two_sided(15)
+
+    def test_lookup(self):
+        """
+        Verifica la consulta con un tablero.
+        """
+        counts = [0] * 28
+        counts[23], counts[18], counts[26] = 1, 1, 13
+        counts[0], counts[1], counts[27] = -1, -2, 12
+        board = CompactBoard.from_counts(counts)
+        equity = self.database.lookup(board, "white")
+        self.assertAlmostEqual(
+            equity,
+            2 * self.database.win_probability((1, 0, 0, 0, 0, 1), (1, 2, 0, 0, 0, 0))
+            - 1,
+        )
+        self.assertEqual(
+            self.database.lookup(counts, "black"),
+            2 * self.database.win_probability((1, 2, 0, 0, 0, 0), (1, 0, 0, 0, 0, 1))
+            - 1,
+        )
+        counts[1], counts[27] = -3, 11
+        self.assertIsNone(self.database.lookup(counts, "white"))
+        counts[1], counts[10], counts[27] = -2, -1, 11
+        self.assertIsNone(self.database.lookup(counts, "black"))
+
+    def test_load_two_sided(self):
+        """
+        Verifica que la base se abra una sola vez y que falte sin error.
+        """
+        self.assertIsNone(load_two_sided(os.path.join(self.directory, "no.bin")))
+        database = load_two_sided(self.path)
+        self.assertIs(database, load_two_sided(self.path))
+        database.close()
+        load_two_sided.cache_clear()
+        with self.assertRaises(ValueError):
+            TwoSidedBearoff(self.one_sided_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
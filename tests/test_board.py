@@ -3,7 +3,7 @@ Este módulo contiene las pruebas unitarias para la clase Board.
 """
 
 import unittest
-from core.board import Board
+from core.board import Board, counts_in_contact, masks_in_contact
 from core.checker import Checker
 
 
@@ -257,6 +257,84 @@ class TestBoard(unittest.TestCase):
         representation = self.board.get_2d_representation()
         self.assertIn("x6", representation)
 
+    def test_initial_counters(self):
+        """
+        Verifica los contadores de la posición inicial: 167 pips por color y
+        las fichas fuera del cuadrante de casa.
+        """
+        for color in ("white", "black"):
+            self.assertEqual(self.board.get_pip_count(color), 167)
+            self.assertEqual(self.board.get_outside_count(color), 10)
+            self.assertEqual(self.board.get_bar_count(color), 0)
+            self.assertEqual(self.board.get_off_count(color), 0)
+        self.assertEqual(
+            self.board.get_occupied_mask("white"),
+            1 << 0 | 1 << 11 | 1 << 16 | 1 << 18,
+        )
+
+    def test_counters_follow_moves_and_direct_assignment(self):
+        """
+        Verifica que los contadores se actualizan con los movimientos, las
+        capturas y la reasignación directa de un punto.
+        """
+        self.board.move_checker("black", 5, 2)
+        self.board.move_checker("white", 0, 2)
+        self.assertEqual(self.board.get_pip_count("white"), 165)
+        self.assertEqual(self.board.get_pip_count("black"), 167 - 3 - 3 + 25)
+        self.assertEqual(self.board.get_bar_count("black"), 1)
+        self.board.__points__[18] = []
+        self.assertEqual(self.board.get_outside_count("white"), 10)
+        self.assertEqual(self.board.get_pip_count("white"), 165 - 30)
+        self.assertFalse(self.board.get_occupied_mask("white") >> 18 & 1)
+
+    def test_made_and_blot_masks(self):
+        """
+        Verifica las máscaras de puntos hechos y de blots tras mover fichas.
+        """
+        self.assertEqual(
+            self.board.get_made_mask("black"), 1 << 5 | 1 << 7 | 1 << 12 | 1 << 23
+        )
+        self.assertEqual(self.board.get_blot_mask("black"), 0)
+        self.board.move_checker("black", 23, 20)
+        self.assertEqual(self.board.get_blot_mask("black"), 1 << 20 | 1 << 23)
+        self.assertFalse(self.board.get_made_mask("black") >> 23 & 1)
+
+    def test_masks_follow_in_place_point_changes(self):
+        """
+        Verifica que modificar las fichas de un punto directamente actualiza
+        las máscaras usadas para validar los movimientos.
+        """
+        self.board.get_point(23).pop()
+        self.assertTrue(self.board.get_blot_mask("black") >> 23 & 1)
+        self.board.get_point(23).pop()
+        self.assertFalse(self.board.get_occupied_mask("black") >> 23 & 1)
+        self.board.move_checker("white", 18, 23)
+        self.assertTrue(self.board.get_blot_mask("white") >> 23 & 1)
+
+    def test_has_contact(self):
+        """
+        Verifica la detección de contacto desde las máscaras y los conteos.
+        """
+        self.assertTrue(self.board.has_contact())
+        for index in range(24):
+            self.board.__points__[index] = []
+        self.board.__points__[20] = [Checker("white") for _ in range(15)]
+        self.board.__points__[3] = [Checker("black") for _ in range(15)]
+        self.assertFalse(self.board.has_contact())
+        self.assertFalse(counts_in_contact(self.board.get_counts()))
+        self.board.move_checker("black", 3, 2)
+        self.assertFalse(self.board.has_contact())
+        self.board.__points__[3].pop()
+        self.board.__points__[22] = [Checker("black")]
+        self.assertTrue(self.board.has_contact())
+        self.assertTrue(counts_in_contact(self.board.get_counts()))
+        self.board.__points__[22] = []
+        self.board.get_captured("black").append(Checker("black"))
+        self.assertTrue(self.board.has_contact())
+        self.assertFalse(masks_in_contact(1 << 5, 0))
+        self.assertTrue(masks_in_contact(1 << 5, 1 << 6))
+        self.assertFalse(masks_in_contact(1 << 7, 1 << 6))
+
 
 if __name__ == "__main__":
     unittest.main()
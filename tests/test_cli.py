@@ -5,6 +5,12 @@ Este módulo contiene las pruebas unitarias para la interfaz de línea de comand
 import unittest
 from unittest.mock import patch, call, Mock
 from cli import cli
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.move import BEAR_OFF, REENTRY, Move
+from core.player import Player
+from engine.policies import FirstLegalPolicy
 
 
 class TestCLI(unittest.TestCase):
@@ -71,7 +77,7 @@ class TestCLI(unittest.TestCase):
         """
         Verifica que la lista de movimientos posibles se muestra correctamente.
         """
-        moves = ["0 a 1", "Barra a 5", "sacar 24"]
+        moves = [Move(0, 1, 1), Move(-1, 5, 6, REENTRY), Move(23, 24, 1, BEAR_OFF)]
         # pylint: disable=protected-access
         cli._display_possible_moves(moves)
         mock_print.assert_has_calls(
@@ -110,7 +116,10 @@ class TestCLI(unittest.TestCase):
         mock_player.__color__ = "white"
         mock_game_instance.get_current_player.return_value = mock_player
         mock_game_instance.get_dice_values.return_value = [5, 2]
-        mock_game_instance.get_possible_moves.return_value = ["11 a 16", "11 a 18"]
+        mock_game_instance.generate_moves.return_value = [
+            Move(10, 15, 5),
+            Move(10, 12, 2),
+        ]
         mock_game_instance.make_move.side_effect = [True, True]
         mock_game_instance.get_winner.return_value.get_player_name.return_value = (
             "Alice"
@@ -150,7 +159,7 @@ class TestCLI(unittest.TestCase):
         mock_game_instance.get_current_player.return_value = mock_player
 
         mock_game_instance.get_dice_values.return_value = [1, 2]
-        mock_game_instance.get_possible_moves.return_value = ["0 a 1"]
+        mock_game_instance.generate_moves.return_value = [Move(0, 1, 1)]
         # Simulamos que el jugador está en fase de reingreso para probar el mensaje de ayuda.
         mock_game_instance.current_player_has_captured.return_value = True
         mock_game_instance.can_current_player_bear_off.return_value = False
@@ -182,7 +191,7 @@ class TestCLI(unittest.TestCase):
         mock_game_instance.get_current_player.return_value = mock_player
 
         mock_game_instance.get_dice_values.return_value = [1, 2]
-        mock_game_instance.get_possible_moves.return_value = ["0 a 1"]
+        mock_game_instance.generate_moves.return_value = [Move(0, 1, 1)]
         mock_game_instance.make_move.return_value = False
 
         cli.main()
@@ -208,7 +217,7 @@ class TestCLI(unittest.TestCase):
         mock_player.__color__ = "white"
         mock_game_instance.get_current_player.return_value = mock_player
         mock_game_instance.get_dice_values.return_value = [1, 2]
-        mock_game_instance.get_possible_moves.return_value = []
+        mock_game_instance.generate_moves.return_value = []
 
         cli.main()
         self.assertIn(
@@ -239,7 +248,10 @@ class TestCLI(unittest.TestCase):
         # Simulamos que el jugador tiene una ficha capturada
         mock_game_instance.current_player_has_captured.return_value = True
         mock_game_instance.get_dice_values.return_value = [5, 2]
-        mock_game_instance.get_possible_moves.return_value = ["Barra a 4", "Barra a 1"]
+        mock_game_instance.generate_moves.return_value = [
+            Move(-1, 4, 5, REENTRY),
+            Move(-1, 1, 2, REENTRY),
+        ]
         mock_game_instance.make_move.return_value = True
 
         cli.main()
@@ -270,7 +282,7 @@ class TestCLI(unittest.TestCase):
         mock_game_instance.current_player_has_captured.return_value = False
         mock_game_instance.can_current_player_bear_off.return_value = True
         mock_game_instance.get_dice_values.return_value = [1, 2]
-        mock_game_instance.get_possible_moves.return_value = ["sacar 24"]
+        mock_game_instance.generate_moves.return_value = [Move(23, 24, 1, BEAR_OFF)]
         mock_game_instance.make_move.return_value = True
 
         cli.main()
@@ -302,7 +314,7 @@ class TestCLI(unittest.TestCase):
         mock_game_instance.current_player_has_captured.return_value = False
         mock_game_instance.can_current_player_bear_off.return_value = True
         mock_game_instance.get_dice_values.return_value = [1, 2]
-        mock_game_instance.get_possible_moves.return_value = ["sacar 24"]
+        mock_game_instance.generate_moves.return_value = [Move(23, 24, 1, BEAR_OFF)]
 
         cli.main()
 
@@ -312,6 +324,38 @@ class TestCLI(unittest.TestCase):
             ]
         )
 
+    @patch("builtins.input", side_effect=["Alice"])
+    def test_get_player_names_with_bot(self, mock_input):
+        """
+        Verifica que no se pregunte el nombre del color de la computadora.
+        """
+        # pylint: disable=protected-access
+        names = cli._get_player_names("black")
+        self.assertEqual(names, ("Alice", cli.BOT_NAME))
+        self.assertEqual(mock_input.call_count, 1)
+
+    @patch("builtins.print")
+    def test_play_bot_turn(self, mock_print):
+        """
+        Verifica que la computadora juegue su turno completo y le tire los
+        dados al rival.
+        """
+        game = Game(
+            Player("Alice", "white"),
+            Player(cli.BOT_NAME, "black"),
+            CompactBoard(),
+            Dice.seeded(3),
+        )
+        game.__current_turn__ = 1
+        game.__dice_values__ = [6, 5]
+        # pylint: disable=protected-access
+        cli._play_bot_turn(game, FirstLegalPolicy())
+        self.assertEqual(game.get_current_player().__color__, "white")
+        self.assertTrue(game.get_dice_values())
+        self.assertTrue(
+            mock_print.call_args_list[0].args[0].startswith(f"{cli.BOT_NAME} juega:")
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
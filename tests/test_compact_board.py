@@ -0,0 +1,207 @@
+"""
+Este módulo contiene las pruebas unitarias para la clase CompactBoard.
+"""
+
+import random
+import unittest
+from core.board import BAR_PIPS, Board, counts_in_contact, tally_counts
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+
+
+class TestCompactBoard(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para la clase CompactBoard.
+
+    Valida que el tablero compacto reproduce el comportamiento de Board:
+    posición inicial, movimientos, capturas, bear-off, reingreso y su uso
+    como tablero de Game.
+    """
+
+    def setUp(self):
+        self.board = CompactBoard()
+
+    def test_initial_position_matches_board(self):
+        """
+        Verifica que la posición inicial coincide con la de Board.
+        """
+        reference = Board()
+        for i in range(24):
+            self.assertEqual(
+                self.board.get_point_count(i), reference.get_point_count(i)
+            )
+            if reference.get_point_count(i):
+                self.assertEqual(
+                    self.board.get_point(i)[-1].__color__,
+                    reference.get_point(i)[-1].__color__,
+                )
+        self.assertEqual(len(self.board.__points_status__), 24)
+
+    def test_move_checker(self):
+        """
+        Verifica que mover una ficha actualiza los conteos de los puntos.
+        """
+        self.board.move_checker("white", 0, 1)
+        self.assertEqual(self.board.get_point_count(0), 1)
+        self.assertEqual(self.board.get_point_count(1), 1)
+        self.assertEqual(self.board.get_point(1)[-1].__color__, "white")
+
+    def test_move_checker_errors(self):
+        """
+        Verifica que se lanzan los mismos errores que en Board.
+        """
+        with self.assertRaises(IndexError):
+            self.board.move_checker("white", 0, 24)
+        with self.assertRaises(ValueError):
+            self.board.move_checker("white", 2, 3)
+        with self.assertRaises(ValueError):
+            self.board.move_checker("black", 0, 1)
+        with self.assertRaises(ValueError):
+            self.board.move_checker("white", 0, 5)
+
+    def test_move_checker_and_capture(self):
+        """
+        Verifica que mover a un punto con un blot rival lo captura.
+        """
+        self.board.move_checker("black", 5, 2)
+        self.board.move_checker("white", 0, 2)
+        self.assertEqual(len(self.board.get_captured("black")), 1)
+        self.assertEqual(self.board.get_point(2)[-1].__color__, "white")
+        self.assertEqual(self.board.get_point_count(2), 1)
+
+    def test_bear_off(self):
+        """
+        Verifica que sacar una ficha la mueve a las fichas retiradas.
+        """
+        self.board.bear_off("white", 18)
+        self.assertEqual(self.board.get_point_count(18), 4)
+        self.assertEqual(len(self.board.get_home("white")), 1)
+        with self.assertRaises(ValueError):
+            self.board.bear_off("white", 5)
+
+    def test_enter_from_captured(self):
+        """
+        Verifica el reingreso desde la barra y sus errores.
+        """
+        with self.assertRaises(ValueError):
+            self.board.enter_from_captured("white", 1)
+        self.board.move_checker("black", 5, 2)
+        self.board.move_checker("white", 0, 2)
+        with self.assertRaises(ValueError):
+            self.board.enter_from_captured("black", 18)
+        self.board.enter_from_captured("black", 2)
+        self.assertEqual(len(self.board.get_captured("black")), 0)
+        self.assertEqual(len(self.board.get_captured("white")), 1)
+        self.assertEqual(self.board.get_point(2)[-1].__color__, "black")
+
+    def test_views_do_not_modify_board(self):
+        """
+        Verifica que las listas devueltas son vistas independientes.
+        """
+        self.board.get_point(0).append(None)
+        self.board.get_captured("white").append(None)
+        self.assertEqual(self.board.get_point_count(0), 2)
+        self.assertEqual(len(self.board.get_captured("white")), 0)
+
+    def test_from_board_and_copy(self):
+        """
+        Verifica la conversión desde Board y que las copias son independientes.
+        """
+        board = Board()
+        board.move_checker("white", 0, 3)
+        compact = CompactBoard.from_board(board)
+        self.assertEqual(compact.get_point_count(3), 1)
+        clone = compact.copy()
+        clone.move_checker("white", 3, 4)
+        self.assertEqual(compact.get_point_count(3), 1)
+        self.assertEqual(clone.get_point_count(3), 0)
+
+    def test_2d_representation_matches_board(self):
+        """
+        Verifica que la representación 2D es idéntica a la de Board.
+        """
+        self.assertEqual(
+            self.board.get_2d_representation(), Board().get_2d_representation()
+        )
+
+    def test_random_moves_match_board(self):
+        """
+        Verifica que una secuencia aleatoria de movimientos deja ambos
+        tableros en la misma posición.
+        """
+        rng = random.Random(7)
+        reference = Board()
+        for _ in range(300):
+            color = rng.choice(("white", "black"))
+            from_point = rng.randrange(24)
+            to_point = rng.randrange(24)
+            results = []
+            for board in (reference, self.board):
+                try:
+                    board.move_checker(color, from_point, to_point)
+                    results.append(True)
+                except ValueError:
+                    results.append(False)
+            self.assertEqual(results[0], results[1])
+        self.assertEqual(
+            self.board.get_2d_representation(), reference.get_2d_representation()
+        )
+
+    def test_counters_match_board_and_full_count(self):
+        """
+        Verifica que los contadores incrementales de ambos tableros coinciden
+        entre sí y con los recalculados desde cero.
+        """
+        rng = random.Random(5)
+        reference = Board()
+        for _ in range(500):
+            color = rng.choice(("white", "black"))
+            action = rng.random()
+            from_point, point = rng.randrange(24), rng.randrange(24)
+            for board in (reference, self.board):
+                try:
+                    if action < 0.6:
+                        board.move_checker(color, from_point, point)
+                    elif action < 0.75:
+                        board.enter_from_captured(color, point)
+                    elif action < 0.85:
+                        board.bear_off(color, point)
+                    elif action < 0.93:
+                        board.return_to_bar(color, point)
+                    else:
+                        board.return_from_home(color, point)
+                except (ValueError, IndexError):
+                    pass
+            counts = reference.get_counts()
+            self.assertEqual(self.board.get_counts(), counts)
+            for color, bar in (("white", counts[24]), ("black", counts[25])):
+                pips, outside, occupied, made = tally_counts(counts, color)
+                for board in (reference, self.board):
+                    self.assertEqual(board.get_pip_count(color), pips + BAR_PIPS * bar)
+                    self.assertEqual(board.get_outside_count(color), outside)
+                    self.assertEqual(board.get_occupied_mask(color), occupied)
+                    self.assertEqual(board.get_made_mask(color), made)
+                    self.assertEqual(board.get_blot_mask(color), occupied & ~made)
+                    self.assertEqual(board.get_bar_count(color), bar)
+            for board in (reference, self.board):
+                self.assertEqual(board.has_contact(), counts_in_contact(counts))
+
+    def test_game_runs_on_compact_board(self):
+        """
+        Verifica que Game funciona sin cambios sobre CompactBoard.
+        """
+        game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), self.board, Dice()
+        )
+        game.__dice_values__ = [3, 4]
+        self.assertIn("0 a 3", game.get_possible_moves())
+        self.assertTrue(game.make_move(0, 3))
+        self.assertEqual(self.board.get_point_count(3), 1)
+        game.reset()
+        self.assertEqual(self.board.get_point_count(3), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,9 +11,11 @@ TestDice
     Clase de pruebas unitarias para la clase Dice
 """
 
+import random
 import unittest
 from unittest.mock import patch
 from core.dice import Dice
+from core.exceptions import DiceTapeExhaustedException
 
 # Sino pongo ,from unittest.mock import patch, no me deja ejecutar los @patch
 
@@ -45,6 +47,14 @@ class TestDice(unittest.TestCase):
         Verifica la detección de dobles cuando los valores son iguales
     test_is_double_false()
         Verifica que no se detecten dobles cuando los valores difieren
+    test_seeded_is_reproducible()
+        Verifica que la misma semilla da las mismas tiradas
+    test_injected_generator()
+        Verifica que se usa el generador recibido
+    test_batched_rolls()
+        Verifica las tiradas generadas por bloques
+    test_tape_replay()
+        Verifica que una cinta grabada se reproduce igual
     """
 
     def setUp(self):
@@ -82,6 +92,52 @@ class TestDice(unittest.TestCase):
         self.dice.__value2__ = 6
         self.assertFalse(self.dice.is_double())
 
+    def _rolls(self, dice, count):
+        """Tira los dados count veces y devuelve los valores."""
+        values = []
+        for _ in range(count):
+            dice.roll()
+            values.append(dice.get_values())
+        return values
+
+    def test_seeded_is_reproducible(self):
+        """Verifica que dos dados con la misma semilla tiran lo mismo."""
+        for batch_size in (0, 16):
+            first = self._rolls(Dice.seeded(11, batch_size), 50)
+            second = self._rolls(Dice.seeded(11, batch_size), 50)
+            self.assertEqual(first, second)
+            self.assertNotEqual(first, self._rolls(Dice.seeded(12, batch_size), 50))
+
+    @patch("core.dice.random.randint")
+    def test_injected_generator(self, mock_randint):
+        """Verifica que un generador propio no toca el módulo random."""
+        dice = Dice(random.Random(5))
+        dice.roll()
+        mock_randint.assert_not_called()
+        self.assertTrue(all(1 <= value <= 6 for value in dice.get_values()))
+
+    def test_batched_rolls(self):
+        """Verifica que los bloques se rellenan y cubren las 36 tiradas."""
+        dice = Dice.seeded(3, 8)
+        values = self._rolls(dice, 2000)
+        self.assertEqual(len(set(values)), 36)
+        doubles = sum(1 for first, second in values if first == second)
+        self.assertTrue(250 < doubles < 420)
+
+    def test_tape_replay(self):
+        """Verifica que la cinta grabada se reproduce y luego se agota."""
+        dice = Dice.seeded(8, 4)
+        dice.start_recording()
+        values = self._rolls(dice, 10)
+        tape = dice.get_tape()
+        self.assertEqual(tape, values)
+
+        replay = Dice.from_tape(tape)
+        self.assertEqual(self._rolls(replay, 10), values)
+        with self.assertRaises(DiceTapeExhaustedException):
+            replay.roll()
+        self.assertEqual(Dice().get_tape(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
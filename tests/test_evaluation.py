@@ -0,0 +1,72 @@
+"""
+Este módulo contiene las pruebas unitarias para la evaluación estática.
+"""
+
+import unittest
+from core.board import Board
+from engine.evaluation import NON_TERMINAL_BOUNDS, evaluate, win_points
+
+
+def _finished(white_off, black_points):
+    """Arma conteos con las blancas terminadas y las negras en black_points."""
+    counts = [0] * 28
+    counts[26] = white_off
+    counts[27] = 15 - sum(black_points.values())
+    for index, checkers in black_points.items():
+        counts[index] = -checkers
+    return counts
+
+
+class TestEvaluation(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para evaluate y win_points.
+    """
+
+    def test_initial_position_favours_roller(self):
+        """
+        Verifica que la posición inicial es simétrica y favorece a quien tira.
+        """
+        counts = Board().get_counts()
+        white = evaluate(counts, "white")
+        self.assertAlmostEqual(white, evaluate(counts, "black"))
+        self.assertGreater(white, 0)
+        self.assertLess(white, NON_TERMINAL_BOUNDS[1])
+
+    def test_pip_lead_and_bar(self):
+        """
+        Verifica que adelantar fichas y mandar al rival a la barra suman.
+        """
+        counts = Board().get_counts()
+        base = evaluate(counts, "white")
+        ahead = list(counts)
+        ahead[0] -= 2
+        ahead[6] += 2
+        self.assertGreater(evaluate(ahead, "white"), base)
+        hit = list(counts)
+        hit[23] += 1
+        hit[25] += 1
+        self.assertGreater(evaluate(hit, "white"), base)
+        self.assertLess(evaluate(hit, "black"), evaluate(counts, "black"))
+
+    def test_win_points(self):
+        """
+        Verifica victorias simples, gammons y backgammons.
+        """
+        self.assertEqual(win_points(_finished(15, {3: 5}), "white"), 1)
+        self.assertEqual(win_points(_finished(15, {3: 15}), "white"), 2)
+        self.assertEqual(win_points(_finished(15, {3: 14, 20: 1}), "white"), 3)
+        on_bar = _finished(15, {3: 14})
+        on_bar[25], on_bar[27] = 1, 0
+        self.assertEqual(win_points(on_bar, "white"), 3)
+
+    def test_terminal_positions(self):
+        """
+        Verifica que las posiciones terminadas valen los puntos con signo.
+        """
+        counts = _finished(15, {3: 15})
+        self.assertEqual(evaluate(counts, "white"), 2.0)
+        self.assertEqual(evaluate(counts, "black"), -2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
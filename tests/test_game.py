@@ -2,8 +2,11 @@
 Este módulo contiene las pruebas de integración para la clase Game.
 """
 
+import random
 import unittest
-from core.game import Game
+from core.game import SNAPSHOT_SIZE, Game
+from core.compact_board import CompactBoard
+from core.move import BEAR_OFF, NORMAL, Move
 from core.player import Player
 from core.board import Board
 from core.checker import Checker
@@ -763,10 +766,11 @@ class TestGame(unittest.TestCase):
         Prueba el algoritmo de búsqueda de overshoot para jugador negro.
 
         Cuando el jugador negro tiene fichas en varias posiciones,
-        el juego debe encontrar cuál es la más lejana (posición más baja).
-        Solo esa ficha puede usar la regla del overshoot.
-        Este test pone fichas en pos 0, 2, y 4, y verifica que
-        la posición 0 (la más lejana) puede hacer overshoot con dado 6.
+        el juego debe encontrar cuál es la más lejana (posición más alta,
+        porque las negras salen por -1). Solo esa ficha puede usar la regla
+        del overshoot. Este test pone fichas en pos 0, 2, y 4, y verifica que
+        la posición 4 (la más lejana) puede hacer overshoot con dado 6 y la
+        posición 0 no.
         """
         player = self.__player2__
         for i in range(24):
@@ -777,8 +781,10 @@ class TestGame(unittest.TestCase):
         self.__game__.__board__.__points__[4] = [Checker("black")]
 
         # pylint: disable=protected-access
-        # Dado 6 > 1 (necesario para pos 0), overshoot válido
-        self.assertTrue(self.__game__._validate_bear_off(player, 0, 6))
+        # Dado 6 > 5 (necesario para pos 4), overshoot válido
+        self.assertTrue(self.__game__._validate_bear_off(player, 4, 6))
+        with self.assertRaisesRegex(ValueError, "Movimiento de bear-off inválido."):
+            self.__game__._validate_bear_off(player, 0, 6)
 
     def test_validate_bear_off_overshoot_invalid(self):
         """
@@ -1174,5 +1180,196 @@ class TestGame(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestGameUndo(unittest.TestCase):
+    """
+    Pruebas de push_move() y pop_move() sobre Board y CompactBoard.
+    """
+
+    def _snapshot(self, game):
+        """Devuelve el estado observable de la partida."""
+        return (
+            game.__board__.get_counts(),
+            game.__board__.zobrist_hash,
+            list(game.__dice_values__),
+            game.__current_turn__,
+            game.__winner__,
+        )
+
+    def test_push_pop_restores_random_lines(self):
+        """
+        Verifica que deshacer jugadas completas al azar restaura la posición,
+        el hash, los dados, el turno y el ganador.
+        """
+        for board in (Board(), CompactBoard()):
+            rng = random.Random(11)
+            game = Game(Player("Alice", "white"), Player("Bob", "black"), board, Dice())
+            for _ in range(60):
+                game.__dice_values__ = [rng.randint(1, 6), rng.randint(1, 6)]
+                if game.__dice_values__[0] == game.__dice_values__[1]:
+                    game.__dice_values__ *= 2
+                before = self._snapshot(game)
+                plays = game.get_legal_plays()
+                if not plays:
+                    game.__current_turn__ = 1 - game.__current_turn__
+                    continue
+                play = rng.choice(plays)
+                for move in play:
+                    game.push_move(move)
+                if len(play) == len(before[2]):
+                    self.assertEqual(game.__current_turn__, 1 - before[3])
+                for move in reversed(play):
+                    self.assertEqual(game.pop_move(), move)
+                self.assertEqual(self._snapshot(game), before)
+                for move in play:
+                    game.push_move(move)
+                game.__dice_values__ = []
+                game.__current_turn__ = 1 - before[3]
+
+    def test_pop_restores_captured_blot(self):
+        """
+        Verifica que deshacer una captura devuelve el blot rival a su punto.
+        """
+        game = Game(Player("Alice", "white"), Player("Bob", "black"), Board(), Dice())
+        game.__board__.move_checker("black", 5, 2)
+        game.__dice_values__ = [2, 6]
+        game.push_move(Move(0, 2, 2, NORMAL))
+        self.assertEqual(len(game.__board__.get_captured("black")), 1)
+        self.assertTrue(game.pop_move().__hit__)
+        self.assertEqual(game.__board__.get_point_owner(2), "black")
+        self.assertEqual(game.__board__.get_captured("black"), [])
+        self.assertEqual(game.__dice_values__, [2, 6])
+
+    def test_pop_clears_winner(self):
+        """
+        Verifica que deshacer el último bear-off anula la victoria.
+        """
+        board = CompactBoard.from_counts([0] * 23 + [1, 0, 0, 14, 0])
+        game = Game(Player("Alice", "white"), Player("Bob", "black"), board, Dice())
+        game.__dice_values__ = [1, 3]
+        game.push_move(Move(23, 24, 1, BEAR_OFF))
+        self.assertTrue(game.is_over())
+        game.pop_move()
+        self.assertFalse(game.is_over())
+        self.assertEqual(board.get_point_count(23), 1)
+
+
+class TestGamePlays(unittest.TestCase):
+    """
+    Pruebas de apply_play() y get_win_points().
+    """
+
+    def _game(self, counts):
+        """Crea una partida sobre un tablero compacto con los conteos dados."""
+        return Game(
+            Player("Alice", "white"),
+            Player("Bob", "black"),
+            CompactBoard.from_counts(counts),
+            Dice(),
+        )
+
+    def test_apply_play_passes_turn_with_unused_dice(self):
+        """
+        Verifica que apply_play pasa el turno aunque queden dados sin usar.
+        """
+        game = Game(Player("Alice", "white"), Player("Bob", "black"), Board(), Dice())
+        game.__dice_values__ = [3, 1]
+        game.apply_play((Move(0, 3, 3),))
+        self.assertEqual(game.__current_turn__, 1)
+        self.assertEqual(game.__dice_values__, [])
+        self.assertEqual(game.__undo_stack__, [])
+        game.__dice_values__ = [6, 6, 6, 6]
+        game.apply_play(())
+        self.assertEqual(game.__current_turn__, 0)
+
+    def test_black_bear_off_furthest_checker(self):
+        """
+        Verifica que las negras saquen primero su ficha más lejana (el punto
+        más alto de su casa) con un dado mayor que su distancia.
+        """
+        counts = [0] * 28
+        counts[0], counts[2], counts[27] = -1, -1, 13
+        counts[23], counts[26] = 1, 14
+        game = self._game(counts)
+        game.__current_turn__ = 1
+        game.__dice_values__ = [6, 5]
+        self.assertEqual(game.get_possible_moves(), ["sacar 3"])
+        self.assertFalse(game.make_move(0, -1))
+        self.assertTrue(game.make_move(2, -1))
+        self.assertEqual(game.__dice_values__, [5])
+        self.assertTrue(game.make_move(0, -1))
+        self.assertTrue(game.is_over())
+
+    def test_win_points(self):
+        """
+        Verifica los puntos de una victoria simple, un gammon y un backgammon.
+        """
+        single = [0] * 23 + [1, 0, 0, 14, 1]
+        single[0] = -14
+        gammon = [0] * 23 + [1, 0, 0, 14, 0]
+        gammon[0] = -15
+        backgammon = [0] * 23 + [1, 0, 0, 14, 0]
+        backgammon[0], backgammon[20] = -14, -1
+        for counts, points in ((single, 1), (gammon, 2), (backgammon, 3)):
+            game = self._game(counts)
+            self.assertEqual(game.get_win_points(), 0)
+            game.__dice_values__ = [1, 2]
+            game.apply_play((Move(23, 24, 1, BEAR_OFF),))
+            self.assertTrue(game.is_over())
+            self.assertEqual(game.get_win_points(), points)
+
+
+class TestGameSnapshot(unittest.TestCase):
+    """
+    Pruebas de to_bytes() y from_bytes().
+    """
+
+    def test_round_trip(self):
+        """
+        Verifica que una partida jugada al azar se restaure igual en cada
+        turno, con la instantánea de tamaño fijo.
+        """
+        rng = random.Random(7)
+        game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), Board(), Dice.seeded(7)
+        )
+        game.start()
+        while not game.is_over():
+            data = game.to_bytes()
+            self.assertEqual(len(data), SNAPSHOT_SIZE)
+            restored = Game.from_bytes(data)
+            self.assertIsInstance(restored.__board__, CompactBoard)
+            self.assertEqual(
+                restored.__board__.get_counts(), game.__board__.get_counts()
+            )
+            self.assertEqual(restored.zobrist_hash, game.zobrist_hash)
+            self.assertEqual(restored.get_dice_values(), game.get_dice_values())
+            plays = game.get_legal_plays()
+            game.apply_play(plays[rng.randrange(len(plays))] if plays else ())
+            if not game.is_over():
+                game.roll_dice()
+        restored = Game.from_bytes(game.to_bytes())
+        self.assertEqual(restored.get_winner().__color__, game.get_winner().__color__)
+        self.assertEqual(restored.get_win_points(), game.get_win_points())
+
+    def test_players(self):
+        """
+        Verifica que se conserve el orden de los colores y que se rechacen
+        jugadores de otro color o instantáneas inválidas.
+        """
+        game = Game(Player("Bob", "black"), Player("Alice", "white"), Board(), Dice())
+        game.__dice_values__ = [5, 5, 5]
+        data = game.to_bytes()
+        restored = Game.from_bytes(data)
+        self.assertEqual(restored.get_current_player().__color__, "black")
+        self.assertEqual(restored.get_dice_values(), [5, 5, 5])
+        alice = Player("Alice", "white")
+        restored = Game.from_bytes(data, Player("Bob", "black"), alice)
+        self.assertIs(restored.__players__[1], alice)
+        with self.assertRaises(ValueError):
+            Game.from_bytes(data, alice)
+        with self.assertRaises(ValueError):
+            Game.from_bytes(data[:-1])
+
+
 if __name__ == "__main__":
     unittest.main()
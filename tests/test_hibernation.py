@@ -0,0 +1,77 @@
+"""
+Este módulo contiene las pruebas unitarias para la hibernación de partidas.
+"""
+
+import os
+import tempfile
+import unittest
+from server.hibernation import HibernationManager
+from server.server import GameServer
+
+
+class TestHibernation(unittest.IsolatedAsyncioTestCase):
+    """
+    Clase de pruebas unitarias para HibernationManager con GameServer.
+    """
+
+    def setUp(self):
+        # pylint: disable-next=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "partidas")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_evict_and_restore(self):
+        """
+        Verifica que una partida inactiva salga de memoria y vuelva intacta
+        con el pedido siguiente.
+        """
+        server = GameServer(__hibernation__=HibernationManager(self.path, 10))
+        state = await server.dispatch({"cmd": "new", "seed": 1})
+        game = state["game"]
+        other = (await server.dispatch({"cmd": "new"}))["game"]
+        self.assertEqual(server.evict_idle(), 0)
+        await server.dispatch({"cmd": "state", "game": other})
+        hibernation = server.__hibernation__
+        hibernation.touch(game, 0)
+        self.assertEqual(server.evict_idle(15), 1)
+        stats = server.get_stats()
+        self.assertEqual((stats["games"], stats["stored"]), (1, 1))
+        restored = await server.dispatch({"cmd": "state", "game": game})
+        self.assertEqual(restored, state)
+        moved = await server.dispatch({"cmd": "play", "game": game, "play": 0})
+        self.assertEqual(moved["turn"], "black")
+        stats = server.get_stats()
+        self.assertEqual((stats["hibernated"], stats["restored"]), (1, 1))
+        self.assertEqual((stats["games"], stats["stored"]), (2, 0))
+        server.close()
+
+    async def test_reopen_and_close(self):
+        """
+        Verifica que las partidas hibernadas sobrevivan al servidor y que
+        cerrar una hibernada la borre del archivo.
+        """
+        server = GameServer(__hibernation__=HibernationManager(self.path, 0))
+        first = await server.dispatch({"cmd": "new", "seed": 2})
+        second = await server.dispatch({"cmd": "new", "seed": 3})
+        self.assertEqual(server.evict_idle(), 2)
+        server.close()
+
+        server = GameServer(__hibernation__=HibernationManager(self.path, 0))
+        created = await server.dispatch({"cmd": "new"})
+        self.assertEqual(created["game"], 3)
+        self.assertEqual(
+            await server.dispatch({"cmd": "state", "game": first["game"]}), first
+        )
+        server.evict_idle()
+        closed = await server.dispatch({"cmd": "close", "game": second["game"]})
+        self.assertTrue(closed["ok"])
+        missing = await server.dispatch({"cmd": "state", "game": second["game"]})
+        self.assertFalse(missing["ok"])
+        self.assertEqual(server.get_stats()["stored"], 2)
+        server.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Este módulo contiene las pruebas unitarias para las sugerencias de jugada.
+"""
+
+import unittest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.hint import HintAdvisor, default_advisor
+from engine.search import ExpectiminimaxSearch
+
+
+def _game(dice):
+    """
+    Devuelve una partida en la posición inicial con los dados dados.
+    """
+    game = Game(
+        Player("Alice", "white"), Player("Bob", "black"), CompactBoard(), Dice()
+    )
+    game.__dice_values__ = dice
+    return game
+
+
+class TestHintAdvisor(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para HintAdvisor y Game.get_hints.
+    """
+
+    def test_matches_one_ply_search(self):
+        """
+        Verifica que las equities sean las de la búsqueda a 1 ply sin filtro.
+        """
+        counts = Board().get_counts()
+        analysis = HintAdvisor(__budget__=60).analyze_counts(counts, "white", [6, 4])
+        search = ExpectiminimaxSearch(__root_widths__={1: len(analysis)})
+        expected = {
+            play: equity
+            for play, equity, _ in search.analyze_counts(counts, "white", [6, 4], 1)
+        }
+        self.assertEqual(len(analysis), len(expected))
+        for play, equity, _, plies in analysis:
+            self.assertEqual(plies, 1)
+            self.assertAlmostEqual(equity, expected[play])
+
+    def test_ranking_and_loss(self):
+        """
+        Verifica el orden, la pérdida de cada jugada y la cantidad pedida.
+        """
+        hints = HintAdvisor().hints(_game([3, 1]), 5)
+        self.assertEqual(len(hints), 5)
+        self.assertEqual(hints[0][2], 0.0)
+        equities = [equity for _, equity, _, _ in hints]
+        self.assertEqual(equities, sorted(equities, reverse=True))
+        for _, equity, loss, _ in hints:
+            self.assertAlmostEqual(loss, hints[0][1] - equity)
+        # El 3-1 de apertura hace el punto 5 de las blancas.
+        self.assertEqual([move.__to_pos__ for move in hints[0][0]], [19, 19])
+
+    def test_budget(self):
+        """
+        Verifica que sin tiempo las jugadas queden valuadas a 0 plies.
+        """
+        hints = HintAdvisor(__budget__=0).hints(_game([6, 5]), 20)
+        self.assertTrue(hints)
+        self.assertTrue(all(plies == 0 for _, _, _, plies in hints))
+
+    def test_cache(self):
+        """
+        Verifica que repetir la sugerencia de un turno salga de la caché y
+        que la caché descarte el turno menos usado.
+        """
+        advisor = HintAdvisor(__capacity__=2)
+        first = advisor.hints(_game([5, 2]), 3)
+        self.assertEqual(advisor.hints(_game([5, 2]), 3), first)
+        self.assertEqual(advisor.hints(_game([5, 2]), 1), first[:1])
+        self.assertEqual(advisor.get_stats(), {"hits": 2, "misses": 1, "size": 1})
+        advisor.hints(_game([4, 1]))
+        advisor.hints(_game([6, 6, 6, 6]))
+        advisor.hints(_game([5, 2]))
+        self.assertEqual(advisor.get_stats(), {"hits": 2, "misses": 4, "size": 2})
+        advisor.clear()
+        self.assertEqual(advisor.get_stats()["size"], 0)
+
+    def test_cache_key_uses_color(self):
+        """
+        Verifica que una partida que empieza con negras no reciba las
+        sugerencias guardadas para las blancas.
+        """
+        advisor = HintAdvisor()
+        white = advisor.hints(_game([3, 1]), 1)
+        game = Game(
+            Player("Bob", "black"), Player("Alice", "white"), CompactBoard(), Dice()
+        )
+        game.__dice_values__ = [3, 1]
+        black = advisor.hints(game, 1)
+        self.assertNotEqual(black, white)
+        self.assertEqual([move.__to_pos__ for move in black[0][0]], [4, 4])
+        self.assertEqual(advisor.get_stats()["misses"], 2)
+
+    def test_cache_larger_budget(self):
+        """
+        Verifica que un análisis incompleto guardado se repita si después se
+        da más tiempo, y que no se repita con menos.
+        """
+        advisor = HintAdvisor(__budget__=0)
+        shallow = advisor.hints(_game([6, 5]), 20)
+        self.assertTrue(all(plies == 0 for _, _, _, plies in shallow))
+        deep = advisor.hints(_game([6, 5]), 20, 60)
+        self.assertTrue(all(plies == 1 for _, _, _, plies in deep))
+        self.assertEqual(advisor.hints(_game([6, 5]), 20), deep)
+        self.assertEqual(advisor.get_stats(), {"hits": 1, "misses": 2, "size": 1})
+
+    def test_lookahead_terminal_uses_evaluator(self):
+        """
+        Verifica que una posición terminal se valúe con la evaluación del
+        asesor.
+        """
+        advisor = HintAdvisor(lambda counts, color: 0.25 if color == "white" else -0.5)
+        after = [0] * 28
+        after[26] = 15
+        after[0] = -15
+        # pylint: disable-next=protected-access
+        self.assertEqual(advisor._lookahead(after, "white"), 0.5)
+
+    def test_game_hints(self):
+        """
+        Verifica la API de Game con el asesor compartido.
+        """
+        game = _game([2, 1])
+        hints = game.get_hints(2)
+        self.assertEqual(len(hints), 2)
+        self.assertIn(hints[0][0], game.get_legal_plays())
+        self.assertIs(default_advisor(), default_advisor())
+        self.assertEqual(game.get_hints(2), hints)
+        game.__dice_values__ = []
+        self.assertEqual(game.get_hints(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Este módulo contiene las pruebas unitarias para el diario de partidas y su
+reproducción.
+"""
+
+import io
+import random
+import unittest
+from core.board import Board
+from core.dice import Dice
+from core.game import Game
+from core.journal import EVENT_MOVE, EVENT_PASS, EVENT_ROLL, GameJournal
+from core.player import Player
+from core.replay import replay
+
+
+def _state(game):
+    """Devuelve lo que debe coincidir entre una partida y su reproducción."""
+    winner = game.get_winner()
+    return (
+        game.__board__.get_counts(),
+        game.__current_turn__,
+        list(game.get_dice_values()),
+        winner.__color__ if winner else None,
+    )
+
+
+def _new_game(seed):
+    """Crea una partida con dados reproducibles, sin tirar todavía."""
+    return Game(
+        Player("Alice", "white"), Player("Bob", "black"), Board(), Dice.seeded(seed)
+    )
+
+
+class TestGameJournal(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para GameJournal y replay.
+    """
+
+    def _play_random_game(self, seed):
+        """
+        Juega una partida al azar con apply_play y devuelve la partida y el
+        estado después de cada tirada.
+        """
+        rng = random.Random(seed)
+        game = _new_game(seed)
+        game.__history__ = GameJournal(game.to_bytes(), 4)
+        game.start()
+        states = [_state(game)]
+        while not game.is_over():
+            plays = game.get_legal_plays()
+            game.apply_play(plays[rng.randrange(len(plays))] if plays else ())
+            if not game.is_over():
+                game.roll_dice()
+                states.append(_state(game))
+        return game, states
+
+    def test_replay_every_ply(self):
+        """
+        Verifica que cada turno se reconstruya igual que en la partida,
+        aplicando sólo los eventos desde la instantánea más cercana.
+        """
+        game, states = self._play_random_game(5)
+        journal = game.__history__
+        self.assertEqual(journal.get_ply_count(), len(states))
+        for ply, state in enumerate(states):
+            self.assertEqual(_state(replay(journal, ply)), state)
+            _, events = journal.locate(ply)
+            rolls = [event for event in events if event >> 16 == EVENT_ROLL]
+            self.assertLessEqual(len(rolls), 4)
+        self.assertEqual(_state(replay(journal)), _state(game))
+        with self.assertRaises(IndexError):
+            journal.locate(len(states))
+
+    def test_events(self):
+        """
+        Verifica los eventos de tiradas, movimientos y pases de turno, y que
+        las búsquedas con push_move y pop_move no escriban en el diario.
+        """
+        game = _new_game(1)
+        game.start()
+        journal = game.__history__
+        kind, payload = journal.get_events()[0]
+        self.assertEqual(kind, EVENT_ROLL)
+        self.assertEqual((payload & 7, payload >> 3 & 7), game.__dice__.get_values())
+        play = game.get_legal_plays()[0]
+        game.push_move(play[0])
+        game.pop_move()
+        self.assertEqual(len(journal), 1)
+        game.apply_play(play[:1])
+        self.assertEqual(
+            [kind for kind, _ in journal.get_events()],
+            [EVENT_ROLL, EVENT_MOVE, EVENT_PASS],
+        )
+        self.assertEqual(journal.get_events()[2], (EVENT_PASS, 1))
+        game.reset()
+        self.assertIsNot(game.__history__, journal)
+        self.assertEqual(len(game.__history__), 1)
+
+    def test_make_move(self):
+        """
+        Verifica que los movimientos hechos con make_move también se
+        registren y se reproduzcan.
+        """
+        game = _new_game(3)
+        game.start()
+        states = [_state(game)]
+        for _ in range(20):
+            plays = game.get_legal_plays()
+            if not plays:
+                game.switch_turn()
+            for move in plays[0] if plays else ():
+                self.assertTrue(game.make_move(move.__from_pos__, move.__to_pos__))
+            states.append(_state(game))
+        journal = game.__history__
+        self.assertEqual(journal.get_ply_count(), len(states))
+        for ply, state in enumerate(states):
+            self.assertEqual(_state(replay(journal, ply)), state)
+
+    def test_restored_games(self):
+        """
+        Verifica que las partidas restauradas con from_bytes o from_ids
+        empiecen su diario en la posición restaurada.
+        """
+        game = _new_game(4)
+        game.start()
+        game.apply_play(game.get_legal_plays()[0])
+        game.roll_dice()
+        for restored in (
+            Game.from_bytes(game.to_bytes()),
+            Game.from_ids(game.get_position_id(), game.get_match_id()),
+        ):
+            self.assertEqual(_state(replay(restored.__history__)), _state(restored))
+            restored.apply_play(restored.get_legal_plays()[0])
+            self.assertEqual(_state(replay(restored.__history__)), _state(restored))
+
+    def test_stream(self):
+        """
+        Verifica que el diario se escriba y se lea como un flujo, y que se
+        rechacen los flujos inválidos o truncados.
+        """
+        game, states = self._play_random_game(9)
+        stream = io.BytesIO()
+        game.__history__.write(stream)
+        data = stream.getvalue()
+        journal = GameJournal.read(io.BytesIO(data))
+        self.assertEqual(journal.get_events(), game.__history__.get_events())
+        self.assertEqual(journal.get_ply_count(), len(states))
+        self.assertEqual(
+            _state(replay(journal, len(states) // 2)), states[len(states) // 2]
+        )
+        for bad in (b"", b"XXXX" + data[4:], data[:-1]):
+            with self.assertRaises(ValueError):
+                GameJournal.read(io.BytesIO(bad))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Este módulo contiene las pruebas unitarias para la clase Move.
+"""
+
+import unittest
+from core.board import Board
+from core.checker import Checker
+from core.dice import Dice
+from core.game import Game
+from core.move import BEAR_OFF, NORMAL, REENTRY, Move
+from core.player import Player
+
+
+class TestMove(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para la clase Move y su codificación entera.
+    """
+
+    def test_encode_decode_round_trip(self):
+        """
+        Verifica que decodificar el código de un movimiento lo reconstruye.
+        """
+        for move in (
+            Move(0, 23, 6, NORMAL, True),
+            Move(-1, 3, 4, REENTRY),
+            Move(18, 24, 6, BEAR_OFF),
+            Move(5, -1, 6, BEAR_OFF),
+            Move(-1, 20, 4, REENTRY, True),
+        ):
+            decoded = Move.decode(move.encode())
+            self.assertEqual(decoded, move)
+            self.assertEqual(decoded.__from_pos__, move.__from_pos__)
+            self.assertEqual(decoded.__to_pos__, move.__to_pos__)
+            self.assertEqual(decoded.__die__, move.__die__)
+            self.assertEqual(decoded.__kind__, move.__kind__)
+            self.assertEqual(decoded.__hit__, move.__hit__)
+
+    def test_code_fits_in_sixteen_bits(self):
+        """
+        Verifica que el código del movimiento más grande cabe en 16 bits.
+        """
+        self.assertLess(Move(23, 24, 7, 3, True).encode(), 1 << 16)
+
+    def test_equality_and_hash(self):
+        """
+        Verifica que los movimientos iguales son intercambiables en conjuntos.
+        """
+        self.assertEqual(Move(1, 4, 3), Move(1, 4, 3))
+        self.assertNotEqual(Move(1, 4, 3), Move(1, 4, 3, NORMAL, True))
+        self.assertEqual(len({Move(1, 4, 3), Move(1, 4, 3)}), 1)
+        self.assertNotEqual(Move(1, 4, 3), "1 a 4")
+
+    def test_repr(self):
+        """
+        Verifica la representación de texto del movimiento.
+        """
+        self.assertIn("Move(0, 3", repr(Move(0, 3, 3)))
+
+
+class TestGameGenerateMoves(unittest.TestCase):
+    """
+    Pruebas de integración de Game.generate_moves con objetos Move.
+    """
+
+    def setUp(self):
+        self.game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), Board(), Dice()
+        )
+
+    def test_generate_moves_returns_move_objects(self):
+        """
+        Verifica que generate_moves devuelve objetos Move con su dado.
+        """
+        self.game.__dice_values__ = [3, 4]
+        moves = self.game.generate_moves()
+        self.assertIn(Move(0, 3, 3), moves)
+        self.assertIn(Move(0, 4, 4), moves)
+        self.assertTrue(all(isinstance(move, Move) for move in moves))
+        self.assertIn("0 a 3", self.game.get_possible_moves())
+
+    def test_generate_moves_marks_hits(self):
+        """
+        Verifica que se marca la captura de un blot rival.
+        """
+        self.game.__board__.__points__[3] = [Checker("black")]
+        self.game.__dice_values__ = [3, 4]
+        self.assertIn(Move(0, 3, 3, NORMAL, True), self.game.generate_moves())
+
+    def test_generate_reentry_and_bear_off_moves(self):
+        """
+        Verifica los tipos REENTRY y BEAR_OFF de los movimientos generados.
+        """
+        board = self.game.__board__
+        board.get_captured("white").append(Checker("white"))
+        self.game.__dice_values__ = [1, 2]
+        kinds = {move.__kind__ for move in self.game.generate_moves()}
+        self.assertEqual(kinds, {REENTRY})
+
+        for i in range(24):
+            board.__points__[i] = []
+        board.get_captured("white").clear()
+        board.__points__[22] = [Checker("white")] * 15
+        moves = self.game.generate_moves()
+        self.assertIn(Move(22, 24, 2, BEAR_OFF), moves)
+        self.assertEqual(self.game.get_possible_moves().count("sacar 23"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
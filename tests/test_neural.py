@@ -0,0 +1,122 @@
+"""
+Este módulo contiene las pruebas unitarias para el evaluador neuronal.
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.evaluation import MAX_EQUITY, MIN_EQUITY
+from engine.neural import INPUTS, OUTPUTS, NeuralEvaluator, encode_batch
+from engine.policies import NeuralPolicy, make_policy
+from engine.search import ExpectiminimaxSearch
+
+
+class TestNeuralEvaluator(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para encode_batch y NeuralEvaluator.
+    """
+
+    def setUp(self):
+        self.evaluator = NeuralEvaluator(__hidden__=16, __seed__=3)
+        self.game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), CompactBoard(), Dice()
+        )
+        self.game.__dice_values__ = [6, 4]
+        self.candidates = self.game.get_legal_plays_with_positions()
+
+    def test_encoding(self):
+        """
+        Verifica la codificación de la posición inicial desde cada color.
+        """
+        counts = Board().get_counts()
+        inputs = encode_batch([counts], "white")
+        self.assertEqual(inputs.shape, (1, INPUTS))
+        np.testing.assert_array_equal(inputs, encode_batch([counts], "black"))
+        # 2 fichas a distancia 24 y 5 a distancia 6 del jugador en turno.
+        np.testing.assert_array_equal(inputs[0, 92:96], [1, 1, 0, 0])
+        np.testing.assert_array_equal(inputs[0, 20:24], [1, 1, 1, 1])
+        self.assertAlmostEqual(float(inputs[0, 196]), 1.67, places=5)
+
+        counts[0] -= 1
+        counts[24] += 1
+        white, black = (
+            encode_batch([counts], "white")[0],
+            encode_batch([counts], "black")[0],
+        )
+        self.assertEqual(white[192], 0.5)
+        self.assertEqual(black[193], 0.5)
+
+    def test_batch_matches_single_evaluations(self):
+        """
+        Verifica que el lote da lo mismo que evaluar posición por posición.
+        """
+        positions = [after for _, after in self.candidates]
+        batch = self.evaluator.evaluate_batch(positions, "black")
+        single = [self.evaluator(after, "black") for after in positions]
+        np.testing.assert_allclose(batch, single, rtol=1e-5, atol=1e-6)
+        probabilities = self.evaluator.probabilities(positions, "black")
+        self.assertEqual(probabilities.shape, (len(positions), OUTPUTS))
+        expected = (
+            2 * probabilities[:, 0]
+            - 1
+            + probabilities[:, 1]
+            + probabilities[:, 2]
+            - probabilities[:, 3]
+            - probabilities[:, 4]
+        )
+        np.testing.assert_allclose(batch, expected, rtol=1e-5, atol=1e-6)
+        self.assertTrue(np.all((batch > MIN_EQUITY) & (batch < MAX_EQUITY)))
+
+    def test_terminal_positions_are_exact(self):
+        """
+        Verifica que una posición terminada vale sus puntos exactos.
+        """
+        counts = [0] * 28
+        counts[26], counts[3] = 15, -15
+        self.assertEqual(self.evaluator(counts, "white"), 2.0)
+        self.assertEqual(self.evaluator(counts, "black"), -2.0)
+
+    def test_save_and_load(self):
+        """
+        Verifica que los pesos guardados se recuperan igual.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.npz")
+            self.evaluator.save(path)
+            loaded = NeuralEvaluator.load(path)
+        positions = [after for _, after in self.candidates]
+        np.testing.assert_array_equal(
+            loaded.evaluate_batch(positions, "white"),
+            self.evaluator.evaluate_batch(positions, "white"),
+        )
+
+    def test_score_plays_and_policy(self):
+        """
+        Verifica que la política elige la jugada con mayor puntaje del lote.
+        """
+        scores = self.evaluator.score_plays(self.candidates, "white")
+        self.assertEqual(len(scores), len(self.candidates))
+        play = NeuralPolicy(self.evaluator).choose_play(self.game, self.candidates)
+        self.assertEqual(play, self.candidates[int(np.argmax(scores))][0])
+        self.assertIsInstance(make_policy("neural", 1), NeuralPolicy)
+
+    def test_search_uses_batches_and_bounds(self):
+        """
+        Verifica que la búsqueda acepta la red y evalúa igual que a mano.
+        """
+        search = ExpectiminimaxSearch(self.evaluator)
+        analysis = search.analyze(self.game, 0)
+        scores = self.evaluator.score_plays(self.candidates, "white")
+        self.assertAlmostEqual(analysis[0][1], float(scores.max()), places=5)
+        self.assertEqual(search.__static_bounds__, (MIN_EQUITY, MAX_EQUITY))
+        self.assertTrue(search.analyze(self.game, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
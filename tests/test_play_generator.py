@@ -0,0 +1,203 @@
+"""
+Este módulo contiene las pruebas unitarias para el generador de jugadas completas.
+"""
+
+import unittest
+from core.board import Board
+from core.checker import Checker
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.move import BEAR_OFF, NORMAL, REENTRY, Move
+from core.play_generator import (
+    enumerate_plays,
+    enumerate_positions,
+    generate_plays,
+    legal_first_steps,
+)
+from core.player import Player
+
+
+def _counts(white=None, black=None, bar=(0, 0), off=(0, 0)):
+    """Construye una lista de 28 conteos con signo a partir de diccionarios."""
+    counts = [0] * 28
+    for point, count in (white or {}).items():
+        counts[point] = count
+    for point, count in (black or {}).items():
+        counts[point] = -count
+    counts[24], counts[25] = bar
+    counts[26], counts[27] = off
+    return counts
+
+
+class TestPlayGenerator(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para enumerate_plays y generate_plays.
+    """
+
+    def test_opening_roll_plays_are_distinct(self):
+        """
+        Verifica que las jugadas de apertura no repiten posiciones.
+        """
+        counts = Board().get_counts()
+        for dice in ([3, 1], [6, 5], [6, 6, 6, 6], [2, 2, 2, 2]):
+            plays = enumerate_plays(counts, "white", dice)
+            positions = {tuple(position) for _, position in plays}
+            self.assertEqual(len(positions), len(plays))
+            for play, _ in plays:
+                self.assertEqual(len(play), len(dice))
+
+    def test_opening_three_one_count(self):
+        """
+        Verifica la cantidad de jugadas distintas del 3-1 de apertura.
+        """
+        self.assertEqual(len(generate_plays(Board().get_counts(), "white", [3, 1])), 16)
+
+    def test_resulting_position(self):
+        """
+        Verifica que la posición devuelta corresponde a aplicar la jugada.
+        """
+        counts = _counts(white={0: 1}, black={23: 1})
+        plays = enumerate_plays(counts, "white", [6, 5])
+        self.assertEqual(len(plays), 1)
+        play, position = plays[0]
+        self.assertEqual(play[-1].__to_pos__, 11)
+        self.assertEqual(position[11], 1)
+        self.assertEqual(position[0], 0)
+
+    def test_must_use_larger_die_when_only_one_playable(self):
+        """
+        Verifica que si sólo se puede usar un dado se obliga a usar el mayor.
+        """
+        counts = _counts(white={0: 1}, black={8: 2})
+        plays = generate_plays(counts, "white", [3, 5])
+        self.assertEqual(plays, [(Move(0, 5, 5, NORMAL),)])
+
+    def test_must_use_both_dice(self):
+        """
+        Verifica que se descartan las jugadas que usan un solo dado cuando
+        se pueden usar ambos.
+        """
+        counts = _counts(white={20: 1}, off=(14, 0))
+        plays = generate_plays(counts, "white", [4, 2])
+        self.assertEqual(plays, [(Move(20, 22, 2), Move(22, 24, 4, BEAR_OFF))])
+        self.assertNotIn(
+            Move(20, 24, 4, BEAR_OFF), legal_first_steps(counts, "white", [4, 2])
+        )
+
+    def test_bar_entry_comes_first(self):
+        """
+        Verifica que con fichas en la barra se reingresa antes de mover.
+        """
+        counts = _counts(white={0: 1}, black={2: 2, 23: 1}, bar=(1, 0))
+        plays = generate_plays(counts, "white", [3, 4])
+        self.assertTrue(plays)
+        for play in plays:
+            self.assertEqual(play[0], Move(-1, 3, 4, REENTRY))
+
+    def test_bar_entry_blocked(self):
+        """
+        Verifica que no hay jugadas si el reingreso está bloqueado.
+        """
+        counts = _counts(white={0: 1}, black={2: 2, 3: 2}, bar=(1, 0))
+        self.assertEqual(generate_plays(counts, "white", [3, 4]), [])
+
+    def test_hit_sends_opponent_to_bar(self):
+        """
+        Verifica que la posición resultante registra la captura.
+        """
+        counts = _counts(black={5: 1, 20: 1}, white={2: 1})
+        for play, position in enumerate_plays(counts, "black", [3, 1]):
+            if Move(5, 2, 3, NORMAL, True) in play:
+                self.assertEqual(position[24], 1)
+                break
+        else:
+            self.fail("No se generó la captura")
+
+    def test_black_bear_off_with_doubles(self):
+        """
+        Verifica el bear-off de negras usando los cuatro dados de un doble.
+        """
+        counts = _counts(black={0: 2, 1: 2}, off=(0, 11))
+        plays = generate_plays(counts, "black", [2, 2, 2, 2])
+        self.assertEqual(len(plays), 1)
+        self.assertEqual(len(plays[0]), 4)
+        self.assertTrue(all(step.__kind__ == BEAR_OFF for step in plays[0]))
+
+    def test_enumerate_positions_matches_plays(self):
+        """
+        Verifica que enumerate_positions devuelve las posiciones de las jugadas.
+        """
+        counts = Board().get_counts()
+        for color, dice in (("white", [6, 1]), ("black", [4, 4, 4, 4])):
+            self.assertEqual(
+                enumerate_positions(counts, color, dice),
+                [position for _, position in enumerate_plays(counts, color, dice)],
+            )
+        self.assertEqual(enumerate_positions(counts, "white", []), [])
+
+    def test_no_dice(self):
+        """
+        Verifica que sin dados no hay jugadas.
+        """
+        self.assertEqual(generate_plays(Board().get_counts(), "white", []), [])
+
+
+class TestGameLegalPlays(unittest.TestCase):
+    """
+    Pruebas de integración del generador de jugadas con Game.
+    """
+
+    def setUp(self):
+        self.game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), Board(), Dice()
+        )
+
+    def test_get_legal_plays(self):
+        """
+        Verifica que Game devuelve las jugadas del jugador y los dados actuales.
+        """
+        self.game.__dice_values__ = [3, 1]
+        self.assertEqual(len(self.game.get_legal_plays()), 16)
+
+    def test_make_move_rejects_move_that_wastes_a_die(self):
+        """
+        Verifica que make_move rechaza sacar una ficha si así se pierde el
+        otro dado, y acepta el movimiento que permite usar ambos.
+        """
+        board = self.game.__board__
+        for i in range(24):
+            board.__points__[i] = []
+        board.__points__[20] = [Checker("white")]
+        for _ in range(14):
+            board.get_home("white").append(Checker("white"))
+        self.game.__dice_values__ = [4, 2]
+        self.assertFalse(self.game.make_move(20, 24))
+        self.assertTrue(self.game.make_move(20, 22))
+        self.assertTrue(self.game.make_move(22, 24))
+        self.assertTrue(self.game.is_over())
+
+    def test_doubles_accept_every_order(self):
+        """
+        Verifica que en dobles se acepten todos los primeros pasos de una
+        jugada legal, no sólo el del orden que genera la búsqueda.
+        """
+        counts = _counts(white={4: 1, 16: 1, 20: 13}, black={2: 15})
+        steps = legal_first_steps(counts, "white", [6, 6, 6, 6])
+        self.assertEqual(
+            {(step.__from_pos__, step.__to_pos__) for step in steps},
+            {(4, 10), (16, 22)},
+        )
+        game = Game(
+            Player("Alice", "white"),
+            Player("Bob", "black"),
+            CompactBoard.from_counts(counts),
+            Dice(),
+        )
+        game.__dice_values__ = [6, 6, 6, 6]
+        self.assertTrue(game.make_move(16, 22))
+        self.assertTrue(game.make_move(4, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
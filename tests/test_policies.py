@@ -0,0 +1,151 @@
+"""
+Este módulo contiene las pruebas unitarias para las políticas de juego.
+"""
+
+import unittest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.policies import (
+    AnytimePolicy,
+    FirstLegalPolicy,
+    GreedyPipPolicy,
+    Policy,
+    RandomPolicy,
+    SearchPolicy,
+    make_policy,
+    pip_count,
+)
+from engine.simulator import simulate
+
+
+class TestPolicies(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para las políticas y sus utilidades.
+    """
+
+    def setUp(self):
+        self.game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), CompactBoard(), Dice()
+        )
+        self.game.__dice_values__ = [3, 1]
+        self.candidates = self.game.get_legal_plays_with_positions()
+
+    def test_pip_count(self):
+        """
+        Verifica la cuenta de pips inicial y con una ficha en la barra.
+        """
+        counts = Board().get_counts()
+        self.assertEqual(pip_count(counts, "white"), 167)
+        counts[0] -= 1
+        counts[24] += 1
+        self.assertEqual(pip_count(counts, "white"), 167 - 24 + 25)
+
+    def test_first_legal_policy(self):
+        """
+        Verifica que FirstLegalPolicy elige la primera jugada.
+        """
+        play = FirstLegalPolicy().choose_play(self.game, self.candidates)
+        self.assertEqual(play, self.candidates[0][0])
+
+    def test_random_policy_is_reproducible(self):
+        """
+        Verifica que dos políticas al azar con la misma semilla eligen igual.
+        """
+        first = RandomPolicy(4)
+        second = RandomPolicy(4)
+        for _ in range(10):
+            self.assertEqual(
+                first.choose_play(self.game, self.candidates),
+                second.choose_play(self.game, self.candidates),
+            )
+
+    def test_greedy_policy_prefers_hit(self):
+        """
+        Verifica que GreedyPipPolicy elige capturar un blot rival.
+        """
+        self.game.__board__.move_checker("black", 5, 3)
+        self.game.__dice_values__ = [3, 1]
+        play = GreedyPipPolicy().choose_play(
+            self.game, self.game.get_legal_plays_with_positions()
+        )
+        self.assertTrue(any(move.__hit__ for move in play))
+
+    def test_greedy_policy_prefers_bear_off(self):
+        """
+        Verifica que GreedyPipPolicy saca una ficha antes que moverla en casa.
+        """
+        board = CompactBoard.from_counts([0] * 18 + [2, 0, 0, 0, 0, 1] + [0, 0, 12, 0])
+        game = Game(Player("Alice", "white"), Player("Bob", "black"), board, Dice())
+        game.__dice_values__ = [6, 1]
+        play = GreedyPipPolicy().choose_play(
+            game, game.get_legal_plays_with_positions()
+        )
+        self.assertEqual(sum(move.__to_pos__ == 24 for move in play), 2)
+
+    def test_greedy_policy_makes_points(self):
+        """
+        Verifica que con el 3-1 y el 4-2 de apertura GreedyPipPolicy haga un
+        punto de la casa en lugar de dejar blots.
+        """
+        for dice, point in (([3, 1], 19), ([4, 2], 20)):
+            self.game.__dice_values__ = dice
+            play = GreedyPipPolicy().choose_play(
+                self.game, self.game.get_legal_plays_with_positions()
+            )
+            self.assertEqual([move.__to_pos__ for move in play], [point, point])
+
+    def test_greedy_policy_beats_random(self):
+        """
+        Verifica que GreedyPipPolicy le gane a RandomPolicy con una semilla
+        fija y que sus partidas no se alarguen.
+        """
+        result = simulate(20, "greedy", "random", 7)
+        self.assertGreaterEqual(result["white_wins"], 18)
+        self.assertLess(result["mean_plies"], 100)
+
+    def test_search_policy(self):
+        """
+        Verifica que SearchPolicy elige la mejor jugada de la búsqueda y que
+        con una sola jugada legal la devuelve sin buscar.
+        """
+        policy = SearchPolicy(0)
+        play = policy.choose_play(self.game, self.candidates)
+        self.assertIn(play, [candidate for candidate, _ in self.candidates])
+        self.assertEqual(
+            policy.choose_play(self.game, self.candidates[1:2]),
+            self.candidates[1][0],
+        )
+
+    def test_anytime_policy(self):
+        """
+        Verifica que AnytimePolicy registre la profundidad alcanzada y que
+        sin tiempo se quede con la jugada a 0 plies.
+        """
+        policy = AnytimePolicy(__budget__=0)
+        with self.assertLogs("engine.policies", level="INFO") as logs:
+            play = policy.choose_play(self.game, self.candidates)
+        self.assertIn("a 0 plies", logs.output[0])
+        self.assertEqual(play, SearchPolicy(0).choose_play(self.game, self.candidates))
+        policy.choose_play(self.game, self.candidates[1:2])
+        self.assertEqual(policy.get_depth_counts(), {0: 1})
+
+    def test_make_policy(self):
+        """
+        Verifica la creación de políticas por nombre.
+        """
+        self.assertIsInstance(make_policy("random", 1), RandomPolicy)
+        self.assertIsInstance(make_policy("first"), FirstLegalPolicy)
+        self.assertIsInstance(make_policy("greedy"), GreedyPipPolicy)
+        self.assertIsInstance(make_policy("expectiminimax"), SearchPolicy)
+        self.assertIsInstance(make_policy("anytime"), AnytimePolicy)
+        with self.assertRaises(ValueError):
+            make_policy("unknown")
+        with self.assertRaises(NotImplementedError):
+            Policy().choose_play(self.game, self.candidates)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Este módulo contiene las pruebas unitarias para la Position ID y la Match ID.
+"""
+
+import random
+import unittest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from core.position_id import (
+    GAME_OVER,
+    MATCH_DEFAULTS,
+    decode_match_id,
+    decode_position_id,
+    encode_match_id,
+    encode_position_id,
+)
+
+
+class TestPositionId(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para la codificación de GNU Backgammon.
+    """
+
+    def test_starting_position(self):
+        """
+        Verifica la Position ID conocida de la posición inicial.
+        """
+        self.assertEqual(Board().get_position_id("white"), "4HPwATDgc/ABMA")
+        self.assertEqual(CompactBoard().get_position_id("black"), "4HPwATDgc/ABMA")
+        board = CompactBoard.from_position_id("4HPwATDgc/ABMA", "white")
+        self.assertEqual(board.get_counts(), Board().get_counts())
+
+    def test_perspective(self):
+        """
+        Verifica que la posición se codifique desde el punto de vista del
+        color en turno: la misma posición espejada da la misma Position ID.
+        """
+        counts = [0] * 28
+        counts[23], counts[18], counts[24], counts[26] = 2, 3, 1, 9
+        counts[0], counts[10], counts[27] = -4, -1, 10
+        mirrored = [-n for n in counts[23::-1]] + [
+            counts[25],
+            counts[24],
+            counts[27],
+            counts[26],
+        ]
+        text = encode_position_id(counts, "white")
+        self.assertEqual(encode_position_id(mirrored, "black"), text)
+        self.assertNotEqual(encode_position_id(counts, "black"), text)
+        self.assertEqual(decode_position_id(text, "white"), counts)
+        self.assertEqual(decode_position_id(text, "black"), mirrored)
+
+    def test_random_games(self):
+        """
+        Verifica que las posiciones de partidas al azar vuelvan intactas por
+        la Position ID y la Match ID.
+        """
+        rng = random.Random(11)
+        game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), Board(), Dice.seeded(11)
+        )
+        game.start()
+        while not game.is_over():
+            restored = Game.from_ids(game.get_position_id(), game.get_match_id())
+            self.assertEqual(
+                restored.__board__.get_counts(), game.__board__.get_counts()
+            )
+            self.assertEqual(restored.__current_turn__, game.__current_turn__)
+            self.assertEqual(restored.get_dice_values(), game.get_dice_values())
+            plays = game.get_legal_plays()
+            game.apply_play(plays[rng.randrange(len(plays))] if plays else ())
+            if not game.is_over():
+                game.roll_dice()
+        match = decode_match_id(game.get_match_id())
+        self.assertEqual(match["state"], GAME_OVER)
+        restored = Game.from_ids(game.get_position_id(), game.get_match_id())
+        self.assertEqual(restored.get_winner().__color__, game.get_winner().__color__)
+
+    def test_match_id(self):
+        """
+        Verifica la Match ID del ejemplo del manual de GNU Backgammon y los
+        valores por defecto.
+        """
+        fields = decode_match_id("QYkqASAAIAAA")
+        self.assertEqual(fields["cube"], 2)
+        self.assertEqual(fields["cube_owner"], 0)
+        self.assertEqual((fields["on_roll"], fields["turn"]), (1, 1))
+        self.assertEqual(fields["dice"], (5, 2))
+        self.assertEqual(fields["match_length"], 9)
+        self.assertEqual(fields["scores"], (2, 4))
+        self.assertEqual(encode_match_id(fields), "QYkqASAAIAAA")
+        self.assertEqual(decode_match_id(encode_match_id()), MATCH_DEFAULTS)
+
+    def test_invalid(self):
+        """
+        Verifica que se rechacen los identificadores inválidos.
+        """
+        for text in ("4HPwATDgc/ABM", "4HPwATDgc/AB!A", "//////////////", None):
+            with self.assertRaises(ValueError):
+                decode_position_id(text, "white")
+        for text in ("QYkqASAAIAA", "QYkqASAAIA*A"):
+            with self.assertRaises(ValueError):
+                decode_match_id(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Este módulo contiene las pruebas unitarias para la evaluación de carreras.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from engine.bearoff import (
+    OneSidedBearoff,
+    TwoSidedBearoff,
+    write_one_sided,
+    write_two_sided,
+)
+from engine.evaluation import evaluate
+from engine.race import effective_pips, race_equity, race_probabilities
+
+
+def _race(white, black):
+    """
+    Arma los conteos de una carrera con las fichas de cada color por punto
+    y el resto retiradas.
+    """
+    counts = [0] * 28
+    for index, checkers in white.items():
+        counts[index] = checkers
+    for index, checkers in black.items():
+        counts[index] = -checkers
+    counts[26] = 15 - sum(white.values())
+    counts[27] = 15 - sum(black.values())
+    return counts
+
+
+class TestRace(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para effective_pips, race_probabilities y
+    race_equity.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.one_sided_path = os.path.join(cls.directory, "bearoff1.bin")
+        cls.two_sided_path = os.path.join(cls.directory, "bearoff2.bin")
+        write_one_sided(cls.one_sided_path, 6)
+        write_two_sided(cls.two_sided_path, 3)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_effective_pips(self):
+        """
+        Verifica las correcciones por fichas apiladas y puntos vacíos.
+        """
+        counts = _race({23: 4, 18: 1}, {0: 2})
+        # 4 + 6 pips, 6 de desperdicio en el punto 1 y 2 huecos (4 y 5).
+        self.assertEqual(effective_pips(counts, "white"), 10 + 6 + 2)
+        # 2 pips, 2 de desperdicio y los puntos 4, 5 y 6 vacíos.
+        self.assertEqual(effective_pips(counts, "black"), 2 + 2 + 3)
+
+    def test_roller_and_leader_are_favoured(self):
+        """
+        Verifica que tener el turno o menos pips aumente las chances.
+        """
+        even = _race({12: 5, 18: 5, 20: 5}, {11: 5, 5: 5, 3: 5})
+        win, win_gammon, lose_gammon = race_probabilities(even, "white")
+        self.assertGreater(win, 0.5)
+        self.assertLess(win, 0.7)
+        self.assertAlmostEqual(win, race_probabilities(even, "black")[0])
+        self.assertLess(win_gammon, 0.01)
+        self.assertLess(lose_gammon, 0.01)
+        ahead = _race({12: 5, 18: 5, 20: 5}, {13: 5, 5: 5, 3: 5})
+        self.assertGreater(race_probabilities(ahead, "white")[0], win)
+        self.assertLess(race_probabilities(ahead, "black")[0], 1 - win)
+
+    def test_gammons(self):
+        """
+        Verifica que un perdedor sin fichas retiradas y lejos de casa arriesgue
+        un gammon, que entra en la equity.
+        """
+        counts = _race({23: 2}, {20: 15})
+        counts[27] = 0
+        win, win_gammon, lose_gammon = race_probabilities(counts, "white")
+        self.assertGreater(win, 0.99)
+        self.assertGreater(win_gammon, 0.9)
+        self.assertEqual(lose_gammon, 0.0)
+        self.assertAlmostEqual(
+            race_equity(counts, "white"), 2 * win - 1 + win_gammon - lose_gammon
+        )
+        self.assertLess(race_equity(counts, "black"), -1.5)
+
+    def test_bear_off_databases(self):
+        """
+        Verifica que las bases de bear-off reemplacen la estimación cuando
+        cubren la posición.
+        """
+        short = _race({23: 1, 18: 1}, {0: 1, 2: 1})
+        with TwoSidedBearoff(self.two_sided_path) as two_sided:
+            self.assertAlmostEqual(
+                race_equity(short, "white", __two_sided__=two_sided),
+                two_sided.lookup(short, "white"),
+            )
+        home = _race({23: 3, 20: 3}, {0: 2, 4: 3})
+        with OneSidedBearoff(self.one_sided_path) as one_sided:
+            win = race_probabilities(home, "white", one_sided)[0]
+            mine = one_sided.distribution((3, 0, 0, 3, 0, 0))
+            theirs = one_sided.distribution((2, 0, 0, 0, 3, 0))
+            expected = sum(
+                mine[turns] * sum(theirs[turns:]) for turns in range(len(mine))
+            )
+            self.assertAlmostEqual(win, expected, places=4)
+            # Sin la base se usa la estimación cerrada.
+            self.assertNotAlmostEqual(
+                win, race_probabilities(home, "white")[0], places=4
+            )
+
+    def test_evaluate_short_circuits_races(self):
+        """
+        Verifica que la evaluación estática use la carrera sin contacto.
+        """
+        counts = _race({12: 5, 18: 5, 20: 5}, {11: 5, 5: 5, 3: 5})
+        self.assertAlmostEqual(
+            evaluate(counts, "white"),
+            2 * race_probabilities(counts, "white")[0] - 1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
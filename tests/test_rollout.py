@@ -0,0 +1,123 @@
+"""
+Este módulo contiene las pruebas unitarias para los rollouts de Monte Carlo.
+"""
+
+import unittest
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.bearoff import load_one_sided, load_two_sided
+from engine.race import race_equity
+from engine.rollout import RolloutEngine, _trial_roll
+
+
+def _contact_counts():
+    """
+    Posición de salida con dos fichas negras todavía en la casa blanca.
+    """
+    counts = [0] * 28
+    counts[16], counts[19], counts[21], counts[23] = 2, 2, 2, 2
+    counts[20] = -2
+    counts[3], counts[4], counts[5] = -4, -4, -4
+    counts[26], counts[27] = 7, 1
+    return counts
+
+
+class TestRollout(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para RolloutEngine.
+    """
+
+    def test_stratified_rolls(self):
+        """
+        Verifica que las dos primeras tiradas recorran las 36 combinaciones.
+        """
+        first = {_trial_roll(None, trial, 0) for trial in range(36)}
+        self.assertEqual(len(first), 21)
+        seconds = [_trial_roll(None, trial, 1) for trial in range(0, 36 * 36, 36)]
+        self.assertEqual(
+            sorted(seconds), sorted(_trial_roll(None, trial, 0) for trial in range(36))
+        )
+
+    def test_sure_win(self):
+        """
+        Verifica que una posición ganada con cualquier tirada valga 1 sin error.
+        """
+        counts = [0] * 28
+        counts[22], counts[23], counts[26] = 1, 1, 13
+        counts[10], counts[27] = -1, 14
+        summary = RolloutEngine(__truncate__=False).rollout(counts, "white", 36)
+        self.assertEqual(summary["equity"], 1.0)
+        self.assertEqual(summary["std_error"], 0.0)
+        self.assertEqual(summary["trials"], 36)
+        self.assertGreater(summary["trials_per_second"], 0)
+
+    def test_race_truncation(self):
+        """
+        Verifica que sin contacto el rollout se corte con la estimación de
+        carrera y que jugarla dé un valor cercano.
+        """
+        counts = [0] * 28
+        counts[12], counts[18], counts[20] = 5, 5, 5
+        counts[11], counts[5], counts[3] = -5, -5, -5
+        expected = race_equity(counts, "white", load_one_sided(), load_two_sided())
+        summary = RolloutEngine().rollout(counts, "white", 36)
+        self.assertAlmostEqual(summary["equity"], expected)
+        self.assertEqual(summary["std_error"], 0.0)
+        played = RolloutEngine(__truncate__=False).rollout(counts, "white", 72)
+        self.assertGreater(played["std_error"], 0.0)
+        self.assertLess(abs(played["equity"] - expected), 4 * played["std_error"])
+
+    def test_reproducible_across_workers(self):
+        """
+        Verifica que cada trial tenga su generador y que el resultado no
+        dependa de los procesos.
+        """
+        counts = _contact_counts()
+        single = RolloutEngine(__seed__=7).rollout(counts, "white", 72)
+        parallel = RolloutEngine(__seed__=7, __workers__=2).rollout(counts, "white", 72)
+        self.assertEqual(single["equity"], parallel["equity"])
+        self.assertEqual(single["std_error"], parallel["std_error"])
+        other = RolloutEngine(__seed__=8).rollout(counts, "white", 72)
+        self.assertNotEqual(single["equity"], other["equity"])
+
+    def test_variance_reduction(self):
+        """
+        Verifica que descontar la suerte baje el error sin mover la equity
+        más allá del ruido.
+        """
+        counts = _contact_counts()
+        plain = RolloutEngine().rollout(counts, "white", 144)
+        reduced = RolloutEngine(__variance_reduction__=True).rollout(
+            counts, "white", 144
+        )
+        self.assertLess(reduced["std_error"], plain["std_error"])
+        self.assertLess(
+            abs(reduced["equity"] - plain["equity"]),
+            3 * (plain["std_error"] + reduced["std_error"]),
+        )
+
+    def test_rollout_plays(self):
+        """
+        Verifica que se evalúen todas las jugadas, ordenadas de mejor a peor.
+        """
+        game = Game(
+            Player("Alice", "white"),
+            Player("Bob", "black"),
+            CompactBoard.from_counts(_contact_counts()),
+            Dice(),
+        )
+        game.__dice_values__ = [2, 1]
+        analysis = RolloutEngine().analyze(game, 36)
+        plays = [play for play, _ in game.get_legal_plays_with_positions()]
+        self.assertEqual(
+            sorted(map(str, plays)), sorted(str(play) for play, _ in analysis)
+        )
+        equities = [summary["equity"] for _, summary in analysis]
+        self.assertEqual(equities, sorted(equities, reverse=True))
+        self.assertTrue(all(summary["trials"] == 36 for _, summary in analysis))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Este módulo contiene las pruebas unitarias para la búsqueda expectiminimax.
+"""
+
+import unittest
+from core.board import OPPONENT, Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.exceptions import SearchTimeoutException
+from core.game import Game
+from core.player import Player
+from core.play_generator import enumerate_plays, enumerate_positions
+from engine.evaluation import evaluate
+from engine.search import REPLY_WIDTH, ROLLS, ExpectiminimaxSearch, dice_for_roll
+from engine.transposition import TranspositionTable
+
+
+def _naive_chance(counts, color, depth, reply_width):
+    """Expectiminimax sin poda, con el mismo filtro de respuestas."""
+    if depth == 0 or counts[26] == 15 or counts[27] == 15:
+        return evaluate(counts, color)
+    opponent = OPPONENT[color]
+    total = 0.0
+    for roll, probability in ROLLS:
+        replies = sorted(
+            enumerate_positions(counts, color, dice_for_roll(roll)),
+            key=lambda after: evaluate(after, opponent),
+        )
+        if depth > 1:
+            replies = replies[:reply_width]
+        if not replies:
+            replies = [counts]
+        total += probability * max(
+            -_naive_chance(after, opponent, depth - 1, reply_width) for after in replies
+        )
+    return total
+
+
+def _bear_off_counts():
+    """Posición de salida en la que las blancas pueden ganar en dos turnos."""
+    counts = [0] * 28
+    counts[20], counts[22], counts[23] = 2, 1, 2
+    counts[2], counts[4], counts[5] = -2, -2, -1
+    counts[26], counts[27] = 10, 10
+    return counts
+
+
+class TestSearch(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para ExpectiminimaxSearch.
+    """
+
+    def test_rolls(self):
+        """
+        Verifica las 21 tiradas, sus probabilidades y los dados de un doble.
+        """
+        self.assertEqual(len(ROLLS), 21)
+        self.assertAlmostEqual(sum(probability for _, probability in ROLLS), 1.0)
+        self.assertEqual(dice_for_roll((4, 4)), [4, 4, 4, 4])
+        self.assertEqual(dice_for_roll((2, 5)), [2, 5])
+
+    def test_zero_ply_is_static_evaluation(self):
+        """
+        Verifica que a 0 plies cada jugada vale la evaluación de su posición.
+        """
+        counts = Board().get_counts()
+        analysis = ExpectiminimaxSearch().analyze_counts(counts, "white", [3, 1], 0)
+        self.assertEqual(len(analysis), 16)
+        equities = [equity for _, equity, _ in analysis]
+        self.assertEqual(equities, sorted(equities, reverse=True))
+        best_after = max(
+            enumerate_positions(counts, "white", [3, 1]),
+            key=lambda after: -evaluate(after, "black"),
+        )
+        self.assertAlmostEqual(equities[0], -evaluate(best_after, "black"))
+        # El 3-1 de apertura hace el punto 5 de las blancas.
+        self.assertEqual([move.__to_pos__ for move in analysis[0][0]], [19, 19])
+
+    def test_pruned_search_matches_naive(self):
+        """
+        Verifica que Star1/Star2 no cambian las equities a 1 y 2 plies.
+        """
+        for counts, color, dice in (
+            (Board().get_counts(), "white", [6, 5]),
+            (_bear_off_counts(), "black", [2, 1]),
+        ):
+            search = ExpectiminimaxSearch(__root_widths__={1: 2, 2: 2})
+            positions = dict(enumerate_plays(counts, color, dice))
+            for plies in (1, 2):
+                analysis = search.analyze_counts(counts, color, dice, plies)
+                for play, equity, depth in analysis[:2]:
+                    self.assertEqual(depth, plies)
+                    expected = -_naive_chance(
+                        positions[play], OPPONENT[color], plies, REPLY_WIDTH
+                    )
+                    self.assertAlmostEqual(equity, expected)
+
+    def test_best_play_matches_analysis(self):
+        """
+        Verifica que best_play (con ventana) elige la mejor jugada exacta.
+        """
+        game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), CompactBoard(), Dice()
+        )
+        game.__dice_values__ = [4, 2]
+        search = ExpectiminimaxSearch()
+        analysis = search.analyze(game, 2)
+        self.assertEqual(search.best_play(game, 2), analysis[0][0])
+        self.assertGreater(search.get_stats()["nodes"], 0)
+        self.assertGreater(search.get_stats()["evaluations"], 0)
+
+    def test_transposition_table_keeps_results(self):
+        """
+        Verifica que la tabla de transposición no cambia el análisis y que
+        repetir la búsqueda la resuelve desde la tabla.
+        """
+        counts = Board().get_counts()
+        plain = ExpectiminimaxSearch().analyze_counts(counts, "black", [5, 2], 2)
+        table = TranspositionTable()
+        search = ExpectiminimaxSearch(__table__=table)
+        for _ in range(2):
+            cached = search.analyze_counts(counts, "black", [5, 2], 2)
+            self.assertEqual(
+                [play for play, _, _ in cached][:2], [play for play, _, _ in plain][:2]
+            )
+            for (_, expected, _), (_, equity, _) in zip(plain, cached):
+                self.assertAlmostEqual(equity, expected)
+        self.assertGreater(table.get_stats()["hits"], 0)
+        self.assertGreater(len(table), 0)
+
+    def test_best_play_within(self):
+        """
+        Verifica que la búsqueda con tiempo profundice mientras le alcance
+        y que sin tiempo devuelva la mejor jugada a 0 plies.
+        """
+        game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), CompactBoard(), Dice()
+        )
+        game.__dice_values__ = [6, 2]
+        search = ExpectiminimaxSearch()
+        play, plies = search.best_play_within(game, 60.0)
+        self.assertEqual(plies, 2)
+        self.assertEqual(play, search.best_play(game, 2))
+        play, plies = search.best_play_within(game, 0.0)
+        self.assertEqual(plies, 0)
+        self.assertEqual(play, search.best_play(game, 0))
+        with self.assertRaises(SearchTimeoutException):
+            search.__deadline__ = 0.0
+            search.analyze(game, 1)
+        search.__deadline__ = None
+        game.__dice_values__ = []
+        self.assertEqual(search.best_play_within(game, 1.0), ((), 0))
+
+    def test_race_cutoff(self):
+        """
+        Verifica que con __race_cutoff__ las carreras no se expanden.
+        """
+        counts = _bear_off_counts()
+        search = ExpectiminimaxSearch(__race_cutoff__=True)
+        static = search.analyze_counts(counts, "white", [6, 3], 0)
+        deep = search.analyze_counts(counts, "white", [6, 3], 2)
+        self.assertEqual(
+            [equity for _, equity, _ in deep], [equity for _, equity, _ in static]
+        )
+        self.assertEqual(search.get_stats()["cutoffs"], 0)
+        self.assertLessEqual(search.get_stats()["evaluations"], 2 * len(static))
+
+    def test_no_legal_plays(self):
+        """
+        Verifica que sin jugadas legales el análisis está vacío.
+        """
+        counts = Board().get_counts()
+        counts[0] -= 1
+        counts[24] += 1
+        for index in range(6):
+            counts[index] = -2
+        search = ExpectiminimaxSearch()
+        self.assertEqual(search.analyze_counts(counts, "white", [6, 6, 6, 6], 1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Este módulo contiene las pruebas unitarias para el servidor de partidas.
+"""
+
+import asyncio
+import json
+import random
+import unittest
+from server.server import GameServer
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Clase de pruebas unitarias para GameServer.
+    """
+
+    def setUp(self):
+        self.server = GameServer()
+
+    async def test_new_and_state(self):
+        """
+        Verifica que una partida nueva empiece con los dados tirados y que
+        su estado se pueda volver a pedir.
+        """
+        created = await self.server.dispatch({"cmd": "new", "seed": 1})
+        self.assertTrue(created["ok"])
+        self.assertEqual(created["turn"], "white")
+        self.assertTrue(created["dice"])
+        self.assertTrue(created["plays"])
+        self.assertIsNone(created["winner"])
+        state = await self.server.dispatch({"cmd": "state", "game": created["game"]})
+        self.assertEqual(state, created)
+
+    async def test_play(self):
+        """
+        Verifica las jugadas por posición y por movimientos, y el rechazo de
+        las ilegales o fuera de turno.
+        """
+        state = await self.server.dispatch({"cmd": "new", "seed": 2})
+        game = state["game"]
+        rejected = await self.server.dispatch(
+            {"cmd": "play", "game": game, "play": 0, "color": "black"}
+        )
+        self.assertEqual(
+            rejected, {"ok": False, "error": "No es el turno de ese color"}
+        )
+        illegal = await self.server.dispatch(
+            {"cmd": "play", "game": game, "moves": [[0, 23]]}
+        )
+        self.assertFalse(illegal["ok"])
+        moved = await self.server.dispatch(
+            {"cmd": "play", "game": game, "moves": state["plays"][-1], "color": "white"}
+        )
+        self.assertTrue(moved["ok"])
+        self.assertEqual(moved["turn"], "black")
+        self.assertNotEqual(moved["counts"], state["counts"])
+        moved = await self.server.dispatch({"cmd": "play", "game": game, "play": 0})
+        self.assertEqual(moved["turn"], "white")
+        self.assertEqual(self.server.get_stats()["moves"], 2)
+
+    async def test_play_moves_in_any_order(self):
+        """
+        Verifica que una jugada por movimientos se acepte en cualquier orden
+        legal de los dados, no sólo en el de la lista de jugadas.
+        """
+        state = await self.server.dispatch({"cmd": "new", "seed": 1})
+        self.assertEqual(sorted(state["dice"]), [2, 5])
+        self.assertIn([[11, 16], [16, 18]], state["plays"])
+        self.assertNotIn([[11, 13], [13, 18]], state["plays"])
+        illegal = await self.server.dispatch(
+            {"cmd": "play", "game": state["game"], "moves": [[11, 13], [13, 20]]}
+        )
+        self.assertFalse(illegal["ok"])
+        moved = await self.server.dispatch(
+            {"cmd": "play", "game": state["game"], "moves": [[11, 13], [13, 18]]}
+        )
+        self.assertTrue(moved["ok"])
+        other = GameServer()
+        created = await other.dispatch({"cmd": "new", "seed": 1})
+        expected = await other.dispatch(
+            {"cmd": "play", "game": created["game"], "moves": [[11, 16], [16, 18]]}
+        )
+        self.assertEqual(moved, expected)
+
+    async def test_full_game(self):
+        """
+        Verifica que una partida jugada al azar termine con un ganador y que
+        después no acepte jugadas.
+        """
+        rng = random.Random(3)
+        state = await self.server.dispatch({"cmd": "new", "seed": 3})
+        while state["winner"] is None:
+            state = await self.server.dispatch(
+                {
+                    "cmd": "play",
+                    "game": state["game"],
+                    "play": rng.randrange(len(state["plays"])),
+                }
+            )
+            self.assertTrue(state["ok"])
+        self.assertIn(state["points"], (1, 2, 3))
+        self.assertEqual(state["plays"], [])
+        finished = await self.server.dispatch(
+            {"cmd": "play", "game": state["game"], "play": 0}
+        )
+        self.assertEqual(finished, {"ok": False, "error": "La partida terminó"})
+
+    async def test_errors(self):
+        """
+        Verifica las respuestas a pedidos inválidos.
+        """
+        for request in (
+            {"cmd": "state", "game": 99},
+            {"cmd": "state", "game": [1]},
+            {"cmd": "fly"},
+            ["new"],
+        ):
+            response = await self.server.dispatch(request)
+            self.assertFalse(response["ok"])
+        response = await self.server.handle_line(b"{no es json\n")
+        self.assertEqual(response, {"ok": False, "error": "JSON inválido"})
+        game = (await self.server.dispatch({"cmd": "new"}))["game"]
+        response = await self.server.dispatch({"cmd": "play", "game": game, "moves": 5})
+        self.assertEqual(response, {"ok": False, "error": "Pedido mal formado"})
+        self.assertEqual(self.server.get_stats()["errors"], 6)
+        limited = GameServer(__max_games__=1)
+        await limited.dispatch({"cmd": "new"})
+        self.assertFalse((await limited.dispatch({"cmd": "new"}))["ok"])
+
+    async def test_hint_and_close(self):
+        """
+        Verifica las sugerencias y que una partida cerrada deje de existir.
+        """
+        game = (await self.server.dispatch({"cmd": "new", "seed": 4}))["game"]
+        response = await self.server.dispatch({"cmd": "hint", "game": game, "count": 2})
+        self.assertTrue(response["ok"])
+        self.assertEqual(len(response["hints"]), 2)
+        self.assertEqual(response["hints"][0]["loss"], 0.0)
+        closed = await self.server.dispatch({"cmd": "close", "game": game})
+        self.assertEqual(closed, {"ok": True, "game": game})
+        self.assertEqual(self.server.get_stats()["games"], 0)
+        missing = await self.server.dispatch({"cmd": "state", "game": game})
+        self.assertFalse(missing["ok"])
+
+    async def test_concurrent_close(self):
+        """
+        Verifica que los pedidos en espera sobre una partida que se cierra
+        respondan que no existe en lugar de fallar.
+        """
+        game = (await self.server.dispatch({"cmd": "new", "seed": 6}))["game"]
+        # La sugerencia retiene el lock mientras los demás pedidos esperan.
+        responses = await asyncio.gather(
+            self.server.dispatch({"cmd": "hint", "game": game, "count": 1}),
+            self.server.dispatch({"cmd": "close", "game": game}),
+            self.server.dispatch({"cmd": "close", "game": game}),
+            self.server.dispatch({"cmd": "play", "game": game, "play": 0}),
+        )
+        missing = {"ok": False, "error": "Partida inexistente"}
+        self.assertTrue(responses[0]["ok"])
+        self.assertEqual(responses[1:], [{"ok": True, "game": game}, missing, missing])
+        self.assertEqual(self.server.get_stats()["games"], 0)
+
+    async def test_connections(self):
+        """
+        Verifica el protocolo de líneas sobre TCP con varias conexiones que
+        comparten una partida.
+        """
+        listener = await self.server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        connections = [
+            await asyncio.open_connection("127.0.0.1", port) for _ in range(3)
+        ]
+
+        async def request(index, message):
+            reader, writer = connections[index]
+            writer.write(json.dumps(message).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        state = await request(0, {"cmd": "new", "seed": 5})
+        states = await asyncio.gather(
+            request(1, {"cmd": "state", "game": state["game"]}),
+            request(2, {"cmd": "state", "game": state["game"]}),
+        )
+        self.assertEqual(states, [state, state])
+        self.assertEqual(self.server.get_stats()["connections"], 3)
+        for _, writer in connections:
+            writer.close()
+            await writer.wait_closed()
+        listener.close()
+        await listener.wait_closed()
+        for _ in range(100):
+            if not self.server.get_stats()["connections"]:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(self.server.get_stats()["connections"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Este módulo contiene las pruebas unitarias para el simulador de partidas.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from core.board import Board
+from engine.policies import FirstLegalPolicy, RandomPolicy
+from engine.simulator import main, play_game, simulate
+
+
+class TestSimulator(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para play_game y simulate.
+    """
+
+    def test_play_game_finishes(self):
+        """
+        Verifica que una partida entre políticas termina con un ganador.
+        """
+        game, plies = play_game(RandomPolicy(1), FirstLegalPolicy(), Board())
+        self.assertTrue(game.is_over())
+        self.assertGreater(plies, 0)
+        self.assertIn(game.get_win_points(), (1, 2, 3))
+
+    def test_play_game_respects_ply_limit(self):
+        """
+        Verifica que la partida se corta al llegar al máximo de turnos.
+        """
+        game, plies = play_game(RandomPolicy(1), RandomPolicy(2), __max_plies__=3)
+        self.assertEqual(plies, 3)
+        self.assertFalse(game.is_over())
+
+    def test_simulate_report(self):
+        """
+        Verifica el resumen de varias partidas y que la semilla lo reproduce.
+        """
+        report = simulate(4, "random", "first", __seed__=7)
+        self.assertEqual(report["games"], 4)
+        self.assertEqual(report["white_wins"] + report["black_wins"], 4)
+        self.assertEqual(report["unfinished"], 0)
+        self.assertGreater(report["games_per_second"], 0)
+        self.assertGreater(report["mean_plies"], 0)
+        again = simulate(4, "random", "first", __seed__=7)
+        self.assertEqual(again["white_wins"], report["white_wins"])
+        self.assertEqual(again["mean_plies"], report["mean_plies"])
+
+    def test_main_prints_report(self):
+        """
+        Verifica que la línea de comandos imprime el resumen.
+        """
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["--games", "2", "--seed", "1"])
+        self.assertIn("Partidas/s", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
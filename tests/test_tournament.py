@@ -0,0 +1,55 @@
+"""
+Este módulo contiene las pruebas unitarias para el torneo multiproceso.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from engine.tournament import derive_seed, main, play_seeded_game, run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para run_tournament y sus utilidades.
+    """
+
+    def test_derive_seed_is_stable_and_independent(self):
+        """
+        Verifica que la semilla de una partida es fija y distinta entre partidas.
+        """
+        self.assertEqual(derive_seed(1, 5), derive_seed(1, 5))
+        self.assertNotEqual(derive_seed(1, 5), derive_seed(1, 6))
+        self.assertNotEqual(derive_seed(1, 5), derive_seed(2, 5))
+
+    def test_seeded_game_is_replayable(self):
+        """
+        Verifica que una partida con la misma semilla se repite exactamente.
+        """
+        first, first_plies = play_seeded_game("random", "random", derive_seed(3, 0))
+        second, second_plies = play_seeded_game("random", "random", derive_seed(3, 0))
+        self.assertEqual(first_plies, second_plies)
+        self.assertEqual(first.__board__.get_counts(), second.__board__.get_counts())
+
+    def test_results_do_not_depend_on_workers_or_batches(self):
+        """
+        Verifica que el resumen es el mismo en un proceso y en varios.
+        """
+        single = run_tournament(12, "random", "first", 9, 1, 5)
+        parallel = run_tournament(12, "random", "first", 9, 2, 4)
+        for key in ("white_wins", "black_wins", "white_points", "mean_plies"):
+            self.assertEqual(single[key], parallel[key])
+        self.assertEqual(single["white_wins"] + single["black_wins"], 12)
+        self.assertEqual(parallel["workers"], 2)
+
+    def test_main_prints_report(self):
+        """
+        Verifica que la línea de comandos imprime el resumen.
+        """
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["--games", "2", "--workers", "1"])
+        self.assertIn("Partidas/s", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Este módulo contiene las pruebas unitarias para el entrenamiento por TD(λ).
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from engine.neural import NeuralEvaluator, encode_batch
+from engine.training import TDTrainer, self_play_game
+
+
+class TestTraining(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para self_play_game y TDTrainer.
+    """
+
+    def setUp(self):
+        self.evaluator = NeuralEvaluator(__hidden__=8, __seed__=1)
+
+    def test_self_play_game(self):
+        """
+        Verifica que la trayectoria sea reproducible y termine con el ganador.
+        """
+        trajectory = self_play_game(self.evaluator, 5)
+        counts, colors, winner, points = trajectory
+        self.assertEqual(counts.shape, (len(colors), 28))
+        self.assertEqual(colors[0], "white")
+        self.assertIn(winner, ("white", "black"))
+        self.assertIn(points, (1, 2, 3))
+        again = self_play_game(self.evaluator, 5)
+        np.testing.assert_array_equal(counts, again[0])
+        self.assertEqual(colors, again[1])
+
+    def test_learn_moves_towards_result(self):
+        """
+        Verifica que aprender una partida acerque la última predicción al
+        resultado real.
+        """
+        trajectory = self_play_game(self.evaluator, 7)
+        counts, colors, winner, _ = trajectory
+        last = encode_batch(counts[-1:], colors[-1])
+        trainer = TDTrainer(self.evaluator, __alpha__=0.5)
+        before = self.evaluator.forward(last)[1][0, 0]
+        for _ in range(5):
+            trainer.learn(trajectory)
+        after = self.evaluator.forward(last)[1][0, 0]
+        if colors[-1] == winner:
+            self.assertGreater(after, before)
+        else:
+            self.assertLess(after, before)
+
+    def test_train_with_checkpoints(self):
+        """
+        Verifica el resumen y los puntos de control del entrenamiento.
+        """
+        trainer = TDTrainer(self.evaluator)
+        with tempfile.TemporaryDirectory() as directory:
+            report = trainer.train(
+                4, __checkpoint_dir__=directory, __checkpoint_every__=2
+            )
+            self.assertEqual(report["games"], 4)
+            self.assertGreater(report["positions"], 0)
+            self.assertGreater(report["games_per_hour"], 0)
+            self.assertEqual(
+                [os.path.basename(path) for path in report["checkpoints"]],
+                ["td_00000002.npz", "td_00000004.npz"],
+            )
+            loaded = NeuralEvaluator.load(os.path.join(directory, "td_latest.npz"))
+            np.testing.assert_array_equal(
+                loaded.get_weights()["output_weights"],
+                self.evaluator.get_weights()["output_weights"],
+            )
+
+    def test_train_with_actors(self):
+        """
+        Verifica que varios actores en procesos alimenten al aprendiz.
+        """
+        weights = self.evaluator.get_weights()["output_weights"].copy()
+        trainer = TDTrainer(self.evaluator)
+        report = trainer.train(4, __actors__=2)
+        self.assertEqual(report["games"], 4)
+        self.assertFalse(
+            np.array_equal(weights, self.evaluator.get_weights()["output_weights"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Este módulo contiene las pruebas unitarias para la tabla de transposición.
+"""
+
+import unittest
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from engine.transposition import (
+    EXACT,
+    LOWER,
+    UPPER,
+    TranspositionTable,
+    position_key,
+)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para TranspositionTable y position_key.
+    """
+
+    def setUp(self):
+        self.table = TranspositionTable(1000)
+
+    def test_capacity_is_power_of_two(self):
+        """
+        Verifica que la capacidad se redondea y que la tabla empieza vacía.
+        """
+        self.assertEqual(self.table.get_capacity(), 1024)
+        self.assertEqual(len(self.table), 0)
+
+    def test_store_and_probe(self):
+        """
+        Verifica aciertos, fallos y el requisito de profundidad.
+        """
+        self.assertIsNone(self.table.probe(7, 1))
+        self.assertTrue(self.table.store(7, 2, 0.25))
+        self.assertEqual(self.table.probe(7, 2), 0.25)
+        self.assertEqual(self.table.probe(7, 1), 0.25)
+        self.assertIsNone(self.table.probe(7, 3))
+        stats = self.table.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+        self.assertEqual(stats["size"], 1)
+
+    def test_bounds(self):
+        """
+        Verifica que las cotas sólo se usan cuando resuelven la ventana.
+        """
+        self.table.store(1, 1, 0.5, LOWER)
+        self.assertEqual(self.table.probe(1, 1, -1.0, 0.4), 0.5)
+        self.assertIsNone(self.table.probe(1, 1, -1.0, 0.6))
+        self.table.store(2, 1, -0.5, UPPER)
+        self.assertEqual(self.table.probe(2, 1, -0.4, 1.0), -0.5)
+        self.assertIsNone(self.table.probe(2, 1, -0.6, 1.0))
+
+    def test_collisions_and_replacement(self):
+        """
+        Verifica la preferencia por profundidad y el reemplazo por antigüedad.
+        """
+        first, second = 5, 5 + 1024
+        self.table.store(first, 2, 0.1)
+        self.assertIsNone(self.table.probe(second, 1))
+        self.assertEqual(self.table.get_stats()["collisions"], 1)
+
+        self.assertFalse(self.table.store(second, 1, 0.2))
+        self.assertEqual(self.table.probe(first, 2), 0.1)
+        self.assertTrue(self.table.store(second, 2, 0.2))
+        self.assertIsNone(self.table.probe(first, 1))
+
+        self.table.store(first, 3, 0.3)
+        self.table.new_search()
+        self.assertTrue(self.table.store(second, 1, 0.4))
+        stats = self.table.get_stats()
+        self.assertEqual(stats["replacements"], 3)
+        self.assertEqual(stats["rejected"], 1)
+
+    def test_same_position_keeps_deeper_exact_value(self):
+        """
+        Verifica que un valor exacto más profundo no se pisa en la misma búsqueda.
+        """
+        self.table.store(9, 2, 0.7, EXACT)
+        self.assertFalse(self.table.store(9, 1, 0.1))
+        self.assertEqual(self.table.probe(9, 1), 0.7)
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(self.table.get_stats()["stores"], 0)
+
+    def test_position_key_matches_game_hash(self):
+        """
+        Verifica que position_key coincide con Game.zobrist_hash sin dados.
+        """
+        game = Game(
+            Player("Alice", "white"), Player("Bob", "black"), CompactBoard(), Dice()
+        )
+        counts = game.__board__.get_counts()
+        for turn, color in ((0, "white"), (1, "black")):
+            game.__current_turn__ = turn
+            self.assertEqual(position_key(counts, color), game.zobrist_hash)
+        self.assertNotEqual(
+            position_key(counts, "white"), position_key(counts, "black")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
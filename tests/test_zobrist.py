@@ -0,0 +1,114 @@
+"""
+Este módulo contiene las pruebas unitarias para el hashing Zobrist de posiciones.
+"""
+
+import random
+import unittest
+from core.board import Board
+from core.checker import Checker
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import Game
+from core.player import Player
+from core.zobrist import fold_bar_and_off, fold_turn_and_dice, hash_counts
+
+
+def _full_hash(board):
+    """Calcula el hash del tablero desde cero a partir de sus conteos."""
+    counts = board.get_counts()
+    return fold_bar_and_off(hash_counts(counts), counts[24:26], counts[26:28])
+
+
+class TestZobrist(unittest.TestCase):
+    """
+    Clase de pruebas unitarias para el hash Zobrist incremental.
+    """
+
+    def test_initial_hash_is_equal_for_both_boards(self):
+        """
+        Verifica que Board y CompactBoard producen el mismo hash inicial.
+        """
+        self.assertEqual(Board().zobrist_hash, CompactBoard().zobrist_hash)
+        self.assertEqual(Board().zobrist_hash, _full_hash(Board()))
+
+    def test_incremental_hash_matches_full_hash(self):
+        """
+        Verifica que el hash incremental coincide con el recalculado tras
+        movimientos, capturas, reingresos y bear-off.
+        """
+        rng = random.Random(3)
+        board = Board()
+        compact = CompactBoard()
+        for _ in range(400):
+            color = rng.choice(("white", "black"))
+            action = rng.random()
+            from_point, to_point = rng.randrange(24), rng.randrange(24)
+            for target in (board, compact):
+                try:
+                    if action < 0.7:
+                        target.move_checker(color, from_point, to_point)
+                    elif action < 0.9:
+                        target.enter_from_captured(color, to_point)
+                    else:
+                        target.bear_off(color, from_point)
+                except ValueError:
+                    pass
+            self.assertEqual(board.zobrist_hash, _full_hash(board))
+            self.assertEqual(compact.zobrist_hash, board.zobrist_hash)
+
+    def test_capture_changes_hash(self):
+        """
+        Verifica que una captura incluye el cambio de la barra en el hash.
+        """
+        board = Board()
+        board.move_checker("black", 5, 2)
+        before = board.zobrist_hash
+        board.move_checker("white", 0, 2)
+        self.assertNotEqual(board.zobrist_hash, before)
+        self.assertEqual(len(board.get_captured("black")), 1)
+        self.assertEqual(board.zobrist_hash, _full_hash(board))
+
+    def test_transposition_gives_same_hash(self):
+        """
+        Verifica que llegar a la misma posición por distinto orden da el mismo hash.
+        """
+        first = CompactBoard()
+        first.move_checker("white", 0, 3)
+        first.move_checker("white", 0, 4)
+        second = CompactBoard()
+        second.move_checker("white", 0, 4)
+        second.move_checker("white", 0, 3)
+        self.assertEqual(first.zobrist_hash, second.zobrist_hash)
+
+    def test_direct_point_assignment_invalidates_hash(self):
+        """
+        Verifica que reasignar un punto directamente recalcula el hash.
+        """
+        board = Board()
+        initial = board.zobrist_hash
+        board.__points__[3] = [Checker("white")]
+        self.assertNotEqual(board.zobrist_hash, initial)
+        self.assertEqual(board.zobrist_hash, _full_hash(board))
+
+    def test_game_hash_folds_turn_and_dice(self):
+        """
+        Verifica que el hash de Game distingue turno y dados restantes.
+        """
+        game = Game(Player("Alice", "white"), Player("Bob", "black"), Board(), Dice())
+        game.__dice_values__ = [3, 4]
+        base = game.zobrist_hash
+        game.__dice_values__ = [4, 3]
+        self.assertEqual(game.zobrist_hash, base)
+        game.__dice_values__ = [3]
+        self.assertNotEqual(game.zobrist_hash, base)
+        game.__dice_values__ = [3, 4]
+        game.__current_turn__ = 1
+        self.assertNotEqual(game.zobrist_hash, base)
+        self.assertEqual(
+            game.zobrist_hash,
+            fold_turn_and_dice(game.__board__.zobrist_hash, 1, [3, 4]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()